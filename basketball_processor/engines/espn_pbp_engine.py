@@ -12,6 +12,8 @@ Analyzes ESPN PBP data for:
 from typing import Dict, Any, List, Optional, Tuple
 import re
 
+from ..utils.play_arrays import AWAY, HOME, PlayArrays
+
 
 class ESPNPlayByPlayEngine:
     """Analyze ESPN play-by-play data for advanced statistics."""
@@ -43,17 +45,33 @@ class ESPNPlayByPlayEngine:
         else:
             self.winner_side = 'home' if self.final_home > self.final_away else 'away'
         self.winner_team = self.home_team if self.winner_side == 'home' else self.away_team
+        self._play_arrays: Optional[PlayArrays] = None
+
+    @property
+    def play_arrays(self) -> PlayArrays:
+        """Typed arrays of the plays, built on first use."""
+        if self._play_arrays is None:
+            self._play_arrays = PlayArrays.from_espn_plays(self.plays)
+        return self._play_arrays
 
-    def analyze(self) -> Dict[str, Any]:
+    def analyze(self, fused: bool = True) -> Dict[str, Any]:
         """
         Run all analyses and return combined results.
 
+        Args:
+            fused: Compute everything in one pass over the plays
+                (analyze_fused); False runs each analyze_* method separately.
+                Both give identical results.
+
         Returns:
             Dictionary with all analysis results
         """
         if not self.plays:
             return {}
 
+        if fused:
+            return self.analyze_fused()
+
         return {
             'team_scoring_runs': self.analyze_team_scoring_runs(),
             'player_point_streaks': self.analyze_player_point_streaks(),
@@ -62,6 +80,223 @@ class ESPNPlayByPlayEngine:
             'game_winning_shots': self.analyze_game_winning_shots(),
         }
 
+    def analyze_fused(
+        self,
+        run_min_points: int = 8,
+        streak_min_points: int = 6,
+        clutch_minutes: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Run all five analyses in a single pass over the plays.
+
+        Produces the same results as the individual analyze_* methods. Run
+        and streak state is kept in locals, and score strings and result
+        dicts are only built for runs, streaks and shots that make the output.
+        The comeback comes from the vectorized play arrays, so non-scoring
+        plays only update the previous score.
+
+        Args:
+            run_min_points: Minimum points for a team scoring run
+            streak_min_points: Minimum points for a player point streak
+            clutch_minutes: Minutes at end of regulation counted as clutch
+
+        Returns:
+            Dictionary with all analysis results
+        """
+        if not self.plays:
+            return {}
+
+        gender = self.espn_pbp.get('gender', 'M')
+        final_period = 2 if gender == 'M' else 4
+        winner_away = self.winner_side == 'away'
+
+        # Team runs and player streaks: (identity, points, start play, start score, end play)
+        runs: List[Dict[str, Any]] = []
+        run_side = None
+        run_team = None
+        run_points = 0
+        run_start: Tuple[Any, ...] = ()
+        run_end: Dict[str, Any] = {}
+
+        streaks: List[Dict[str, Any]] = []
+        streak_player = None
+        streak_points = 0
+        streak_start: Tuple[Any, ...] = ()
+        streak_end: Dict[str, Any] = {}
+
+        def close_run() -> None:
+            if run_team and run_points >= run_min_points:
+                start_play, start_away, start_home = run_start
+                runs.append({
+                    'team': run_team,
+                    'team_side': run_side,
+                    'points': run_points,
+                    'start_time': start_play['time'],
+                    'end_time': run_end['time'],
+                    'start_period': start_play['period'],
+                    'end_period': run_end['period'],
+                    'start_score': f"{start_away}-{start_home}",
+                    'end_score': f"{run_end['away_score']}-{run_end['home_score']}",
+                })
+
+        def close_streak() -> None:
+            if streak_player and streak_points >= streak_min_points:
+                start_play, start_away, start_home = streak_start
+                streaks.append({
+                    'player': streak_player,
+                    'team': start_play['team'],
+                    'team_side': start_play.get('team_side', ''),
+                    'points': streak_points,
+                    'start_time': start_play['time'],
+                    'end_time': streak_end['time'],
+                    'start_period': start_play['period'],
+                    'end_period': streak_end['period'],
+                    'start_score': f"{start_away}-{start_home}",
+                    'end_score': f"{streak_end['away_score']}-{streak_end['home_score']}",
+                })
+
+        # Clutch scoring: side -> player -> stats
+        clutch_stats: Dict[str, Dict[str, Dict[str, Any]]] = {'away': {}, 'home': {}}
+
+        # Go-ahead shots by the winning team
+        last_go_ahead = None
+        clutch_go_ahead = None
+
+        # Scores before the current play: any play (go-ahead check) and the
+        # last scoring play (runs and streaks)
+        prev_away = prev_home = 0
+        scoring_prev_away = scoring_prev_home = 0
+
+        for play in self.plays:
+            away_score = play['away_score']
+            home_score = play['home_score']
+
+            if not play.get('scoring_play'):
+                prev_away = away_score
+                prev_home = home_score
+                continue
+
+            team_side = play.get('team_side', '')
+
+            # Team scoring runs
+            away_scored = away_score - scoring_prev_away
+            home_scored = home_score - scoring_prev_home
+            if team_side == 'away' and away_scored > 0:
+                scoring_side = 'away'
+                points = away_scored
+            elif team_side == 'home' and home_scored > 0:
+                scoring_side = 'home'
+                points = home_scored
+            else:
+                # Both teams scored or unclear - end run
+                scoring_side = None
+            if scoring_side is None:
+                close_run()
+                run_side = run_team = None
+                run_points = 0
+            elif run_side == scoring_side:
+                run_points += points
+                run_end = play
+            else:
+                close_run()
+                run_side = scoring_side
+                run_team = play['team']
+                run_points = points
+                run_start = (play, scoring_prev_away, scoring_prev_home)
+                run_end = play
+
+            # Player point streaks
+            player = play.get('player', '')
+            points = play.get('score_value', 0)
+            if points == 0:
+                points = (away_score - scoring_prev_away) + (home_score - scoring_prev_home)
+            if player and points > 0:
+                if streak_player == player:
+                    streak_points += points
+                    streak_end = play
+                else:
+                    close_streak()
+                    streak_player = player
+                    streak_points = points
+                    streak_start = (play, scoring_prev_away, scoring_prev_home)
+                    streak_end = play
+
+            scoring_prev_away = away_score
+            scoring_prev_home = home_score
+
+            # Clutch scoring (final minutes of regulation)
+            if play['period'] == final_period:
+                minutes = self._parse_time_minutes(play.get('time', ''))
+                score_value = play.get('score_value', 0)
+                if minutes is not None and minutes < clutch_minutes and player and team_side and score_value != 0:
+                    stats = clutch_stats[team_side].get(player)
+                    if stats is None:
+                        stats = clutch_stats[team_side][player] = {
+                            'player': player, 'points': 0, 'fg': 0, 'ft': 0, 'three': 0,
+                        }
+                    stats['points'] += score_value
+                    play_type = play.get('play_type', '')
+                    if 'ft' in play_type or 'free_throw' in play_type:
+                        stats['ft'] += 1
+                    elif 'three' in play_type:
+                        stats['fg'] += 1
+                        stats['three'] += 1
+                    elif 'made' in play_type:
+                        stats['fg'] += 1
+
+            # Go-ahead shots by the winning team
+            margin = away_score - home_score  # Positive = away leading
+            prev_margin = prev_away - prev_home
+            if team_side == 'away' and winner_away:
+                is_go_ahead = prev_margin <= 0 and margin > 0
+            elif team_side == 'home' and not winner_away:
+                is_go_ahead = prev_margin >= 0 and margin < 0
+            else:
+                is_go_ahead = False
+            if is_go_ahead:
+                last_go_ahead = play
+                if play['period'] == final_period:
+                    minutes = self._parse_time_minutes(play['time'])
+                    if minutes is not None and minutes < 2:
+                        clutch_go_ahead = play
+
+            prev_away = away_score
+            prev_home = home_score
+
+        close_run()
+        close_streak()
+        runs.sort(key=lambda x: x['points'], reverse=True)
+        streaks.sort(key=lambda x: x['points'], reverse=True)
+
+        def shot_info(play: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if play is None:
+                return None
+            return {
+                'player': play.get('player', ''),
+                'team': play.get('team', ''),
+                'team_side': play.get('team_side', ''),
+                'time': play['time'],
+                'period': play['period'],
+                'points': play.get('score_value', 0),
+                'play_type': play.get('play_type', ''),
+                'score': f"{play['away_score']}-{play['home_score']}",
+                'text': play.get('text', ''),
+            }
+
+        return {
+            'team_scoring_runs': runs,
+            'player_point_streaks': streaks,
+            'biggest_comeback': self.analyze_biggest_comeback(),
+            'clutch_scoring': {
+                side: sorted(clutch_stats[side].values(), key=lambda x: x['points'], reverse=True)
+                for side in ('away', 'home')
+            },
+            'game_winning_shots': {
+                'clutch_go_ahead': shot_info(clutch_go_ahead),
+                'decisive_shot': shot_info(last_go_ahead),
+            },
+        }
+
     def analyze_team_scoring_runs(self, min_points: int = 8) -> List[Dict[str, Any]]:
         """
         Find consecutive team scoring runs.
@@ -260,32 +495,11 @@ class ESPNPlayByPlayEngine:
         if not self.plays:
             return None
 
-        # Track max deficit for the winning team
-        max_deficit = 0
-        max_deficit_time = ''
-        max_deficit_period = 0
-        max_deficit_score = ''
-
-        for play in self.plays:
-            away_score = play['away_score']
-            home_score = play['home_score']
-            margin = away_score - home_score  # Positive = away leading
-
-            # Calculate deficit for winning team
-            if self.winner_side == 'away':
-                # Away won - check if they were behind
-                deficit = -margin if margin < 0 else 0
-            else:
-                # Home won - check if they were behind
-                deficit = margin if margin > 0 else 0
-
-            if deficit > max_deficit:
-                max_deficit = deficit
-                max_deficit_time = play['time']
-                max_deficit_period = play['period']
-                max_deficit_score = f"{away_score}-{home_score}"
+        final_score = f"{self.final_away}-{self.final_home}"
+        side = AWAY if self.winner_side == 'away' else HOME
+        index = self.play_arrays.max_deficit_index(side)
 
-        if max_deficit == 0:
+        if index is None:
             return {
                 'team': self.winner_team,
                 'team_side': self.winner_side,
@@ -295,19 +509,22 @@ class ESPNPlayByPlayEngine:
                 'deficit_score': '',
                 'won': True,
                 'never_trailed': True,
-                'final_score': f"{self.final_away}-{self.final_home}",
+                'final_score': final_score,
             }
 
+        play = self.plays[index]
+        away_score = play['away_score']
+        home_score = play['home_score']
         return {
             'team': self.winner_team,
             'team_side': self.winner_side,
-            'deficit': max_deficit,
-            'deficit_time': max_deficit_time,
-            'deficit_period': max_deficit_period,
-            'deficit_score': max_deficit_score,
+            'deficit': abs(away_score - home_score),
+            'deficit_time': play['time'],
+            'deficit_period': play['period'],
+            'deficit_score': f"{away_score}-{home_score}",
             'won': True,
             'never_trailed': False,
-            'final_score': f"{self.final_away}-{self.final_home}",
+            'final_score': final_score,
         }
 
     def analyze_clutch_scoring(self, final_minutes: int = 5) -> Dict[str, List[Dict[str, Any]]]:
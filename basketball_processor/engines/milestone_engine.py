@@ -2,21 +2,22 @@
 Milestone detection engine for basketball achievements.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
 from ..utils.helpers import safe_int, safe_float, calculate_game_score
 from ..utils.stat_utils import (
-    is_double_double,
-    is_triple_double,
     get_double_double_categories,
-    is_hot_shooting,
-    is_perfect_ft,
-    is_near_double_double,
     get_near_double_double_detail,
     calculate_four_factors,
     calculate_pace,
 )
 from ..utils.constants import MILESTONE_THRESHOLDS, MILESTONE_STAT_CONFIGS
 
+# Bump when detection logic changes so cached milestone_stats are re-run
+ENGINE_VERSION = 1
+
 
 class MilestoneEngine:
     """Detect milestones during game parsing."""
@@ -87,12 +88,41 @@ class MilestoneEngine:
 
     def process(self) -> Dict[str, Any]:
         """Run all milestone checks and add to game_data."""
-        self._process_player_milestones()
-        self._calculate_game_stats()
-        self.game_data['milestone_stats'] = self.milestones
-        self.game_data['game_stats'] = self.game_stats
+        self.process_batch([self.game_data])
         return self.game_data
 
+    @classmethod
+    def process_batch(cls, games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run milestone checks for many games at once.
+
+        Every player line across the games goes into one stats matrix and
+        each milestone rule (see _milestone_rules) is evaluated as a boolean
+        mask over it, so the thresholds are checked once per collection
+        rather than once per player. process() runs a batch of one game.
+
+        Args:
+            games: Game data dictionaries (updated in place)
+
+        Returns:
+            The same games, each with milestone_stats and game_stats
+        """
+        engines = [cls(game_data) for game_data in games]
+        lines = PlayerLines(games)
+
+        for milestone_key, mask, detail in _milestone_rules(lines):
+            for row in np.flatnonzero(mask).tolist():
+                engines[lines.game_index[row]].milestones[milestone_key].append({
+                    **lines.milestone_base(row),
+                    'detail': detail(lines.player(row), lines.row_stats(row)),
+                })
+
+        for engine in engines:
+            engine._calculate_game_stats()
+            engine.game_data['milestone_stats'] = engine.milestones
+            engine.game_data['game_stats'] = engine.game_stats
+        return games
+
     def _calculate_game_stats(self):
         """Calculate game-level advanced stats."""
         box_score = self.game_data.get('box_score', {})
@@ -123,257 +153,8 @@ class MilestoneEngine:
             # Store game minutes
             self.game_stats['game_minutes'] = game_minutes
 
-    def _process_player_milestones(self):
-        """Check individual player achievements for both teams."""
-        basic_info = self.game_data.get('basic_info', {})
-
-        for side in ['away', 'home']:
-            players = self.game_data.get('box_score', {}).get(side, {}).get('players', [])
-            if not players:
-                # Fallback to basic stats
-                players = self.game_data.get('box_score', {}).get(side, {}).get('basic', [])
-
-            team_name = basic_info.get(f'{side}_team', '')
-            opponent = basic_info.get('home_team' if side == 'away' else 'away_team', '')
-
-            for player in players:
-                self._check_player_milestones(player, team_name, opponent, side)
-
-    def _add_milestone(
-        self,
-        milestone_key: str,
-        milestone_base: Dict[str, Any],
-        detail: str
-    ) -> None:
-        """Add a milestone entry to the milestones dict."""
-        self.milestones[milestone_key].append({
-            **milestone_base,
-            'detail': detail,
-        })
-
-    def _check_simple_thresholds(
-        self,
-        stats: Dict[str, int],
-        milestone_base: Dict[str, Any]
-    ) -> None:
-        """Check all simple single-stat thresholds from config."""
-        for category, thresholds in MILESTONE_STAT_CONFIGS.items():
-            for milestone_key, stat_name, min_val, max_val, detail_template in thresholds:
-                stat_value = stats.get(stat_name, 0)
-                # Check if stat meets threshold
-                if stat_value >= min_val:
-                    # Check max_val if specified (for range-based milestones)
-                    if max_val is None or stat_value <= max_val:
-                        detail = detail_template.format(value=stat_value)
-                        self._add_milestone(milestone_key, milestone_base, detail)
-
-    def _check_player_milestones(self, player: Dict[str, Any], team: str, opponent: str, side: str):
-        """Check all milestones for a single player."""
-        player_name = player.get('name', '')
-        player_id = player.get('player_id', '')
-
-        pts = safe_int(player.get('pts', 0))
-        trb = safe_int(player.get('trb', 0))
-        ast = safe_int(player.get('ast', 0))
-        stl = safe_int(player.get('stl', 0))
-        blk = safe_int(player.get('blk', 0))
-        tov = safe_int(player.get('tov', 0))
-        fg3 = safe_int(player.get('fg3', 0))
-        fg3a = safe_int(player.get('fg3a', 0))
-        fg = safe_int(player.get('fg', 0))
-        fga = safe_int(player.get('fga', 0))
-        ft = safe_int(player.get('ft', 0))
-        fta = safe_int(player.get('fta', 0))
-
-        # Get minutes played
-        mp = player.get('mp', 0)
-        if isinstance(mp, str) and ':' in mp:
-            parts = mp.split(':')
-            minutes = int(parts[0]) + int(parts[1]) / 60.0
-        else:
-            minutes = safe_float(mp)
-
-        milestone_base = {
-            'player': player_name,
-            'player_id': player_id,
-            'team': team,
-            'opponent': opponent,
-            'side': side,
-            'stats': {
-                'pts': pts, 'trb': trb, 'ast': ast, 'stl': stl, 'blk': blk,
-                'fg3': fg3, 'fg': fg, 'fga': fga, 'ft': ft, 'fta': fta, 'tov': tov,
-            }
-        }
-
-        # Count categories with 10+, 8+, 5+
-        categories_10 = sum([pts >= 10, trb >= 10, ast >= 10, stl >= 10, blk >= 10])
-        categories_8 = sum([pts >= 8, trb >= 8, ast >= 8, stl >= 8, blk >= 8])
-        categories_5 = sum([pts >= 5, trb >= 5, ast >= 5, stl >= 5, blk >= 5])
-
-        # ===================
-        # MULTI-CATEGORY ACHIEVEMENTS
-        # ===================
-
-        # Quadruple-double (extremely rare)
-        if categories_10 >= 4:
-            categories = get_double_double_categories(player)
-            self.milestones['quadruple_double'].append({
-                **milestone_base,
-                'detail': categories,
-            })
-
-        # Triple-double
-        if is_triple_double(player):
-            categories = get_double_double_categories(player)
-            self.milestones['triple_doubles'].append({
-                **milestone_base,
-                'detail': categories,
-            })
-
-        # Double-double
-        if is_double_double(player):
-            categories = get_double_double_categories(player)
-            self.milestones['double_doubles'].append({
-                **milestone_base,
-                'detail': categories,
-            })
-
-        # Near triple-double (has 2 categories with 10+ and 1 with 8-9)
-        if categories_10 == 2 and categories_8 >= 3 and not is_triple_double(player):
-            detail = self._get_near_triple_double_detail(player)
-            self.milestones['near_triple_doubles'].append({
-                **milestone_base,
-                'detail': detail,
-            })
-
-        # Near double-double
-        if is_near_double_double(player):
-            detail = get_near_double_double_detail(player)
-            self.milestones['near_double_doubles'].append({
-                **milestone_base,
-                'detail': detail,
-            })
-
-        # 5x5 (5+ in all 5 categories) - very rare
-        if categories_5 >= 5:
-            self.milestones['five_by_five'].append({
-                **milestone_base,
-                'detail': f'{pts}p/{trb}r/{ast}a/{stl}s/{blk}b',
-            })
-
-        # All-around game (5+ in 5 categories or 8+ in 4)
-        if categories_5 >= 5 or (categories_8 >= 4 and not is_triple_double(player)):
-            self.milestones['all_around_game'].append({
-                **milestone_base,
-                'detail': f'{pts}p/{trb}r/{ast}a/{stl}s/{blk}b',
-            })
-
-        # ===================
-        # SIMPLE STAT THRESHOLDS (config-driven)
-        # Scoring, rebounding, assists, blocks, steals, three-pointers
-        # ===================
-        simple_stats = {
-            'pts': pts, 'trb': trb, 'ast': ast,
-            'blk': blk, 'stl': stl, 'fg3': fg3,
-        }
-        self._check_simple_thresholds(simple_stats, milestone_base)
-
-        # ===================
-        # DEFENSIVE MILESTONES (complex)
-        # ===================
-        # Defensive monster (7+ combined blocks + steals)
-        if blk + stl >= 7:
-            self.milestones['defensive_monster'].append({
-                **milestone_base,
-                'detail': f'{blk} blocks, {stl} steals ({blk + stl} combined)',
-            })
-
-        # ===================
-        # THREE-POINTER MILESTONES (complex)
-        # ===================
-        # Perfect from three (100% with 4+ attempts)
-        if fg3a >= 4 and fg3 == fg3a:
-            self.milestones['perfect_from_three'].append({
-                **milestone_base,
-                'detail': f'{fg3}/{fg3a} 3PT (100%)',
-            })
-
-        # ===================
-        # EFFICIENCY MILESTONES
-        # ===================
-        if is_hot_shooting(player,
-                           min_fga=MILESTONE_THRESHOLDS['hot_shooting_min_fga'],
-                           min_pct=MILESTONE_THRESHOLDS['hot_shooting_pct']):
-            fg_pct = round(fg / fga * 100, 1) if fga > 0 else 0
-            self.milestones['hot_shooting_games'].append({
-                **milestone_base,
-                'detail': f'{fg}/{fga} FG ({fg_pct}%)',
-            })
-
-        if is_perfect_ft(player):
-            self.milestones['perfect_ft_games'].append({
-                **milestone_base,
-                'detail': f'{ft}/{fta} FT (100%)',
-            })
-
-        # Perfect FG (100% with 5+ attempts)
-        if fga >= 5 and fg == fga:
-            self.milestones['perfect_fg_games'].append({
-                **milestone_base,
-                'detail': f'{fg}/{fga} FG (100%)',
-            })
-
-        # Efficient scoring (65%+ TS with 15+ pts)
-        ts_denom = 2 * (fga + 0.44 * fta)
-        ts_pct = (pts / ts_denom) if ts_denom > 0 else 0
-        if pts >= 15 and ts_pct >= 0.65:
-            self.milestones['efficient_scoring'].append({
-                **milestone_base,
-                'detail': f'{pts} pts on {round(ts_pct * 100, 1)}% TS',
-            })
-
-        # ===================
-        # COMBINED MILESTONES
-        # ===================
-        # 30-10 games
-        if pts >= 30 and trb >= 10:
-            self.milestones['thirty_ten_games'].append({
-                **milestone_base,
-                'detail': f'{pts} pts, {trb} reb',
-            })
-
-        # 20-10-5 games
-        if pts >= 20 and trb >= 10 and ast >= 5:
-            self.milestones['twenty_ten_five_games'].append({
-                **milestone_base,
-                'detail': f'{pts} pts, {trb} reb, {ast} ast',
-            })
-
-        # 20-10 games (includes 20-10-5 games too)
-        if pts >= 20 and trb >= 10:
-            self.milestones['twenty_ten_games'].append({
-                **milestone_base,
-                'detail': f'{pts} pts, {trb} reb',
-            })
-
-        # Points-assists double-double (10+ pts, 10+ ast)
-        if pts >= 10 and ast >= 10:
-            self.milestones['points_assists_dd'].append({
-                **milestone_base,
-                'detail': f'{pts} pts, {ast} ast',
-            })
-
-        # ===================
-        # CLEAN GAMES
-        # ===================
-        # Zero turnover game (with significant playing time)
-        if tov == 0 and minutes >= 20:
-            self.milestones['zero_turnover_games'].append({
-                **milestone_base,
-                'detail': f'{int(minutes)} min, 0 turnovers',
-            })
-
-    def _get_near_triple_double_detail(self, player: Dict[str, Any]) -> str:
+    @staticmethod
+    def _get_near_triple_double_detail(player: Dict[str, Any]) -> str:
         """Get detail string for near triple-double."""
         pts = safe_int(player.get('pts', 0))
         trb = safe_int(player.get('trb', 0))
@@ -396,3 +177,191 @@ class MilestoneEngine:
             return f"{', '.join(parts)} (needed {needed} more {closest[0].lower()})"
 
         return ', '.join(parts)
+
+
+# Box score columns in the batch stats matrix
+LINE_STATS = ('pts', 'trb', 'ast', 'stl', 'blk', 'tov', 'fg3', 'fg3a', 'fg', 'fga', 'ft', 'fta')
+
+# Stats available to MILESTONE_STAT_CONFIGS (others count as 0)
+SIMPLE_THRESHOLD_STATS = ('pts', 'trb', 'ast', 'blk', 'stl', 'fg3')
+
+
+def _line_int(value: Any) -> int:
+    # Cached box scores are almost all ints already
+    return value if type(value) is int else safe_int(value)
+
+
+def _minutes_played(mp: Any) -> float:
+    if isinstance(mp, str) and ':' in mp:
+        parts = mp.split(':')
+        return int(parts[0]) + int(parts[1]) / 60.0
+    return safe_float(mp)
+
+
+class PlayerLines:
+    """
+    Player box score lines from one or more games as a stats matrix.
+
+    Rows are player lines in game order, away team first. Each LINE_STATS column is an int64 array
+    converted with safe_int; minutes and fg_pct are float arrays.
+    """
+
+    def __init__(self, games: List[Dict[str, Any]]):
+        self._players: List[Dict[str, Any]] = []
+        self._teams: List[Tuple[str, str, str]] = []  # (team, opponent, side)
+        self.game_index: List[int] = []
+
+        for index, game_data in enumerate(games):
+            basic_info = game_data.get('basic_info', {})
+            box_score = game_data.get('box_score', {})
+            for side in ['away', 'home']:
+                players = box_score.get(side, {}).get('players', [])
+                if not players:
+                    # Fallback to basic stats
+                    players = box_score.get(side, {}).get('basic', [])
+                team = (
+                    basic_info.get(f'{side}_team', ''),
+                    basic_info.get('home_team' if side == 'away' else 'away_team', ''),
+                    side,
+                )
+                self._players.extend(players)
+                self._teams.extend([team] * len(players))
+                self.game_index.extend([index] * len(players))
+
+        count = len(self._players)
+        self.stats: Dict[str, np.ndarray] = {
+            stat: np.fromiter((_line_int(p.get(stat, 0)) for p in self._players), dtype=np.int64, count=count)
+            for stat in LINE_STATS
+        }
+        self._columns = {stat: column.tolist() for stat, column in self.stats.items()}
+        self.minutes = np.fromiter((_minutes_played(p.get('mp', 0)) for p in self._players),
+                                   dtype=np.float64, count=count)
+        self.fg_pct = np.fromiter((safe_float(p.get('fg_pct', 0)) for p in self._players),
+                                  dtype=np.float64, count=count)
+        self._row_stats: Dict[int, Dict[str, Any]] = {}
+        self._bases: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def player(self, row: int) -> Dict[str, Any]:
+        """The player dict for a row."""
+        return self._players[row]
+
+    def row_stats(self, row: int) -> Dict[str, Any]:
+        """The row's stats as Python numbers, plus 'minutes'."""
+        values = self._row_stats.get(row)
+        if values is None:
+            values = self._row_stats[row] = {stat: column[row] for stat, column in self._columns.items()}
+            values['minutes'] = float(self.minutes[row])
+        return values
+
+    def milestone_base(self, row: int) -> Dict[str, Any]:
+        """The milestone entry fields shared by every milestone of a row."""
+        base = self._bases.get(row)
+        if base is None:
+            player = self._players[row]
+            team, opponent, side = self._teams[row]
+            stats = self.row_stats(row)
+            base = self._bases[row] = {
+                'player': player.get('name', ''),
+                'player_id': player.get('player_id', ''),
+                'team': team,
+                'opponent': opponent,
+                'side': side,
+                'stats': {
+                    stat: stats[stat]
+                    for stat in ('pts', 'trb', 'ast', 'stl', 'blk', 'fg3', 'fg', 'fga', 'ft', 'fta', 'tov')
+                },
+            }
+        return base
+
+
+MilestoneRule = Tuple[str, np.ndarray, Callable[[Dict[str, Any], Dict[str, Any]], str]]
+
+
+def _milestone_rules(lines: PlayerLines) -> List[MilestoneRule]:
+    """
+    Milestone masks over a stats matrix.
+
+    One (milestone_key, mask, detail) per milestone, where detail builds the
+    entry's detail string from the player dict and row stats. Within a key,
+    entries follow row order.
+    """
+    s = lines.stats
+    pts, trb, ast, stl, blk = s['pts'], s['trb'], s['ast'], s['stl'], s['blk']
+    fg, fga, fg3, fg3a, ft, fta = s['fg'], s['fga'], s['fg3'], s['fg3a'], s['ft'], s['fta']
+    core = np.stack([pts, trb, ast, stl, blk])
+    categories_10 = (core >= 10).sum(axis=0)
+    categories_8 = (core >= 8).sum(axis=0)
+    categories_5 = (core >= 5).sum(axis=0)
+    near_10 = ((core >= 8) & (core < 10)).sum(axis=0)
+    double_double = categories_10 >= 2
+    triple_double = categories_10 >= 3
+
+    # is_hot_shooting: fg_pct from the box score, or computed when missing
+    computed_pct = np.divide(fg, fga, out=np.zeros(len(lines)), where=fga > 0)
+    fg_pct = np.where((lines.fg_pct == 0) & (fga > 0), computed_pct, lines.fg_pct)
+    ts_denom = 2 * (fga + 0.44 * fta)
+    ts_pct = np.divide(pts, ts_denom, out=np.zeros(len(lines)), where=ts_denom > 0)
+
+    def categories(player, v):
+        return get_double_double_categories(player)
+
+    def line(player, v):
+        return f"{v['pts']}p/{v['trb']}r/{v['ast']}a/{v['stl']}s/{v['blk']}b"
+
+    def threshold_detail(stat_name: str, template: str) -> Callable[[Dict[str, Any], Dict[str, Any]], str]:
+        def detail(player, v):
+            return template.format(value=v[stat_name] if stat_name in SIMPLE_THRESHOLD_STATS else 0)
+        return detail
+
+    rules: List[MilestoneRule] = [
+        # Multi-category achievements
+        ('quadruple_double', categories_10 >= 4, categories),
+        ('triple_doubles', triple_double, categories),
+        ('double_doubles', double_double, categories),
+        ('near_triple_doubles', (categories_10 == 2) & (categories_8 >= 3),
+         lambda player, v: MilestoneEngine._get_near_triple_double_detail(player)),
+        ('near_double_doubles', ~double_double & (categories_10 >= 1) & (near_10 >= 1),
+         lambda player, v: get_near_double_double_detail(player)),
+        ('five_by_five', categories_5 >= 5, line),
+        ('all_around_game', (categories_5 >= 5) | ((categories_8 >= 4) & ~triple_double), line),
+    ]
+
+    # Simple stat thresholds (config-driven)
+    zeros = np.zeros(len(lines), dtype=np.int64)
+    for thresholds in MILESTONE_STAT_CONFIGS.values():
+        for milestone_key, stat_name, min_val, max_val, detail_template in thresholds:
+            values = s[stat_name] if stat_name in SIMPLE_THRESHOLD_STATS else zeros
+            mask = values >= min_val
+            if max_val is not None:
+                mask &= values <= max_val
+            rules.append((milestone_key, mask, threshold_detail(stat_name, detail_template)))
+
+    rules += [
+        ('defensive_monster', blk + stl >= 7,
+         lambda player, v: f"{v['blk']} blocks, {v['stl']} steals ({v['blk'] + v['stl']} combined)"),
+        ('perfect_from_three', (fg3a >= 4) & (fg3 == fg3a),
+         lambda player, v: f"{v['fg3']}/{v['fg3a']} 3PT (100%)"),
+        ('hot_shooting_games',
+         (fga >= MILESTONE_THRESHOLDS['hot_shooting_min_fga']) & (fg_pct >= MILESTONE_THRESHOLDS['hot_shooting_pct']),
+         lambda player, v: f"{v['fg']}/{v['fga']} FG ({round(v['fg'] / v['fga'] * 100, 1) if v['fga'] > 0 else 0}%)"),
+        ('perfect_ft_games', (ft >= 5) & (ft == fta),
+         lambda player, v: f"{v['ft']}/{v['fta']} FT (100%)"),
+        ('perfect_fg_games', (fga >= 5) & (fg == fga),
+         lambda player, v: f"{v['fg']}/{v['fga']} FG (100%)"),
+        ('efficient_scoring', (pts >= 15) & (ts_pct >= 0.65),
+         lambda player, v: f"{v['pts']} pts on {round(v['pts'] / (2 * (v['fga'] + 0.44 * v['fta'])) * 100, 1)}% TS"),
+        ('thirty_ten_games', (pts >= 30) & (trb >= 10),
+         lambda player, v: f"{v['pts']} pts, {v['trb']} reb"),
+        ('twenty_ten_five_games', (pts >= 20) & (trb >= 10) & (ast >= 5),
+         lambda player, v: f"{v['pts']} pts, {v['trb']} reb, {v['ast']} ast"),
+        ('twenty_ten_games', (pts >= 20) & (trb >= 10),
+         lambda player, v: f"{v['pts']} pts, {v['trb']} reb"),
+        ('points_assists_dd', (pts >= 10) & (ast >= 10),
+         lambda player, v: f"{v['pts']} pts, {v['ast']} ast"),
+        ('zero_turnover_games', (s['tov'] == 0) & (lines.minutes >= 20),
+         lambda player, v: f"{int(v['minutes'])} min, 0 turnovers"),
+    ]
+    return rules
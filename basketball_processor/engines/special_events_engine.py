@@ -5,6 +5,9 @@ Special events detection engine for basketball games.
 from typing import Dict, Any, List
 from ..utils.helpers import safe_int
 
+# Bump when detection logic changes so cached special_events are re-run
+ENGINE_VERSION = 1
+
 
 class SpecialEventsEngine:
     """Detect special events during games."""
@@ -2,7 +2,7 @@
 Excel formatting utilities for the basketball processor.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, Tuple
 import pandas as pd
 
 from ..utils.constants import EXCEL_COLORS
@@ -30,13 +30,10 @@ def get_default_format(workbook) -> Any:
     })
 
 
-def get_alt_row_format(workbook) -> Any:
-    """Get alternating row format."""
+def get_alt_row_band_format(workbook) -> Any:
+    """Get the fill-only format used by the alternating-row conditional format."""
     return workbook.add_format({
         'bg_color': EXCEL_COLORS['alt_row'],
-        'border': 1,
-        'align': 'center',
-        'valign': 'vcenter',
     })
 
 
@@ -207,21 +204,59 @@ def format_worksheet(worksheet, workbook, df: pd.DataFrame,
         width = get_column_width(col_name)
         worksheet.set_column(col_idx, col_idx, width)
 
-    # Apply header format
-    header_format = get_header_format(workbook)
-    for col_idx, col_name in enumerate(df.columns):
-        worksheet.write(0, col_idx, col_name, header_format)
+    # Apply header format and write data rows with alternating row colors
+    _write_header_row(worksheet, workbook, df)
+    _write_data_rows(worksheet, workbook, df)
+
+
+def iter_dataframe_rows(df: pd.DataFrame) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield DataFrame rows as tuples of cell values for writing.
+
+    Missing values (NaN/None/NA) become ''. Only columns that have missing
+    values are converted, once per column; rows are then streamed with
+    itertuples, so no second copy of the sheet is built as row lists.
+
+    Args:
+        df: DataFrame to convert
 
-    # Apply alternating row colors for data rows
+    Returns:
+        Iterator of rows, each a tuple of cell values in column order
+    """
+    missing = df.isna()
+    missing_columns = [i for i, has_missing in enumerate(missing.any().tolist()) if has_missing]
+    if missing_columns:
+        # Positional labels, so duplicate column names are replaced independently
+        df = df.set_axis(range(len(df.columns)), axis=1)
+        for i in missing_columns:
+            df[i] = df[i].astype(object).where(~missing.iloc[:, i].to_numpy(), '')
+    return df.itertuples(index=False, name=None)
+
+
+def _write_header_row(worksheet, workbook, df: pd.DataFrame) -> None:
+    """Write the column names as a formatted header row."""
+    worksheet.write_row(0, 0, list(df.columns), get_header_format(workbook))
+
+
+def _write_data_rows(worksheet, workbook, df: pd.DataFrame) -> None:
+    """
+    Write DataFrame rows starting at row 1 with alternating row colors.
+
+    Every row uses the default format; banding is applied with a single
+    conditional format over the data range instead of per-cell formats.
+    """
     default_format = get_default_format(workbook)
-    alt_format = get_alt_row_format(workbook)
 
-    for row_idx in range(1, len(df) + 1):
-        row_format = alt_format if row_idx % 2 == 0 else default_format
-        for col_idx in range(len(df.columns)):
-            # Get the value from the DataFrame
-            value = df.iloc[row_idx - 1, col_idx]
-            worksheet.write(row_idx, col_idx, value, row_format)
+    for row_idx, row in enumerate(iter_dataframe_rows(df), start=1):
+        worksheet.write_row(row_idx, 0, row, default_format)
+
+    if len(df) >= 2:
+        # Even row_idx (0-based) == odd Excel ROW()
+        worksheet.conditional_format(1, 0, len(df), len(df.columns) - 1, {
+            'type': 'formula',
+            'criteria': '=MOD(ROW(),2)=1',
+            'format': get_alt_row_band_format(workbook),
+        })
 
 
 def write_dataframe_to_sheet(workbook, sheet_name: str, df: pd.DataFrame,
@@ -245,23 +280,9 @@ def write_dataframe_to_sheet(workbook, sheet_name: str, df: pd.DataFrame,
 
     worksheet = workbook.add_worksheet(sheet_name)
 
-    # Write headers
-    header_format = get_header_format(workbook)
-    for col_idx, col_name in enumerate(df.columns):
-        worksheet.write(0, col_idx, col_name, header_format)
-
-    # Write data with alternating row colors
-    default_format = get_default_format(workbook)
-    alt_format = get_alt_row_format(workbook)
-
-    for row_idx, (_, row) in enumerate(df.iterrows(), start=1):
-        row_format = alt_format if row_idx % 2 == 0 else default_format
-        for col_idx, value in enumerate(row):
-            # Handle NaN/None values
-            if pd.isna(value):
-                worksheet.write(row_idx, col_idx, '', row_format)
-            else:
-                worksheet.write(row_idx, col_idx, value, row_format)
+    # Write headers, then data with alternating row colors
+    _write_header_row(worksheet, workbook, df)
+    _write_data_rows(worksheet, workbook, df)
 
     if format_sheet:
         # Freeze header row
@@ -8,17 +8,23 @@ import pandas as pd
 import xlsxwriter
 
 from .formatters import write_dataframe_to_sheet
+from ..processors.game_frame import GameFrame
 from ..processors.player_stats_processor import PlayerStatsProcessor
 from ..processors.milestones_processor import MilestonesProcessor, OvertimeGamesProcessor, BlowoutGamesProcessor
 from ..processors.team_records_processor import TeamRecordsProcessor, GameLogProcessor
-from ..utils.log import info
+from ..processors.aggregation_store import process_games_incremental, diff_processed_data
+from ..utils.log import info, warn
 from ..utils.venue_resolver import resolve_venue
 
 
 def generate_excel_workbook(
     games: List[Dict[str, Any]],
     output_path: str,
-    write_file: bool = True
+    write_file: bool = True,
+    constant_memory: bool = False,
+    incremental: bool = False,
+    rebuild_store: bool = False,
+    verify_store: bool = False
 ) -> Dict[str, Any]:
     """
     Generate Excel workbook from parsed games data.
@@ -27,6 +33,13 @@ def generate_excel_workbook(
         games: List of parsed game dictionaries
         output_path: Path to save the Excel file
         write_file: Whether to actually write the file (False for website-only mode)
+        constant_memory: Use xlsxwriter's constant_memory mode, which flushes each
+            row to disk as it is written (lower peak memory for very large logs)
+        incremental: Update the persisted aggregation store with new/changed games
+            instead of re-aggregating every game
+        rebuild_store: With incremental, discard the store and rebuild it
+        verify_store: With incremental, also run the full processors and warn
+            about any table that differs
 
     Returns:
         Dictionary containing all processed DataFrames
@@ -40,17 +53,65 @@ def generate_excel_workbook(
             if resolved:
                 game['basic_info']['venue'] = resolved
 
-    # Process all data
+    if incremental:
+        info("  Updating aggregation store...")
+        processed_data = process_games_incremental(games, rebuild=rebuild_store)
+        if verify_store:
+            info("  Verifying aggregation store against a full rebuild...")
+            mismatches = diff_processed_data(processed_data, process_games(games))
+            if mismatches:
+                warn(f"  Aggregation store differs from full rebuild: {', '.join(mismatches)}")
+            else:
+                info("  Aggregation store matches full rebuild")
+    else:
+        processed_data = process_games(games)
+
+    if not write_file:
+        info("  Skipping Excel file generation (website-only mode)")
+        return processed_data
+
+    # Create workbook
+    info(f"  Writing Excel file: {output_path}")
+
+    # Ensure directory exists
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    workbook = xlsxwriter.Workbook(output_path, {'constant_memory': constant_memory})
+
+    # Write sheets in order
+    _write_sheets(workbook, processed_data)
+
+    workbook.close()
+    info(f"  Excel file saved: {output_path}")
+
+    return processed_data
+
+
+def process_games(games: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run every processor over the full game list.
+
+    Args:
+        games: List of parsed game dictionaries
+
+    Returns:
+        Dictionary containing all processed DataFrames
+    """
     processed_data = {}
 
+    # Flatten the games once; every processor reads the same tables
+    frame = GameFrame(games)
+
     # Game Log
     info("  Creating game log...")
-    game_log_processor = GameLogProcessor(games)
+    game_log_processor = GameLogProcessor(games, frame)
     processed_data['game_log'] = game_log_processor.create_game_log()
 
     # Player Stats
     info("  Processing player statistics...")
-    player_processor = PlayerStatsProcessor(games)
+    player_processor = PlayerStatsProcessor(games, frame)
     player_data = player_processor.process_all_player_stats()
     processed_data['players'] = player_data['players']
     processed_data['player_games'] = player_data['player_games']
@@ -59,21 +120,21 @@ def generate_excel_workbook(
 
     # Milestones
     info("  Processing milestones...")
-    milestones_processor = MilestonesProcessor(games)
+    milestones_processor = MilestonesProcessor(games, frame)
     milestones_data = milestones_processor.process_all_milestones()
     processed_data['milestones'] = milestones_data
 
     # Overtime games
-    ot_processor = OvertimeGamesProcessor(games)
+    ot_processor = OvertimeGamesProcessor(games, frame)
     processed_data['overtime_games'] = ot_processor.process_overtime_games()
 
     # Blowout games
-    blowout_processor = BlowoutGamesProcessor(games)
+    blowout_processor = BlowoutGamesProcessor(games, frame)
     processed_data['blowout_games'] = blowout_processor.process_blowout_games()
 
     # Team Records
     info("  Processing team records...")
-    team_processor = TeamRecordsProcessor(games)
+    team_processor = TeamRecordsProcessor(games, frame)
     team_data = team_processor.process_team_records()
     processed_data['team_records'] = team_data['team_records']
     processed_data['matchup_matrix'] = team_data['matchup_matrix']
@@ -84,26 +145,6 @@ def generate_excel_workbook(
     processed_data['home_away_splits'] = team_data.get('home_away_splits', pd.DataFrame())
     processed_data['attendance_stats'] = team_data.get('attendance_stats', pd.DataFrame())
 
-    if not write_file:
-        info("  Skipping Excel file generation (website-only mode)")
-        return processed_data
-
-    # Create workbook
-    info(f"  Writing Excel file: {output_path}")
-
-    # Ensure directory exists
-    output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-
-    workbook = xlsxwriter.Workbook(output_path)
-
-    # Write sheets in order
-    _write_sheets(workbook, processed_data)
-
-    workbook.close()
-    info(f"  Excel file saved: {output_path}")
-
     return processed_data
 
 
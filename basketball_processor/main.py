@@ -10,14 +10,22 @@ import traceback
 import re
 import shutil
 import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 
 from .excel.workbook_generator import generate_excel_workbook
 from .parsers.html_parser import parse_sports_reference_boxscore, HTMLParsingError
 from .parsers.sidearm_parser import parse_sidearm_boxscore, is_sidearm_format, SidearmParsingError
+from .parsers.backend import PARSER_BACKENDS, set_parser_backend, get_parser_backend, resolve_parser_backend
 from .utils.constants import BASE_DIR, DEFAULT_INPUT_DIR, CACHE_DIR, DEFAULT_HTML_OUTPUT, SURGE_DOMAIN
-from .utils.log import info, warn, error, success, debug, set_verbosity, set_use_emoji
+from .utils.parse_cache import get_parse_cache
+from .utils.pbp_enrichment import enrich_games_with_pbp, DEFAULT_PBP_WORKERS, SOURCE_FILE_KEY
+from .utils.derived_stats import refresh_derived_stats
+from .utils.log import (
+    info, warn, error, success, debug, set_verbosity, set_use_emoji, is_verbose, get_use_emoji
+)
 from .website import generate_website_from_data
 from .engines.milestone_engine import MilestoneEngine
 
@@ -82,21 +90,34 @@ def load_espn_cached_games(existing_game_ids: set) -> List[Dict[str, Any]]:
             # Mark as ESPN source
             game_data['_source'] = 'espn'
             game_data['basic_info']['source'] = 'espn'
+            # No parse cache entry: PBP enrichment saves back to this file
+            game_data[SOURCE_FILE_KEY] = str(cache_file)
 
             # Ensure milestone_stats exists
             if 'milestone_stats' not in game_data:
                 game_data['milestone_stats'] = {}
 
-            # Run milestone detection on ESPN data
-            milestone_engine = MilestoneEngine(game_data)
-            game_data = milestone_engine.process()
-
             espn_games.append(game_data)
             info(f"  Added ESPN game: {basic_info.get('away_team')} @ {home_team}")
 
         except Exception as e:
             warn(f"Failed to load ESPN cache {cache_file}: {e}")
 
+    # Run milestone detection on all ESPN games in one pass
+    try:
+        MilestoneEngine.process_batch(espn_games)
+    except Exception as e:
+        # Retry game by game so one bad box score only drops that game
+        warn(f"Batch milestone detection failed ({e}), processing ESPN games individually")
+        processed = []
+        for game_data in espn_games:
+            try:
+                processed.append(MilestoneEngine(game_data).process())
+            except Exception as game_error:
+                basic_info = game_data.get('basic_info', {})
+                warn(f"Failed to process ESPN game {basic_info.get('away_team')} @ {basic_info.get('home_team')}: {game_error}")
+        espn_games = processed
+
     return espn_games
 
 
@@ -106,10 +127,9 @@ def enrich_game_with_rankings(game_data: Dict[str, Any]) -> Dict[str, Any]:
     Rankings are stored in basic_info as 'away_rank' and 'home_rank'.
     """
     try:
-        from .scrapers.poll_scraper import get_rankings_for_game, load_existing_polls
+        from .scrapers.poll_scraper import get_rankings_for_game, get_poll_index
         gender = game_data.get('basic_info', {}).get('gender', 'M')
-        polls_data = load_existing_polls(gender=gender)
-        if not polls_data:
+        if not get_poll_index(gender=gender):
             return game_data
     except ImportError:
         return game_data
@@ -148,6 +168,81 @@ def enrich_game_with_rankings(game_data: Dict[str, Any]) -> Dict[str, Any]:
     return game_data
 
 
+def _get_legacy_cache_path(file_path: str) -> Path:
+    """Return the pre-content-hash cache path for an HTML file (keyed on its filename)."""
+    filename = os.path.basename(file_path)
+    filename_no_ext = os.path.splitext(filename)[0]
+    safe_filename = re.sub(r'[^\w\-_]', '_', filename_no_ext)
+    return CACHE_DIR / f"{safe_filename}.json"
+
+
+def _detect_gender(file_path: str, gender: str) -> str:
+    """Auto-detect gender from the filename, falling back to the given gender."""
+    filename_lower = os.path.basename(file_path).lower()
+    if '(women)' in filename_lower or 'women' in filename_lower or '_w_' in filename_lower or '_w.' in filename_lower:
+        return 'W'
+    elif '(men)' in filename_lower or 'men' in filename_lower or '_m_' in filename_lower or '_m.' in filename_lower:
+        return 'M'
+    return gender
+
+
+def _has_fresh_legacy_cache(file_path: str) -> bool:
+    """Return True if a filename-keyed cache entry exists and is newer than the HTML."""
+    legacy_path = _get_legacy_cache_path(file_path)
+    if not legacy_path.exists():
+        return False
+    return os.path.getmtime(file_path) <= os.path.getmtime(legacy_path)
+
+
+def _adopt_legacy_cache(file_path: str, content_hash: str, gender: str) -> Optional[Dict[str, Any]]:
+    """
+    Move a fresh filename-keyed cache entry into the content-hash cache.
+
+    Lets an existing cache directory carry over without re-parsing every file.
+
+    Returns:
+        Cached game data, or None if there is no usable legacy entry
+    """
+    if not _has_fresh_legacy_cache(file_path):
+        return None
+    legacy_path = _get_legacy_cache_path(file_path)
+    try:
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            game_data = json.load(f)
+    except (json.JSONDecodeError, IOError, OSError):
+        return None
+    get_parse_cache().store(content_hash, gender, game_data)
+    legacy_path.unlink()
+    debug(f"  Migrated cache entry {legacy_path.name}")
+    return game_data
+
+
+def _drop_legacy_cache(file_path: str) -> None:
+    """
+    Remove a filename-keyed cache entry once the file has a content-hash entry.
+
+    A stale legacy entry (HTML newer than it) is never adopted, but left in
+    place it would be loaded again by --from-cache-only next to the new entry.
+    """
+    legacy_path = _get_legacy_cache_path(file_path)
+    try:
+        legacy_path.unlink()
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        warn(f"  Could not remove old cache entry {legacy_path.name}: {e}")
+        return
+    debug(f"  Removed old cache entry {legacy_path.name}")
+
+
+def _has_fresh_cache(file_path: str, gender: str = 'M') -> bool:
+    """Return True if an HTML file can be served from cache without parsing."""
+    parse_cache = get_parse_cache()
+    detected_gender = _detect_gender(file_path, gender)
+    content_hash = parse_cache.get_content_hash(file_path)
+    return parse_cache.has_entry(content_hash, detected_gender) or _has_fresh_legacy_cache(file_path)
+
+
 def process_html_file(
     file_path: str,
     index: Optional[int] = None,
@@ -155,7 +250,7 @@ def process_html_file(
     gender: str = 'M'
 ) -> Dict[str, Any]:
     """
-    Process a single Sports Reference HTML file, with filename-based caching.
+    Process a single Sports Reference HTML file, with content-hash caching.
 
     Args:
         file_path: Path to HTML file
@@ -167,95 +262,38 @@ def process_html_file(
         Parsed game data dictionary or error dict
     """
     try:
-        # Use filename as cache key
-        filename = os.path.basename(file_path)
-        filename_no_ext = os.path.splitext(filename)[0]
-        safe_filename = re.sub(r'[^\w\-_]', '_', filename_no_ext)
-
-        cache_path = CACHE_DIR / f"{safe_filename}.json"
+        parse_cache = get_parse_cache()
+        # Auto-detect gender from filename if not explicitly set
+        detected_gender = _detect_gender(file_path, gender)
+        content_hash = parse_cache.get_content_hash(file_path)
 
         # Check cache
-        if cache_path.exists():
-            html_mtime = os.path.getmtime(file_path)
-            json_mtime = os.path.getmtime(cache_path)
-
-            if html_mtime <= json_mtime:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    cached_data['_from_cache'] = True
-                    # Normalize venue names to match current venues.json
-                    from .utils.venue_resolver import normalize_cached_venue
-                    normalized_venue = normalize_cached_venue(cached_data)
-                    if normalized_venue:
-                        cached_data['basic_info']['venue'] = normalized_venue
-
-                    # Run ESPN PBP analysis if not already present
-                    if 'espn_pbp_analysis' not in cached_data:
-                        try:
-                            from .engines.espn_pbp_engine import ESPNPlayByPlayEngine
-
-                            pbp_data = None
-
-                            # First check if we have stored PBP data (from SIDEARM embedded)
-                            if cached_data.get('espn_pbp') and cached_data['espn_pbp'].get('plays'):
-                                pbp_data = cached_data['espn_pbp']
-                            else:
-                                # Try to fetch from ESPN API for D1 games
-                                from .utils.espn_pbp_scraper import fetch_espn_play_by_play, get_espn_id_from_cache
-                                from datetime import datetime
-
-                                basic_info = cached_data.get('basic_info', {})
-                                game_gender = basic_info.get('gender', 'M')
-                                date_str = basic_info.get('date', '')
-                                away_team = basic_info.get('away_team', '')
-                                home_team = basic_info.get('home_team', '')
-
-                                # Convert date from "January 11, 2025" to "20250111" format
-                                date_yyyymmdd = ''
-                                if date_str:
-                                    try:
-                                        dt = datetime.strptime(date_str, '%B %d, %Y')
-                                        date_yyyymmdd = dt.strftime('%Y%m%d')
-                                    except ValueError:
-                                        pass
-
-                                if date_yyyymmdd:
-                                    espn_id = get_espn_id_from_cache(away_team, home_team, date_yyyymmdd, game_gender)
-                                    if espn_id:
-                                        # Pass date for ncaahoopR fallback on older games
-                                        pbp_data = fetch_espn_play_by_play(
-                                            espn_id, game_gender, verbose=False, date_yyyymmdd=date_yyyymmdd
-                                        )
-
-                            if pbp_data and pbp_data.get('plays'):
-                                engine = ESPNPlayByPlayEngine(pbp_data, cached_data)
-                                cached_data['espn_pbp_analysis'] = engine.analyze()
-                                # Save updated cache
-                                with open(cache_path, 'w', encoding='utf-8') as cf:
-                                    json.dump(cached_data, cf)
-                        except Exception:
-                            pass  # Don't fail if ESPN PBP fails
-
-                    return cached_data
+        cached_data = parse_cache.load(content_hash, detected_gender)
+        if cached_data is None:
+            cached_data = _adopt_legacy_cache(file_path, content_hash, detected_gender)
+        else:
+            _drop_legacy_cache(file_path)
+        if cached_data is not None:
+            cached_data['_from_cache'] = True
+            # Normalize venue names to match current venues.json
+            from .utils.venue_resolver import normalize_cached_venue
+            normalized_venue = normalize_cached_venue(cached_data)
+            if normalized_venue:
+                cached_data['basic_info']['venue'] = normalized_venue
+
+            # Play-by-play enrichment runs as a separate stage (see enrich_games_with_pbp)
+            return cached_data
 
         # Parse HTML (cache miss or outdated)
         with open(file_path, 'r', encoding='utf-8') as file:
             html_content = file.read()
 
-        # Auto-detect gender from filename if not explicitly set
-        detected_gender = gender
-        filename_lower = os.path.basename(file_path).lower()
-        if '(women)' in filename_lower or 'women' in filename_lower or '_w_' in filename_lower or '_w.' in filename_lower:
-            detected_gender = 'W'
-        elif '(men)' in filename_lower or 'men' in filename_lower or '_m_' in filename_lower or '_m.' in filename_lower:
-            detected_gender = 'M'
-
         # Auto-detect parser format
         if is_sidearm_format(html_content):
             debug("  Detected SIDEARM Stats format")
             game_data = parse_sidearm_boxscore(html_content, detected_gender)
         else:
-            game_data = parse_sports_reference_boxscore(html_content, detected_gender)
+            game_data = parse_sports_reference_boxscore(html_content, detected_gender, fetch_pbp=False)
         game_id = game_data.get("game_id", "UNKNOWN")
 
         debug(f"  Parsed game: {game_id}")
@@ -270,8 +308,8 @@ def process_html_file(
         game_data = enrich_game_with_rankings(game_data)
 
         # Save to cache
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(game_data, f, indent=2)
+        parse_cache.store(content_hash, detected_gender, game_data)
+        _drop_legacy_cache(file_path)
 
         # Copy HTML file to html_games directory if not already there
         html_games_dir = os.path.join(BASE_DIR, 'html_games')
@@ -298,19 +336,84 @@ def process_html_file(
         return {"_error": True, "file": file_path, "error": str(e)}
 
 
-def process_directory_or_file(input_path: str, gender: str = 'M') -> List[Dict[str, Any]]:
+def _init_parse_worker(verbose: bool, use_emoji: bool, parser_backend: str) -> None:
+    """Apply the parent's logging and parser configuration inside a pool worker process."""
+    set_verbosity(verbose)
+    set_use_emoji(use_emoji)
+    set_parser_backend(parser_backend)
+
+
+def _iter_parallel_results(
+    file_paths: List[str],
+    gender: str,
+    jobs: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Process HTML files using a process pool for cache misses.
+
+    Files with a fresh cache entry are loaded in this process (cheap JSON reads),
+    while files that need a full parse are sent to worker processes. Results are
+    yielded in the same order as file_paths regardless of completion order.
+
+    Args:
+        file_paths: Ordered list of HTML file paths
+        gender: 'M' for men's, 'W' for women's
+        jobs: Maximum number of worker processes
+
+    Yields:
+        Parsed game data dictionary or error dict for each file, in input order
+    """
+    total = len(file_paths)
+    misses = [path for path in file_paths if not _has_fresh_cache(path, gender)]
+    # Persist hashes computed above so workers don't re-hash the same files
+    get_parse_cache().save_manifest()
+    if not misses:
+        for idx, file_path in enumerate(file_paths, start=1):
+            yield process_html_file(file_path, idx, total, gender)
+        return
+
+    workers = min(jobs, len(misses))
+    debug(f"  Parsing {len(misses)} uncached file(s) with {workers} worker(s)")
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parse_worker,
+        initargs=(is_verbose(), get_use_emoji(), get_parser_backend()),
+    ) as executor:
+        futures = {
+            path: executor.submit(process_html_file, path, None, None, gender)
+            for path in misses
+        }
+        for idx, file_path in enumerate(file_paths, start=1):
+            future = futures.get(file_path)
+            if future is None:
+                yield process_html_file(file_path, idx, total, gender)
+                continue
+            try:
+                yield future.result()
+            except Exception as e:
+                # Worker crashed or result could not be pickled
+                error(f"Worker failed on {file_path}: {e}")
+                yield {"_error": True, "file": file_path, "error": str(e)}
+
+
+def process_directory_or_file(input_path: str, gender: str = 'M', jobs: int = 1) -> List[Dict[str, Any]]:
     """
     Process HTML files from directory or single file.
 
     Args:
         input_path: Path to file or directory
         gender: Gender filter
+        jobs: Number of worker processes for parsing uncached files (1 = serial)
 
     Returns:
         List of parsed game dictionaries
     """
     all_games_data = []
     failed_files = []
+    cached_count = 0
+    parsed_count = 0
+    start_time = time.perf_counter()
 
     if os.path.isfile(input_path):
         if input_path.endswith('.html'):
@@ -324,16 +427,20 @@ def process_directory_or_file(input_path: str, gender: str = 'M') -> List[Dict[s
             warn(f"File must be an HTML file: {input_path}")
 
     elif os.path.isdir(input_path):
-        html_files = [f for f in os.listdir(input_path) if f.endswith('.html')]
-        total = len(html_files)
+        html_files = sorted(f for f in os.listdir(input_path) if f.endswith('.html'))
+        file_paths = [os.path.join(input_path, filename) for filename in html_files]
+        total = len(file_paths)
         info(f"Processing {total} HTML files...")
 
-        cached_count = 0
-        parsed_count = 0
+        if jobs > 1 and total > 1:
+            results = _iter_parallel_results(file_paths, gender, jobs)
+        else:
+            results = (
+                process_html_file(file_path, idx, total, gender)
+                for idx, file_path in enumerate(file_paths, start=1)
+            )
 
-        for idx, filename in enumerate(html_files, start=1):
-            file_path = os.path.join(input_path, filename)
-            game_data = process_html_file(file_path, idx, total, gender)
+        for idx, game_data in enumerate(results, start=1):
             if game_data:
                 if game_data.get("_error"):
                     failed_files.append(game_data)
@@ -352,13 +459,18 @@ def process_directory_or_file(input_path: str, gender: str = 'M') -> List[Dict[s
         warn(f"Invalid path: {input_path}")
         return []
 
+    get_parse_cache().save_manifest()
+
+    # Cached games detected under other thresholds are re-run from their box scores
+    refresh_derived_stats(all_games_data)
+
     # Summary line
     summary_parts = [f"{len(all_games_data)} games"]
     if cached_count > 0:
         summary_parts.append(f"{cached_count} cached")
     if parsed_count > 0:
-        summary_parts.append(f"{parsed_count} parsed")
-    info(f"Loaded {', '.join(summary_parts)}")
+        summary_parts.append(f"{parsed_count} parsed with {resolve_parser_backend()}")
+    info(f"Loaded {', '.join(summary_parts)} in {time.perf_counter() - start_time:.1f}s")
 
     # Report failed files
     if failed_files:
@@ -456,6 +568,51 @@ def _deploy_to_surge(html_path: str) -> None:
         warn(f"OS error during deployment: {e}")
 
 
+def _publish_background_lookups(processed_data: Dict[str, Any], output_html: str, deploy: bool) -> None:
+    """
+    Wait for background pro status lookups, then regenerate (and redeploy) the website.
+
+    Results are checkpointed, so Ctrl+C keeps what has been looked up and the
+    rest resumes next run; the site is then left as first generated.
+    """
+    from .utils.nba_players import background_lookups_started, wait_for_background_lookups
+    if not background_lookups_started():
+        return
+    info("Waiting for background pro status lookups to finish...")
+    try:
+        wait_for_background_lookups()
+    except KeyboardInterrupt:
+        warn("Stopped waiting; remaining lookups will resume next run")
+        return
+
+    # Everything is cached now, so regenerate without any new lookups
+    generate_website_from_data(processed_data, output_html, skip_nba=True)
+    if deploy:
+        _deploy_to_surge(output_html)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for --pbp-workers: a whole number >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or greater, got {number}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for --jobs: a whole number >= 0 (0 = all cores)."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="College Basketball Game Processor - Parse HTML box scores and generate statistics"
@@ -517,6 +674,12 @@ def main() -> None:
         action='store_true',
         help='Run NBA/WNBA player lookups (skipped by default during season)'
     )
+    parser.add_argument(
+        '--nba-background',
+        action='store_true',
+        help='With --check-nba, look up new players in the background; the website is '
+             'regenerated (and redeployed) once they finish'
+    )
     parser.add_argument(
         '--no-deploy',
         action='store_true',
@@ -548,12 +711,56 @@ def main() -> None:
         action='store_true',
         help='Backfill draft info for all confirmed NBA/WNBA players'
     )
+    parser.add_argument(
+        '--excel-constant-memory',
+        action='store_true',
+        help='Write the Excel workbook in constant-memory mode (for very large game logs)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Update the persisted aggregation store instead of re-aggregating every game'
+    )
+    parser.add_argument(
+        '--rebuild-store',
+        action='store_true',
+        help='With --incremental, discard the aggregation store and rebuild it from all games'
+    )
+    parser.add_argument(
+        '--verify-store',
+        action='store_true',
+        help='With --incremental, compare the store output against a full rebuild'
+    )
+    parser.add_argument(
+        '--parser-backend',
+        choices=PARSER_BACKENDS,
+        default='auto',
+        help='HTML tree builder for box scores (default: auto = lxml if installed, else html.parser)'
+    )
+    parser.add_argument(
+        '--no-pbp',
+        action='store_true',
+        help='Skip the play-by-play enrichment stage (no ESPN/SIDEARM requests)'
+    )
+    parser.add_argument(
+        '--pbp-workers',
+        type=_positive_int,
+        default=DEFAULT_PBP_WORKERS,
+        help=f'Concurrent play-by-play lookups (default: {DEFAULT_PBP_WORKERS}; per-site rate limits still apply)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=_non_negative_int,
+        default=1,
+        help='Number of worker processes for parsing uncached HTML files (default: 1, 0 = all cores)'
+    )
 
     args = parser.parse_args()
 
     # Configure logging
     set_verbosity(args.verbose)
     set_use_emoji(not args.no_emoji)
+    set_parser_backend(args.parser_backend)
     if args.log_file:
         from .utils.log import set_log_file
         set_log_file(args.log_file)
@@ -598,48 +805,69 @@ def main() -> None:
     if args.from_cache_only:
         info("Loading games from cache only...")
         from .utils.venue_resolver import normalize_cached_venue
-        games_data = []
-        skipped_files = 0
-        error_files = []
-        # Skip non-game cache files (metadata caches that don't contain game data)
-        skip_files = {
-            'nba_lookup_cache.json', 'nba_api_cache.json', 'schedule_cache.json',
-            'proballers_cache.json', 'poll_cache.json', 'conferences_cache.json'
-        }
-        for file in CACHE_DIR.glob("*.json"):
-            if file.name in skip_files:
-                skipped_files += 1
-                continue
+        from .utils.game_archive import (
+            GameArchive, ARCHIVE_FILE, load_archived_games, list_cache_sources, source_signature,
+        )
+        # The archive remembers which cache files hold games and which are
+        # other caches (lookups, manifests), so only new or changed files matter
+        games_data, cache_sources, rejected_files = load_archived_games(CACHE_DIR)
+        write_archive = games_data is None
+        if games_data is not None:
+            debug(f"Loaded {len(games_data)} games from {ARCHIVE_FILE.name}")
+        else:
+            games_data = []
+            game_files = []
+            rejected_files = []
+            error_files = []
+            for file in list_cache_sources(CACHE_DIR):
+                try:
+                    with open(file, 'r', encoding='utf-8') as f:
+                        game = json.load(f)
+                    # Validate this looks like a game file (has basic_info with required fields)
+                    basic_info = game.get('basic_info') if isinstance(game, dict) else None
+                    if not basic_info or not isinstance(basic_info, dict):
+                        rejected_files.append(file.name)
+                        continue
+                    # Skip if missing essential game fields
+                    if not basic_info.get('home_team') or not basic_info.get('away_team'):
+                        rejected_files.append(file.name)
+                        continue
+                    games_data.append(game)
+                    game_files.append(file)
+                except json.JSONDecodeError as e:
+                    error_files.append(f"{file.name}: JSON parse error - {e}")
+                except Exception as e:
+                    error_files.append(f"{file.name}: {e}")
+            if error_files:
+                warn(f"Failed to load {len(error_files)} cache file(s):")
+                for err in error_files[:5]:  # Show first 5 errors
+                    warn(f"  - {err}")
+                if len(error_files) > 5:
+                    warn(f"  ... and {len(error_files) - 5} more")
+            # Files that failed to load are in neither list, so they are read again next run
+            cache_sources = source_signature(game_files)
+        # Games detected under other thresholds are re-run from their box scores
+        # and written back to their cache files, which the archive must then cover
+        if refresh_derived_stats(games_data)['refreshed']:
+            cache_sources = source_signature([CACHE_DIR / name for name in cache_sources])
+            write_archive = True
+        if write_archive:
+            # Pack the games so the next cache-only run is a single read
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    game = json.load(f)
-                # Validate this looks like a game file (has basic_info with required fields)
-                basic_info = game.get('basic_info')
-                if not basic_info or not isinstance(basic_info, dict):
-                    skipped_files += 1
-                    continue
-                # Skip if missing essential game fields
-                if not basic_info.get('home_team') or not basic_info.get('away_team'):
-                    skipped_files += 1
-                    continue
-                # Normalize venue names to match current venues.json
-                # This handles arena renames while preserving neutral site venues
-                normalized_venue = normalize_cached_venue(game)
-                if normalized_venue:
-                    basic_info['venue'] = normalized_venue
-                games_data.append(game)
-            except json.JSONDecodeError as e:
-                error_files.append(f"{file.name}: JSON parse error - {e}")
-            except Exception as e:
-                error_files.append(f"{file.name}: {e}")
-        if error_files:
-            warn(f"Failed to load {len(error_files)} cache file(s):")
-            for err in error_files[:5]:  # Show first 5 errors
-                warn(f"  - {err}")
-            if len(error_files) > 5:
-                warn(f"  ... and {len(error_files) - 5} more")
+                GameArchive(CACHE_DIR / ARCHIVE_FILE.name).write(games_data, cache_sources, rejected_files)
+            except OSError as e:
+                warn(f"Could not write game archive: {e}")
+        # Normalize venue names to match current venues.json
+        # This handles arena renames while preserving neutral site venues
+        for game in games_data:
+            normalized_venue = normalize_cached_venue(game)
+            if normalized_venue:
+                game['basic_info']['venue'] = normalized_venue
     else:
-        games_data = process_directory_or_file(args.input_path, args.gender)
+        jobs = args.jobs or (os.cpu_count() or 1)
+        games_data = process_directory_or_file(args.input_path, args.gender, jobs=jobs)
+        if not args.no_pbp:
+            enrich_games_with_pbp(games_data, workers=args.pbp_workers)
 
     if not games_data:
         warn("No games data to process. Exiting.")
@@ -668,13 +896,21 @@ def main() -> None:
         processed_data = generate_excel_workbook(
             games_data,
             args.output_excel,
-            write_file=generate_excel
+            write_file=generate_excel,
+            constant_memory=args.excel_constant_memory,
+            incremental=args.incremental,
+            rebuild_store=args.rebuild_store,
+            verify_store=args.verify_store
         )
 
         # Generate website if requested
         if generate_website:
             processed_data['_raw_games'] = games_data
-            generate_website_from_data(processed_data, args.output_html, skip_nba=not args.check_nba)
+            generate_website_from_data(
+                processed_data, args.output_html,
+                skip_nba=not args.check_nba,
+                background_nba=args.check_nba and args.nba_background
+            )
 
         # Report results
         success("\nProcessing complete!")
@@ -694,6 +930,10 @@ def main() -> None:
             except Exception as e:
                 warn(f"Active status refresh failed: {e}")
 
+        # Publish the players looked up in the background once they finish
+        if generate_website and args.check_nba and args.nba_background:
+            _publish_background_lookups(processed_data, args.output_html, deploy=not args.no_deploy)
+
     except Exception as e:
         from .utils.log import exception
         exception("Error during processing", e)
@@ -7,6 +7,7 @@ from .html_parser import (
     HTMLParsingError,
 )
 from .stats_parser import extract_player_stats, extract_team_totals
+from .backend import PARSER_BACKENDS, set_parser_backend, get_parser_backend, resolve_parser_backend
 from .sidearm_parser import (
     parse_sidearm_boxscore,
     is_sidearm_format,
@@ -20,6 +21,10 @@ __all__ = [
     'HTMLParsingError',
     'extract_player_stats',
     'extract_team_totals',
+    'PARSER_BACKENDS',
+    'set_parser_backend',
+    'get_parser_backend',
+    'resolve_parser_backend',
     'parse_sidearm_boxscore',
     'is_sidearm_format',
     'SidearmParsingError',
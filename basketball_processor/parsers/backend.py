@@ -0,0 +1,67 @@
+"""
+Pluggable BeautifulSoup tree-builder backend for box score parsing.
+
+The C-accelerated lxml builder is noticeably faster than the pure-Python
+html.parser on large Sports Reference pages and produces the same game data
+(see tests/test_parser_backends.py). lxml is optional: 'auto' uses it when
+installed and falls back to html.parser otherwise.
+"""
+
+from bs4 import BeautifulSoup
+
+from ..utils.log import warn
+
+PARSER_BACKENDS = ('auto', 'lxml', 'html.parser')
+
+_backend = 'auto'
+_resolved_backend = None
+
+
+def _lxml_available() -> bool:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def set_parser_backend(name: str) -> None:
+    """
+    Select the tree builder used for box score parsing.
+
+    Args:
+        name: 'auto', 'lxml' or 'html.parser'
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    global _backend, _resolved_backend
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name} (choose from {', '.join(PARSER_BACKENDS)})")
+    _backend = name
+    _resolved_backend = None
+
+
+def get_parser_backend() -> str:
+    """Return the configured backend name ('auto', 'lxml' or 'html.parser')."""
+    return _backend
+
+
+def resolve_parser_backend() -> str:
+    """Return the BeautifulSoup feature string that make_soup() will use."""
+    global _resolved_backend
+    if _resolved_backend is None:
+        if _backend == 'html.parser':
+            _resolved_backend = 'html.parser'
+        elif _lxml_available():
+            _resolved_backend = 'lxml'
+        else:
+            if _backend == 'lxml':
+                warn("lxml is not installed; falling back to html.parser")
+            _resolved_backend = 'html.parser'
+    return _resolved_backend
+
+
+def make_soup(html_content: str) -> BeautifulSoup:
+    """Parse HTML with the selected backend."""
+    return BeautifulSoup(html_content, resolve_parser_backend())
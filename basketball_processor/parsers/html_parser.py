@@ -4,7 +4,7 @@ Main HTML parser for Sports Reference college basketball box scores.
 
 import re
 from typing import Dict, List, Any, Optional, Tuple
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup
 
 from .stats_parser import (
     extract_player_stats,
@@ -12,6 +12,9 @@ from .stats_parser import (
     merge_basic_and_advanced_stats,
     find_box_score_tables,
 )
+from .backend import make_soup
+from .region_slicer import slice_boxscore_regions
+from .table_locator import TableLocator
 from .play_by_play_parser import (
     extract_play_by_play,
     extract_scoring_runs,
@@ -28,7 +31,10 @@ from ..utils.helpers import (
 )
 from ..engines.milestone_engine import MilestoneEngine
 from ..engines.special_events_engine import SpecialEventsEngine
+from ..utils.derived_stats import stamp_derived_stats
+from ..utils.play_arrays import PlayArrays
 from ..utils.venue_resolver import resolve_venue
+from ..utils.pbp_enrichment import fetch_pbp_for_game, apply_pbp_analysis
 
 
 class HTMLParsingError(Exception):
@@ -101,13 +107,23 @@ def validate_game_data(game_data: Dict[str, Any]) -> List[str]:
     return warnings
 
 
-def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dict[str, Any]:
+def parse_sports_reference_boxscore(
+    html_content: str,
+    gender: str = 'M',
+    slice_regions: bool = True,
+    fetch_pbp: bool = True
+) -> Dict[str, Any]:
     """
     Parse a Sports Reference college basketball box score HTML file.
 
     Args:
         html_content: Raw HTML string
         gender: 'M' for men's, 'W' for women's
+        slice_regions: Build the DOM from only the regions the parser reads
+            (falls back to the full page if they can't be located)
+        fetch_pbp: Fetch ESPN/SIDEARM play-by-play over the network during the
+            parse. Pass False to keep parsing network-free and run
+            enrich_games_with_pbp() afterwards.
 
     Returns:
         game_data dictionary with all extracted information
@@ -118,7 +134,10 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
     # Validate input
     validate_html_content(html_content)
 
-    soup = BeautifulSoup(html_content, 'html.parser')
+    sliced_html = slice_boxscore_regions(html_content) if slice_regions else None
+    soup = make_soup(sliced_html or html_content)
+    # Index tables once; extractors share it instead of re-searching the tree
+    locator = TableLocator(soup)
 
     # Initialize game data structure
     game_data = {
@@ -144,7 +163,7 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
     game_data['basic_info']['division'] = 'D1'  # Sports Reference only covers D1
 
     # Extract linescore (pass gender to correctly handle women's 4-quarter format)
-    game_data['linescore'] = extract_linescore(soup, gender)
+    game_data['linescore'] = extract_linescore(soup, gender, locator=locator)
 
     # Fallback: If team names are empty, try to extract from title
     if not game_data['basic_info'].get('away_team') or not game_data['basic_info'].get('home_team'):
@@ -180,7 +199,7 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
         game_data['basic_info']['venue'] = resolved_venue
 
     # Find team slugs from box score tables
-    team_slugs = find_box_score_tables(soup)
+    team_slugs = find_box_score_tables(soup, locator=locator)
 
     if len(team_slugs) >= 2:
         # Determine which is away/home based on order (away team listed first)
@@ -188,10 +207,10 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
         home_slug = team_slugs[1]
 
         # Extract player stats
-        game_data['box_score']['away']['basic'] = extract_player_stats(soup, away_slug, is_basic=True)
-        game_data['box_score']['away']['advanced'] = extract_player_stats(soup, away_slug, is_basic=False)
-        game_data['box_score']['home']['basic'] = extract_player_stats(soup, home_slug, is_basic=True)
-        game_data['box_score']['home']['advanced'] = extract_player_stats(soup, home_slug, is_basic=False)
+        game_data['box_score']['away']['basic'] = extract_player_stats(soup, away_slug, is_basic=True, locator=locator)
+        game_data['box_score']['away']['advanced'] = extract_player_stats(soup, away_slug, is_basic=False, locator=locator)
+        game_data['box_score']['home']['basic'] = extract_player_stats(soup, home_slug, is_basic=True, locator=locator)
+        game_data['box_score']['home']['advanced'] = extract_player_stats(soup, home_slug, is_basic=False, locator=locator)
 
         # Merge basic and advanced stats
         game_data['box_score']['away']['players'] = merge_basic_and_advanced_stats(
@@ -204,8 +223,8 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
         )
 
         # Extract team totals
-        game_data['team_totals']['away'] = extract_team_totals(soup, away_slug, is_basic=True)
-        game_data['team_totals']['home'] = extract_team_totals(soup, home_slug, is_basic=True)
+        game_data['team_totals']['away'] = extract_team_totals(soup, away_slug, is_basic=True, locator=locator)
+        game_data['team_totals']['home'] = extract_team_totals(soup, home_slug, is_basic=True, locator=locator)
 
         # Store team slugs for reference
         game_data['basic_info']['away_team_slug'] = away_slug
@@ -217,57 +236,20 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
     # Extract play-by-play data and analysis
     away_team = game_data['basic_info'].get('away_team', '')
     home_team = game_data['basic_info'].get('home_team', '')
-    plays = extract_play_by_play(soup, away_team, home_team)
+    plays = extract_play_by_play(soup, away_team, home_team, locator=locator)
 
     if plays:
+        arrays = PlayArrays.from_sr_plays(plays)
         game_data['play_by_play'] = {
             'plays': plays,
-            'scoring_runs': extract_scoring_runs(plays, min_run=8),
-            'lead_changes': count_lead_changes(plays),
-            'largest_leads': get_largest_lead(plays),
+            'scoring_runs': extract_scoring_runs(plays, min_run=8, arrays=arrays),
+            'lead_changes': count_lead_changes(plays, arrays=arrays),
+            'largest_leads': get_largest_lead(plays, arrays=arrays),
         }
 
-    # Fetch ESPN play-by-play for advanced analysis
-    date_yyyymmdd = game_data['basic_info'].get('date_yyyymmdd', '')
-    if away_team and home_team and date_yyyymmdd:
-        pbp_data = None
-
-        # Try ESPN first
-        try:
-            from ..utils.espn_pbp_scraper import get_espn_pbp_for_game
-            from ..engines.espn_pbp_engine import ESPNPlayByPlayEngine
-
-            pbp_data = get_espn_pbp_for_game(
-                away_team, home_team, date_yyyymmdd,
-                gender=gender, verbose=False
-            )
-        except ImportError:
-            pass  # ESPN PBP scraper not available
-        except Exception:
-            pass  # Don't fail if ESPN PBP fails
-
-        # Fall back to SIDEARM if ESPN didn't have data
-        if not pbp_data or not pbp_data.get('plays'):
-            try:
-                from ..utils.sidearm_scraper import get_sidearm_pbp_for_game
-
-                pbp_data = get_sidearm_pbp_for_game(
-                    home_team, away_team, date_yyyymmdd,
-                    gender=gender, verbose=False
-                )
-            except ImportError:
-                pass  # SIDEARM scraper not available
-            except Exception:
-                pass  # Don't fail if SIDEARM PBP fails
-
-        # Run analysis if we have play-by-play data
-        if pbp_data and pbp_data.get('plays'):
-            try:
-                from ..engines.espn_pbp_engine import ESPNPlayByPlayEngine
-                engine = ESPNPlayByPlayEngine(pbp_data, game_data)
-                game_data['espn_pbp_analysis'] = engine.analyze()
-            except Exception:
-                pass  # Don't fail parsing if analysis fails
+    # Fetch ESPN/SIDEARM play-by-play for advanced analysis
+    if fetch_pbp:
+        apply_pbp_analysis(game_data, fetch_pbp_for_game(game_data))
 
     # Run milestone detection
     milestone_engine = MilestoneEngine(game_data)
@@ -276,6 +258,7 @@ def parse_sports_reference_boxscore(html_content: str, gender: str = 'M') -> Dic
     # Run special events detection
     special_events_engine = SpecialEventsEngine(game_data)
     game_data = special_events_engine.detect()
+    stamp_derived_stats(game_data)
 
     # Validate parsed data and store any warnings
     warnings = validate_game_data(game_data)
@@ -396,7 +379,11 @@ def extract_basic_info(soup: BeautifulSoup) -> Dict[str, Any]:
     return info
 
 
-def extract_linescore(soup: BeautifulSoup, gender: str = 'M') -> Dict[str, Any]:
+def extract_linescore(
+    soup: BeautifulSoup,
+    gender: str = 'M',
+    locator: Optional[TableLocator] = None
+) -> Dict[str, Any]:
     """
     Extract period-by-period and overtime scoring.
 
@@ -406,6 +393,7 @@ def extract_linescore(soup: BeautifulSoup, gender: str = 'M') -> Dict[str, Any]:
     Args:
         soup: BeautifulSoup object of the HTML
         gender: 'M' for men's (2 halves), 'W' for women's (4 quarters)
+        locator: Shared TableLocator for the page (built from soup if omitted)
 
     Returns:
         Dictionary with linescore data including periods and OT
@@ -420,18 +408,8 @@ def extract_linescore(soup: BeautifulSoup, gender: str = 'M') -> Dict[str, Any]:
     }
 
     # Find linescore table
-    # It may be in a comment, so we need to parse comments
-    linescore_table = soup.find('table', {'id': 'line-score'})
-
-    if not linescore_table:
-        # Check for commented out content
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        for comment in comments:
-            if 'line-score' in comment:
-                comment_soup = BeautifulSoup(comment, 'html.parser')
-                linescore_table = comment_soup.find('table', {'id': 'line-score'})
-                if linescore_table:
-                    break
+    # It may be in a comment, which the locator also searches
+    linescore_table = (locator or TableLocator(soup)).find('line-score')
 
     if not linescore_table:
         return linescore
@@ -501,10 +479,14 @@ def extract_officials(soup: BeautifulSoup) -> List[str]:
     return officials
 
 
-def extract_four_factors(soup: BeautifulSoup) -> Dict[str, Any]:
+def extract_four_factors(soup: BeautifulSoup, locator: Optional[TableLocator] = None) -> Dict[str, Any]:
     """
     Extract Four Factors data if available.
 
+    Args:
+        soup: BeautifulSoup object of the HTML
+        locator: Shared TableLocator for the page (built from soup if omitted)
+
     Returns:
         Dictionary with four factors for both teams
     """
@@ -513,18 +495,8 @@ def extract_four_factors(soup: BeautifulSoup) -> Dict[str, Any]:
         'home': {},
     }
 
-    # Find four factors table
-    ff_table = soup.find('table', {'id': 'four-factors'})
-
-    if not ff_table:
-        # Check comments
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        for comment in comments:
-            if 'four-factors' in comment:
-                comment_soup = BeautifulSoup(comment, 'html.parser')
-                ff_table = comment_soup.find('table', {'id': 'four-factors'})
-                if ff_table:
-                    break
+    # Find four factors table (may be commented out)
+    ff_table = (locator or TableLocator(soup)).find('four-factors')
 
     if not ff_table:
         return factors
@@ -3,13 +3,20 @@ Play-by-play parser for extracting detailed game events.
 """
 
 from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Tag
 import re
 
+from .table_locator import TableLocator
 from ..utils.helpers import safe_int
+from ..utils.play_arrays import AWAY, HOME, PlayArrays
 
 
-def extract_play_by_play(soup: BeautifulSoup, away_team: str, home_team: str) -> List[Dict[str, Any]]:
+def extract_play_by_play(
+    soup: BeautifulSoup,
+    away_team: str,
+    home_team: str,
+    locator: Optional[TableLocator] = None
+) -> List[Dict[str, Any]]:
     """
     Extract play-by-play events from the game.
 
@@ -17,30 +24,21 @@ def extract_play_by_play(soup: BeautifulSoup, away_team: str, home_team: str) ->
         soup: BeautifulSoup object
         away_team: Away team name
         home_team: Home team name
+        locator: Shared TableLocator for the page (built from soup if omitted)
 
     Returns:
         List of play dictionaries
     """
     plays = []
 
-    # Find play-by-play table
-    pbp_table = soup.find('table', {'id': 'pbp'})
-
-    if not pbp_table:
-        # Check comments
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        for comment in comments:
-            if 'id="pbp"' in comment:
-                comment_soup = BeautifulSoup(comment, 'html.parser')
-                pbp_table = comment_soup.find('table', {'id': 'pbp'})
-                if pbp_table:
-                    break
+    # Find play-by-play table (may be commented out)
+    pbp_table = (locator or TableLocator(soup)).find('pbp', comment_marker='id="pbp"')
 
     if not pbp_table:
         return plays
 
     tbody = pbp_table.find('tbody')
-    if not tbody:
+    if not isinstance(tbody, Tag):
         return plays
 
     current_half = 1
@@ -138,90 +136,48 @@ def classify_play_type(description: str) -> str:
     return 'other'
 
 
-def extract_scoring_runs(plays: List[Dict[str, Any]], min_run: int = 10) -> List[Dict[str, Any]]:
+def extract_scoring_runs(
+    plays: List[Dict[str, Any]],
+    min_run: int = 10,
+    arrays: Optional[PlayArrays] = None
+) -> List[Dict[str, Any]]:
     """
     Identify scoring runs (e.g., 10-0 runs).
 
     Args:
         plays: List of play dictionaries
         min_run: Minimum point differential for a "run"
+        arrays: PlayArrays for the plays (built from plays if omitted)
 
     Returns:
         List of scoring run dictionaries
     """
-    runs = []
-
     if not plays:
-        return runs
-
-    # Track consecutive scoring
-    current_run = {
-        'team': None,
-        'points': 0,
-        'start_time': '',
-        'end_time': '',
-        'start_score': '',
-    }
+        return []
 
-    prev_away = plays[0]['score_away']
-    prev_home = plays[0]['score_home']
-
-    for play in plays[1:]:
-        away_scored = play['score_away'] - prev_away
-        home_scored = play['score_home'] - prev_home
-
-        if away_scored > 0 and home_scored == 0:
-            if current_run['team'] == 'away':
-                current_run['points'] += away_scored
-                current_run['end_time'] = play['time']
-            else:
-                # Save previous run if significant
-                if current_run['team'] and current_run['points'] >= min_run:
-                    runs.append(current_run.copy())
-                # Start new run
-                current_run = {
-                    'team': 'away',
-                    'points': away_scored,
-                    'start_time': play['time'],
-                    'end_time': play['time'],
-                    'start_score': f"{prev_away}-{prev_home}",
-                }
-        elif home_scored > 0 and away_scored == 0:
-            if current_run['team'] == 'home':
-                current_run['points'] += home_scored
-                current_run['end_time'] = play['time']
-            else:
-                if current_run['team'] and current_run['points'] >= min_run:
-                    runs.append(current_run.copy())
-                current_run = {
-                    'team': 'home',
-                    'points': home_scored,
-                    'start_time': play['time'],
-                    'end_time': play['time'],
-                    'start_score': f"{prev_away}-{prev_home}",
-                }
-        elif away_scored > 0 or home_scored > 0:
-            # Both teams scored or run is broken
-            if current_run['team'] and current_run['points'] >= min_run:
-                runs.append(current_run.copy())
-            current_run = {'team': None, 'points': 0, 'start_time': '', 'end_time': '', 'start_score': ''}
-
-        prev_away = play['score_away']
-        prev_home = play['score_home']
-
-    # Check final run
-    if current_run['team'] and current_run['points'] >= min_run:
-        runs.append(current_run)
+    if arrays is None:
+        arrays = PlayArrays.from_sr_plays(plays)
 
+    runs = []
+    for run in arrays.scoring_runs(min_run):
+        before = plays[run.start - 1]
+        runs.append({
+            'team': 'away' if run.side == AWAY else 'home',
+            'points': run.points,
+            'start_time': plays[run.start]['time'],
+            'end_time': plays[run.end]['time'],
+            'start_score': f"{before['score_away']}-{before['score_home']}",
+        })
     return runs
 
 
-def count_lead_changes(plays: List[Dict[str, Any]]) -> int:
+def count_lead_changes(plays: List[Dict[str, Any]], arrays: Optional[PlayArrays] = None) -> int:
     """
     Count the number of lead changes in the game.
 
     Args:
         plays: List of play dictionaries
+        arrays: PlayArrays for the plays (built from plays if omitted)
 
     Returns:
         Number of lead changes
@@ -229,35 +185,18 @@ def count_lead_changes(plays: List[Dict[str, Any]]) -> int:
     if not plays:
         return 0
 
-    lead_changes = 0
-    prev_leader = None  # 'away', 'home', or 'tie'
-
-    for play in plays:
-        away = play['score_away']
-        home = play['score_home']
+    if arrays is None:
+        arrays = PlayArrays.from_sr_plays(plays)
+    return arrays.lead_changes()
 
-        if away > home:
-            current_leader = 'away'
-        elif home > away:
-            current_leader = 'home'
-        else:
-            current_leader = 'tie'
 
-        if prev_leader is not None and prev_leader != 'tie' and current_leader != 'tie':
-            if prev_leader != current_leader:
-                lead_changes += 1
-
-        prev_leader = current_leader
-
-    return lead_changes
-
-
-def get_largest_lead(plays: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_largest_lead(plays: List[Dict[str, Any]], arrays: Optional[PlayArrays] = None) -> Dict[str, Any]:
     """
     Find the largest lead for each team.
 
     Args:
         plays: List of play dictionaries
+        arrays: PlayArrays for the plays (built from plays if omitted)
 
     Returns:
         Dictionary with largest leads for away and home teams
@@ -266,22 +205,24 @@ def get_largest_lead(plays: List[Dict[str, Any]]) -> Dict[str, Any]:
         'away': {'lead': 0, 'score': '', 'time': '', 'half': 0},
         'home': {'lead': 0, 'score': '', 'time': '', 'half': 0},
     }
+    if not plays:
+        return result
+
+    if arrays is None:
+        arrays = PlayArrays.from_sr_plays(plays)
 
-    for play in plays:
+    for side, code in (('away', AWAY), ('home', HOME)):
+        index = arrays.largest_lead_index(code)
+        if index is None:
+            continue
+        play = plays[index]
         away = play['score_away']
         home = play['score_home']
-        margin = away - home
-
-        if margin > result['away']['lead']:
-            result['away']['lead'] = margin
-            result['away']['score'] = f"{away}-{home}"
-            result['away']['time'] = play['time']
-            result['away']['half'] = play['half']
-
-        if -margin > result['home']['lead']:
-            result['home']['lead'] = -margin
-            result['home']['score'] = f"{away}-{home}"
-            result['home']['time'] = play['time']
-            result['home']['half'] = play['half']
+        result[side] = {
+            'lead': abs(away - home),
+            'score': f"{away}-{home}",
+            'time': play['time'],
+            'half': play['half'],
+        }
 
     return result
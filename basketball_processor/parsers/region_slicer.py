@@ -0,0 +1,181 @@
+"""
+Streaming pre-pass that slices the parsed regions out of a box score page.
+
+Sports Reference pages are mostly ads, navigation and scripts; the parser only
+reads the title, canonical link, scorebox and a handful of tables (linescore,
+box scores, play-by-play, four factors), some of which sit inside HTML
+comments. slice_boxscore_regions() finds those regions with a regex/offset
+scan and returns a much smaller document, so the tree builder never builds a
+DOM for the rest of the page.
+
+Tables found inside comments are re-wrapped in comments so lookups behave
+exactly as on the full page. If a required region can't be located cleanly
+the caller should parse the full page instead.
+"""
+
+import bisect
+import re
+from typing import List, Optional, Tuple
+
+# Blocks whose contents the tree builder does not parse as markup
+_OPAQUE_RE = re.compile(
+    r'<!--.*?-->|<script\b.*?</script\s*>|<style\b.*?</style\s*>',
+    re.DOTALL | re.IGNORECASE,
+)
+_OPENER_RE = re.compile(r'<(table|div|title|link)\b[^>]*>', re.IGNORECASE)
+_TABLE_OPENER_RE = re.compile(r'<table\b[^>]*>', re.IGNORECASE)
+_TITLE_END_RE = re.compile(r'</title\s*>', re.IGNORECASE)
+_ID_RE = re.compile(r'''\bid\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.IGNORECASE)
+_CLASS_RE = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.IGNORECASE)
+_REL_RE = re.compile(r'''\brel\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.IGNORECASE)
+
+_TABLE_IDS = ('line-score', 'pbp', 'four-factors')
+_TABLE_ID_PREFIXES = ('box-score-basic-', 'box-score-advanced-')
+
+
+def _attr(pattern: re.Pattern, tag: str) -> Optional[str]:
+    match = pattern.search(tag)
+    if not match:
+        return None
+    return next(group for group in match.groups() if group is not None)
+
+
+def _is_wanted_table(tag: str) -> bool:
+    table_id = _attr(_ID_RE, tag)
+    if not table_id:
+        return False
+    return table_id in _TABLE_IDS or table_id.startswith(_TABLE_ID_PREFIXES)
+
+
+class _OpaqueSpans:
+    """Sorted (start, end) spans of comments/scripts/styles for fast containment checks."""
+
+    def __init__(self, spans: List[Tuple[int, int]]):
+        self.spans = spans
+        self.starts = [start for start, _ in spans]
+
+    def containing(self, pos: int) -> Optional[Tuple[int, int]]:
+        idx = bisect.bisect_right(self.starts, pos) - 1
+        if idx >= 0 and pos < self.spans[idx][1]:
+            return self.spans[idx]
+        return None
+
+
+def _element_end(html: str, tag: str, start: int, opaque: Optional[_OpaqueSpans]) -> Optional[int]:
+    """Return the offset just past the element opened at start, or None if unbalanced."""
+    depth = 0
+    pattern = re.compile(rf'<(/?){tag}\b[^>]*>', re.IGNORECASE)
+    pos = start
+    while True:
+        match = pattern.search(html, pos)
+        if not match:
+            return None
+        pos = match.end()
+        if opaque is not None:
+            span = opaque.containing(match.start())
+            if span is not None:
+                pos = span[1]
+                continue
+        if match.group(1):
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        else:
+            depth += 1
+
+
+def _comment_tables(comment: str) -> List[str]:
+    """Return wanted tables inside one comment's text, in order."""
+    tables: List[str] = []
+    pos = 0
+    while True:
+        match = _TABLE_OPENER_RE.search(comment, pos)
+        if not match:
+            return tables
+        if not _is_wanted_table(match.group(0)):
+            pos = match.end()
+            continue
+        end = _element_end(comment, 'table', match.start(), None)
+        if end is None:
+            return tables
+        tables.append(comment[match.start():end])
+        pos = end
+
+
+def slice_boxscore_regions(html: str) -> Optional[str]:
+    """
+    Build a reduced document holding only the regions the box score parser reads.
+
+    Args:
+        html: Full Sports Reference box score HTML
+
+    Returns:
+        Reduced HTML document, or None if the page should be parsed in full
+        (no scorebox, fewer than two box score tables, or unbalanced markup)
+    """
+    opaque_spans = [(m.start(), m.end()) for m in _OPAQUE_RE.finditer(html)]
+    opaque = _OpaqueSpans(opaque_spans)
+
+    title = canonical = scorebox = None
+    # Main-page regions already sliced; comments inside them come along verbatim
+    sliced: List[Tuple[int, int]] = []
+    # (offset, fragment, from_comment) so main-page and commented tables keep document order
+    tables: List[Tuple[int, str, bool]] = []
+    basic_tables = 0
+
+    pos = 0
+    while True:
+        match = _OPENER_RE.search(html, pos)
+        if not match:
+            break
+        span = opaque.containing(match.start())
+        if span is not None:
+            pos = span[1]
+            continue
+        tag_name = match.group(1).lower()
+        tag = match.group(0)
+        pos = match.end()
+
+        if tag_name == 'title' and title is None:
+            end_match = _TITLE_END_RE.search(html, match.end())
+            if end_match is None:
+                return None
+            title = html[match.start():end_match.end()]
+            pos = end_match.end()
+        elif tag_name == 'link' and canonical is None:
+            if 'canonical' in (_attr(_REL_RE, tag) or '').split():
+                canonical = tag
+        elif tag_name == 'div' and scorebox is None:
+            if 'scorebox' in (_attr(_CLASS_RE, tag) or '').split():
+                end = _element_end(html, 'div', match.start(), opaque)
+                if end is None:
+                    return None
+                scorebox = html[match.start():end]
+                sliced.append((match.start(), end))
+                pos = end
+        elif tag_name == 'table' and _is_wanted_table(tag):
+            end = _element_end(html, 'table', match.start(), opaque)
+            if end is None:
+                return None
+            tables.append((match.start(), html[match.start():end], False))
+            sliced.append((match.start(), end))
+            if (_attr(_ID_RE, tag) or '').startswith('box-score-basic-'):
+                basic_tables += 1
+            pos = end
+
+    if scorebox is None or basic_tables < 2:
+        return None
+
+    for start, end in opaque_spans:
+        if any(s_start <= start < s_end for s_start, s_end in sliced):
+            continue
+        if html.startswith('<!--', start) and '<table' in html[start:end]:
+            for fragment in _comment_tables(html[start + 4:end - 3]):
+                tables.append((start, fragment, True))
+    tables.sort(key=lambda item: item[0])
+
+    parts = ['<html><head>', title or '', canonical or '', '</head><body>', scorebox]
+    for _, fragment, from_comment in tables:
+        parts.append(f'<!--{fragment}-->' if from_comment else fragment)
+    parts.append('</body></html>')
+    return ''.join(parts)
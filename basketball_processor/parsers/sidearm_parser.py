@@ -7,6 +7,8 @@ import re
 from typing import Dict, List, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 
+from .backend import make_soup
+
 from ..utils.helpers import (
     safe_int,
     safe_float,
@@ -17,6 +19,7 @@ from ..utils.helpers import (
 from ..engines.milestone_engine import MilestoneEngine
 from ..engines.special_events_engine import SpecialEventsEngine
 from ..engines.espn_pbp_engine import ESPNPlayByPlayEngine
+from ..utils.derived_stats import stamp_derived_stats
 from ..utils.venue_resolver import resolve_venue
 
 
@@ -713,7 +716,7 @@ def parse_sidearm_boxscore(html_content: str, gender: str = 'M', url: str = '')
     Returns:
         Dictionary with game data in standard format
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_soup(html_content)
 
     # Extract team names and scores from captions
     away_team, home_team = _extract_team_names(soup)
@@ -852,5 +855,6 @@ def parse_sidearm_boxscore(html_content: str, gender: str = 'M', url: str = '')
     # Check special events
     special_events_engine = SpecialEventsEngine(game_data)
     game_data = special_events_engine.detect()
+    stamp_derived_stats(game_data)
 
     return game_data
@@ -6,10 +6,16 @@ import re
 from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup, Tag
 
+from .table_locator import TableLocator
 from ..utils.helpers import safe_int, safe_float, extract_player_id_from_href
 
 
-def extract_player_stats(soup: BeautifulSoup, team_slug: str, is_basic: bool = True) -> List[Dict[str, Any]]:
+def extract_player_stats(
+    soup: BeautifulSoup,
+    team_slug: str,
+    is_basic: bool = True,
+    locator: Optional[TableLocator] = None
+) -> List[Dict[str, Any]]:
     """
     Extract player statistics from a box score table.
 
@@ -17,6 +23,7 @@ def extract_player_stats(soup: BeautifulSoup, team_slug: str, is_basic: bool = T
         soup: BeautifulSoup object of the page
         team_slug: Team slug used in table ID (e.g., 'gonzaga', 'san-francisco')
         is_basic: True for basic stats, False for advanced stats
+        locator: Shared TableLocator for the page (built from soup if omitted)
 
     Returns:
         List of player stat dictionaries
@@ -24,19 +31,18 @@ def extract_player_stats(soup: BeautifulSoup, team_slug: str, is_basic: bool = T
     table_type = "basic" if is_basic else "advanced"
     table_id = f"box-score-{table_type}-{team_slug}"
 
-    table = soup.find('table', {'id': table_id})
+    locator = locator or TableLocator(soup)
+    table = locator.table(table_id)
     if not table:
         # Try finding in div container
-        container = soup.find('div', {'id': f'div_{table_id}'})
-        if container:
-            table = container.find('table')
+        table = locator.table_in_div(table_id)
 
     if not table:
         return []
 
     players = []
     tbody = table.find('tbody')
-    if not tbody:
+    if not isinstance(tbody, Tag):
         return []
 
     is_starter = True  # First group is starters
@@ -88,7 +94,12 @@ def extract_player_stats(soup: BeautifulSoup, team_slug: str, is_basic: bool = T
     return players
 
 
-def extract_team_totals(soup: BeautifulSoup, team_slug: str, is_basic: bool = True) -> Dict[str, Any]:
+def extract_team_totals(
+    soup: BeautifulSoup,
+    team_slug: str,
+    is_basic: bool = True,
+    locator: Optional[TableLocator] = None
+) -> Dict[str, Any]:
     """
     Extract team totals from the footer of a box score table.
 
@@ -96,6 +107,7 @@ def extract_team_totals(soup: BeautifulSoup, team_slug: str, is_basic: bool = Tr
         soup: BeautifulSoup object
         team_slug: Team slug
         is_basic: True for basic stats
+        locator: Shared TableLocator for the page (built from soup if omitted)
 
     Returns:
         Dictionary of team total stats
@@ -103,11 +115,10 @@ def extract_team_totals(soup: BeautifulSoup, team_slug: str, is_basic: bool = Tr
     table_type = "basic" if is_basic else "advanced"
     table_id = f"box-score-{table_type}-{team_slug}"
 
-    table = soup.find('table', {'id': table_id})
+    locator = locator or TableLocator(soup)
+    table = locator.table(table_id)
     if not table:
-        container = soup.find('div', {'id': f'div_{table_id}'})
-        if container:
-            table = container.find('table')
+        table = locator.table_in_div(table_id)
 
     if not table:
         return {}
@@ -224,18 +235,19 @@ def extract_team_slug_from_table_id(table_id: str) -> Optional[str]:
     return None
 
 
-def find_box_score_tables(soup: BeautifulSoup) -> List[str]:
+def find_box_score_tables(soup: BeautifulSoup, locator: Optional[TableLocator] = None) -> List[str]:
     """
     Find all box score table IDs in the page.
 
     Returns:
         List of team slugs found
     """
-    tables = soup.find_all('table', {'id': re.compile(r'^box-score-basic-')})
+    locator = locator or TableLocator(soup)
     team_slugs = []
 
-    for table in tables:
-        table_id = table.get('id', '')
+    for table_id in locator.table_ids:
+        if not table_id.startswith('box-score-basic-'):
+            continue
         slug = extract_team_slug_from_table_id(table_id)
         if slug:
             team_slugs.append(slug)
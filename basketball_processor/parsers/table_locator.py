@@ -0,0 +1,94 @@
+"""
+Single-pass table lookup for Sports Reference box score pages.
+
+Sports Reference pages hold a dozen or so tables, some of them inside HTML
+comments (rendered client-side). Each extractor used to search the whole tree
+for its table and, on a miss, re-walk every comment and re-parse the matching
+ones. TableLocator indexes every table[id] in the document once and parses
+each comment at most once, so extractors can share lookups.
+"""
+
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, Comment, Tag
+
+from .backend import make_soup
+
+
+def _table_id(table: Tag) -> str:
+    """The id attribute of a table found with id=True."""
+    return str(table.get('id'))
+
+
+class TableLocator:
+    """Index of table[id] elements in a page and its commented-out blocks."""
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self._tables: Dict[str, Tag] = {}
+        self._table_ids: List[str] = []
+        for table in soup.find_all('table', id=True):
+            table_id = _table_id(table)
+            self._table_ids.append(table_id)
+            self._tables.setdefault(table_id, table)
+        self._comments: Optional[List[str]] = None
+        self._comment_tables: Dict[int, Dict[str, Tag]] = {}
+
+    @property
+    def table_ids(self) -> List[str]:
+        """IDs of tables in the (uncommented) document, in document order."""
+        return self._table_ids
+
+    def table(self, table_id: str) -> Optional[Tag]:
+        """Return the first table with this ID in the document (not in comments)."""
+        return self._tables.get(table_id)
+
+    def table_in_div(self, table_id: str) -> Optional[Tag]:
+        """Return the first table inside div#div_<table_id>, if present."""
+        container = self.soup.find('div', {'id': f'div_{table_id}'})
+        if not isinstance(container, Tag):
+            return None
+        table = container.find('table')
+        return table if isinstance(table, Tag) else None
+
+    def _get_comments(self) -> List[str]:
+        if self._comments is None:
+            self._comments = [
+                str(text) for text in self.soup.find_all(string=lambda text: isinstance(text, Comment))
+            ]
+        return self._comments
+
+    def _parse_comment(self, index: int) -> Dict[str, Tag]:
+        """Parse one comment (once, with the selected backend) and index its tables by ID."""
+        tables = self._comment_tables.get(index)
+        if tables is None:
+            tables = {}
+            comment_soup = make_soup(self._get_comments()[index])
+            for table in comment_soup.find_all('table', id=True):
+                tables.setdefault(_table_id(table), table)
+            self._comment_tables[index] = tables
+        return tables
+
+    def find(self, table_id: str, comment_marker: Optional[str] = None) -> Optional[Tag]:
+        """
+        Find a table in the document, falling back to commented-out blocks.
+
+        Args:
+            table_id: The table's id attribute
+            comment_marker: Substring a comment must contain to be searched
+                (defaults to the table ID)
+
+        Returns:
+            The table Tag, or None if not found
+        """
+        table = self._tables.get(table_id)
+        if table is not None:
+            return table
+
+        marker = comment_marker or table_id
+        for index, comment in enumerate(self._get_comments()):
+            if marker in comment:
+                table = self._parse_comment(index).get(table_id)
+                if table is not None:
+                    return table
+        return None
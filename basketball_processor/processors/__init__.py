@@ -1,13 +1,17 @@
 """Data processors for aggregating and analyzing game statistics."""
 
 from .base_processor import BaseProcessor
+from .game_frame import GameFrame
 from .player_stats_processor import PlayerStatsProcessor
 from .milestones_processor import MilestonesProcessor
 from .team_records_processor import TeamRecordsProcessor
+from .aggregation_store import AggregationStore
 
 __all__ = [
     'BaseProcessor',
+    'GameFrame',
     'PlayerStatsProcessor',
     'MilestonesProcessor',
     'TeamRecordsProcessor',
+    'AggregationStore',
 ]
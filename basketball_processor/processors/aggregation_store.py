@@ -0,0 +1,523 @@
+"""
+Incremental store for processed player, team and milestone data.
+
+Rebuilding every aggregate from the full game list is wasteful when one new
+box score arrives: only the players and teams in that game change. This store
+persists per-key aggregates (player totals, per-game lines, season highs,
+starter/bench splits, team records, head-to-head history) and per-game rows
+(milestones, attendance), each tied to the games that produced them.
+
+On sync, games are matched by game_id and a content fingerprint. For new,
+changed or removed games, only the affected keys are recomputed - by running
+the regular processors over just the games those keys appear in - so the
+store always holds exactly what a full rebuild would produce. Lightweight
+per-game tables (game log, overtime/blowout games, matchup matrix, venue
+records) are built from small per-game stubs at assembly time.
+
+A full rebuild remains available via rebuild(), and diff_processed_data()
+compares store output against the regular processors. A persisted store is
+also discarded and rebuilt when the conference, alias or school-history data
+it was built against has changed.
+"""
+
+import hashlib
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+import pandas as pd
+
+from .game_frame import GameFrame
+from .player_stats_processor import PlayerStatsProcessor
+from .milestones_processor import MilestonesProcessor, OvertimeGamesProcessor, BlowoutGamesProcessor
+from .team_records_processor import TeamRecordsProcessor, GameLogProcessor
+from ..utils import constants, school_history_scraper
+from ..utils.constants import CACHE_DIR
+from ..utils.derived_stats import DERIVED_STATS_KEY
+from ..utils.log import debug, info
+from ..utils.helpers import atomic_write_json
+from ..utils.parse_cache import CACHE_META_KEY
+
+# Bump when processor output changes in a way a persisted store should not survive
+STORE_VERSION = 3
+
+# Kept out of the top-level cache directory, which --from-cache-only reads as games
+STORE_FILE = CACHE_DIR / "aggregation" / "store.json"
+
+# Game fields kept for tables that are cheap to rebuild from every game
+_STUB_FIELDS = ('game_id', 'gender', 'basic_info', 'special_events')
+
+
+# Fields the processors read that can change after a game is parsed
+# (venue normalization, rankings, play-by-play enrichment)
+_MUTABLE_FIELDS = ('game_id', 'gender', 'basic_info', 'espn_pbp_analysis')
+
+# Every field the processors read, hashed for games without a parse cache stamp
+_PROCESSED_FIELDS = _MUTABLE_FIELDS + ('box_score', 'special_events', 'milestone_stats')
+
+
+def game_fingerprint(game: Dict[str, Any]) -> str:
+    """
+    Return a stable content hash for a parsed game dictionary.
+
+    Games from the parse cache are identified by their HTML content hash and
+    derived-stats stamp plus the few fields that change after parsing, so the
+    box score is not re-serialized on every sync. Other games hash every
+    field the processors read.
+    """
+    meta = game.get(CACHE_META_KEY) or {}
+    derived = game.get(DERIVED_STATS_KEY)
+    if meta.get('content_hash') and derived:
+        fields = {field: game.get(field) for field in _MUTABLE_FIELDS}
+        fields['_source'] = [meta.get('parser_version'), meta['content_hash'], derived]
+    else:
+        fields = {field: game.get(field) for field in _PROCESSED_FIELDS}
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def reference_fingerprint() -> str:
+    """
+    Return a hash of the reference data baked into stored team aggregates.
+
+    Team records carry conferences and conference-game results, which come
+    from the alias and conference tables and the scraped school history
+    rather than from the games, so game fingerprints cannot see them change.
+    """
+    tables = [
+        constants.TEAM_ALIASES, constants.CONFERENCES, constants.D2_CONFERENCES,
+        constants.D3_CONFERENCES, constants.CONFERENCE_HISTORY,
+    ]
+    digest = hashlib.sha1(json.dumps(tables, sort_keys=True, default=str).encode('utf-8'))
+    try:
+        with open(school_history_scraper.SCHOOL_HISTORY_FILE, 'rb') as f:
+            digest.update(f.read())
+    except (IOError, OSError):
+        pass
+    return digest.hexdigest()
+
+
+def _assign_store_ids(games: List[Dict[str, Any]]) -> List[str]:
+    """Return a unique store ID per game (game_id, suffixed for duplicates)."""
+    seen: Dict[str, int] = {}
+    ids = []
+    for game in games:
+        game_id = game.get('game_id', '')
+        count = seen.get(game_id, 0)
+        seen[game_id] = count + 1
+        ids.append(game_id if count == 0 else f"{game_id}#{count}")
+    return ids
+
+
+def _game_info(game: Dict[str, Any], fingerprint: str) -> Dict[str, Any]:
+    """
+    Compute the per-game rows and the keys a game contributes to.
+
+    Returns:
+        Dictionary with the fingerprint, affected player/team/matchup keys,
+        milestone rows, attendance row and a stub for per-game tables
+    """
+    basic_info = game.get('basic_info', {})
+    gender = basic_info.get('gender', 'M')
+
+    players = PlayerStatsProcessor([game])
+    player_keys: List[str] = []
+    split_teams: Set[str] = set()
+    for side in ['away', 'home']:
+        team = basic_info.get(f'{side}_team', '')
+        for player in players.get_players_for_side(game, side):
+            if not player.get('name', ''):
+                continue
+            key = PlayerStatsProcessor.player_key(player)
+            if key not in player_keys:
+                player_keys.append(key)
+            split_teams.add(team)
+
+    away_raw = basic_info.get('away_team', '')
+    home_raw = basic_info.get('home_team', '')
+    team_keys: List[str] = []
+    matchup = None
+    if away_raw and home_raw:
+        team_keys = [f"{away_raw}|{gender}", f"{home_raw}|{gender}"]
+        matchup = tuple(sorted(team_keys))
+
+    frame = GameFrame([game])
+    milestones = MilestonesProcessor([game], frame).collect_milestones()
+
+    team_records = TeamRecordsProcessor([game], frame)
+    team_records.aggregate_team_stats()
+
+    return {
+        'fingerprint': fingerprint,
+        'date': basic_info.get('date_yyyymmdd', ''),
+        'player_keys': player_keys,
+        'split_teams': split_teams,
+        'team_keys': team_keys,
+        'matchup': matchup,
+        'milestones': milestones,
+        'attendance': team_records.get_attendance_rows(),
+        'stub': {field: game[field] for field in _STUB_FIELDS if field in game},
+    }
+
+
+def _sorted_list(values: Iterable[Any]) -> List[Any]:
+    """Return a set's values as a list in a stable order for JSON."""
+    return sorted(values, key=str)
+
+
+def _encode_game_info(game_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a game info's set and tuple fields to JSON lists."""
+    return {
+        **game_info,
+        'split_teams': _sorted_list(game_info['split_teams']),
+        'matchup': list(game_info['matchup']) if game_info['matchup'] else None,
+    }
+
+
+def _decode_game_info(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _encode_game_info()."""
+    return {
+        **data,
+        'split_teams': set(data['split_teams']),
+        'matchup': tuple(data['matchup']) if data['matchup'] else None,
+    }
+
+
+_PLAYER_SET_FIELDS = ('teams', 'genders', 'divisions')
+
+
+def _encode_player(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a player state's set fields to JSON lists."""
+    return {**state, **{field: _sorted_list(state[field]) for field in _PLAYER_SET_FIELDS}}
+
+
+def _decode_player(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _encode_player()."""
+    return {**data, **{field: set(data[field]) for field in _PLAYER_SET_FIELDS}}
+
+
+class AggregationStore:
+    """Persisted per-key aggregates that can be updated one game at a time."""
+
+    def __init__(self, path: Path = STORE_FILE):
+        self.path = path
+        self.reference = reference_fingerprint()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear all stored state."""
+        self.order: List[str] = []
+        self.game_infos: Dict[str, Dict[str, Any]] = {}
+        # Inverted indexes: key -> store IDs of the games it appears in
+        self.player_index: Dict[str, Set[str]] = defaultdict(set)
+        self.split_index: Dict[str, Set[str]] = defaultdict(set)
+        self.team_index: Dict[str, Set[str]] = defaultdict(set)
+        self.matchup_index: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        # Aggregates per key
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self.starter_totals: Dict[str, Dict[str, Any]] = {}
+        self.bench_totals: Dict[str, Dict[str, Any]] = {}
+        self.team_stats: Dict[str, Dict[str, Any]] = {}
+        self.head_to_head: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
+    def load(self) -> bool:
+        """
+        Load persisted state from disk.
+
+        Returns:
+            True if a store for the current STORE_VERSION and reference data
+            was loaded
+        """
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError, OSError):
+            return False
+        if not isinstance(data, dict) or data.get('version') != STORE_VERSION:
+            return False
+        if data.get('reference') != self.reference:
+            debug("Conference/alias reference data changed since the store was built; rebuilding")
+            return False
+        self._reset()
+        try:
+            state = data['state']
+            self.order = state['order']
+            for sid in self.order:
+                self._index_game(sid, _decode_game_info(state['game_infos'][sid]))
+            self.players = {key: _decode_player(value) for key, value in state['players'].items()}
+            self.starter_totals = state['starter_totals']
+            self.bench_totals = state['bench_totals']
+            self.team_stats = state['team_stats']
+            self.head_to_head = {tuple(matchup): games for matchup, games in state['head_to_head']}
+        except (KeyError, TypeError, ValueError):
+            self._reset()
+            return False
+        return True
+
+    def save(self) -> None:
+        """
+        Write the store to disk atomically as JSON.
+
+        The inverted indexes are not written; load() rebuilds them from the
+        game infos.
+        """
+        state = {
+            'order': self.order,
+            'game_infos': {sid: _encode_game_info(self.game_infos[sid]) for sid in self.order},
+            'players': {key: _encode_player(value) for key, value in self.players.items()},
+            'starter_totals': self.starter_totals,
+            'bench_totals': self.bench_totals,
+            'team_stats': self.team_stats,
+            'head_to_head': [[list(matchup), games] for matchup, games in self.head_to_head.items()],
+        }
+        atomic_write_json(self.path, {'version': STORE_VERSION, 'reference': self.reference, 'state': state})
+
+    def sync(self, games: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Bring the store in line with the current game list.
+
+        Args:
+            games: Full list of parsed games, in processing order
+
+        Returns:
+            Counts of 'added', 'changed', 'removed' and 'unchanged' games
+        """
+        store_ids = _assign_store_ids(games)
+        games_by_id = dict(zip(store_ids, games))
+
+        # Aggregates like "most recent name" depend on game order; if the
+        # surviving games were reordered, incremental updates can't be trusted
+        retained = [sid for sid in store_ids if sid in self.game_infos]
+        if retained != [sid for sid in self.order if sid in games_by_id]:
+            if self.order:
+                debug("Game order changed since the store was built; rebuilding")
+            self._reset()
+
+        touched: List[Dict[str, Any]] = []
+        counts = {'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 0}
+
+        for sid in self.order:
+            if sid not in games_by_id:
+                touched.append(self._unindex_game(sid))
+                counts['removed'] += 1
+
+        for sid, game in games_by_id.items():
+            fingerprint = game_fingerprint(game)
+            old_info = self.game_infos.get(sid)
+            if old_info and old_info['fingerprint'] == fingerprint:
+                counts['unchanged'] += 1
+                continue
+            if old_info:
+                touched.append(self._unindex_game(sid))
+                counts['changed'] += 1
+            else:
+                counts['added'] += 1
+            info_dict = _game_info(game, fingerprint)
+            self._index_game(sid, info_dict)
+            touched.append(info_dict)
+
+        self.order = store_ids
+        if touched:
+            self._recompute(touched, games_by_id)
+        return counts
+
+    def rebuild(self, games: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Discard all state and rebuild the store from every game."""
+        self._reset()
+        return self.sync(games)
+
+    def _index_game(self, sid: str, game_info: Dict[str, Any]) -> None:
+        """Record a game's info and add it to the inverted indexes."""
+        self.game_infos[sid] = game_info
+        for key in game_info['player_keys']:
+            self.player_index[key].add(sid)
+        for team in game_info['split_teams']:
+            self.split_index[team].add(sid)
+        for key in game_info['team_keys']:
+            self.team_index[key].add(sid)
+        if game_info['matchup']:
+            self.matchup_index[game_info['matchup']].add(sid)
+
+    def _unindex_game(self, sid: str) -> Dict[str, Any]:
+        """Remove a game from the indexes and return its old info."""
+        game_info = self.game_infos.pop(sid)
+        for index, keys in (
+            (self.player_index, game_info['player_keys']),
+            (self.split_index, game_info['split_teams']),
+            (self.team_index, game_info['team_keys']),
+            (self.matchup_index, [game_info['matchup']] if game_info['matchup'] else []),
+        ):
+            for key in keys:
+                index[key].discard(sid)
+                if not index[key]:
+                    del index[key]
+        return game_info
+
+    def _games_for(self, sids: Set[str], games_by_id: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the given games in store order."""
+        return [games_by_id[sid] for sid in self.order if sid in sids]
+
+    @staticmethod
+    def _sids_for(index: Dict[Any, Set[str]], keys: Iterable[Any]) -> Set[str]:
+        """Return the store IDs of every game containing any of the keys."""
+        sids: Set[str] = set()
+        for key in keys:
+            sids |= index.get(key, set())
+        return sids
+
+    def _recompute(self, touched: List[Dict[str, Any]],
+                   games_by_id: Dict[str, Dict[str, Any]]) -> None:
+        """Recompute aggregates for every key touched by added/changed/removed games."""
+        player_keys = {k for gi in touched for k in gi['player_keys']}
+        split_teams = {t for gi in touched for t in gi['split_teams']}
+        team_keys = {k for gi in touched for k in gi['team_keys']}
+        matchups = {gi['matchup'] for gi in touched if gi['matchup']}
+
+        if player_keys or split_teams:
+            sids = self._sids_for(self.player_index, player_keys) | self._sids_for(self.split_index, split_teams)
+            player_processor = PlayerStatsProcessor(self._games_for(sids, games_by_id))
+            player_processor.aggregate_player_stats()
+            for key in player_keys:
+                state = player_processor.get_player_state(key) if key in self.player_index else None
+                if state is None:
+                    self.players.pop(key, None)
+                else:
+                    self.players[key] = state
+            for team in split_teams:
+                splits = player_processor.get_split_totals(team) if team in self.split_index else (None, None)
+                for totals, target in zip(splits, (self.starter_totals, self.bench_totals)):
+                    if totals is None:
+                        target.pop(team, None)
+                    else:
+                        target[team] = totals
+
+        if team_keys or matchups:
+            sids = self._sids_for(self.team_index, team_keys) | self._sids_for(self.matchup_index, matchups)
+            team_processor = TeamRecordsProcessor(self._games_for(sids, games_by_id))
+            team_processor.aggregate_team_stats()
+            for key in team_keys:
+                stats = team_processor.get_team_state(key) if key in self.team_index else None
+                if stats is None:
+                    self.team_stats.pop(key, None)
+                else:
+                    self.team_stats[key] = stats
+            for matchup in matchups:
+                games = team_processor.get_head_to_head(matchup) if matchup in self.matchup_index else None
+                if games is None:
+                    self.head_to_head.pop(matchup, None)
+                else:
+                    self.head_to_head[matchup] = games
+
+    def _date_sorted_infos(self) -> List[Dict[str, Any]]:
+        """Return game infos sorted by date, ties in store order (as the team processor sorts)."""
+        infos = [self.game_infos[sid] for sid in self.order]
+        return sorted(infos, key=lambda gi: gi['date'])
+
+    def build_outputs(self) -> Dict[str, Any]:
+        """
+        Assemble the processed DataFrames from stored state.
+
+        Returns:
+            Dictionary with the same keys generate_excel_workbook() produces
+        """
+        stubs = [self.game_infos[sid]['stub'] for sid in self.order]
+        frame = GameFrame(stubs)
+        processed_data: Dict[str, Any] = {}
+
+        processed_data['game_log'] = GameLogProcessor(stubs, frame).create_game_log()
+
+        # Keys must be inserted in first-appearance order to match a full rebuild
+        players = PlayerStatsProcessor([])
+        added_players: Set[str] = set()
+        for sid in self.order:
+            for key in self.game_infos[sid]['player_keys']:
+                if key not in added_players:
+                    added_players.add(key)
+                    players.add_player_state(key, self.players[key])
+        for team, totals in self.starter_totals.items():
+            players.add_split_totals(team, totals, None)
+        for team, totals in self.bench_totals.items():
+            players.add_split_totals(team, None, totals)
+        player_data = players.build_outputs()
+        processed_data['players'] = player_data['players']
+        processed_data['player_games'] = player_data['player_games']
+        processed_data['starters_vs_bench'] = player_data['starters_vs_bench']
+        processed_data['season_highs'] = player_data['season_highs']
+
+        milestones = MilestonesProcessor([])
+        for sid in self.order:
+            milestones.add_milestone_rows(self.game_infos[sid]['milestones'])
+        processed_data['milestones'] = milestones.build_outputs()
+
+        processed_data['overtime_games'] = OvertimeGamesProcessor(stubs, frame).process_overtime_games()
+        processed_data['blowout_games'] = BlowoutGamesProcessor(stubs, frame).process_blowout_games()
+
+        teams = TeamRecordsProcessor(stubs, frame)
+        for game_info in self._date_sorted_infos():
+            for key in game_info['team_keys']:
+                if teams.get_team_state(key) is None:
+                    teams.add_team_state(key, self.team_stats[key])
+            matchup = game_info['matchup']
+            if matchup and teams.get_head_to_head(matchup) is None:
+                teams.add_head_to_head(matchup, self.head_to_head[matchup])
+            teams.add_attendance_rows(game_info['attendance'])
+        team_data = teams.build_outputs()
+        processed_data['team_records'] = team_data['team_records']
+        processed_data['matchup_matrix'] = team_data['matchup_matrix']
+        processed_data['venue_records'] = team_data['venue_records']
+        processed_data['team_streaks'] = team_data['team_streaks']
+        processed_data['head_to_head'] = team_data['head_to_head_history']
+        processed_data['conference_standings'] = team_data['conference_standings']
+        processed_data['home_away_splits'] = team_data['home_away_splits']
+        processed_data['attendance_stats'] = team_data['attendance_stats']
+
+        return processed_data
+
+
+def _frames_equal(a: Any, b: Any) -> bool:
+    """Compare processed outputs (DataFrames or dicts of DataFrames)."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_frames_equal(a[k], b[k]) for k in a)
+    if isinstance(a, pd.DataFrame) and isinstance(b, pd.DataFrame):
+        return a.equals(b) and list(a.columns) == list(b.columns)
+    return False
+
+
+def diff_processed_data(incremental: Dict[str, Any], full: Dict[str, Any]) -> List[str]:
+    """
+    Return the output tables that differ between two processed-data dicts.
+
+    Args:
+        incremental: Output of AggregationStore.build_outputs()
+        full: Output of a full rebuild through the processors
+
+    Returns:
+        Sorted list of table names that do not match
+    """
+    names = set(incremental) | set(full)
+    return sorted(n for n in names if not _frames_equal(incremental.get(n), full.get(n)))
+
+
+def process_games_incremental(games: List[Dict[str, Any]], rebuild: bool = False) -> Dict[str, Any]:
+    """
+    Produce processed data through the persisted aggregation store.
+
+    Args:
+        games: Full list of parsed games, in processing order
+        rebuild: Discard the persisted store and rebuild it from every game
+
+    Returns:
+        Dictionary of processed DataFrames, identical to a full rebuild
+    """
+    store = AggregationStore()
+    if not rebuild and not store.load():
+        debug("No usable aggregation store; building from scratch")
+    counts = store.rebuild(games) if rebuild else store.sync(games)
+    info(f"  Aggregation store: {counts['added']} added, {counts['changed']} changed, "
+         f"{counts['removed']} removed, {counts['unchanged']} unchanged")
+    if counts['added'] or counts['changed'] or counts['removed'] or rebuild:
+        store.save()
+    return store.build_outputs()
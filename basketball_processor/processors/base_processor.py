@@ -5,21 +5,32 @@ Base processor class for game data processing.
 from typing import Dict, List, Any, Optional
 import pandas as pd
 
+from .game_frame import GameFrame
 from ..utils.helpers import get_team_code, safe_int, safe_float
 
 
 class BaseProcessor:
     """Base class for all game data processors."""
 
-    def __init__(self, games: List[Dict[str, Any]]):
+    def __init__(self, games: List[Dict[str, Any]], frame: Optional[GameFrame] = None):
         """
         Initialize processor with games data.
 
         Args:
             games: List of parsed game dictionaries
+            frame: GameFrame already built from games, shared between
+                processors; built on first use if not given
         """
         self.games = games
         self.game_count = len(games)
+        self._frame = frame
+
+    @property
+    def frame(self) -> GameFrame:
+        """Columnar games and player-lines tables for self.games."""
+        if self._frame is None:
+            self._frame = GameFrame(self.games)
+        return self._frame
 
     def create_dataframe(self, rows: List[Dict], columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -0,0 +1,216 @@
+"""
+Shared columnar view of a game list.
+
+The processors all read the same handful of fields from the nested game
+dictionaries (scores, dates, teams, player stat lines). GameFrame flattens a
+game list once into typed column lists that every processor reads instead:
+
+- games (game_values): one entry per game, in input order
+- player lines (line_values): one entry per named player line, in game order
+  with the away team's players first
+
+Dates are kept as the stored date_yyyymmdd strings, which processors sort
+and display, so a malformed date behaves as it always has. Scores and stats
+are ints converted with safe_int. Build one frame per run (or per batch of
+games) and pass it to each processor.
+"""
+
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from ..utils.helpers import normalize_name, parse_minutes, safe_int
+
+# Box score stats carried on every player line, in output column order
+PLAYER_LINE_STATS = (
+    'pts', 'trb', 'ast', 'stl', 'blk', 'tov', 'pf',
+    'fg', 'fga', 'fg3', 'fg3a', 'ft', 'fta',
+    'orb', 'drb',
+)
+
+_GAME_COLUMNS = (
+    'game_id', 'date', 'date_yyyymmdd', 'gender', 'division',
+    'away_team', 'home_team', 'away_score', 'home_score',
+    'venue', 'neutral_site', 'conference_game', 'attendance',
+    'home_team_slug', 'sports_ref_url',
+    'overtime', 'overtime_periods', 'blowout', 'blowout_margin', 'blowout_winner',
+)
+
+_LINE_COLUMNS = ('game', 'side', 'team', 'opponent', 'key', 'player', 'player_id')
+
+
+def player_key(player: Dict[str, Any]) -> str:
+    """Return the tracking key for a player line (player ID, else normalized name)."""
+    player_id = player.get('player_id', '')
+    return player_id if player_id else normalize_name(player.get('name', ''))
+
+
+def _int(value: Any) -> int:
+    # Parsed box scores are almost all ints already
+    return value if type(value) is int else safe_int(value)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    # Nullable columns keep missing and unparseable values as None
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _int_column(values: List[Any]) -> List[int]:
+    return [value if type(value) is int else safe_int(value) for value in values]
+
+
+def _game_columns(games: List[Dict[str, Any]]) -> Dict[str, list]:
+    columns: Dict[str, list] = {name: [] for name in _GAME_COLUMNS}
+
+    for game in games:
+        basic_info = game.get('basic_info', {})
+        special_events = game.get('special_events', {})
+
+        columns['game_id'].append(game.get('game_id', 'UNKNOWN'))
+        columns['date'].append(basic_info.get('date', ''))
+        columns['date_yyyymmdd'].append(basic_info.get('date_yyyymmdd', ''))
+        columns['gender'].append(basic_info.get('gender', 'M'))
+        columns['division'].append(basic_info.get('division', 'D1'))
+        columns['away_team'].append(basic_info.get('away_team', ''))
+        columns['home_team'].append(basic_info.get('home_team', ''))
+        columns['away_score'].append(_int(basic_info.get('away_score', 0)))
+        columns['home_score'].append(_int(basic_info.get('home_score', 0)))
+        columns['venue'].append(basic_info.get('venue', '') or '')
+        columns['neutral_site'].append(bool(basic_info.get('neutral_site', False)))
+        columns['conference_game'].append(bool(basic_info.get('conference_game', False)))
+        columns['attendance'].append(_optional_int(basic_info.get('attendance')))
+        columns['home_team_slug'].append(basic_info.get('home_team_slug', ''))
+        columns['sports_ref_url'].append(basic_info.get('sports_ref_url', ''))
+        columns['overtime'].append(bool(special_events.get('overtime_game')))
+        columns['overtime_periods'].append(_int(special_events.get('overtime_periods', 1)))
+        columns['blowout'].append(bool(special_events.get('blowout')))
+        columns['blowout_margin'].append(_int(special_events.get('blowout_margin', 0)))
+        columns['blowout_winner'].append(special_events.get('blowout_winner', '') or '')
+
+    return columns
+
+
+def _line_columns(games: List[Dict[str, Any]], game_columns: Dict[str, list]) -> Dict[str, list]:
+    columns: Dict[str, list] = {name: [] for name in _LINE_COLUMNS}
+    lines: List[Dict[str, Any]] = []
+    keys: Dict[str, str] = {}
+
+    for index, game in enumerate(games):
+        basic_info = game.get('basic_info', {})
+        box_score = game.get('box_score', {})
+
+        for side, opp_side in (('away', 'home'), ('home', 'away')):
+            side_data = box_score.get(side, {})
+            # Prefer merged 'players' key
+            players = side_data.get('players', []) or side_data.get('basic', [])
+            team = basic_info.get(f'{side}_team', '')
+            opponent = basic_info.get(f'{opp_side}_team', '')
+
+            for player in players:
+                name = player.get('name', '')
+                if not name:
+                    continue
+
+                player_id = player.get('player_id', '') or ''
+                if player_id:
+                    key = player_id
+                else:
+                    key = keys.get(name)
+                    if key is None:
+                        key = keys[name] = normalize_name(name)
+
+                lines.append(player)
+                columns['game'].append(index)
+                columns['side'].append(side)
+                columns['team'].append(team)
+                columns['opponent'].append(opponent)
+                columns['key'].append(key)
+                columns['player'].append(name)
+                columns['player_id'].append(player_id)
+
+    # Stats are converted column by column over the collected lines
+    columns['starter'] = [bool(line.get('starter', False)) for line in lines]
+    columns['minutes'] = [parse_minutes(line.get('mp', 0)) for line in lines]
+
+    away_scores = game_columns['away_score']
+    home_scores = game_columns['home_score']
+    columns['team_score'] = [
+        away_scores[game] if side == 'away' else home_scores[game]
+        for game, side in zip(columns['game'], columns['side'])
+    ]
+    columns['opp_score'] = [
+        home_scores[game] if side == 'away' else away_scores[game]
+        for game, side in zip(columns['game'], columns['side'])
+    ]
+
+    for stat in PLAYER_LINE_STATS:
+        columns[stat] = _int_column([line.get(stat, 0) for line in lines])
+    columns['game_score'] = _game_scores(columns)
+    return columns
+
+
+def _game_scores(columns: Dict[str, list]) -> List[float]:
+    """Hollinger Game Score per line, same arithmetic and rounding as calculate_game_score()."""
+    return [
+        round(
+            pts + 0.4 * fg - 0.7 * fga - 0.4 * (fta - ft) + 0.7 * orb + 0.3 * drb
+            + stl + 0.7 * ast + 0.7 * blk - 0.4 * pf - tov,
+            1,
+        )
+        for pts, fg, fga, fta, ft, orb, drb, stl, ast, blk, pf, tov in zip(
+            columns['pts'], columns['fg'], columns['fga'], columns['fta'], columns['ft'],
+            columns['orb'], columns['drb'], columns['stl'], columns['ast'], columns['blk'],
+            columns['pf'], columns['tov'],
+        )
+    ]
+
+
+class GameFrame:
+    """
+    Games and player lines of a game list as typed columns.
+
+    The flatten pass produces plain typed column lists, which is all the
+    processors read, so frames over a single game in the aggregation store
+    stay cheap. Player lines are flattened on first use.
+
+    Game columns (game_values): game_id, date, date_yyyymmdd (as stored),
+    gender (from basic_info), division, away/home team and score, venue,
+    neutral_site, conference_game, attendance (None when missing),
+    home_team_slug, sports_ref_url and the overtime/blowout special events.
+
+    Player line columns (line_values): game (index into the game columns),
+    side, team, opponent, key (see player_key()), player, player_id, starter,
+    minutes, team_score, opp_score, PLAYER_LINE_STATS and game_score.
+    """
+
+    def __init__(self, games: List[Dict[str, Any]]):
+        """
+        Args:
+            games: List of parsed game dictionaries
+        """
+        self._source = games
+        self._games = _game_columns(games)
+
+    def __len__(self) -> int:
+        return len(self._games['game_id'])
+
+    def game_values(self, *names: str) -> List[list]:
+        """
+        Get game columns as Python lists, shared by every caller (do not modify).
+
+        Missing attendance comes back as None.
+        """
+        return [self._games[name] for name in names]
+
+    @cached_property
+    def _lines(self) -> Dict[str, list]:
+        # Only player stats need the lines, so they are flattened on first use
+        return _line_columns(self._source, self._games)
+
+    def line_values(self, *names: str) -> List[list]:
+        """Get player line columns as Python lists, shared by every caller (do not modify)."""
+        return [self._lines[name] for name in names]
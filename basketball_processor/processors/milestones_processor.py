@@ -6,14 +6,14 @@ from typing import Dict, List, Any, Optional
 import pandas as pd
 
 from .base_processor import BaseProcessor
-from ..utils.helpers import safe_int
+from .game_frame import GameFrame
 
 
 class MilestonesProcessor(BaseProcessor):
     """Process and compile all milestones across games."""
 
-    def __init__(self, games: List[Dict[str, Any]]):
-        super().__init__(games)
+    def __init__(self, games: List[Dict[str, Any]], frame: Optional[GameFrame] = None):
+        super().__init__(games, frame)
         self.all_milestones = {}
 
     def process_all_milestones(self) -> Dict[str, pd.DataFrame]:
@@ -23,6 +23,16 @@ class MilestonesProcessor(BaseProcessor):
         Returns:
             Dictionary of milestone type -> DataFrame
         """
+        self.collect_milestones()
+        return self.build_outputs()
+
+    def collect_milestones(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect milestone rows from all games into self.all_milestones.
+
+        Returns:
+            Dictionary of milestone type -> rows (no DataFrames)
+        """
         # Standard box-score based milestones
         milestone_types = [
             'double_doubles',
@@ -53,15 +63,21 @@ class MilestonesProcessor(BaseProcessor):
             self.all_milestones[milestone_type] = []
 
         # Collect milestones from all games
-        for game in self.games:
-            basic_info = self.get_basic_info(game)
-            game_id = self.get_game_id(game)
-            date = basic_info.get('date', '')
-            gender = game.get('gender', 'M')
-            away_score = safe_int(basic_info.get('away_score', 0))
-            home_score = safe_int(basic_info.get('home_score', 0))
+        game_ids, dates, away_scores, home_scores = self.frame.game_values(
+            'game_id', 'date', 'away_score', 'home_score')
 
+        for index, game in enumerate(self.games):
             milestone_stats = game.get('milestone_stats', {})
+            espn_pbp = game.get('espn_pbp_analysis', {})
+            if not milestone_stats and not espn_pbp:
+                continue
+
+            game_id = game_ids[index]
+            date = dates[index]
+            # Milestone rows have always taken the top-level game gender
+            gender = game.get('gender', 'M')
+            away_score = away_scores[index]
+            home_score = home_scores[index]
 
             # Process standard box-score milestones
             for milestone_type in milestone_types:
@@ -92,14 +108,26 @@ class MilestonesProcessor(BaseProcessor):
                     })
 
             # Process ESPN PBP milestones
-            espn_pbp = game.get('espn_pbp_analysis', {})
             if espn_pbp:
                 self._process_espn_pbp_milestones(
                     game, espn_pbp, game_id, date, gender,
-                    basic_info, away_score, home_score
+                    self.get_basic_info(game), away_score, home_score
                 )
 
-        # Convert to DataFrames
+        return self.all_milestones
+
+    def add_milestone_rows(self, rows: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Append milestone rows returned by collect_milestones()."""
+        for milestone_type, entries in rows.items():
+            self.all_milestones.setdefault(milestone_type, []).extend(entries)
+
+    def build_outputs(self) -> Dict[str, pd.DataFrame]:
+        """
+        Convert collected milestone rows to DataFrames.
+
+        Returns:
+            Dictionary of milestone type -> DataFrame, sorted by date descending
+        """
         result = {}
         for milestone_type, entries in self.all_milestones.items():
             if entries:
@@ -230,21 +258,21 @@ class OvertimeGamesProcessor(BaseProcessor):
     def process_overtime_games(self) -> pd.DataFrame:
         """Get all overtime games."""
         ot_games = []
+        values = self.frame.game_values(
+            'overtime', 'date', 'away_team', 'home_team', 'away_score', 'home_score',
+            'overtime_periods', 'venue', 'game_id')
 
-        for game in self.games:
-            special_events = game.get('special_events', {})
-            if special_events.get('overtime_game'):
-                basic_info = self.get_basic_info(game)
-                ot_periods = special_events.get('overtime_periods', 1)
-
+        for (overtime, date, away_team, home_team, away_score, home_score,
+             ot_periods, venue, game_id) in zip(*values):
+            if overtime:
                 ot_games.append({
-                    'Date': basic_info.get('date', ''),
-                    'Away Team': basic_info.get('away_team', ''),
-                    'Home Team': basic_info.get('home_team', ''),
-                    'Score': f"{basic_info.get('away_score', 0)}-{basic_info.get('home_score', 0)}",
+                    'Date': date,
+                    'Away Team': away_team,
+                    'Home Team': home_team,
+                    'Score': f"{away_score}-{home_score}",
                     'OT Periods': ot_periods,
-                    'Venue': basic_info.get('venue', ''),
-                    'GameID': self.get_game_id(game),
+                    'Venue': venue,
+                    'GameID': game_id,
                 })
 
         df = pd.DataFrame(ot_games) if ot_games else pd.DataFrame()
@@ -259,26 +287,25 @@ class BlowoutGamesProcessor(BaseProcessor):
     def process_blowout_games(self) -> pd.DataFrame:
         """Get all blowout games."""
         blowouts = []
+        values = self.frame.game_values(
+            'blowout', 'date', 'away_team', 'home_team', 'away_score', 'home_score',
+            'blowout_margin', 'blowout_winner', 'venue', 'game_id')
 
-        for game in self.games:
-            special_events = game.get('special_events', {})
-            if special_events.get('blowout'):
-                basic_info = self.get_basic_info(game)
-                margin = special_events.get('blowout_margin', 0)
-                winner_side = special_events.get('blowout_winner', '')
-
-                winner = basic_info.get(f'{winner_side}_team', '') if winner_side else ''
-                loser_side = 'home' if winner_side == 'away' else 'away'
-                loser = basic_info.get(f'{loser_side}_team', '')
+        for (blowout, date, away_team, home_team, away_score, home_score,
+             margin, winner_side, venue, game_id) in zip(*values):
+            if blowout:
+                teams = {'away': away_team, 'home': home_team}
+                winner = teams.get(winner_side, '')
+                loser = teams['home' if winner_side == 'away' else 'away']
 
                 blowouts.append({
-                    'Date': basic_info.get('date', ''),
+                    'Date': date,
                     'Winner': winner,
                     'Loser': loser,
-                    'Score': f"{basic_info.get('away_score', 0)}-{basic_info.get('home_score', 0)}",
+                    'Score': f"{away_score}-{home_score}",
                     'Margin': margin,
-                    'Venue': basic_info.get('venue', ''),
-                    'GameID': self.get_game_id(game),
+                    'Venue': venue,
+                    'GameID': game_id,
                 })
 
         df = pd.DataFrame(blowouts) if blowouts else pd.DataFrame()
@@ -2,12 +2,12 @@
 Player statistics aggregation processor.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 from collections import defaultdict
 
 from .base_processor import BaseProcessor
-from ..utils.helpers import safe_int, safe_float, normalize_name, calculate_game_score
+from .game_frame import GameFrame, PLAYER_LINE_STATS, player_key
 from ..utils.stat_utils import (
     calculate_shooting_percentages,
     calculate_per_game_stats,
@@ -17,8 +17,8 @@ from ..utils.stat_utils import (
 class PlayerStatsProcessor(BaseProcessor):
     """Process and aggregate player statistics across games."""
 
-    def __init__(self, games: List[Dict[str, Any]]):
-        super().__init__(games)
+    def __init__(self, games: List[Dict[str, Any]], frame: Optional[GameFrame] = None):
+        super().__init__(games, frame)
         self.player_totals = defaultdict(lambda: defaultdict(int))
         self.player_games = defaultdict(list)
         self.player_teams = defaultdict(set)
@@ -50,8 +50,16 @@ class PlayerStatsProcessor(BaseProcessor):
             - 'starters_vs_bench': DataFrame with starters vs bench splits
             - 'season_highs': DataFrame with season high performances
         """
-        self._aggregate_player_stats()
+        self.aggregate_player_stats()
+        return self.build_outputs()
 
+    def build_outputs(self) -> Dict[str, pd.DataFrame]:
+        """
+        Build the output DataFrames from already-aggregated player state.
+
+        Returns:
+            Same dictionary as process_all_player_stats()
+        """
         players_df = self._create_players_dataframe()
         player_games_df = self._create_player_games_dataframe()
         starters_bench_df = self._create_starters_bench_dataframe()
@@ -64,128 +72,145 @@ class PlayerStatsProcessor(BaseProcessor):
             'season_highs': season_highs_df,
         }
 
-    def _aggregate_player_stats(self) -> None:
-        """Aggregate statistics for each player across all games."""
-        stat_keys = [
-            'pts', 'trb', 'ast', 'stl', 'blk', 'tov', 'pf',
-            'fg', 'fga', 'fg3', 'fg3a', 'ft', 'fta',
-            'orb', 'drb',
-        ]
-
-        for game in self.games:
-            basic_info = self.get_basic_info(game)
-            game_id = self.get_game_id(game)
-            date = basic_info.get('date', '')
-            date_yyyymmdd = basic_info.get('date_yyyymmdd', '')
-            gender = basic_info.get('gender', 'M')
-            division = basic_info.get('division', 'D1')
-
-            for side in ['away', 'home']:
-                team = basic_info.get(f'{side}_team', '')
-                opponent = basic_info.get('home_team' if side == 'away' else 'away_team', '')
-                team_score = safe_int(basic_info.get(f'{side}_score', 0))
-                opp_score = safe_int(basic_info.get('home_score' if side == 'away' else 'away_score', 0))
-                won = team_score > opp_score
-
-                players = self.get_players_for_side(game, side)
-
-                for player in players:
-                    player_name = player.get('name', '')
-                    player_id = player.get('player_id', '')
-
-                    if not player_name:
-                        continue
-
-                    # Normalize name for consistent tracking
-                    key = player_id if player_id else normalize_name(player_name)
-
-                    # Store player ID mapping
-                    if player_id:
-                        self.player_ids[key] = player_id
-
-                    # Track teams
-                    self.player_teams[key].add(team)
-
-                    # Track gender
-                    self.player_genders[key].add(gender)
-
-                    # Track division
-                    self.player_divisions[key].add(division)
-
-                    # Track name (use most recent)
-                    self.player_totals[key]['name'] = player_name
-
-                    # Aggregate stats
-                    for stat in stat_keys:
-                        value = safe_int(player.get(stat, 0))
-                        self.player_totals[key][stat] += value
-
-                    # Track games played
-                    mp = player.get('mp', 0)
-                    if isinstance(mp, str) and ':' in mp:
-                        parts = mp.split(':')
-                        minutes = int(parts[0]) + int(parts[1]) / 60.0
-                    else:
-                        minutes = safe_float(mp, 0)
-
-                    if minutes > 0 or safe_int(player.get('pts', 0)) > 0:
-                        self.player_totals[key]['games'] += 1
-                        self.player_totals[key]['minutes'] += minutes
-
-                    # Track wins
-                    if won:
-                        self.player_totals[key]['wins'] += 1
-
-                    # Calculate game score for this performance
-                    player_stats = {stat: safe_int(player.get(stat, 0)) for stat in stat_keys}
-                    player_stats['mp'] = minutes
-                    game_score = calculate_game_score(player_stats)
-
-                    # Track starters vs bench stats
-                    is_starter = player.get('starter', False)
-                    split_dict = self.starter_totals if is_starter else self.bench_totals
-
-                    for stat in stat_keys:
-                        value = safe_int(player.get(stat, 0))
-                        split_dict[team][stat] += value
-                    split_dict[team]['games'] += 1
-                    split_dict[team]['minutes'] += minutes
-
-                    # Track season highs
-                    highs = self.player_season_highs[key]
-                    for stat in ['pts', 'trb', 'ast', 'stl', 'blk', 'fg3']:
-                        value = safe_int(player.get(stat, 0))
-                        if value > highs[stat]['value']:
-                            highs[stat] = {
-                                'value': value,
-                                'game_id': game_id,
-                                'date': date,
-                                'opponent': opponent,
-                            }
-                    if game_score > highs['game_score']['value']:
-                        highs['game_score'] = {
-                            'value': game_score,
-                            'game_id': game_id,
-                            'date': date,
-                            'opponent': opponent,
-                        }
-
-                    # Store per-game record
-                    self.player_games[key].append({
-                        'player': player_name,
-                        'player_id': player_id,
+    @staticmethod
+    def player_key(player: Dict[str, Any]) -> str:
+        """Return the tracking key for a player line (player ID, else normalized name)."""
+        return player_key(player)
+
+    def aggregate_player_stats(self) -> None:
+        """Aggregate statistics for each player across all games (no DataFrames)."""
+        game_ids, dates, date_strings, genders, divisions = self.frame.game_values(
+            'game_id', 'date', 'date_yyyymmdd', 'gender', 'division')
+        lines = self.frame.line_values(
+            'game', 'team', 'opponent', 'team_score', 'opp_score', 'key', 'player', 'player_id',
+            'starter', 'minutes', 'game_score', *PLAYER_LINE_STATS)
+
+        for (game, team, opponent, team_score, opp_score, key, player_name, player_id,
+             is_starter, minutes, game_score, *stat_values) in zip(*lines):
+            game_id = game_ids[game]
+            date = dates[game]
+            gender = genders[game]
+            won = team_score > opp_score
+            player_stats = dict(zip(PLAYER_LINE_STATS, stat_values))
+
+            # Store player ID mapping
+            if player_id:
+                self.player_ids[key] = player_id
+
+            # Track teams
+            self.player_teams[key].add(team)
+
+            # Track gender
+            self.player_genders[key].add(gender)
+
+            # Track division
+            self.player_divisions[key].add(divisions[game])
+
+            # Track name (use most recent)
+            totals = self.player_totals[key]
+            totals['name'] = player_name
+
+            # Aggregate stats
+            for stat, value in player_stats.items():
+                totals[stat] += value
+
+            # Track games played
+            if minutes > 0 or player_stats['pts'] > 0:
+                totals['games'] += 1
+                totals['minutes'] += minutes
+
+            # Track wins
+            if won:
+                totals['wins'] += 1
+
+            # Track starters vs bench stats
+            split_totals = (self.starter_totals if is_starter else self.bench_totals)[team]
+            for stat, value in player_stats.items():
+                split_totals[stat] += value
+            split_totals['games'] += 1
+            split_totals['minutes'] += minutes
+
+            # Track season highs
+            highs = self.player_season_highs[key]
+            for stat in ['pts', 'trb', 'ast', 'stl', 'blk', 'fg3']:
+                value = player_stats[stat]
+                if value > highs[stat]['value']:
+                    highs[stat] = {
+                        'value': value,
+                        'game_id': game_id,
                         'date': date,
-                        'date_yyyymmdd': date_yyyymmdd,
-                        'team': team,
                         'opponent': opponent,
-                        'result': 'W' if won else 'L',
-                        'score': f"{team_score}-{opp_score}",
-                        'game_id': game_id,
-                        'starter': is_starter,
-                        'gender': gender,
-                        **player_stats,
-                        'game_score': game_score,
-                    })
+                    }
+            if game_score > highs['game_score']['value']:
+                highs['game_score'] = {
+                    'value': game_score,
+                    'game_id': game_id,
+                    'date': date,
+                    'opponent': opponent,
+                }
+
+            # Store per-game record
+            player_stats['mp'] = minutes
+            self.player_games[key].append({
+                'player': player_name,
+                'player_id': player_id,
+                'date': date,
+                'date_yyyymmdd': date_strings[game],
+                'team': team,
+                'opponent': opponent,
+                'result': 'W' if won else 'L',
+                'score': f"{team_score}-{opp_score}",
+                'game_id': game_id,
+                'starter': is_starter,
+                'gender': gender,
+                **player_stats,
+                'game_score': game_score,
+            })
+
+    def get_player_state(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the aggregated state for one player key.
+
+        Returns:
+            Dictionary with 'totals', 'games', 'teams', 'player_id', 'genders',
+            'divisions' and 'season_highs', or None if the key was not seen
+        """
+        if key not in self.player_totals:
+            return None
+        return {
+            'totals': dict(self.player_totals[key]),
+            'games': self.player_games[key],
+            'teams': self.player_teams[key],
+            'player_id': self.player_ids.get(key),
+            'genders': self.player_genders[key],
+            'divisions': self.player_divisions[key],
+            'season_highs': self.player_season_highs[key],
+        }
+
+    def add_player_state(self, key: str, state: Dict[str, Any]) -> None:
+        """Load state returned by get_player_state() for a player not yet aggregated."""
+        self.player_totals[key].update(state['totals'])
+        self.player_games[key] = state['games']
+        self.player_teams[key] = state['teams']
+        if state['player_id'] is not None:
+            self.player_ids[key] = state['player_id']
+        self.player_genders[key] = state['genders']
+        self.player_divisions[key] = state['divisions']
+        self.player_season_highs[key] = state['season_highs']
+
+    def get_split_totals(self, team: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Return a team's (starter, bench) totals; None for a split with no lines."""
+        starter = dict(self.starter_totals[team]) if team in self.starter_totals else None
+        bench = dict(self.bench_totals[team]) if team in self.bench_totals else None
+        return starter, bench
+
+    def add_split_totals(self, team: str, starter: Optional[Dict[str, Any]],
+                         bench: Optional[Dict[str, Any]]) -> None:
+        """Load totals returned by get_split_totals()."""
+        if starter is not None:
+            self.starter_totals[team].update(starter)
+        if bench is not None:
+            self.bench_totals[team].update(bench)
 
     def _create_players_dataframe(self) -> pd.DataFrame:
         """Create aggregated players DataFrame."""
@@ -2,21 +2,23 @@
 Team records and statistics processor.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
 import pandas as pd
 from collections import defaultdict
 
 from .base_processor import BaseProcessor
-from ..utils.helpers import safe_int, get_team_code
-from ..utils.constants import CONFERENCES, get_conference, get_conference_for_date
+from .game_frame import GameFrame
+from ..utils.helpers import get_team_code
+from ..utils.constants import CONFERENCES
+from ..utils.team_names import get_team_resolver
 
 
 class TeamRecordsProcessor(BaseProcessor):
     """Process team-level statistics and records."""
 
-    def __init__(self, games: List[Dict[str, Any]]):
-        super().__init__(games)
-        self.team_stats = defaultdict(lambda: {
+    def __init__(self, games: List[Dict[str, Any]], frame: Optional[GameFrame] = None):
+        super().__init__(games, frame)
+        self.team_stats: DefaultDict[str, Dict[str, Any]] = defaultdict(lambda: {
             'wins': 0,
             'losses': 0,
             'home_wins': 0,
@@ -33,8 +35,9 @@ class TeamRecordsProcessor(BaseProcessor):
             'conf_wins': 0,
             'conf_losses': 0,
         })
-        self.head_to_head = defaultdict(list)  # Track all games between teams
-        self.attendance_data = []  # Track attendance per game
+        # Track all games between teams
+        self.head_to_head: DefaultDict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        self.attendance_data: List[Dict[str, Any]] = []  # Track attendance per game
 
     def process_team_records(self) -> Dict[str, pd.DataFrame]:
         """
@@ -51,8 +54,16 @@ class TeamRecordsProcessor(BaseProcessor):
             - 'home_away_splits': Detailed home/away/neutral splits
             - 'attendance_stats': Attendance statistics
         """
-        self._aggregate_team_stats()
+        self.aggregate_team_stats()
+        return self.build_outputs()
 
+    def build_outputs(self) -> Dict[str, pd.DataFrame]:
+        """
+        Build the output DataFrames from already-aggregated team state.
+
+        Returns:
+            Same dictionary as process_team_records()
+        """
         return {
             'team_records': self._create_team_records_df(),
             'matchup_matrix': self._create_matchup_matrix(),
@@ -64,42 +75,45 @@ class TeamRecordsProcessor(BaseProcessor):
             'attendance_stats': self._create_attendance_stats_df(),
         }
 
-    def _aggregate_team_stats(self) -> None:
-        """Aggregate statistics for each team."""
-        # Sort games by date first
-        sorted_games = sorted(self.games,
-            key=lambda g: g.get('basic_info', {}).get('date_yyyymmdd', ''))
+    def aggregate_team_stats(self) -> None:
+        """Aggregate statistics for each team (no DataFrames)."""
+        (game_ids, dates, date_strings, genders, away_teams, home_teams, away_scores, home_scores,
+         venues, attendances, neutral_sites, conference_games) = self.frame.game_values(
+            'game_id', 'date', 'date_yyyymmdd', 'gender', 'away_team', 'home_team',
+            'away_score', 'home_score', 'venue', 'attendance', 'neutral_site', 'conference_game')
 
-        for game in sorted_games:
-            basic_info = self.get_basic_info(game)
-            game_id = self.get_game_id(game)
-            date = basic_info.get('date', '')
-            date_yyyymmdd = basic_info.get('date_yyyymmdd', '')
-            gender = basic_info.get('gender', 'M')
+        resolver = get_team_resolver()
+
+        # Walk games by date first
+        for index in sorted(range(len(game_ids)), key=date_strings.__getitem__):
+            game_id = game_ids[index]
+            date = dates[index]
+            date_yyyymmdd = date_strings[index]
+            gender = genders[index]
 
             # Use team|gender as key to separate men's and women's teams
-            away_team_raw = basic_info.get('away_team', '')
-            home_team_raw = basic_info.get('home_team', '')
+            away_team_raw = away_teams[index]
+            home_team_raw = home_teams[index]
             away_team = f"{away_team_raw}|{gender}"
             home_team = f"{home_team_raw}|{gender}"
-            away_score = safe_int(basic_info.get('away_score', 0))
-            home_score = safe_int(basic_info.get('home_score', 0))
-            venue = basic_info.get('venue', '')
-            attendance = basic_info.get('attendance')
-            is_neutral = basic_info.get('neutral_site', False)
+            away_score = away_scores[index]
+            home_score = home_scores[index]
+            venue = venues[index]
+            attendance = attendances[index]
+            is_neutral = neutral_sites[index]
+
+            if not away_team_raw or not home_team_raw:
+                continue
 
             # Auto-detect conference games - check if both teams are in the same conference
             # Use date-aware lookup to handle historical conference affiliations
-            is_conference = basic_info.get('conference_game', False)
+            is_conference = conference_games[index]
             if not is_conference:
-                away_conf = get_conference_for_date(away_team_raw, date_yyyymmdd)
-                home_conf = get_conference_for_date(home_team_raw, date_yyyymmdd)
+                away_conf = resolver.resolve(away_team_raw, date_yyyymmdd).conference
+                home_conf = resolver.resolve(home_team_raw, date_yyyymmdd).conference
                 if away_conf and home_conf and away_conf == home_conf:
                     is_conference = True
 
-            if not away_team_raw or not home_team_raw:
-                continue
-
             # Track attendance (use raw team names for display)
             if attendance:
                 self.attendance_data.append({
@@ -180,15 +194,39 @@ class TeamRecordsProcessor(BaseProcessor):
                     self.team_stats[away_team]['conf_losses'] += 1
                     self.team_stats[home_team]['conf_wins'] += 1
 
-        # Determine conferences for teams (using get_conference which handles aliases)
+        # Determine current conferences for teams (the resolver handles aliases)
         for team_key in self.team_stats.keys():
             # Split team|gender key to get raw team name for conference lookup
             parts = team_key.rsplit('|', 1)
             team_name = parts[0]
-            conf = get_conference(team_name)
+            conf = resolver.resolve(team_name).conference
             if conf:
                 self.team_stats[team_key]['conference'] = conf
 
+    def get_team_state(self, team_key: str) -> Optional[Dict[str, Any]]:
+        """Return the aggregated stats for a team|gender key, or None if it played no game."""
+        return self.team_stats.get(team_key)
+
+    def add_team_state(self, team_key: str, stats: Dict[str, Any]) -> None:
+        """Load stats returned by get_team_state()."""
+        self.team_stats[team_key] = stats
+
+    def get_head_to_head(self, matchup: Tuple[str, ...]) -> Optional[List[Dict[str, Any]]]:
+        """Return the games for a sorted (team|gender, team|gender) matchup, or None."""
+        return self.head_to_head.get(matchup)
+
+    def add_head_to_head(self, matchup: Tuple[str, ...], games: List[Dict[str, Any]]) -> None:
+        """Load games returned by get_head_to_head()."""
+        self.head_to_head[matchup] = games
+
+    def get_attendance_rows(self) -> List[Dict[str, Any]]:
+        """Return the per-game attendance rows collected by aggregate_team_stats()."""
+        return self.attendance_data
+
+    def add_attendance_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Append attendance rows returned by get_attendance_rows()."""
+        self.attendance_data.extend(rows)
+
     def _create_team_records_df(self) -> pd.DataFrame:
         """Create team records DataFrame."""
         rows = []
@@ -241,15 +279,12 @@ class TeamRecordsProcessor(BaseProcessor):
 
     def _create_matchup_matrix(self) -> pd.DataFrame:
         """Create team vs team matchup matrix."""
-        matchups = defaultdict(lambda: defaultdict(lambda: {'wins': 0, 'losses': 0}))
+        matchups: DefaultDict[str, DefaultDict[str, Dict[str, int]]] = defaultdict(
+            lambda: defaultdict(lambda: {'wins': 0, 'losses': 0}))
 
-        for game in self.games:
-            basic_info = self.get_basic_info(game)
-            away_team = basic_info.get('away_team', '')
-            home_team = basic_info.get('home_team', '')
-            away_score = safe_int(basic_info.get('away_score', 0))
-            home_score = safe_int(basic_info.get('home_score', 0))
+        values = self.frame.game_values('away_team', 'home_team', 'away_score', 'home_score')
 
+        for away_team, home_team, away_score, home_score in zip(*values):
             if not away_team or not home_team:
                 continue
 
@@ -290,7 +325,7 @@ class TeamRecordsProcessor(BaseProcessor):
             'Kezar Pavilion',  # Academy of Art's former venue
         }
 
-        venue_stats = defaultdict(lambda: {
+        venue_stats: DefaultDict[str, Dict[str, Any]] = defaultdict(lambda: {
             'games': 0,
             'home_points': 0,
             'away_points': 0,
@@ -300,17 +335,12 @@ class TeamRecordsProcessor(BaseProcessor):
             'home_team': None,  # Track primary home team
         })
 
-        for game in self.games:
-            basic_info = self.get_basic_info(game)
-            venue = basic_info.get('venue', '')
+        values = self.frame.game_values('venue', 'away_score', 'home_score', 'division', 'home_team')
+
+        for venue, away_score, home_score, division, home_team in zip(*values):
             if not venue:
                 venue = 'Unknown'
 
-            away_score = safe_int(basic_info.get('away_score', 0))
-            home_score = safe_int(basic_info.get('home_score', 0))
-            division = basic_info.get('division', 'D1')
-            home_team = basic_info.get('home_team', '')
-
             venue_stats[venue]['games'] += 1
             venue_stats[venue]['home_points'] += home_score
             venue_stats[venue]['away_points'] += away_score
@@ -367,7 +397,7 @@ class TeamRecordsProcessor(BaseProcessor):
 
     def _create_streaks_df(self) -> pd.DataFrame:
         """Create team streaks DataFrame (current and longest win/loss streaks)."""
-        rows = []
+        rows: List[Dict[str, Any]] = []
 
         for team_key, stats in self.team_stats.items():
             results = stats.get('game_results', [])
@@ -574,41 +604,47 @@ class GameLogProcessor(BaseProcessor):
         """Create chronological game log."""
         from ..utils.venue_resolver import parse_venue_components
 
-        rows = []
-
-        for game in self.games:
-            basic_info = self.get_basic_info(game)
-            special_events = game.get('special_events', {})
+        values = self.frame.game_values(
+            'date', 'date_yyyymmdd', 'away_team', 'away_score', 'home_team', 'home_score',
+            'overtime', 'overtime_periods', 'blowout', 'blowout_margin', 'game_id',
+            'home_team_slug', 'sports_ref_url', 'gender', 'division', 'neutral_site', 'attendance',
+            'venue')
+        # Venues repeat across games; parse each one once
+        venue_parts: Dict[str, Dict[str, str]] = {}
 
+        rows = []
+        for (date, date_yyyymmdd, away_team, away_score, home_team, home_score,
+             overtime, ot, blowout, margin, game_id,
+             home_team_slug, sports_ref_url, gender, division, neutral, attendance,
+             venue_full) in zip(*values):
             notes = []
-            if special_events.get('overtime_game'):
-                ot = special_events.get('overtime_periods', 1)
+            if overtime:
                 notes.append(f"{'OT' if ot == 1 else f'{ot}OT'}")
-            if special_events.get('blowout'):
-                notes.append(f"+{special_events.get('blowout_margin', 0)}")
+            if blowout:
+                notes.append(f"+{margin}")
 
-            # Parse venue into components
-            venue_full = basic_info.get('venue', '')
-            venue_parts = parse_venue_components(venue_full)
+            venue = venue_parts.get(venue_full)
+            if venue is None:
+                venue = venue_parts[venue_full] = parse_venue_components(venue_full)
 
             rows.append({
-                'Date': basic_info.get('date', ''),
-                'DateSort': basic_info.get('date_yyyymmdd', ''),
-                'Away Team': basic_info.get('away_team', ''),
-                'Away Score': safe_int(basic_info.get('away_score', 0)),
-                'Home Team': basic_info.get('home_team', ''),
-                'Home Score': safe_int(basic_info.get('home_score', 0)),
-                'Venue': venue_parts['name'],
-                'City': venue_parts['city'],
-                'State': venue_parts['state'],
+                'Date': date,
+                'DateSort': date_yyyymmdd,
+                'Away Team': away_team,
+                'Away Score': away_score,
+                'Home Team': home_team,
+                'Home Score': home_score,
+                'Venue': venue['name'],
+                'City': venue['city'],
+                'State': venue['state'],
                 'Notes': ', '.join(notes) if notes else '',
-                'GameID': self.get_game_id(game),
-                'HomeTeamSlug': basic_info.get('home_team_slug', ''),
-                'SportsRefURL': basic_info.get('sports_ref_url', ''),
-                'Gender': basic_info.get('gender', 'M'),
-                'Division': basic_info.get('division', 'D1'),  # D1, D2, D3, NAIA
-                'Neutral': basic_info.get('neutral_site', False),
-                'Attendance': basic_info.get('attendance'),
+                'GameID': game_id,
+                'HomeTeamSlug': home_team_slug,
+                'SportsRefURL': sports_ref_url,
+                'Gender': gender,
+                'Division': division,  # D1, D2, D3, NAIA
+                'Neutral': neutral,
+                'Attendance': attendance,
             })
 
         # Sort by date descending (using YYYYMMDD format for proper chronological order)
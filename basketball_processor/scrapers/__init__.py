@@ -5,6 +5,8 @@ from .poll_scraper import (
     get_team_rank,
     get_rankings_for_game,
     load_existing_polls,
+    get_poll_index,
+    PollIndex,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     'get_team_rank',
     'get_rankings_for_game',
     'load_existing_polls',
+    'get_poll_index',
+    'PollIndex',
 ]
@@ -19,24 +19,19 @@ Usage:
 """
 
 import json
+import os
 import re
-import time
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 
 from ..utils.log import info, warn, error, debug
+from ..utils.http_client import HAS_REQUESTS, http_get
 
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-
-
-# Rate limiting: Sports Reference asks for 3+ seconds between requests
-REQUEST_DELAY = 3.05  # seconds between requests
+# Sports Reference asks for 3+ seconds between requests; the shared HTTP
+# client enforces that per host (see HOST_RATE_LIMITS)
 USER_AGENT = "Mozilla/5.0 (compatible; CollegeBasketballTracker/1.0)"
 
 # File paths
@@ -202,12 +197,10 @@ def fetch_polls_from_url(url: str) -> Optional[BeautifulSoup]:
         return None
 
     debug(f"Fetching: {url}")
-    debug(f"Waiting {REQUEST_DELAY}s to respect rate limits...")
-    time.sleep(REQUEST_DELAY)
 
     try:
         headers = {'User-Agent': USER_AGENT}
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_get(url, headers=headers, timeout=30)
         response.raise_for_status()
         return BeautifulSoup(response.text, 'html.parser')
     except Exception as e:
@@ -244,9 +237,102 @@ def save_polls(all_polls: Dict[str, Dict[str, Dict[str, int]]], gender: str = 'M
     polls_file = get_polls_file(gender)
     with open(polls_file, 'w') as f:
         json.dump(all_polls, f, indent=2, sort_keys=True)
+    _poll_indexes.pop(gender, None)
     debug(f"Saved polls to: {polls_file}")
 
 
+class PollIndex:
+    """Pre-sorted, alias-resolved view of a gender's AP polls for fast lookups.
+
+    For each season, poll dates are kept sorted for bisect, and each poll has
+    both its raw team -> rank map and a canonical-name map built through
+    TEAM_ALIASES, so get_team_rank never scans a poll's rankings.
+    """
+
+    def __init__(self, all_polls: Dict[str, Dict[str, Dict[str, int]]]):
+        from ..utils.constants import TEAM_ALIASES
+
+        # season -> sorted poll dates
+        self.poll_dates: Dict[str, List[str]] = {}
+        # season -> poll date -> team name as listed -> rank
+        self.rankings: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # season -> poll date -> canonical name -> (position in poll, rank)
+        self.canonical_rankings: Dict[str, Dict[str, Dict[str, Tuple[int, int]]]] = {}
+
+        for season, season_polls in all_polls.items():
+            self.poll_dates[season] = sorted(season_polls.keys())
+            self.rankings[season] = season_polls
+            canonical_by_date = {}
+            for poll_date, rankings in season_polls.items():
+                canonical_map: Dict[str, Tuple[int, int]] = {}
+                for position, (poll_team, rank) in enumerate(rankings.items()):
+                    canonical_map.setdefault(TEAM_ALIASES.get(poll_team, poll_team), (position, rank))
+                canonical_by_date[poll_date] = canonical_map
+            self.canonical_rankings[season] = canonical_by_date
+
+        self._aliases = TEAM_ALIASES
+
+    def __bool__(self) -> bool:
+        return bool(self.poll_dates)
+
+    def applicable_poll_date(self, game_date: str, season: str) -> Optional[str]:
+        """Return the most recent poll date on or before game_date, if any."""
+        poll_dates = self.poll_dates.get(season)
+        if not poll_dates:
+            return None
+        i = bisect_right(poll_dates, game_date) - 1
+        return poll_dates[i] if i >= 0 else None
+
+    def latest_poll_date(self, season: str) -> Optional[str]:
+        """Return the last poll date in a season, if any."""
+        poll_dates = self.poll_dates.get(season)
+        return poll_dates[-1] if poll_dates else None
+
+    def get_rank(self, team_name: str, game_date: str, season: str) -> Optional[int]:
+        """Look up a team's rank; see get_team_rank for matching rules."""
+        poll_date = self.applicable_poll_date(game_date, season)
+        if not poll_date:
+            return None
+
+        rankings = self.rankings[season][poll_date]
+
+        # Try exact match first
+        if team_name in rankings:
+            return rankings[team_name]
+
+        # Try alias lookup
+        canonical = self._aliases.get(team_name, team_name)
+        if canonical in rankings:
+            return rankings[canonical]
+
+        # Try reverse: maybe the poll uses an alias (earliest listed team wins)
+        canonical_map = self.canonical_rankings[season][poll_date]
+        matches = [m for m in (canonical_map.get(team_name), canonical_map.get(canonical)) if m]
+        if matches:
+            return min(matches)[1]
+
+        return None
+
+
+# Cached PollIndex per gender, with the polls file mtime it was built from
+_poll_indexes: Dict[str, Tuple[Optional[float], PollIndex]] = {}
+
+
+def get_poll_index(gender: str = 'M') -> PollIndex:
+    """Return the cached PollIndex for a gender, rebuilding if the file changed."""
+    polls_file = get_polls_file(gender)
+    try:
+        mtime: Optional[float] = os.path.getmtime(polls_file)
+    except OSError:
+        mtime = None
+
+    cached = _poll_indexes.get(gender)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, PollIndex(load_existing_polls(gender)))
+        _poll_indexes[gender] = cached
+    return cached[1]
+
+
 def scrape_season_polls(season: str, local_file: Optional[Path] = None, gender: str = 'M') -> Dict[str, Dict[str, int]]:
     """Scrape AP polls for a season.
 
@@ -289,48 +375,7 @@ def get_team_rank(team_name: str, game_date: str, season: str, gender: str = 'M'
     Returns:
         Rank (1-25) or None if unranked
     """
-    all_polls = load_existing_polls(gender)
-
-    if season not in all_polls:
-        return None
-
-    season_polls = all_polls[season]
-
-    # Find the most recent poll before/on the game date
-    poll_dates = sorted(season_polls.keys())
-    applicable_poll = None
-
-    for poll_date in poll_dates:
-        if poll_date <= game_date:
-            applicable_poll = poll_date
-        else:
-            break
-
-    if not applicable_poll:
-        return None
-
-    rankings = season_polls[applicable_poll]
-
-    # Try exact match first
-    if team_name in rankings:
-        return rankings[team_name]
-
-    # Try alias lookup
-    try:
-        from ..utils.constants import TEAM_ALIASES
-        canonical = TEAM_ALIASES.get(team_name, team_name)
-        if canonical in rankings:
-            return rankings[canonical]
-
-        # Try reverse: maybe the poll uses an alias
-        for poll_team, rank in rankings.items():
-            poll_canonical = TEAM_ALIASES.get(poll_team, poll_team)
-            if poll_canonical == team_name or poll_canonical == canonical:
-                return rank
-    except ImportError:
-        pass
-
-    return None
+    return get_poll_index(gender).get_rank(team_name, game_date, season)
 
 
 def get_rankings_for_game(away_team: str, home_team: str, game_date: str, season: str, gender: str = 'M') -> Tuple[Optional[int], Optional[int]]:
@@ -382,17 +427,7 @@ def is_basketball_season() -> bool:
 
 def get_latest_poll_date(gender: str = 'M') -> Optional[str]:
     """Get the most recent poll date in the cache for current season."""
-    all_polls = load_existing_polls(gender)
-    current_season = get_current_season()
-
-    if current_season not in all_polls:
-        return None
-
-    season_polls = all_polls[current_season]
-    if not season_polls:
-        return None
-
-    return max(season_polls.keys())
+    return get_poll_index(gender).latest_poll_date(get_current_season())
 
 
 def should_refresh_polls(gender: str = 'M') -> bool:
@@ -409,7 +444,6 @@ def should_refresh_polls(gender: str = 'M') -> bool:
     # Check cache file age - don't refresh more than once per day
     polls_file = get_polls_file(gender)
     if polls_file.exists():
-        import os
         file_age_hours = (datetime.now().timestamp() - os.path.getmtime(polls_file)) / 3600
         if file_age_hours < 20:  # Less than 20 hours old, skip refresh
             return False
@@ -490,6 +490,19 @@ CONFERENCES = _load_conferences()
 D2_CONFERENCES = _load_d2_conferences()
 D3_CONFERENCES = _load_d3_conferences()
 
+
+def reload_conferences() -> None:
+    """Reload D1/D2/D3 conference data from disk and drop the lookup index.
+
+    Rebinds CONFERENCES, D2_CONFERENCES and D3_CONFERENCES; modules that imported
+    those names directly keep their old objects.
+    """
+    global CONFERENCES, D2_CONFERENCES, D3_CONFERENCES, _conference_index
+    CONFERENCES = _load_conferences()
+    D2_CONFERENCES = _load_d2_conferences()
+    D3_CONFERENCES = _load_d3_conferences()
+    _conference_index = None
+
 # === DEFUNCT TEAMS ===
 # Teams that no longer have active programs - included in conferences for historical
 # badge attribution but excluded from checklist of teams to see
@@ -510,7 +523,7 @@ D1_EXIT_TEAMS = {
 # Teams transitioning into Division I that aren't yet in CONFERENCES
 # Format: 'Team': (entry_date_YYYYMMDD, 'D1 Conference')
 # Note: Most recent D1 transition teams are already in CONFERENCES directly
-D1_ENTRY_TEAMS = {
+D1_ENTRY_TEAMS: Dict[str, Tuple[int, str]] = {
     # Add future D1 transition teams here as needed
 }
 
@@ -1407,6 +1420,58 @@ NON_D1_SCHOOLS = {
     'Davenport', 'Grand Canyon JV',
 }
 
+# Lazily built lookup index for get_conference, tagged with the identities of the
+# source tables so rebinding CONFERENCES / D2_CONFERENCES / D3_CONFERENCES /
+# TEAM_ALIASES (e.g. via reload_conferences) triggers a rebuild.
+_conference_index: Optional[Tuple[Tuple[int, ...], Dict[str, str], Dict[str, str]]] = None
+
+# Marker for a team whose first conference listing is the generic 'D3' placeholder
+_D3_PLACEHOLDER = 'D3'
+
+
+def _first_d1_conference(team_name: str, d1_index: Dict[str, str]) -> Optional[str]:
+    """Return a team's D1 conference from the index, treating the 'D3' placeholder as a miss."""
+    conf = d1_index.get(team_name)
+    if conf == _D3_PLACEHOLDER:
+        return None
+    return conf
+
+
+def _build_conference_index() -> Tuple[Tuple[int, ...], Dict[str, str], Dict[str, str]]:
+    """
+    Build name -> conference maps equivalent to the scans in get_conference.
+
+    Returns:
+        Tuple of (source identities, first D1 conference listing per team
+        (may be the 'D3' placeholder), D1 conference reached via reverse alias)
+    """
+    d1_index: Dict[str, str] = {}
+    for conf, teams in CONFERENCES.items():
+        for team in teams:
+            # First listing wins, matching the in-order scan
+            d1_index.setdefault(team, conf)
+
+    reverse_alias_index: Dict[str, str] = {}
+    for alias, canon in TEAM_ALIASES.items():
+        if canon in reverse_alias_index:
+            continue
+        alias_conf = _first_d1_conference(alias, d1_index)
+        if alias_conf:
+            reverse_alias_index[canon] = alias_conf
+
+    sources = (id(CONFERENCES), id(D2_CONFERENCES), id(D3_CONFERENCES), id(TEAM_ALIASES))
+    return sources, d1_index, reverse_alias_index
+
+
+def _get_conference_index() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Return (d1_index, reverse_alias_index), rebuilding if the source tables changed."""
+    global _conference_index
+    sources = (id(CONFERENCES), id(D2_CONFERENCES), id(D3_CONFERENCES), id(TEAM_ALIASES))
+    if _conference_index is None or _conference_index[0] != sources:
+        _conference_index = _build_conference_index()
+    return _conference_index[1], _conference_index[2]
+
+
 # Get conference for a team
 def get_conference(team_name: str, format_division: bool = True) -> Optional[str]:
     """Get conference name for a team.
@@ -1418,31 +1483,24 @@ def get_conference(team_name: str, format_division: bool = True) -> Optional[str
     Returns:
         Conference name, optionally with division suffix for non-D1
     """
-    # Try direct match first for D1
-    for conf, teams in CONFERENCES.items():
-        if team_name in teams:
-            # Don't format D1 conferences, and skip the generic 'D3' placeholder
-            if conf == 'D3':
-                break  # Fall through to D3 lookup below
-            return conf
+    d1_index, reverse_alias_index = _get_conference_index()
+
+    # Try direct match first for D1 (the generic 'D3' placeholder falls through)
+    conf = _first_d1_conference(team_name, d1_index)
+    if conf:
+        return conf
 
     # Try alias for D1
     canonical = TEAM_ALIASES.get(team_name)
     if canonical:
-        for conf, teams in CONFERENCES.items():
-            if canonical in teams:
-                if conf == 'D3':
-                    break  # Fall through to D3 lookup below
-                return conf
+        conf = _first_d1_conference(canonical, d1_index)
+        if conf:
+            return conf
 
     # Try reverse alias for D1 (in case canonical name is in CONFERENCES)
-    for alias, canon in TEAM_ALIASES.items():
-        if canon == team_name:
-            for conf, teams in CONFERENCES.items():
-                if alias in teams:
-                    if conf == 'D3':
-                        break  # Fall through to D3 lookup below
-                    return conf
+    conf = reverse_alias_index.get(team_name)
+    if conf:
+        return conf
 
     # Check D2 conferences
     if team_name in D2_CONFERENCES:
@@ -6,11 +6,12 @@ import json
 import re
 import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set
 
-import cloudscraper
 from bs4 import BeautifulSoup
 
+from .http_client import get_cloudscraper_client, get_http_client
+
 DATA_DIR = Path(__file__).parent.parent.parent / 'data'
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -20,7 +21,6 @@ D2D3_REFRESH_TIMESTAMP_FILE = DATA_DIR / "d2d3_refresh_timestamp.txt"
 REALGM_PLAYER_CACHE_FILE = DATA_DIR / "realgm_player_cache.json"
 REALGM_TRANSFER_CACHE_FILE = DATA_DIR / "realgm_transfers.json"
 
-RATE_LIMIT_DELAY = 1.5  # seconds between requests
 REFRESH_INTERVAL_DAYS = 90  # Re-scrape every 90 days during season
 
 
@@ -82,8 +82,8 @@ def should_refresh_d2d3() -> bool:
 
 
 def _get_scraper():
-    """Create a cloudscraper instance."""
-    return cloudscraper.create_scraper()
+    """Get the shared rate-limited client (cloudscraper when installed)."""
+    return get_cloudscraper_client() or get_http_client()
 
 
 def _get_conferences(scraper, division: str) -> Dict[str, int]:
@@ -91,7 +91,7 @@ def _get_conferences(scraper, division: str) -> Dict[str, int]:
     Get all conferences for a division.
 
     Args:
-        scraper: cloudscraper instance
+        scraper: HTTP client from _get_scraper()
         division: 'ncaa-dii' or 'ncaa-diii'
 
     Returns:
@@ -121,7 +121,7 @@ def _get_conference_schools(scraper, division: str, conf_slug: str, conf_id: int
     Get all schools in a conference.
 
     Args:
-        scraper: cloudscraper instance
+        scraper: HTTP client from _get_scraper()
         division: 'ncaa-dii' or 'ncaa-diii'
         conf_slug: Conference URL slug
         conf_id: Conference ID
@@ -197,7 +197,6 @@ def scrape_division(division: str, season: str = None) -> Dict[str, Any]:
         conf_name = conf_slug.replace('-', ' ')
         print(f"  [{i}/{len(conferences)}] {conf_name}...")
 
-        time.sleep(RATE_LIMIT_DELAY)
         schools = _get_conference_schools(scraper, division, conf_slug, conf_id)
 
         all_data['conferences'][conf_name] = {
@@ -220,6 +219,9 @@ def scrape_d2() -> Dict[str, Any]:
         json.dump(data, f, indent=2)
     print(f"\nSaved to {D2_DATA_FILE}")
 
+    from .constants import reload_conferences
+    reload_conferences()
+
     return data
 
 
@@ -343,7 +345,6 @@ def scrape_d3_from_d3hoops(season: str = None) -> Dict[str, Any]:
         conf_name = D3_CONF_NAMES.get(conf_code, conf_code)
         print(f"  [{i}/{len(conf_codes)}] {conf_name} ({conf_code})...")
 
-        time.sleep(RATE_LIMIT_DELAY)
         schools = _get_d3hoops_conference_schools(scraper, conf_code, season)
 
         all_data['conferences'][conf_name] = {
@@ -371,6 +372,10 @@ def scrape_d3(season: str = None) -> Dict[str, Any]:
         json.dump(data, f, indent=2)
     print(f"\nSaved to {output_file}")
 
+    if output_file == D3_DATA_FILE:
+        from .constants import reload_conferences
+        reload_conferences()
+
     return data
 
 
@@ -613,8 +618,85 @@ def _load_transfer_cache() -> Dict[str, Any]:
 
 def _save_transfer_cache(cache: Dict[str, Any]) -> None:
     """Save transfer portal cache."""
+    global _transfer_index
     with open(REALGM_TRANSFER_CACHE_FILE, 'w', encoding='utf-8') as f:
         json.dump(cache, f, indent=2)
+    _transfer_index = None
+
+
+# Substring length indexed by TransferIndex (names shorter than this are scanned)
+TRANSFER_NGRAM = 3
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + TRANSFER_NGRAM] for i in range(len(text) - TRANSFER_NGRAM + 1)}
+
+
+class TransferIndex:
+    """
+    Name lookups over the transfer portal players.
+
+    Matches are the same as a scan of the players in file order for the first
+    key equal to, containing, or contained in the lowercased name:
+
+    - keys contained in the name are found by probing the name's substrings
+      against the key dict
+    - keys containing the name are the intersection of the posting sets of
+      the name's trigrams, verified with a substring check
+
+    Results are memoized per name.
+    """
+
+    def __init__(self, players: Dict[str, Any]):
+        self.players = players
+        self._order = {key: i for i, key in enumerate(players)}
+        self._postings: Dict[str, Set[str]] = {}
+        for key in players:
+            for gram in _ngrams(key):
+                self._postings.setdefault(gram, set()).add(key)
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def _keys_in(self, name_key: str) -> Set[str]:
+        """Keys that are substrings of name_key."""
+        return {
+            name_key[i:j]
+            for i in range(len(name_key))
+            for j in range(i + 1, len(name_key) + 1)
+            if name_key[i:j] in self.players
+        }
+
+    def _keys_containing(self, name_key: str) -> Set[str]:
+        """Keys that contain name_key."""
+        if len(name_key) < TRANSFER_NGRAM:
+            return {key for key in self.players if name_key in key}
+        postings = sorted((self._postings.get(gram, set()) for gram in _ngrams(name_key)), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return {key for key in candidates if name_key in key}
+
+    def find_key(self, name_key: str) -> Optional[str]:
+        """Return the matching player key for a lowercased name, or None."""
+        if name_key in self.players:
+            return name_key
+        if name_key not in self._memo:
+            matches = self._keys_in(name_key) | self._keys_containing(name_key)
+            self._memo[name_key] = min(matches, key=self._order.__getitem__) if matches else None
+        return self._memo[name_key]
+
+    def lookup(self, player_name: str) -> Dict[str, Any]:
+        """Return the player's transfer data, or an empty dict."""
+        key = self.find_key(player_name.lower().strip())
+        return self.players[key] if key is not None else {}
+
+
+_transfer_index: Optional[TransferIndex] = None
+
+
+def _get_transfer_index() -> TransferIndex:
+    """Get the transfer index, loading the transfer cache on first use."""
+    global _transfer_index
+    if _transfer_index is None:
+        _transfer_index = TransferIndex(_load_transfer_cache().get('players', {}))
+    return _transfer_index
 
 
 def scrape_transfer_portal() -> Dict[str, Any]:
@@ -715,11 +797,11 @@ def get_realgm_player_url(player_name: str, realgm_id: str = None) -> str:
         return f"https://basketball.realgm.com/player/{name_slug}/Summary/{realgm_id}"
 
     # Try to find in cache
-    cache = _load_transfer_cache()
+    players = _get_transfer_index().players
     name_key = player_name.lower().strip()
 
-    if name_key in cache.get('players', {}):
-        player_data = cache['players'][name_key]
+    if name_key in players:
+        player_data = players[name_key]
         if player_data.get('realgm_id'):
             name_slug = player_name.replace(' ', '-').replace('.', '').replace("'", '')
             return f"https://basketball.realgm.com/player/{name_slug}/Summary/{player_data['realgm_id']}"
@@ -737,18 +819,8 @@ def lookup_player_transfers(player_name: str) -> Dict[str, Any]:
     Returns:
         Dict with player info and transfer history, or empty dict if not found
     """
-    cache = _load_transfer_cache()
-    name_key = player_name.lower().strip()
-
-    if name_key in cache.get('players', {}):
-        return cache['players'][name_key]
-
-    # Try partial matching
-    for key, data in cache.get('players', {}).items():
-        if name_key in key or key in name_key:
-            return data
-
-    return {}
+    # Exact name, then the first player whose name contains or is contained in it
+    return _get_transfer_index().lookup(player_name)
 
 
 def get_player_school_history(player_name: str) -> List[str]:
@@ -796,7 +868,6 @@ def search_realgm_player(player_name: str, school: str = None) -> Dict[str, Any]
     search_name = player_name.replace(' ', '+')
     url = f'https://basketball.realgm.com/search?q={search_name}'
 
-    time.sleep(RATE_LIMIT_DELAY)
     resp = scraper.get(url)
 
     if resp.status_code != 200:
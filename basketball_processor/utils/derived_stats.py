@@ -0,0 +1,111 @@
+"""
+Fingerprinted milestone, special event and game stat results.
+
+milestone_stats, special_events and game_stats are computed from the box
+score when a game is parsed and then cached with it. Each game is stamped
+with a fingerprint of the engine versions and the milestone threshold
+config, so a change to MILESTONE_THRESHOLDS or MILESTONE_STAT_CONFIGS (or
+an ENGINE_VERSION bump) is picked up on the next load: only games with a
+stale or missing stamp are re-run through MilestoneEngine and
+SpecialEventsEngine, straight from their cached box scores, and written
+back to the parse cache. No HTML is re-parsed.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from .constants import MILESTONE_THRESHOLDS, MILESTONE_STAT_CONFIGS
+from .log import info, warn
+
+# Key holding the fingerprint the game's derived stats were computed with
+DERIVED_STATS_KEY = '_derived_fingerprint'
+
+
+def derived_stats_fingerprint() -> str:
+    """Return a short hash of the engine versions and milestone thresholds."""
+    from ..engines import milestone_engine, special_events_engine
+
+    config = {
+        'milestone_engine': milestone_engine.ENGINE_VERSION,
+        'special_events_engine': special_events_engine.ENGINE_VERSION,
+        'thresholds': MILESTONE_THRESHOLDS,
+        'stat_configs': MILESTONE_STAT_CONFIGS,
+    }
+    encoded = json.dumps(config, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def stamp_derived_stats(game_data: Dict[str, Any], fingerprint: Optional[str] = None) -> None:
+    """Record that a game's derived stats match the current (or given) fingerprint."""
+    game_data[DERIVED_STATS_KEY] = fingerprint or derived_stats_fingerprint()
+
+
+def needs_derived_refresh(game_data: Dict[str, Any], fingerprint: Optional[str] = None) -> bool:
+    """Return True if a game's derived stats were computed with other thresholds or engines."""
+    return game_data.get(DERIVED_STATS_KEY) != (fingerprint or derived_stats_fingerprint())
+
+
+def _run_engines(games: List[Dict[str, Any]], fingerprint: str) -> List[Dict[str, Any]]:
+    """Re-run detection for games, returning the ones that succeeded."""
+    from ..engines.milestone_engine import MilestoneEngine
+    from ..engines.special_events_engine import SpecialEventsEngine
+
+    try:
+        MilestoneEngine.process_batch(games)
+    except Exception as e:
+        # Retry game by game so one bad box score keeps only its old results
+        warn(f"Batch milestone detection failed ({e}), processing games individually")
+        processed = []
+        for game in games:
+            try:
+                processed.append(MilestoneEngine(game).process())
+            except Exception as game_error:
+                warn(f"  Milestone detection failed for {game.get('game_id', '')}: {game_error}")
+        games = processed
+
+    refreshed = []
+    for game in games:
+        try:
+            SpecialEventsEngine(game).detect()
+        except Exception as e:
+            warn(f"  Special event detection failed for {game.get('game_id', '')}: {e}")
+            continue
+        stamp_derived_stats(game, fingerprint)
+        refreshed.append(game)
+    return refreshed
+
+
+def refresh_derived_stats(games: List[Dict[str, Any]], persist: bool = True) -> Dict[str, int]:
+    """
+    Re-run milestone and special event detection for games with a stale fingerprint.
+
+    Games are updated in place. Refreshed games with a parse cache stamp are
+    written back to their cache entry so the work is done once.
+
+    Args:
+        games: Loaded games
+        persist: Write refreshed games back to the parse cache
+
+    Returns:
+        Counts of 'refreshed', 'failed' and 'current' games
+    """
+    fingerprint = derived_stats_fingerprint()
+    stale = [game for game in games if needs_derived_refresh(game, fingerprint)]
+    counts = {'refreshed': 0, 'failed': 0, 'current': len(games) - len(stale)}
+    if not stale:
+        return counts
+
+    info(f"Re-running milestone detection for {len(stale)} game(s) with outdated thresholds...")
+    refreshed = _run_engines(stale, fingerprint)
+    counts['refreshed'] = len(refreshed)
+    counts['failed'] = len(stale) - len(refreshed)
+
+    if persist:
+        from .parse_cache import get_parse_cache
+
+        parse_cache = get_parse_cache()
+        for game in refreshed:
+            parse_cache.write_back(game)
+
+    return counts
@@ -7,10 +7,11 @@ as the Sports Reference HTML parser.
 
 import re
 import json
-import requests
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 
+from .http_client import http_get
+
 # ESPN API endpoints
 ESPN_SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/{league}/summary"
 
@@ -60,7 +61,7 @@ def fetch_espn_game(game_id: str, league: str = "mens-college-basketball") -> Di
     url = ESPN_SUMMARY_URL.format(league=league)
     params = {"event": game_id}
 
-    response = requests.get(url, params=params, timeout=30)
+    response = http_get(url, params=params, timeout=30)
     response.raise_for_status()
 
     return response.json()
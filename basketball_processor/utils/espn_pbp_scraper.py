@@ -11,20 +11,18 @@ Data sources:
 """
 
 import json
+import os
 import re
-import time
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
 import requests
 
 from .constants import BASE_DIR
+from .http_client import http_get
 from .team_names import normalize_team_name_for_comparison
 
-# Rate limiting
-RATE_LIMIT_DELAY = 1.0  # seconds between requests
-_last_request_time = 0.0
-
 # ESPN API endpoints (using /summary endpoint which includes play-by-play)
 ESPN_PBP_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/summary"
 ESPN_WOMENS_PBP_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball/summary"
@@ -38,14 +36,102 @@ SCHEDULE_CACHE_FILE = BASE_DIR / "data" / "schedule_cache.json"
 SCHEDULE_CACHE_FILE_WOMENS = BASE_DIR / "data" / "schedule_cache_womens.json"
 
 
-def _rate_limit():
-    """Enforce rate limiting between requests."""
-    global _last_request_time
-    current_time = time.time()
-    elapsed = current_time - _last_request_time
-    if elapsed < RATE_LIMIT_DELAY:
-        time.sleep(RATE_LIMIT_DELAY - elapsed)
-    _last_request_time = time.time()
+class ScheduleIndex:
+    """
+    Schedule cache games bucketed by date with team names pre-normalized.
+
+    Built once from schedule_cache*.json so that a lookup only compares
+    against games in the +/-1 day buckets instead of re-parsing every date
+    and re-normalizing every team name in the file.
+    """
+
+    def __init__(self, games: List[Dict[str, Any]]):
+        # date -> [(position in file, home names, away names, espn_id)]
+        self.buckets: Dict[date, List[Tuple[int, Tuple[str, ...], Tuple[str, ...], Any]]] = {}
+
+        for position, game in enumerate(games):
+            # Parse game date from ISO format
+            game_date_str = game.get('date', '')
+            try:
+                # Handle both "2026-01-16T01:00Z" and "2026-01-16" formats
+                if 'T' in game_date_str:
+                    game_dt = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+                else:
+                    game_dt = datetime.fromisoformat(game_date_str)
+                game_date = game_dt.date()
+            except (ValueError, AttributeError):
+                continue
+
+            espn_home = game.get('home_team', {})
+            espn_away = game.get('away_team', {})
+            # Try various name fields
+            home_names = self._normalized_names(espn_home)
+            away_names = self._normalized_names(espn_away)
+
+            self.buckets.setdefault(game_date, []).append(
+                (position, home_names, away_names, game.get('espn_id'))
+            )
+
+    @staticmethod
+    def _normalized_names(team: Dict[str, Any]) -> Tuple[str, ...]:
+        """Return the non-empty normalized name, short name and abbreviation."""
+        names = (
+            normalize_team_name_for_comparison(team.get('name', '')),
+            normalize_team_name_for_comparison(team.get('short_name', '')),
+            normalize_team_name_for_comparison(team.get('abbreviation', '')),
+        )
+        return tuple(n for n in names if n)
+
+    def find(self, away_norm: str, home_norm: str, target_date: date) -> Optional[Tuple[int, Any]]:
+        """
+        Find the first game (in file order) within one day of target_date
+        whose teams match the normalized away/home names.
+
+        Returns:
+            (position in file, espn_id) of the match, or None if no game matches
+        """
+        best: Optional[Tuple[int, Any]] = None
+        # ESPN dates can be off by one due to timezone (late night games)
+        for offset in (-1, 0, 1):
+            for position, home_names, away_names, espn_id in self.buckets.get(target_date + timedelta(days=offset), ()):
+                if best is not None and position > best[0]:
+                    break
+                home_match = any(home_norm in n or n in home_norm for n in home_names)
+                away_match = any(away_norm in n or n in away_norm for n in away_names)
+                if home_match and away_match:
+                    best = (position, espn_id)
+                    break
+        return best
+
+
+# Cached ScheduleIndex per gender with the schedule file mtime it was built from.
+# None means the file was unreadable or had no games.
+_schedule_indexes: Dict[str, Tuple[float, Optional[ScheduleIndex]]] = {}
+
+
+def _get_schedule_index(cache_file: Path, gender: str) -> Optional[ScheduleIndex]:
+    """Return the ScheduleIndex for a schedule cache file, rebuilding if it changed."""
+    try:
+        mtime = os.path.getmtime(cache_file)
+    except OSError:
+        return None
+
+    cached = _schedule_indexes.get(gender)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    index = None
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+        games = cache.get('games', [])
+        if games:
+            index = ScheduleIndex(games)
+    except (json.JSONDecodeError, IOError):
+        pass
+
+    _schedule_indexes[gender] = (mtime, index)
+    return index
 
 
 def get_espn_id_from_cache(
@@ -69,20 +155,10 @@ def get_espn_id_from_cache(
     # Use gender-specific cache file
     cache_file = SCHEDULE_CACHE_FILE_WOMENS if gender == 'W' else SCHEDULE_CACHE_FILE
 
-    if not cache_file.exists():
-        return _lookup_espn_id_from_scoreboard(away_team, home_team, date_yyyymmdd, gender)
-
-    try:
-        with open(cache_file, 'r') as f:
-            cache = json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return _lookup_espn_id_from_scoreboard(away_team, home_team, date_yyyymmdd, gender)
-
-    games = cache.get('games', [])
-    if not games:
+    index = _get_schedule_index(cache_file, gender)
+    if index is None:
         return _lookup_espn_id_from_scoreboard(away_team, home_team, date_yyyymmdd, gender)
 
-    # Convert date to comparable format
     # Schedule cache uses ISO format: "2026-01-16T01:00Z"
     # We need to match on the date portion
     try:
@@ -93,47 +169,9 @@ def get_espn_id_from_cache(
     away_norm = normalize_team_name_for_comparison(away_team)
     home_norm = normalize_team_name_for_comparison(home_team)
 
-    for game in games:
-        # Parse game date from ISO format
-        game_date_str = game.get('date', '')
-        try:
-            # Handle both "2026-01-16T01:00Z" and "2026-01-16" formats
-            if 'T' in game_date_str:
-                game_dt = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-            else:
-                game_dt = datetime.fromisoformat(game_date_str)
-            game_date = game_dt.date()
-        except (ValueError, AttributeError):
-            continue
-
-        # ESPN dates can be off by one due to timezone (late night games)
-        # Check if within 1 day
-        date_diff = abs((game_date - target_date).days)
-        if date_diff > 1:
-            continue
-
-        # Match teams
-        espn_home = game.get('home_team', {})
-        espn_away = game.get('away_team', {})
-
-        # Try various name fields
-        espn_home_names = [
-            normalize_team_name_for_comparison(espn_home.get('name', '')),
-            normalize_team_name_for_comparison(espn_home.get('short_name', '')),
-            normalize_team_name_for_comparison(espn_home.get('abbreviation', '')),
-        ]
-        espn_away_names = [
-            normalize_team_name_for_comparison(espn_away.get('name', '')),
-            normalize_team_name_for_comparison(espn_away.get('short_name', '')),
-            normalize_team_name_for_comparison(espn_away.get('abbreviation', '')),
-        ]
-
-        # Check for matches
-        home_match = any(home_norm in n or n in home_norm for n in espn_home_names if n)
-        away_match = any(away_norm in n or n in away_norm for n in espn_away_names if n)
-
-        if home_match and away_match:
-            return game.get('espn_id')
+    match = index.find(away_norm, home_norm, target_date)
+    if match is not None:
+        return match[1]
 
     # Not found in cache - try live scoreboard lookup
     return _lookup_espn_id_from_scoreboard(away_team, home_team, date_yyyymmdd, gender)
@@ -157,8 +195,6 @@ def _lookup_espn_id_from_scoreboard(
     Returns:
         ESPN game ID or None if not found
     """
-    _rate_limit()
-
     # Build scoreboard URL
     if gender == 'W':
         base_url = "https://site.api.espn.com/apis/site/v2/sports/basketball/womens-college-basketball/scoreboard"
@@ -172,7 +208,7 @@ def _lookup_espn_id_from_scoreboard(
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
 
         if response.status_code != 200:
             return None
@@ -327,13 +363,11 @@ def _lookup_espn_id_from_ncaahoopr(
 
     url = f"{NCAAHOOPR_BASE_URL}/{season}/schedules/{home_schedule_name}_schedule.csv"
 
-    _rate_limit()
-
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
 
         if response.status_code != 200:
             return None
@@ -448,13 +482,11 @@ def fetch_ncaahoopr_play_by_play(
     if verbose:
         print(f"  Trying ncaahoopR fallback: {url}")
 
-    _rate_limit()
-
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
 
         if response.status_code != 200:
             if verbose:
@@ -620,9 +652,6 @@ def fetch_espn_play_by_play(
         except (json.JSONDecodeError, IOError):
             pass  # Cache corrupted, fetch fresh
 
-    # Rate limit
-    _rate_limit()
-
     # Select endpoint based on gender
     base_url = ESPN_WOMENS_PBP_URL if gender == 'W' else ESPN_PBP_URL
     url = f"{base_url}?event={game_id}"
@@ -636,7 +665,7 @@ def fetch_espn_play_by_play(
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
 
         if response.status_code == 200:
             raw_data = response.json()
@@ -5,13 +5,10 @@ Fetches attendance from ESPN boxscores when SIDEARM sites don't have it.
 """
 
 import re
-import time
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-import requests
 
-# Rate limiting
-RATE_LIMIT_DELAY = 1.0  # seconds between requests
+from .http_client import http_get
 
 # ESPN API endpoints
 ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard"
@@ -36,7 +33,7 @@ def _fetch_espn_scoreboard(date_str: str) -> Optional[Dict]:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -135,7 +132,7 @@ def _fetch_boxscore_attendance(game_id: str) -> Optional[int]:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code != 200:
             return None
 
@@ -188,8 +185,6 @@ def get_espn_attendance(
             print(f"  ESPN scoreboard not available for {game_date}")
         return None
 
-    time.sleep(RATE_LIMIT_DELAY)
-
     # Find game ID
     game_id = _find_game_id(scoreboard, home_team, away_team)
     if not game_id:
@@ -0,0 +1,203 @@
+"""
+Packed archive of parsed games for fast cache-only startup.
+
+The per-game cache is hundreds of pretty-printed JSON files; loading them all
+means one open/read/parse per file plus filtering out non-game caches that
+share the directory. The archive packs every game into a single file:
+
+    MAGIC (4 bytes) | VERSION (4 bytes)
+    record 0 | record 1 | ...          zlib-compressed compact JSON
+    index                              zlib-compressed JSON
+    index offset (8 bytes) | index length (8 bytes)
+
+The index lists each game's (game_id, offset, length) in load order, the
+(size, mtime) of every cache file that yielded a game, and the names of the
+files that were read and rejected as non-game caches. The archive is stale
+when a game file changes or disappears, or when a file that is in neither
+list appears, so staleness can be checked with stat() alone and rewriting a
+non-game cache (lookup caches, manifests) does not force a rebuild. Loading
+everything is one sequential read; a single game is a seek and one record read.
+"""
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .constants import CACHE_DIR
+
+ARCHIVE_MAGIC = b'CBGA'
+ARCHIVE_VERSION = 1
+ARCHIVE_FILE = CACHE_DIR / "games_archive.bin"
+
+_HEADER = struct.Struct('<4sI')
+_FOOTER = struct.Struct('<QQ')
+
+
+def _encode(data: Any) -> bytes:
+    return zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'), 6)
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+def source_signature(paths: List[Path]) -> Dict[str, List[float]]:
+    """Return {file name: [size, mtime]} for the cache files an archive covers."""
+    signature = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature[path.name] = [stat.st_size, stat.st_mtime]
+    return signature
+
+
+class GameArchive:
+    """Single-file archive of parsed games with a per-game offset index."""
+
+    def __init__(self, path: Path = ARCHIVE_FILE):
+        self.path = path
+
+    def _read_index(self, f) -> Optional[Dict[str, Any]]:
+        """Read and validate the header and index from an open archive."""
+        header = f.read(_HEADER.size)
+        if len(header) != _HEADER.size or _HEADER.unpack(header) != (ARCHIVE_MAGIC, ARCHIVE_VERSION):
+            return None
+        f.seek(-_FOOTER.size, os.SEEK_END)
+        index_offset, index_length = _FOOTER.unpack(f.read(_FOOTER.size))
+        f.seek(index_offset)
+        return _decode(f.read(index_length))
+
+    def read_index(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the archive index.
+
+        Returns:
+            Index dictionary ('games', 'sources' and 'rejected'), or None if missing/corrupt
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                return self._read_index(f)
+        except (OSError, struct.error, zlib.error, ValueError):
+            return None
+
+    def is_fresh(self, sources: Dict[str, List[float]]) -> bool:
+        """Return True if the archive was built from exactly these source files."""
+        index = self.read_index()
+        return index is not None and index.get('sources') == sources
+
+    def write(
+        self,
+        games: List[Dict[str, Any]],
+        sources: Dict[str, List[float]],
+        rejected: Iterable[str] = ()
+    ) -> None:
+        """
+        Write games to the archive, replacing any existing file atomically.
+
+        Args:
+            games: Parsed games, in the order they should load
+            sources: source_signature() of the cache files the games came from
+            rejected: Names of cache files that were read and held no game
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        entries = []
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION))
+            for game in games:
+                blob = _encode(game)
+                entries.append([game.get('game_id', ''), f.tell(), len(blob)])
+                f.write(blob)
+            index_blob = _encode({'games': entries, 'sources': sources, 'rejected': sorted(rejected)})
+            index_offset = f.tell()
+            f.write(index_blob)
+            f.write(_FOOTER.pack(index_offset, len(index_blob)))
+        tmp_path.replace(self.path)
+
+    def load_all(self, sources: Optional[Dict[str, List[float]]] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load every game with one sequential read.
+
+        Args:
+            sources: If given, only load when the archive was built from exactly
+                these source files (see source_signature())
+
+        Returns:
+            List of games in archive order, or None if the archive is unusable or stale
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                content = f.read()
+            magic, version = _HEADER.unpack_from(content, 0)
+            if (magic, version) != (ARCHIVE_MAGIC, ARCHIVE_VERSION):
+                return None
+            index_offset, index_length = _FOOTER.unpack_from(content, len(content) - _FOOTER.size)
+            index = _decode(content[index_offset:index_offset + index_length])
+            if sources is not None and index.get('sources') != sources:
+                return None
+            return [_decode(content[offset:offset + length]) for _, offset, length in index['games']]
+        except (OSError, struct.error, zlib.error, ValueError, KeyError):
+            return None
+
+    def load_game(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a single game without reading the rest of the archive.
+
+        Args:
+            game_id: Game ID to look up (first match if duplicated)
+
+        Returns:
+            Game dictionary, or None if not found
+        """
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                index = self._read_index(f)
+                if index is None:
+                    return None
+                for entry_id, offset, length in index['games']:
+                    if entry_id == game_id:
+                        f.seek(offset)
+                        return _decode(f.read(length))
+        except (OSError, struct.error, zlib.error, ValueError, KeyError):
+            return None
+        return None
+
+
+def list_cache_sources(cache_dir: Path, rejected: Iterable[str] = ()) -> List[Path]:
+    """Return cache JSON files not already known to hold no game, in load order."""
+    rejected = set(rejected)
+    return [path for path in cache_dir.glob("*.json") if path.name not in rejected]
+
+
+def load_archived_games(
+    cache_dir: Path
+) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, List[float]], List[str]]:
+    """
+    Load games from the archive if it is up to date with the cache directory.
+
+    Files the archive recorded as non-game caches are ignored; any other file
+    that is new, changed or gone makes the archive stale.
+
+    Args:
+        cache_dir: Directory holding per-game cache JSON files
+
+    Returns:
+        (games or None if the archive is stale/missing, current source
+        signature, names the archive recorded as non-game caches)
+    """
+    archive = GameArchive(cache_dir / ARCHIVE_FILE.name)
+    index = archive.read_index()
+    rejected = list(index.get('rejected', [])) if index else []
+    sources = source_signature(list_cache_sources(cache_dir, rejected))
+    return archive.load_all(sources), sources, rejected
@@ -2,12 +2,16 @@
 Helper utility functions for the basketball processor.
 """
 
+import json
+import os
 import re
 import unicodedata
 from datetime import datetime
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-from .constants import TEAM_CODES, DATE_FORMATS, GID_DATE_RE
+from .constants import DATE_FORMATS, GID_DATE_RE
+from .team_names import get_team_resolver
 
 
 def normalize_name(name: str) -> str:
@@ -40,26 +44,7 @@ def get_team_code(team_name: str) -> str:
     Returns:
         Team code string or the original name if not found
     """
-    if not team_name:
-        return ""
-
-    # Direct lookup
-    if team_name in TEAM_CODES:
-        return TEAM_CODES[team_name]
-
-    # Try case-insensitive lookup
-    team_lower = team_name.lower()
-    for name, code in TEAM_CODES.items():
-        if name.lower() == team_lower:
-            return code
-
-    # Try partial match
-    for name, code in TEAM_CODES.items():
-        if team_lower in name.lower() or name.lower() in team_lower:
-            return code
-
-    # Return original if no match
-    return team_name[:4].upper() if len(team_name) >= 4 else team_name.upper()
+    return get_team_resolver().code(team_name)
 
 
 def parse_date(date_str: str) -> Optional[datetime]:
@@ -444,3 +429,22 @@ def sort_games_by_date(games: List[Dict]) -> List[Dict]:
         return datetime.min
 
     return sorted(games, key=get_date_key, reverse=True)
+
+
+def atomic_write_json(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    """
+    Write JSON to a temp file and rename it over the target.
+
+    Readers never see a half-written file, and an interrupted write leaves
+    the previous contents in place.
+
+    Args:
+        path: Destination file (parent directories are created)
+        data: JSON-serializable data
+        indent: json.dump indent, or None for compact output
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
+    tmp_path.replace(path)
@@ -0,0 +1,327 @@
+"""
+Shared HTTP client for the scrapers.
+
+Every scraper used to call requests.get() directly and pace itself with its
+own time.sleep() global, so requests to different sites queued up behind
+each other and no connection was ever reused. This module gives them one
+client with:
+
+- per-host token buckets (HOST_RATE_LIMITS), shared process-wide, so each
+  site's politeness limit holds across threads and clients while requests
+  to different sites overlap
+- keep-alive connection pooling through a requests.Session
+- retries with exponential backoff on connection errors and 429/5xx
+  responses (Retry-After is honored)
+- an asyncio API (aget/aget_many) for running many lookups concurrently
+
+cloudscraper sessions can be wrapped too: HttpClient(session=scraper) keeps
+the Cloudflare handling and adds the shared rate limits.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+# Minimum seconds between requests per site. Keys match the host and any
+# subdomain of it; every matching host shares one bucket.
+HOST_RATE_LIMITS: Dict[str, float] = {
+    'sports-reference.com': 3.1,
+    'basketball-reference.com': 3.1,
+    'espn.com': 1.0,
+    'raw.githubusercontent.com': 1.0,
+    'realgm.com': 1.5,
+    'proballers.com': 0.0,
+}
+
+# Endpoints paced in their own bucket instead of their site's: (site key in
+# HOST_RATE_LIMITS, URL path fragment) -> minimum seconds between requests
+ENDPOINT_RATE_LIMITS: Dict[Tuple[str, str], float] = {
+    # Schedule scraping walks the scoreboard one date at a time
+    ('espn.com', '/scoreboard'): 0.5,
+}
+
+# Interval for hosts not listed above (school athletics sites)
+DEFAULT_HOST_INTERVAL = 1.5
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 1.0
+MAX_RETRY_AFTER = 60.0
+DEFAULT_TIMEOUT = 15
+DEFAULT_POOL_SIZE = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it, so the lock
+    is never held while sleeping and waiting on one bucket never blocks
+    another.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        """
+        Args:
+            interval: Seconds per token (0 disables limiting)
+            burst: Tokens that may be spent back to back after an idle period
+        """
+        self.interval = max(0.0, interval)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        if self.interval == 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.interval
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _bucket_key(host: str) -> str:
+    host = host.lower()
+    for key in HOST_RATE_LIMITS:
+        if host == key or host.endswith('.' + key):
+            return key
+    return host
+
+
+def get_host_bucket(url_or_host: str) -> TokenBucket:
+    """
+    Return the process-wide bucket for a URL's host.
+
+    URLs matching an ENDPOINT_RATE_LIMITS entry get that endpoint's bucket.
+
+    Args:
+        url_or_host: Full URL or bare host name
+    """
+    if '://' in url_or_host:
+        parts = urlsplit(url_or_host)
+        host, path = parts.hostname, parts.path
+    else:
+        host, path = url_or_host, ''
+    key = _bucket_key(host or '')
+    interval = HOST_RATE_LIMITS.get(key, DEFAULT_HOST_INTERVAL)
+    for (site, fragment), endpoint_interval in ENDPOINT_RATE_LIMITS.items():
+        if site == key and fragment in path:
+            key, interval = site + fragment, endpoint_interval
+            break
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(interval)
+            _buckets[key] = bucket
+        return bucket
+
+
+def reset_host_buckets() -> None:
+    """Forget all bucket state (after changing the rate limits, or in tests)."""
+    with _buckets_lock:
+        _buckets.clear()
+
+
+def _retry_delay(response: Any, attempt: int, backoff: float) -> float:
+    """Seconds to wait before retry number attempt (0-based)."""
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER)
+    return backoff * (2 ** attempt) * (1 + random.random() * 0.1)
+
+
+class HttpClient:
+    """
+    Pooled, rate-limited HTTP client.
+
+    get()/head()/request() mirror the requests API and return a
+    requests.Response, so existing call sites keep their status checks and
+    exception handling. The final attempt's response is returned (or its
+    exception raised) once retries are exhausted.
+    """
+
+    def __init__(
+        self,
+        session: Any = None,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            session: requests.Session (or cloudscraper instance) to send with;
+                a new pooled session is created if omitted
+            retries: Extra attempts after a failed request
+            backoff: Base delay for exponential backoff between attempts
+            pool_size: Connections kept alive per host (new sessions only)
+            headers: Default headers for every request
+        """
+        if session is None:
+            if not HAS_REQUESTS:
+                raise ImportError("requests is required for HttpClient")
+            session = requests.Session()
+            # Caller-supplied sessions keep their own adapters (cloudscraper
+            # mounts a TLS adapter that must not be replaced)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        if headers:
+            session.headers.update(headers)
+        self.session = session
+        self.retries = retries
+        self.backoff = backoff
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request, waiting for the host's rate limit before each attempt."""
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        bucket = get_host_bucket(url)
+        for attempt in range(self.retries):
+            bucket.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                response = None
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+            time.sleep(_retry_delay(response, attempt, self.backoff))
+        bucket.acquire()
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Rate-limited GET."""
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> Any:
+        """Rate-limited HEAD (like requests.head, redirects are not followed by default)."""
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> Any:
+        """
+        Async request: rate-limit and backoff waits happen on the event loop,
+        the blocking send runs in the default executor.
+        """
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        bucket = get_host_bucket(url)
+        loop = asyncio.get_running_loop()
+
+        def send() -> Any:
+            return self.session.request(method, url, **kwargs)
+
+        for attempt in range(self.retries):
+            await bucket.acquire_async()
+            try:
+                response = await loop.run_in_executor(None, send)
+            except (requests.ConnectionError, requests.Timeout):
+                response = None
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt, self.backoff))
+        await bucket.acquire_async()
+        return await loop.run_in_executor(None, send)
+
+    async def aget(self, url: str, **kwargs: Any) -> Any:
+        """Async rate-limited GET."""
+        return await self.arequest('GET', url, **kwargs)
+
+    async def aget_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = DEFAULT_POOL_SIZE,
+        **kwargs: Any
+    ) -> List[Any]:
+        """
+        GET many URLs concurrently, each host still at its own pace.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum requests in flight
+            **kwargs: Passed to every request
+
+        Returns:
+            Response or exception for each URL, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(url: str) -> Any:
+            async with semaphore:
+                return await self.aget(url, **kwargs)
+
+        return await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+
+_client: Optional[HttpClient] = None
+_cloudscraper_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the shared plain-requests client (created on first use)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def get_cloudscraper_client() -> Optional[HttpClient]:
+    """
+    Get the shared client for Cloudflare-protected sites.
+
+    Returns:
+        HttpClient wrapping a cloudscraper session, or None if cloudscraper
+        is not installed
+    """
+    global _cloudscraper_client
+    with _client_lock:
+        if _cloudscraper_client is None:
+            try:
+                import cloudscraper  # type: ignore[import-not-found]
+            except ImportError:
+                return None
+            _cloudscraper_client = HttpClient(session=cloudscraper.create_scraper())
+        return _cloudscraper_client
+
+
+def http_get(url: str, **kwargs: Any) -> Any:
+    """GET through the shared client (drop-in for requests.get)."""
+    return get_http_client().get(url, **kwargs)
+
+
+def http_head(url: str, **kwargs: Any) -> Any:
+    """HEAD through the shared client (drop-in for requests.head)."""
+    return get_http_client().head(url, **kwargs)
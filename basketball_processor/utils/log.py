@@ -118,6 +118,16 @@ def set_log_file(path: Optional[str]) -> None:
             _log_file_path = None
 
 
+def is_verbose() -> bool:
+    """Return True if DEBUG level messages are currently shown."""
+    return _log_level <= LogLevel.DEBUG
+
+
+def get_use_emoji() -> bool:
+    """Return True if emoji are currently enabled in output."""
+    return _use_emoji
+
+
 def get_log_file_path() -> Optional[Path]:
     """Return the current log file path, or None if file logging is disabled."""
     return _log_file_path
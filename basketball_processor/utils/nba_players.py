@@ -4,12 +4,14 @@ Uses Sports Reference links to determine if a college player went to the NBA.
 Also checks Proballers.com for comprehensive international league data.
 """
 
+import atexit
 import json
 import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Set, Tuple
 from datetime import datetime
-import time
 
 # Import Proballers scraper for international league data
 try:
@@ -35,6 +37,9 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+from .helpers import atomic_write_json
+from .http_client import HOST_RATE_LIMITS, HttpClient, get_cloudscraper_client, http_get, http_head
+
 # Cache file location (can be cleared)
 CACHE_DIR = Path(__file__).parent.parent.parent / 'cache'
 NBA_LOOKUP_CACHE_FILE = CACHE_DIR / 'nba_lookup_cache.json'
@@ -85,8 +90,19 @@ def _get_current_wnba_years() -> Tuple[str, str]:
 SPORTS_REF_BASE = "https://www.sports-reference.com/cbb/players/"
 
 # Rate limiting: Sports Reference allows 20 requests/minute
-# We use 3.1 seconds to stay under limit (19 req/min)
-RATE_LIMIT_SECONDS = 3.1
+# We use 3.1 seconds to stay under limit (19 req/min); the shared HTTP client
+# enforces it per host, this value is used for time estimates
+RATE_LIMIT_SECONDS = HOST_RATE_LIMITS['sports-reference.com']
+
+# Concurrent lookups write nba_lookup_cache.json after this many players
+LOOKUP_CHECKPOINT_EVERY = 10
+
+# Seconds to let a stopping background run finish its in-flight checks at exit
+BACKGROUND_EXIT_TIMEOUT = 15
+
+# Serializes read-modify-write of the lookup cache and confirmed file
+# between the main thread and background lookups
+_lookup_lock = threading.RLock()
 
 # Player ID aliases for typos/spelling differences between SR and BR
 # Maps: wrong_id -> correct_id (for Basketball Reference lookups)
@@ -143,74 +159,163 @@ NATIONAL_TEAM_TOURNAMENT_NAMES = {
 NATIONAL_TEAM_TOURNAMENTS = set(NATIONAL_TEAM_TOURNAMENT_NAMES.keys())
 
 
+class ProStatusStore:
+    """
+    One pro status JSON file, loaded once per process and written back lazily.
+
+    Every caller shares the same in-memory dict, so a lookup saved by one
+    function is immediately visible to the next without re-reading the file.
+    Changes mark the store dirty and the whole file is written atomically by
+    flush(), which runs at the end of each batch (and at interpreter exit)
+    instead of after every single update.
+    """
+
+    def __init__(self, path: Path, label: str):
+        """
+        Args:
+            path: JSON file backing the store
+            label: Name used in warnings (e.g. 'lookup cache')
+        """
+        self.path = path
+        self.label = label
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    def data(self) -> Dict[str, Any]:
+        """Return the live dict, loading the file on first use."""
+        from .log import warn_once
+        with _lookup_lock:
+            if self._data is None:
+                self._data = {}
+                if self.path.exists():
+                    key = self.label.replace(' ', '_')
+                    try:
+                        with open(self.path, 'r') as f:
+                            self._data = json.load(f)
+                    except json.JSONDecodeError as e:
+                        warn_once(f"NBA {self.label} corrupted ({self.path}): {e}", key=f'nba_{key}_corrupt')
+                    except (IOError, OSError, PermissionError) as e:
+                        warn_once(f"Failed to load NBA {self.label}: {e}", key=f'nba_{key}_error')
+            return self._data
+
+    def mark_dirty(self) -> None:
+        """Record that the live dict changed and needs writing on the next flush."""
+        with _lookup_lock:
+            self._dirty = True
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """Adopt data as the store's contents and mark it dirty."""
+        with _lookup_lock:
+            self._data = data
+            self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def flush(self) -> bool:
+        """
+        Write the file atomically if anything changed since the last flush.
+
+        Returns:
+            True if the file was written
+        """
+        with _lookup_lock:
+            if self._data is None or not self.dirty:
+                return False
+            # Copy entries first: background lookups may flush while the main
+            # thread is still updating them
+            snapshot = {k: dict(v) if isinstance(v, dict) else v for k, v in list(self._data.items())}
+            atomic_write_json(self.path, snapshot, indent=2)
+            self._dirty = False
+            return True
+
+
+_stores: Dict[Path, ProStatusStore] = {}
+
+
+def _get_store(path: Path, label: str) -> ProStatusStore:
+    with _lookup_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = ProStatusStore(path, label)
+            _stores[path] = store
+        return store
+
+
+def get_lookup_store() -> ProStatusStore:
+    """Store for nba_lookup_cache.json (every lookup result, including nulls)."""
+    return _get_store(NBA_LOOKUP_CACHE_FILE, 'lookup cache')
+
+
+def get_confirmed_store() -> ProStatusStore:
+    """Store for nba_confirmed.json (confirmed pros, survives cache clears)."""
+    return _get_store(NBA_CONFIRMED_FILE, 'confirmed cache')
+
+
+def flush_pro_status() -> None:
+    """Write any pending lookup cache / confirmed changes to disk."""
+    for store in list(_stores.values()):
+        store.flush()
+
+
+def _flush_at_exit() -> None:
+    # A background run still going at exit stops after the players in hand
+    _background_stop.set()
+    if _background_thread is not None:
+        _background_thread.join(BACKGROUND_EXIT_TIMEOUT)
+    try:
+        flush_pro_status()
+    except (IOError, OSError) as e:
+        print(f"Warning: Failed to save NBA status caches: {e}")
+
+
+atexit.register(_flush_at_exit)
+
+
 def _load_lookup_cache() -> Dict[str, Any]:
-    """Load cached NBA lookup results."""
-    from .log import warn_once
-    if NBA_LOOKUP_CACHE_FILE.exists():
-        try:
-            with open(NBA_LOOKUP_CACHE_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            warn_once(f"NBA lookup cache corrupted ({NBA_LOOKUP_CACHE_FILE}): {e}", key='nba_lookup_cache_corrupt')
-        except (IOError, OSError, PermissionError) as e:
-            warn_once(f"Failed to load NBA lookup cache: {e}", key='nba_lookup_cache_error')
-    return {}
+    """Get cached NBA lookup results (the shared, live dict)."""
+    return get_lookup_store().data()
 
 
 def _save_lookup_cache(cache: Dict[str, Any]) -> None:
-    """Save NBA lookup cache atomically to prevent corruption."""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    tmp_file = NBA_LOOKUP_CACHE_FILE.with_suffix('.tmp')
-    with open(tmp_file, 'w') as f:
-        json.dump(cache, f, indent=2)
-    tmp_file.replace(NBA_LOOKUP_CACHE_FILE)
+    """Mark the NBA lookup cache changed (written by flush_pro_status())."""
+    get_lookup_store().save(cache)
 
 
 def _load_confirmed() -> Dict[str, Any]:
-    """Load persistent confirmed NBA/Intl players (survives cache clears)."""
-    from .log import warn_once
-    if NBA_CONFIRMED_FILE.exists():
-        try:
-            with open(NBA_CONFIRMED_FILE, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            warn_once(f"NBA confirmed cache corrupted ({NBA_CONFIRMED_FILE}): {e}", key='nba_confirmed_cache_corrupt')
-        except (IOError, OSError, PermissionError) as e:
-            warn_once(f"Failed to load NBA confirmed cache: {e}", key='nba_confirmed_cache_error')
-    return {}
+    """Get persistent confirmed NBA/Intl players (the shared, live dict)."""
+    return get_confirmed_store().data()
 
 
 def _save_confirmed(confirmed: Dict[str, Any]) -> None:
-    """Save to persistent confirmed file atomically to prevent corruption."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    tmp_file = NBA_CONFIRMED_FILE.with_suffix('.tmp')
-    with open(tmp_file, 'w') as f:
-        json.dump(confirmed, f, indent=2)
-    tmp_file.replace(NBA_CONFIRMED_FILE)
+    """Mark the confirmed file changed (written by flush_pro_status())."""
+    get_confirmed_store().save(confirmed)
 
 
 def _add_to_confirmed(player_id: str, data: Dict[str, Any]) -> None:
     """Add a player to the persistent confirmed file."""
     if data and (data.get('nba_url') or data.get('wnba_url') or data.get('intl_url')):
-        confirmed = _load_confirmed()
-        # Preserve first_detected from existing entry
-        if player_id in confirmed and confirmed[player_id]:
-            existing = confirmed[player_id]
-            if existing.get('first_detected') and not data.get('first_detected'):
-                data['first_detected'] = existing['first_detected']
-                data['first_detected_as'] = existing.get('first_detected_as', '')
-        # Set first_detected if not present
-        if not data.get('first_detected'):
-            data['first_detected'] = datetime.now().isoformat()
-            # Determine what they were first detected as
-            if data.get('nba_url'):
-                data['first_detected_as'] = 'nba'
-            elif data.get('wnba_url'):
-                data['first_detected_as'] = 'wnba'
-            elif data.get('intl_url'):
-                data['first_detected_as'] = 'international'
-        confirmed[player_id] = data
-        _save_confirmed(confirmed)
+        with _lookup_lock:
+            confirmed = _load_confirmed()
+            # Preserve first_detected from existing entry
+            if player_id in confirmed and confirmed[player_id]:
+                existing = confirmed[player_id]
+                if existing.get('first_detected') and not data.get('first_detected'):
+                    data['first_detected'] = existing['first_detected']
+                    data['first_detected_as'] = existing.get('first_detected_as', '')
+            # Set first_detected if not present
+            if not data.get('first_detected'):
+                data['first_detected'] = datetime.now().isoformat()
+                # Determine what they were first detected as
+                if data.get('nba_url'):
+                    data['first_detected_as'] = 'nba'
+                elif data.get('wnba_url'):
+                    data['first_detected_as'] = 'wnba'
+                elif data.get('intl_url'):
+                    data['first_detected_as'] = 'international'
+            confirmed[player_id] = data
+            get_confirmed_store().mark_dirty()
 
 
 def _validate_url(url: str, timeout: int = 10) -> Dict[str, Any]:
@@ -226,12 +331,12 @@ def _validate_url(url: str, timeout: int = 10) -> Dict[str, Any]:
         return result
 
     try:
-        if HAS_CLOUDSCRAPER:
-            scraper = cloudscraper.create_scraper()
+        scraper = get_cloudscraper_client() if HAS_CLOUDSCRAPER else None
+        if scraper is not None:
             response = scraper.head(url, timeout=timeout, allow_redirects=True)
         elif HAS_REQUESTS:
-            response = requests.head(url, timeout=timeout, allow_redirects=True,
-                                     headers={'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'})
+            response = http_head(url, timeout=timeout, allow_redirects=True,
+                                 headers={'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'})
         else:
             return result
 
@@ -275,7 +380,6 @@ def validate_all_urls(auto_fix: bool = False) -> Dict[str, Any]:
             results['total'] += 1
             print(f"  Checking {player_id} {field}...", end='', flush=True)
 
-            time.sleep(RATE_LIMIT_SECONDS)
             check = _validate_url(url)
 
             if check['valid']:
@@ -302,6 +406,7 @@ def validate_all_urls(auto_fix: bool = False) -> Dict[str, Any]:
                     results['fixed'] += 1
 
     _save_confirmed(confirmed)
+    flush_pro_status()
 
     print(f"\nURL Validation complete:")
     print(f"  Total URLs: {results['total']}")
@@ -362,7 +467,6 @@ def validate_urls_on_load(max_checks: int = 50) -> int:
             if not url:
                 continue
 
-            time.sleep(RATE_LIMIT_SECONDS)
             check = _validate_url(url)
             checked += 1
 
@@ -374,6 +478,7 @@ def validate_urls_on_load(max_checks: int = 50) -> int:
 
     if checked > 0:
         _save_confirmed(confirmed)
+        flush_pro_status()
         # Save timestamp
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         URL_VALIDATION_TIMESTAMP_FILE.write_text(datetime.now().isoformat())
@@ -478,7 +583,7 @@ def backfill_draft_info(max_players: int = 0) -> Dict[str, int]:
     print(f"Estimated time: {est_minutes:.1f} minutes")
 
     if HAS_CLOUDSCRAPER:
-        scraper = cloudscraper.create_scraper()
+        scraper = get_cloudscraper_client()
     else:
         scraper = None
 
@@ -487,11 +592,10 @@ def backfill_draft_info(max_players: int = 0) -> Dict[str, int]:
         print(f"  {i+1}/{len(to_check)} {player_id}...", end='', flush=True)
 
         try:
-            time.sleep(RATE_LIMIT_SECONDS)
             if scraper:
                 response = scraper.get(url, timeout=15)
             elif HAS_REQUESTS:
-                response = requests.get(url, timeout=15, headers={
+                response = http_get(url, timeout=15, headers={
                     'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'
                 })
             else:
@@ -516,6 +620,7 @@ def backfill_draft_info(max_players: int = 0) -> Dict[str, int]:
             print(f" -> Error: {e}")
 
     _save_confirmed(confirmed)
+    flush_pro_status()
 
     # Save timestamp
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -574,7 +679,7 @@ def _bulk_check_active_rosters() -> Optional[Set[str]]:
                 'x-nba-stats-origin': 'stats',
                 'x-nba-stats-token': 'true',
             }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_get(url, headers=headers, timeout=15)
             if response.status_code == 200:
                 data = response.json()
                 # Response format: resultSets[0].rowSet where each row has player name at index 2
@@ -638,6 +743,7 @@ def backfill_first_detected() -> int:
 
     if updated > 0:
         _save_confirmed(confirmed)
+        flush_pro_status()
         print(f"Backfilled first_detected for {updated} players")
 
     return updated
@@ -662,12 +768,10 @@ def _check_intl_type(intl_url: str, scraper: Any = None) -> Dict[str, Any]:
     result = {'pro': False, 'national_team': False, 'leagues': [], 'tournaments': []}
 
     try:
-        time.sleep(RATE_LIMIT_SECONDS)
-
         if HAS_CLOUDSCRAPER and scraper:
             response = scraper.get(intl_url, timeout=15)
         elif HAS_REQUESTS:
-            response = requests.get(intl_url, timeout=15)
+            response = http_get(intl_url, timeout=15)
         else:
             return result
 
@@ -848,12 +952,10 @@ def _verify_nba_stats(nba_url: str, scraper: Any = None) -> Dict[str, Any]:
         Dict with 'played': bool and 'games': int (0 if signed but didn't play)
     """
     try:
-        time.sleep(RATE_LIMIT_SECONDS)
-
         if scraper:
             response = scraper.get(nba_url, timeout=15)
         elif HAS_REQUESTS:
-            response = requests.get(nba_url, timeout=10, headers={
+            response = http_get(nba_url, timeout=10, headers={
                 'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'
             })
         else:
@@ -908,12 +1010,10 @@ def _verify_wnba_stats(wnba_url: str, scraper: Any = None) -> Dict[str, Any]:
         Dict with 'played': bool and 'games': int (0 if signed but didn't play)
     """
     try:
-        time.sleep(RATE_LIMIT_SECONDS)
-
         if scraper:
             response = scraper.get(wnba_url, timeout=15)
         elif HAS_REQUESTS:
-            response = requests.get(wnba_url, timeout=10, headers={
+            response = http_get(wnba_url, timeout=10, headers={
                 'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'
             })
         else:
@@ -948,6 +1048,191 @@ def _verify_wnba_stats(wnba_url: str, scraper: Any = None) -> Dict[str, Any]:
         return {'verified': False, 'error': str(e)}  # Can't verify - network error
 
 
+def _scan_sr_page(player_id: str, scraper: Any, notes: List[str]) -> Dict[str, Any]:
+    """
+    Fetch a player's Sports Reference page and collect their pro links.
+
+    This is the Sports Reference half of a status lookup; _resolve_pro_links()
+    does the Basketball Reference half.
+
+    Args:
+        player_id: Sports Reference player ID
+        scraper: Optional cloudscraper client (plain requests if None)
+        notes: Collects short status tags for display
+
+    Returns:
+        Dict with the partial 'result' and any 'nba_url'/'wnba_url'/'intl_url'
+        found, plus whether the page shows a recent NBA/WNBA season
+    """
+    url = f"{SPORTS_REF_BASE}{player_id}.html"
+    # Use cloudscraper to bypass Cloudflare protection
+    if scraper is not None:
+        response = scraper.get(url, timeout=15)
+    else:
+        response = http_get(url, timeout=10, headers={
+            'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'
+        })
+
+    scan: Dict[str, Any] = {'result': {}}
+    result = scan['result']
+
+    # Only warn about rate limiting, not missing pages
+    if response.status_code == 429:
+        notes.append("RATE LIMITED")
+    elif response.status_code >= 500:
+        notes.append(f"HTTP {response.status_code}")
+    elif response.status_code == 404:
+        # Player doesn't have a Sports Reference page
+        result['sr_page_exists'] = False
+
+    if response.status_code == 200:
+        result['sr_page_exists'] = True
+        html = response.text
+
+        # Look for Basketball Reference NBA link
+        nba_match = re.search(
+            r'href="(https://www\.basketball-reference\.com/players/[^"]+)"[^>]*>Basketball-Reference\.com</a>',
+            html
+        )
+        if nba_match:
+            scan['nba_url'] = nba_match.group(1)
+            # Check if currently active (look for recent season in stats table)
+            current_season, prev_season = _get_current_nba_seasons()
+            season_pattern = re.compile(rf'<th[^>]*scope="row"[^>]*>({re.escape(current_season)}|{re.escape(prev_season)})</th>')
+            scan['nba_active'] = bool(season_pattern.search(html))
+
+        # Look for Basketball Reference WNBA link
+        wnba_match = re.search(
+            r'href="(https://www\.basketball-reference\.com/wnba/players/[^"]+)"[^>]*>Basketball-Reference\.com</a>',
+            html
+        )
+        if wnba_match:
+            scan['wnba_url'] = wnba_match.group(1)
+            # Check if currently active (look for year in stats table)
+            current_year, prev_year = _get_current_wnba_years()
+            season_pattern = re.compile(rf'<th[^>]*scope="row"[^>]*>({re.escape(current_year)}|{re.escape(prev_year)})</th>')
+            scan['wnba_active'] = bool(season_pattern.search(html))
+
+        # Look for Basketball Reference International link
+        intl_match = re.search(
+            r'href="(https://www\.basketball-reference\.com/international/players/[^"]+)"',
+            html
+        )
+        if intl_match:
+            scan['intl_url'] = intl_match.group(1)
+
+    return scan
+
+
+def _intl_tags(intl_types: Dict[str, Any]) -> str:
+    tags = []
+    if intl_types['pro']:
+        tags.append("Pro")
+    if intl_types['national_team']:
+        tags.append("Nat'l")
+    return '+'.join(tags)
+
+
+def _resolve_pro_links(player_id: str, scan: Dict[str, Any], scraper: Any, notes: List[str]) -> Dict[str, Any]:
+    """
+    Verify the pro links found by _scan_sr_page() on Basketball Reference.
+
+    Args:
+        player_id: Sports Reference player ID
+        scan: Result of _scan_sr_page()
+        scraper: Optional cloudscraper client (plain requests if None)
+        notes: Collects short status tags for display
+
+    Returns:
+        Completed lookup result (empty if the player has no pro links)
+    """
+    result = scan['result']
+
+    nba_url = scan.get('nba_url')
+    if nba_url:
+        # Verify they actually played NBA games (not just a draft/G-League page)
+        nba_verify = _verify_nba_stats(nba_url, scraper)
+        # Always store the URL (they were signed)
+        result['nba_url'] = nba_url
+        # Store draft info if found
+        if nba_verify.get('draft_round') is not None or nba_verify.get('undrafted') is not None:
+            for key in ('draft_round', 'draft_pick', 'draft_year', 'draft_team', 'undrafted'):
+                if key in nba_verify:
+                    result[key] = nba_verify[key]
+        # Only set played status if we could verify
+        if nba_verify.get('verified') is not False:
+            result['nba_played'] = nba_verify['played']
+            if nba_verify['games'] is not None:
+                result['nba_games'] = nba_verify['games']
+            if nba_verify['played']:
+                result['is_active'] = scan['nba_active']
+            else:
+                result['is_active'] = False
+                notes.append("Signed, no games")
+
+    wnba_url = scan.get('wnba_url')
+    if wnba_url:
+        # Verify they actually played WNBA games
+        wnba_verify = _verify_wnba_stats(wnba_url, scraper)
+        # Always store the URL (they were signed)
+        result['wnba_url'] = wnba_url
+        # Only set played status if we could verify
+        if wnba_verify.get('verified') is not False:
+            result['wnba_played'] = wnba_verify['played']
+            if wnba_verify['games'] is not None:
+                result['wnba_games'] = wnba_verify['games']
+            if wnba_verify['played']:
+                result['is_wnba_active'] = scan['wnba_active']
+            else:
+                result['is_wnba_active'] = False
+                notes.append("Signed, no games")
+
+    intl_url = scan.get('intl_url')
+    if intl_url:
+        result['intl_url'] = intl_url
+        # Check if professional league and/or national team
+        intl_types = _check_intl_type(intl_url, scraper)
+        result['intl_pro'] = intl_types['pro']
+        result['intl_national_team'] = intl_types['national_team']
+        if _intl_tags(intl_types):
+            notes.append(_intl_tags(intl_types))
+
+    # Always check Basketball Reference international directly as fallback
+    # (Works even when Sports Reference is rate limited or doesn't show the link)
+    if 'intl_url' not in result:
+        try:
+            # Use alias if player ID has a typo on SR vs BR
+            lookup_id = PLAYER_ID_ALIASES.get(player_id, player_id)
+            intl_check_url = f"https://www.basketball-reference.com/international/players/{lookup_id}.html"
+            if scraper is not None:
+                intl_response = scraper.head(intl_check_url, timeout=10, allow_redirects=True)
+            else:
+                intl_response = http_head(intl_check_url, timeout=10, allow_redirects=True)
+            if intl_response.status_code == 200:
+                result['intl_url'] = intl_check_url
+                # Check type (need to fetch the page)
+                intl_types = _check_intl_type(intl_check_url, scraper)
+                result['intl_pro'] = intl_types['pro']
+                result['intl_national_team'] = intl_types['national_team']
+                if _intl_tags(intl_types):
+                    notes.append(_intl_tags(intl_types))
+        except (requests.RequestException, ConnectionError, TimeoutError):
+            pass  # Network errors are expected for players without intl pages
+
+    return result
+
+
+def _record_lookup(cache: Dict[str, Any], player_id: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Store a finished lookup in the lookup cache and the confirmed file."""
+    get_lookup_store().mark_dirty()
+    if result:
+        cache[player_id] = result
+        _add_to_confirmed(player_id, result)  # Persist for cache clears
+        return result
+    cache[player_id] = None
+    return None
+
+
 def check_player_nba_status(player_id: str) -> Optional[Dict[str, Any]]:
     """
     Check if a player went to the NBA by looking up their Sports Reference page.
@@ -980,163 +1265,164 @@ def check_player_nba_status(player_id: str) -> Optional[Dict[str, Any]]:
         return None
 
     url = f"{SPORTS_REF_BASE}{player_id}.html"
+    scraper = get_cloudscraper_client() if HAS_CLOUDSCRAPER else None
+    notes: List[str] = []
     try:
-        # Rate limit to stay under 20 requests/minute
-        time.sleep(RATE_LIMIT_SECONDS)
-
-        # Use cloudscraper to bypass Cloudflare protection
-        if HAS_CLOUDSCRAPER:
-            scraper = cloudscraper.create_scraper()
-            response = scraper.get(url, timeout=15)
-        else:
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; BasketballStatsBot/1.0)'
-            })
-
-        result = {}
-
-        # Only warn about rate limiting, not missing pages
-        if response.status_code == 429:
-            print(f" [RATE LIMITED]", end="", flush=True)
-        elif response.status_code >= 500:
-            print(f" [HTTP {response.status_code}]", end="", flush=True)
-        elif response.status_code == 404:
-            # Player doesn't have a Sports Reference page
-            result['sr_page_exists'] = False
-
-        if response.status_code == 200:
-            result['sr_page_exists'] = True
-            html = response.text
-
-            # Look for Basketball Reference NBA link
-            nba_match = re.search(
-                r'href="(https://www\.basketball-reference\.com/players/[^"]+)"[^>]*>Basketball-Reference\.com</a>',
-                html
-            )
-
-            if nba_match:
-                nba_url = nba_match.group(1)
-                # Verify they actually played NBA games (not just a draft/G-League page)
-                nba_verify = _verify_nba_stats(nba_url, scraper if HAS_CLOUDSCRAPER else None)
-                # Always store the URL (they were signed)
-                result['nba_url'] = nba_url
-                # Store draft info if found
-                if nba_verify.get('draft_round') is not None or nba_verify.get('undrafted') is not None:
-                    for key in ('draft_round', 'draft_pick', 'draft_year', 'draft_team', 'undrafted'):
-                        if key in nba_verify:
-                            result[key] = nba_verify[key]
-                # Only set played status if we could verify
-                if nba_verify.get('verified') is not False:
-                    result['nba_played'] = nba_verify['played']
-                    if nba_verify['games'] is not None:
-                        result['nba_games'] = nba_verify['games']
-                    if nba_verify['played']:
-                        # Check if currently active (look for recent season in stats table)
-                        current_season, prev_season = _get_current_nba_seasons()
-                        season_pattern = re.compile(rf'<th[^>]*scope="row"[^>]*>({re.escape(current_season)}|{re.escape(prev_season)})</th>')
-                        is_active = bool(season_pattern.search(html))
-                        result['is_active'] = is_active
-                    else:
-                        result['is_active'] = False
-                        print(" [Signed, no games]", end="", flush=True)
-
-            # Look for Basketball Reference WNBA link
-            wnba_match = re.search(
-                r'href="(https://www\.basketball-reference\.com/wnba/players/[^"]+)"[^>]*>Basketball-Reference\.com</a>',
-                html
-            )
-
-            if wnba_match:
-                wnba_url = wnba_match.group(1)
-                # Verify they actually played WNBA games
-                wnba_verify = _verify_wnba_stats(wnba_url, scraper if HAS_CLOUDSCRAPER else None)
-                # Always store the URL (they were signed)
-                result['wnba_url'] = wnba_url
-                # Only set played status if we could verify
-                if wnba_verify.get('verified') is not False:
-                    result['wnba_played'] = wnba_verify['played']
-                    if wnba_verify['games'] is not None:
-                        result['wnba_games'] = wnba_verify['games']
-                    if wnba_verify['played']:
-                        # Check if currently active (look for year in stats table)
-                        current_year, prev_year = _get_current_wnba_years()
-                        season_pattern = re.compile(rf'<th[^>]*scope="row"[^>]*>({re.escape(current_year)}|{re.escape(prev_year)})</th>')
-                        is_wnba_active = bool(season_pattern.search(html))
-                        result['is_wnba_active'] = is_wnba_active
-                    else:
-                        result['is_wnba_active'] = False
-                        print(" [Signed, no games]", end="", flush=True)
-
-            # Look for Basketball Reference International link
-            intl_match = re.search(
-                r'href="(https://www\.basketball-reference\.com/international/players/[^"]+)"',
-                html
-            )
-
-            if intl_match:
-                intl_url = intl_match.group(1)
-                result['intl_url'] = intl_url
-                # Check if professional league and/or national team
-                intl_types = _check_intl_type(intl_url, scraper if HAS_CLOUDSCRAPER else None)
-                result['intl_pro'] = intl_types['pro']
-                result['intl_national_team'] = intl_types['national_team']
-                # Print what was found
-                tags = []
-                if intl_types['pro']:
-                    tags.append("Pro")
-                if intl_types['national_team']:
-                    tags.append("Nat'l")
-                if tags:
-                    print(f" [{'+'.join(tags)}]", end="", flush=True)
-
-        # Always check Basketball Reference international directly as fallback
-        # (Works even when Sports Reference is rate limited or doesn't show the link)
-        if 'intl_url' not in result:
-            try:
-                time.sleep(RATE_LIMIT_SECONDS)  # Rate limit BR requests too
-                # Use alias if player ID has a typo on SR vs BR
-                lookup_id = PLAYER_ID_ALIASES.get(player_id, player_id)
-                intl_check_url = f"https://www.basketball-reference.com/international/players/{lookup_id}.html"
-                if HAS_CLOUDSCRAPER:
-                    intl_response = scraper.head(intl_check_url, timeout=10, allow_redirects=True)
-                else:
-                    intl_response = requests.head(intl_check_url, timeout=10, allow_redirects=True)
-                if intl_response.status_code == 200:
-                    result['intl_url'] = intl_check_url
-                    # Check type (need to fetch the page)
-                    intl_types = _check_intl_type(intl_check_url, scraper if HAS_CLOUDSCRAPER else None)
-                    result['intl_pro'] = intl_types['pro']
-                    result['intl_national_team'] = intl_types['national_team']
-                    # Print what was found
-                    tags = []
-                    if intl_types['pro']:
-                        tags.append("Pro")
-                    if intl_types['national_team']:
-                        tags.append("Nat'l")
-                    if tags:
-                        print(f" [{'+'.join(tags)}]", end="", flush=True)
-            except (requests.RequestException, ConnectionError, TimeoutError):
-                pass  # Network errors are expected for players without intl pages
-
-        if result:
-            cache[player_id] = result
-            _save_lookup_cache(cache)
-            _add_to_confirmed(player_id, result)  # Persist for cache clears
-            return result
-        else:
-            cache[player_id] = None
-            _save_lookup_cache(cache)
-            return None
-
+        scan = _scan_sr_page(player_id, scraper, notes)
+        result = _resolve_pro_links(player_id, scan, scraper, notes)
     except (requests.RequestException, ConnectionError, TimeoutError) as e:
         print(f"Warning: Network error fetching {url}: {e}")
         return None
     except (ValueError, AttributeError) as e:
         print(f"Warning: Parse error for {url}: {e}")
         return None
+    finally:
+        for note in notes:
+            print(f" [{note}]", end="", flush=True)
+
+    with _lookup_lock:
+        return _record_lookup(_load_lookup_cache(), player_id, result)
+
+
+def _lookup_tags(result: Optional[Dict[str, Any]]) -> List[str]:
+    tags = []
+    if result and result.get('nba_url'):
+        tags.append("NBA")
+    if result and result.get('wnba_url'):
+        tags.append("WNBA")
+    if result and result.get('intl_url'):
+        tags.append("Intl")
+    return tags
+
+
+def _new_lookup_scraper() -> Any:
+    """A cloudscraper client with its own session (one per host lane), or None."""
+    if HAS_CLOUDSCRAPER:
+        return HttpClient(session=cloudscraper.create_scraper())
+    return None
+
+
+def resolve_nba_status_concurrent(
+    player_ids: List[str],
+    checkpoint_every: int = LOOKUP_CHECKPOINT_EVERY,
+    show_progress: bool = True,
+    stop: Optional[threading.Event] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Look up pro status for many players, overlapping requests to different hosts.
+
+    Each lookup is a Sports Reference page fetch followed by Basketball
+    Reference checks. The two hosts run as separate lanes (one worker each,
+    paced by the shared per-host rate limits), so while Basketball Reference
+    verifies one player, Sports Reference is already fetching the next.
+
+    International pages are checked in the Basketball Reference lane: they
+    are on the same host and rate limit, so a lane of their own could not
+    run any faster. Proballers is not a lane here. It needs each player's
+    name and college and adds to the entries this run writes, so it stays
+    in check_proballers_for_all_players(), which runs after the batch.
+
+    Results are written to nba_lookup_cache.json every checkpoint_every
+    players and when the run ends or is interrupted, so a later run resumes
+    with the players still missing. Players whose lookup failed (network
+    errors) are not cached and are retried next time. If the interpreter
+    exits mid-run (background lookups), the run stops quietly after saving
+    the players already finished.
+
+    Args:
+        player_ids: Sports Reference player IDs to look up
+        checkpoint_every: Players between cache writes
+        show_progress: Print one line per finished player
+        stop: Event that ends the run early; queued players are skipped
+
+    Returns:
+        Dict mapping player_id to pro info (or None) for completed lookups
+    """
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    if not player_ids:
+        return results
+
+    sr_lane = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sr-lookup')
+    br_lane = ThreadPoolExecutor(max_workers=1, thread_name_prefix='br-lookup')
+    sr_scraper = _new_lookup_scraper()
+    br_scraper = _new_lookup_scraper()
+    notes: Dict[str, List[str]] = {player_id: [] for player_id in player_ids}
+    stopped = stop if stop is not None else threading.Event()
+
+    def scan(player_id: str) -> Dict[str, Any]:
+        # Queued scans are skipped once the run stops, so interpreter exit
+        # does not wait for the rest of the Sports Reference lane
+        if stopped.is_set():
+            return {}
+        return _scan_sr_page(player_id, sr_scraper, notes[player_id])
+
+    stage: Dict[Any, Tuple[str, str]] = {}
+    for player_id in player_ids:
+        future = sr_lane.submit(scan, player_id)
+        stage[future] = ('sr', player_id)
+
+    cache = _load_lookup_cache()
+    unsaved = 0
+    finished = 0
+    pending = set(stage)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                lane, player_id = stage.pop(future)
+                try:
+                    outcome = future.result()
+                except (requests.RequestException, ConnectionError, TimeoutError, ValueError, AttributeError) as e:
+                    finished += 1
+                    if show_progress:
+                        print(f"  {finished}/{len(player_ids)} {player_id} → Error: {e}")
+                    continue
+
+                if lane == 'sr':
+                    if stopped.is_set():
+                        continue
+                    try:
+                        br_future = br_lane.submit(_resolve_pro_links, player_id, outcome, br_scraper, notes[player_id])
+                    except RuntimeError:
+                        # The interpreter is exiting and executors refuse new
+                        # work. Finish what was submitted; this player is
+                        # looked up again next run.
+                        stopped.set()
+                        continue
+                    stage[br_future] = ('br', player_id)
+                    pending.add(br_future)
+                    continue
 
+                finished += 1
+                with _lookup_lock:
+                    results[player_id] = _record_lookup(cache, player_id, outcome)
+                    unsaved += 1
+                    if unsaved >= checkpoint_every:
+                        flush_pro_status()
+                        unsaved = 0
+                if show_progress:
+                    tags = [f"[{note}]" for note in notes[player_id]]
+                    found = _lookup_tags(results[player_id])
+                    if found:
+                        tags.append(f"→ {', '.join(found)}")
+                    print(f"  {finished}/{len(player_ids)} {player_id} {' '.join(tags)}".rstrip())
+            if stopped.is_set():
+                # Collect the Basketball Reference checks already handed over
+                pending = {future for future in pending if stage[future][0] == 'br'}
+    finally:
+        sr_lane.shutdown(wait=False, cancel_futures=True)
+        br_lane.shutdown(wait=False, cancel_futures=True)
+        flush_pro_status()
 
-def get_nba_status_batch(player_ids: List[str], use_api_fallback: bool = True, max_fetch: int = 0) -> Dict[str, Optional[Dict[str, Any]]]:
+    return results
+
+
+def get_nba_status_batch(
+    player_ids: List[str],
+    use_api_fallback: bool = True,
+    max_fetch: int = 0,
+    background: bool = False
+) -> Dict[str, Optional[Dict[str, Any]]]:
     """
     Get NBA status for multiple players.
     Uses cached data where available, fetches missing data.
@@ -1145,11 +1431,13 @@ def get_nba_status_batch(player_ids: List[str], use_api_fallback: bool = True, m
         player_ids: List of Sports Reference player IDs
         use_api_fallback: If True, also check nba_api for name matches
         max_fetch: Maximum number of new players to fetch (0 = unlimited)
+        background: Fetch missing players on a background thread and return
+            cached results immediately (see wait_for_background_lookups)
 
     Returns:
         Dict mapping player_id to NBA info (or None if not NBA)
     """
-    results = {}
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
     cache = _load_lookup_cache()
     confirmed = _load_confirmed()
     to_fetch = []
@@ -1179,29 +1467,64 @@ def get_nba_status_batch(player_ids: List[str], use_api_fallback: bool = True, m
     # Fetch missing players (max_fetch=-1 means cache only, skip fetching)
     if to_fetch and HAS_REQUESTS and max_fetch != -1:
         fetch_list = to_fetch if max_fetch == 0 else to_fetch[:max_fetch]
-        # Estimate time: ~6.2 seconds per player (2 requests @ 3.1s each)
-        est_minutes = (len(fetch_list) * 6.2) / 60
-        print(f"Checking {len(fetch_list)} players for NBA status... (est. {est_minutes:.0f} min)")
-        for i, player_id in enumerate(fetch_list):
-            print(f"  {i+1}/{len(fetch_list)} {player_id}", end="", flush=True)
-            result = check_player_nba_status(player_id)
-            results[player_id] = result
-            # Show what was found (can be multiple)
-            tags = []
-            if result and result.get('nba_url'):
-                tags.append("NBA")
-            if result and result.get('wnba_url'):
-                tags.append("WNBA")
-            if result and result.get('intl_url'):
-                tags.append("Intl")
-            if tags:
-                print(f" → {', '.join(tags)}")
-            else:
-                print()
+        # Estimate time: ~3.1 seconds per player (SR and BR requests overlap)
+        est_minutes = (len(fetch_list) * RATE_LIMIT_SECONDS) / 60
+        if background:
+            if _start_background_lookups(fetch_list):
+                print(f"Checking {len(fetch_list)} players for NBA status in the background... (est. {est_minutes:.0f} min)")
+        else:
+            print(f"Checking {len(fetch_list)} players for NBA status... (est. {est_minutes:.0f} min)")
+            results.update(resolve_nba_status_concurrent(fetch_list))
 
     return results
 
 
+_background_thread: Optional[threading.Thread] = None
+_background_stop = threading.Event()
+
+
+def _start_background_lookups(player_ids: List[str]) -> bool:
+    """Start resolving player_ids on a daemon thread (False if a run is already going)."""
+    global _background_thread
+    if _background_thread is not None and _background_thread.is_alive():
+        return False
+    _background_stop.clear()
+    _background_thread = threading.Thread(
+        target=resolve_nba_status_concurrent,
+        args=(player_ids,),
+        kwargs={'show_progress': False, 'stop': _background_stop},
+        name='nba-status-lookups',
+        daemon=True
+    )
+    _background_thread.start()
+    return True
+
+
+def background_lookups_started() -> bool:
+    """True if get_nba_status_batch() started a background run in this process."""
+    return _background_thread is not None
+
+
+def background_lookups_running() -> bool:
+    """True while a background get_nba_status_batch() run is in progress."""
+    return _background_thread is not None and _background_thread.is_alive()
+
+
+def wait_for_background_lookups(timeout: Optional[float] = None) -> bool:
+    """
+    Wait for a background get_nba_status_batch() run to finish.
+
+    Progress is checkpointed, so an interrupted wait loses at most the last
+    few lookups.
+
+    Returns:
+        True if no background run is still in progress
+    """
+    if _background_thread is not None:
+        _background_thread.join(timeout)
+    return not background_lookups_running()
+
+
 def is_nba_player_by_id(player_id: str) -> bool:
     """Check if a player went to the NBA by their Sports Reference ID."""
     if player_id in FALSE_POSITIVE_IDS:
@@ -1370,6 +1693,7 @@ def check_all_players_from_cache() -> Dict[str, int]:
         else:
             print()
 
+    flush_pro_status()
     print(f"\nComplete! Checked {len(to_check)} players, found {nba_found} new NBA players")
 
     # Count total NBA players in cache and confirmed
@@ -1452,41 +1776,38 @@ def _check_nba_players_for_intl() -> int:
     print(f"\nChecking {len(nba_only)} NBA-only players for international status...")
 
     intl_found = 0
-    if HAS_CLOUDSCRAPER:
-        scraper = cloudscraper.create_scraper()
+    scraper = get_cloudscraper_client() if HAS_CLOUDSCRAPER else None
 
     for i, player_id in enumerate(nba_only):
         print(f"  {i+1}/{len(nba_only)} {player_id}", end="", flush=True)
 
-        # Rate limit
-        time.sleep(RATE_LIMIT_SECONDS)
-
         # Check Basketball Reference international page directly
         # Use alias if player ID has a typo on SR vs BR
         lookup_id = PLAYER_ID_ALIASES.get(player_id, player_id)
         intl_check_url = f"https://www.basketball-reference.com/international/players/{lookup_id}.html"
         try:
-            if HAS_CLOUDSCRAPER:
+            if scraper is not None:
                 response = scraper.head(intl_check_url, timeout=10, allow_redirects=True)
             else:
-                response = requests.head(intl_check_url, timeout=10, allow_redirects=True)
+                response = http_head(intl_check_url, timeout=10, allow_redirects=True)
 
             if response.status_code == 200:
                 intl_found += 1
                 # Update cache
                 if player_id in cache and cache[player_id]:
                     cache[player_id]['intl_url'] = intl_check_url
-                    _save_lookup_cache(cache)
+                    get_lookup_store().mark_dirty()
                 # Update confirmed
                 if player_id in confirmed and confirmed[player_id]:
                     confirmed[player_id]['intl_url'] = intl_check_url
-                    _save_confirmed(confirmed)
+                    get_confirmed_store().mark_dirty()
                 print(" → +Intl")
             else:
                 print()
         except (requests.RequestException, ConnectionError, TimeoutError):
             print()
 
+    flush_pro_status()
     return intl_found
 
 
@@ -1537,7 +1858,7 @@ def recheck_null_players(force: bool = False) -> Dict[str, int]:
 
         # Remove from cache so check_player_nba_status will re-fetch
         del cache[player_id]
-        _save_lookup_cache(cache)
+        get_lookup_store().mark_dirty()
 
         # Do a fresh check
         result = check_player_nba_status(player_id)
@@ -1558,13 +1879,11 @@ def recheck_null_players(force: bool = False) -> Dict[str, int]:
         else:
             print()
 
-        # Reload cache for next iteration
-        cache = _load_lookup_cache()
-
     # Also check NBA-only players for international status
     intl_from_nba = _check_nba_players_for_intl()
 
     # Save timestamp so we don't re-check again for 90 days
+    flush_pro_status()
     _save_recheck_timestamp()
 
     print(f"\nComplete! Re-checked {len(null_players)} null players")
@@ -1696,7 +2015,7 @@ def recheck_female_players_for_wnba(force: bool = False) -> Dict[str, int]:
         # Remove from cache so check_player_nba_status will re-fetch
         if player_id in cache:
             del cache[player_id]
-            _save_lookup_cache(cache)
+            get_lookup_store().mark_dirty()
 
         # Do a fresh check
         result = check_player_nba_status(player_id)
@@ -1716,9 +2035,7 @@ def recheck_female_players_for_wnba(force: bool = False) -> Dict[str, int]:
         else:
             print()
 
-        # Reload cache for next iteration
-        cache = _load_lookup_cache()
-
+    flush_pro_status()
     # Save timestamp so we don't re-check again for 90 days
     _save_wnba_recheck_timestamp()
 
@@ -1760,7 +2077,7 @@ def reverify_cached_pro_players() -> Dict[str, int]:
     print(f"Estimated time: {est_minutes:.0f} minutes")
 
     if HAS_CLOUDSCRAPER:
-        scraper = cloudscraper.create_scraper()
+        scraper = get_cloudscraper_client()
     else:
         scraper = None
 
@@ -1792,7 +2109,7 @@ def reverify_cached_pro_players() -> Dict[str, int]:
                 cache[player_id]['nba_games'] = nba_verify['games']
             if not nba_verify['played']:
                 cache[player_id]['is_active'] = False
-            _save_lookup_cache(cache)
+            get_lookup_store().mark_dirty()
 
             # Also update confirmed if present
             if player_id in confirmed and confirmed[player_id].get('nba_url'):
@@ -1801,7 +2118,7 @@ def reverify_cached_pro_players() -> Dict[str, int]:
                     confirmed[player_id]['nba_games'] = nba_verify['games']
                 if not nba_verify['played']:
                     confirmed[player_id]['is_active'] = False
-                _save_confirmed(confirmed)
+                get_confirmed_store().mark_dirty()
 
             if nba_verify['played']:
                 print(f" ✓ ({nba_verify['games']} games)" if nba_verify['games'] else " ✓")
@@ -1834,7 +2151,7 @@ def reverify_cached_pro_players() -> Dict[str, int]:
                 cache[player_id]['wnba_games'] = wnba_verify['games']
             if not wnba_verify['played']:
                 cache[player_id]['is_wnba_active'] = False
-            _save_lookup_cache(cache)
+            get_lookup_store().mark_dirty()
 
             # Also update confirmed if present
             if player_id in confirmed and confirmed[player_id].get('wnba_url'):
@@ -1843,7 +2160,7 @@ def reverify_cached_pro_players() -> Dict[str, int]:
                     confirmed[player_id]['wnba_games'] = wnba_verify['games']
                 if not wnba_verify['played']:
                     confirmed[player_id]['is_wnba_active'] = False
-                _save_confirmed(confirmed)
+                get_confirmed_store().mark_dirty()
 
             if wnba_verify['played']:
                 print(f" ✓ ({wnba_verify['games']} games)" if wnba_verify['games'] else " ✓")
@@ -1851,6 +2168,7 @@ def reverify_cached_pro_players() -> Dict[str, int]:
                 wnba_signed_only += 1
                 print(" → Signed, no games")
 
+    flush_pro_status()
     print(f"\nComplete!")
     print(f"  NBA: {len(nba_players)} checked, {nba_signed_only} signed only (no games)")
     print(f"  WNBA: {len(wnba_players)} checked, {wnba_signed_only} signed only (no games)")
@@ -1913,7 +2231,7 @@ def recheck_intl_types(force: bool = False) -> Dict[str, int]:
     print(f"Estimated time: {est_minutes:.0f} minutes (rate limited)")
 
     if HAS_CLOUDSCRAPER:
-        scraper = cloudscraper.create_scraper()
+        scraper = get_cloudscraper_client()
     else:
         scraper = None
 
@@ -1939,7 +2257,7 @@ def recheck_intl_types(force: bool = False) -> Dict[str, int]:
             cache[player_id]['intl_tournaments'] = intl_types.get('tournaments', [])
             # Remove old intl_type field if present
             cache[player_id].pop('intl_type', None)
-            _save_lookup_cache(cache)
+            get_lookup_store().mark_dirty()
 
         # Update confirmed
         if player_id in confirmed and confirmed[player_id]:
@@ -1949,7 +2267,7 @@ def recheck_intl_types(force: bool = False) -> Dict[str, int]:
             confirmed[player_id]['intl_tournaments'] = intl_types.get('tournaments', [])
             # Remove old intl_type field if present
             confirmed[player_id].pop('intl_type', None)
-            _save_confirmed(confirmed)
+            get_confirmed_store().mark_dirty()
 
         # Count results and show leagues
         leagues_str = ', '.join(intl_types.get('leagues', []))
@@ -1966,6 +2284,7 @@ def recheck_intl_types(force: bool = False) -> Dict[str, int]:
         else:
             print(" → (none found)")
 
+    flush_pro_status()
     print(f"\nComplete! Checked {len(to_check)} international players")
     print(f"  Overseas Pro only: {pro_count}")
     print(f"  National Team only: {national_team_count}")
@@ -2084,9 +2403,10 @@ def check_proballers_for_all_players(
         else:
             print(" → (not found)")
 
-        _save_lookup_cache(cache)
-        _save_confirmed(confirmed)
+        get_lookup_store().mark_dirty()
+        get_confirmed_store().mark_dirty()
 
+    flush_pro_status()
     print(f"\nComplete!")
     print(f"  Checked: {len(players)}")
     print(f"  Found on Proballers: {found_count}")
@@ -2119,6 +2439,9 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
         except Exception:
             pass  # If timestamp is corrupt, just re-run
 
+    # Background lookups write to the same confirmed file; let them finish first
+    wait_for_background_lookups()
+
     confirmed = _load_confirmed()
     cache = _load_lookup_cache()
 
@@ -2208,7 +2531,7 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
     print(f"Estimated time: {est_minutes:.1f} minutes (Proballers is fast)")
 
     if HAS_CLOUDSCRAPER:
-        scraper = cloudscraper.create_scraper()
+        scraper = get_cloudscraper_client()
     elif HAS_REQUESTS:
         scraper = None
     else:
@@ -2230,9 +2553,9 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
             pb_updated = 0
             pb_results = []  # Collect (player_id, updates_dict) for main thread to apply
             pb_log = []  # Collect log lines for main thread to print
-            # Proballers needs its own scraper instance (thread safety)
+            # Proballers needs its own session (thread safety); host limits are still shared
             if HAS_CLOUDSCRAPER:
-                pb_scraper = cloudscraper.create_scraper()
+                pb_scraper = HttpClient(session=cloudscraper.create_scraper())
             elif HAS_REQUESTS:
                 pb_scraper = None
             else:
@@ -2269,7 +2592,7 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
             if scraper:
                 resp = scraper.get(url, timeout=15)
             else:
-                resp = requests.get(url, timeout=15)
+                resp = http_get(url, timeout=15)
 
             if resp.status_code == 200:
                 html = resp.text
@@ -2294,8 +2617,6 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
         except Exception as e:
             print(f" → Error: {e}")
 
-        time.sleep(RATE_LIMIT_SECONDS)
-
     # Check WNBA players
     for i, (player_id, url) in enumerate(wnba_to_check):
         print(f"  WNBA {i+1}/{len(wnba_to_check)} {player_id}...", end='', flush=True)
@@ -2304,7 +2625,7 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
             if scraper:
                 resp = scraper.get(url, timeout=15)
             else:
-                resp = requests.get(url, timeout=15)
+                resp = http_get(url, timeout=15)
 
             if resp.status_code == 200:
                 html = resp.text
@@ -2328,8 +2649,6 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
         except Exception as e:
             print(f" → Error: {e}")
 
-        time.sleep(RATE_LIMIT_SECONDS)
-
     # Check International players
     intl_updated = 0
     for i, (player_id, url) in enumerate(intl_to_check):
@@ -2410,6 +2729,7 @@ def refresh_active_status(force: bool = False) -> Dict[str, Any]:
     # Save updated data
     _save_confirmed(confirmed)
     _save_lookup_cache(cache)
+    flush_pro_status()
 
     # Save refresh timestamp
     PRO_REFRESH_TIMESTAMP_FILE.write_text(datetime.now().isoformat())
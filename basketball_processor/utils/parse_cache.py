@@ -0,0 +1,235 @@
+"""
+Content-addressed cache for parsed box score HTML files.
+
+Cache entries are keyed on a SHA-256 hash of the HTML bytes (plus the gender
+the file was parsed as), so renamed or copied box scores share one entry and
+touching a file's mtime does not force a re-parse. Every entry is stamped with
+PARSER_VERSION; bumping it invalidates all existing entries.
+
+A small manifest maps each source path to (size, mtime, hash) so unchanged
+files can be matched to their entry without re-reading and re-hashing them.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .constants import CACHE_DIR
+from .helpers import atomic_write_json
+
+# Bump when parser output changes in a way cached entries should not survive
+PARSER_VERSION = 1
+
+MANIFEST_FILE = CACHE_DIR / "parse_manifest.json"
+
+# Key stored on each cache entry with its parser version and content hash
+CACHE_META_KEY = '_cache_meta'
+
+# Characters read from the start of an entry to find its stamp
+META_HEAD_CHARS = 1024
+
+
+def hash_html_bytes(content: bytes) -> str:
+    """Return the SHA-256 hex digest of raw HTML bytes."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _read_entry_meta(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read the CACHE_META_KEY stamp from the start of a cache entry.
+
+    store() writes the stamp as the first key, so only the head of the file
+    is read and decoded; the box score that follows is never parsed.
+
+    Returns:
+        The stamp dictionary, or None if the entry does not start with one
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            head = f.read(META_HEAD_CHARS)
+    except (IOError, OSError):
+        return None
+
+    decoder = json.JSONDecoder()
+    try:
+        # '{' then the first key, ':' and the stamp object
+        index = head.index('{') + 1
+        key, index = decoder.raw_decode(head, _skip_whitespace(head, index))
+        index = _skip_whitespace(head, index)
+        if key != CACHE_META_KEY or head[index] != ':':
+            return None
+        meta, _ = decoder.raw_decode(head, _skip_whitespace(head, index + 1))
+    except (ValueError, IndexError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    while index < len(text) and text[index] in ' \t\r\n':
+        index += 1
+    return index
+
+
+class ParseCache:
+    """Maps HTML files to parsed game JSON via a content hash."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, manifest_path: Optional[Path] = None):
+        self.cache_dir = cache_dir
+        self.manifest_path = manifest_path or cache_dir / MANIFEST_FILE.name
+        self._files: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the path -> (size, mtime, hash) manifest on first use."""
+        if self._files is None:
+            self._files = {}
+            if self.manifest_path.exists():
+                try:
+                    with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._files = data.get('files', {})
+                except (json.JSONDecodeError, IOError, OSError):
+                    self._files = {}
+        return self._files
+
+    def get_content_hash(self, file_path: str) -> str:
+        """
+        Return the content hash for an HTML file.
+
+        Uses the manifest entry when the file's size and mtime are unchanged;
+        otherwise reads and hashes the bytes and records the result.
+
+        Args:
+            file_path: Path to the HTML file
+
+        Returns:
+            SHA-256 hex digest of the file contents
+        """
+        files = self._load_manifest()
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+
+        entry = files.get(key)
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime:
+            return entry['hash']
+
+        with open(file_path, 'rb') as f:
+            content_hash = hash_html_bytes(f.read())
+
+        files[key] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'hash': content_hash}
+        self._dirty = True
+        if entry and entry.get('hash') != content_hash:
+            self._drop_orphaned_entries(entry['hash'])
+        return content_hash
+
+    def _drop_orphaned_entries(self, content_hash: str) -> None:
+        """Delete cache entries for a hash no manifest path points at anymore.
+
+        Without this, editing an HTML file would leave its old parse behind and
+        loaders that glob the cache directory would see the game twice.
+        """
+        files = self._load_manifest()
+        if any(entry.get('hash') == content_hash for entry in files.values()):
+            return
+        for path in self.cache_dir.glob(f"{content_hash[:32]}-*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def entry_path(self, content_hash: str, gender: str) -> Path:
+        """Return the cache JSON path for a content hash and parse gender."""
+        return self.cache_dir / f"{content_hash[:32]}-{gender}.json"
+
+    def has_entry(self, content_hash: str, gender: str) -> bool:
+        """Return True if a cache entry exists for the current parser version."""
+        path = self.entry_path(content_hash, gender)
+        if not path.exists():
+            return False
+        meta = _read_entry_meta(path)
+        if meta is None:
+            # No readable stamp up front (hand-edited or foreign entry): check the full entry
+            return self.load(content_hash, gender) is not None
+        return meta.get('parser_version') == PARSER_VERSION
+
+    def load(self, content_hash: str, gender: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached game if it was produced by the current parser version.
+
+        Returns:
+            Game data dictionary, or None on miss, stale version, or corrupt entry
+        """
+        path = self.entry_path(content_hash, gender)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                game_data = json.load(f)
+        except (json.JSONDecodeError, IOError, OSError):
+            return None
+        meta = game_data.get(CACHE_META_KEY) or {}
+        if meta.get('parser_version') != PARSER_VERSION:
+            return None
+        return game_data
+
+    def store(self, content_hash: str, gender: str, game_data: Dict[str, Any]) -> Path:
+        """
+        Write a parsed game to the cache, stamped with the parser version.
+
+        The caller's game_data gets the same stamp, so later stages can write
+        the game back to its entry.
+
+        Returns:
+            Path of the written cache entry
+        """
+        meta = {'parser_version': PARSER_VERSION, 'content_hash': content_hash, 'gender': gender}
+        # Put the stamp first so has_entry() can read it without a full load
+        entry = {CACHE_META_KEY: meta}
+        entry.update((k, v) for k, v in game_data.items() if k not in (CACHE_META_KEY, '_from_cache'))
+        path = self.entry_path(content_hash, gender)
+        atomic_write_json(path, entry, indent=2)
+        game_data[CACHE_META_KEY] = meta
+        return path
+
+    def write_back(self, game_data: Dict[str, Any]) -> Optional[Path]:
+        """
+        Re-store a game loaded from this cache to the entry it came from.
+
+        The entry is located from the game's CACHE_META_KEY stamp. Its gender is
+        the one the file was parsed as, not game_data['gender'], which SIDEARM
+        games do not set.
+
+        Returns:
+            Path of the written cache entry, or None if the game has no stamp
+        """
+        meta = game_data.get(CACHE_META_KEY) or {}
+        content_hash = meta.get('content_hash')
+        if not content_hash:
+            return None
+        gender = meta.get('gender')
+        if not gender:
+            # Entries stamped before the gender was recorded
+            basic_info = game_data.get('basic_info') or {}
+            gender = basic_info.get('gender', game_data.get('gender', 'M'))
+        return self.store(content_hash, gender, game_data)
+
+    def save_manifest(self) -> None:
+        """Persist the manifest if any hashes were added or changed."""
+        if not self._dirty or self._files is None:
+            return
+        atomic_write_json(self.manifest_path, {'files': self._files})
+        self._dirty = False
+
+
+_parse_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide ParseCache instance."""
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = ParseCache()
+    return _parse_cache
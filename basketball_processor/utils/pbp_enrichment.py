@@ -0,0 +1,218 @@
+"""
+Play-by-play enrichment stage.
+
+Parsing a box score is pure CPU; fetching ESPN or SIDEARM play-by-play for it
+is slow, rate-limited HTTP. This module runs the fetches as a separate stage
+over games that are still missing 'espn_pbp_analysis': lookups run on a small
+thread pool (each scraper keeps its own politeness delay), and every finished
+game is written back to the parse cache immediately, so an interrupted run
+picks up where it left off. Games loaded from another JSON file (the ESPN
+cache) record it under SOURCE_FILE_KEY, and their results are merged back
+into that file instead.
+
+Games whose lookup found nothing are stamped with the attempt date and not
+retried for PBP_RETRY_DAYS.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .helpers import atomic_write_json
+from .log import info, debug, warn
+
+# Key recording when a lookup last came back empty (YYYYMMDD)
+PBP_ATTEMPT_KEY = '_pbp_attempted'
+
+# Key naming the JSON file a game outside the parse cache was loaded from
+SOURCE_FILE_KEY = '_source_file'
+
+# Game fields set by this stage, merged back into source files
+_ENRICHMENT_KEYS = ('espn_pbp_analysis', PBP_ATTEMPT_KEY)
+
+# Days to wait before retrying a game whose PBP could not be found
+PBP_RETRY_DAYS = 7
+
+DEFAULT_PBP_WORKERS = 4
+
+
+def _game_date_yyyymmdd(basic_info: Dict[str, Any]) -> str:
+    """Return the game date as YYYYMMDD, converting from 'January 11, 2025' if needed."""
+    date_yyyymmdd = basic_info.get('date_yyyymmdd', '')
+    if date_yyyymmdd:
+        return date_yyyymmdd
+    date_str = basic_info.get('date', '')
+    if date_str:
+        try:
+            return datetime.strptime(date_str, '%B %d, %Y').strftime('%Y%m%d')
+        except ValueError:
+            pass
+    return ''
+
+
+def needs_pbp_enrichment(game_data: Dict[str, Any], today: Optional[datetime] = None) -> bool:
+    """
+    Return True if a game is missing PBP analysis and is due for a lookup.
+
+    Args:
+        game_data: Parsed game dictionary
+        today: Current date (for tests)
+    """
+    if 'espn_pbp_analysis' in game_data:
+        return False
+    attempted = game_data.get(PBP_ATTEMPT_KEY)
+    if attempted:
+        today = today or datetime.now()
+        cutoff = (today - timedelta(days=PBP_RETRY_DAYS)).strftime('%Y%m%d')
+        if attempted > cutoff:
+            return False
+    return True
+
+
+def fetch_pbp_for_game(game_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Find play-by-play data for a game.
+
+    Uses PBP embedded in the game (SIDEARM box scores), then ESPN, then the
+    home/away SIDEARM sites.
+
+    Args:
+        game_data: Parsed game dictionary
+
+    Returns:
+        PBP data with a non-empty 'plays' list, or None
+    """
+    embedded = game_data.get('espn_pbp')
+    if embedded and embedded.get('plays'):
+        return embedded
+
+    basic_info = game_data.get('basic_info', {})
+    away_team = basic_info.get('away_team', '')
+    home_team = basic_info.get('home_team', '')
+    gender = basic_info.get('gender', game_data.get('gender', 'M'))
+    date_yyyymmdd = _game_date_yyyymmdd(basic_info)
+    if not (away_team and home_team and date_yyyymmdd):
+        return None
+
+    pbp_data = None
+
+    # Try ESPN first
+    try:
+        from .espn_pbp_scraper import get_espn_pbp_for_game
+
+        pbp_data = get_espn_pbp_for_game(
+            away_team, home_team, date_yyyymmdd,
+            gender=gender, verbose=False
+        )
+    except ImportError:
+        pass  # ESPN PBP scraper not available
+    except Exception:
+        pass  # Don't fail if ESPN PBP fails
+
+    # Fall back to SIDEARM if ESPN didn't have data
+    if not pbp_data or not pbp_data.get('plays'):
+        try:
+            from .sidearm_scraper import get_sidearm_pbp_for_game
+
+            pbp_data = get_sidearm_pbp_for_game(
+                home_team, away_team, date_yyyymmdd,
+                gender=gender, verbose=False
+            )
+        except ImportError:
+            pass  # SIDEARM scraper not available
+        except Exception:
+            pass  # Don't fail if SIDEARM PBP fails
+
+    if pbp_data and pbp_data.get('plays'):
+        return pbp_data
+    return None
+
+
+def apply_pbp_analysis(game_data: Dict[str, Any], pbp_data: Optional[Dict[str, Any]]) -> bool:
+    """
+    Run the PBP engine and store 'espn_pbp_analysis' on the game.
+
+    Returns:
+        True if analysis was added
+    """
+    if not pbp_data or not pbp_data.get('plays'):
+        return False
+    try:
+        from ..engines.espn_pbp_engine import ESPNPlayByPlayEngine
+        engine = ESPNPlayByPlayEngine(pbp_data, game_data)
+        game_data['espn_pbp_analysis'] = engine.analyze()
+    except Exception:
+        return False  # Don't fail if analysis fails
+    return True
+
+
+def _write_back_to_source(game_data: Dict[str, Any]) -> None:
+    """Merge a game's enrichment fields into the JSON file it was loaded from."""
+    path = Path(game_data[SOURCE_FILE_KEY])
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        for key in _ENRICHMENT_KEYS:
+            if key in game_data:
+                stored[key] = game_data[key]
+            else:
+                stored.pop(key, None)
+        atomic_write_json(path, stored, indent=2)
+    except (json.JSONDecodeError, IOError, OSError) as e:
+        warn(f"  Could not save play-by-play to {path.name}: {e}")
+
+
+def enrich_games_with_pbp(
+    games: List[Dict[str, Any]],
+    workers: int = DEFAULT_PBP_WORKERS
+) -> Dict[str, int]:
+    """
+    Fetch and analyze PBP for every game that needs it, writing results to the cache.
+
+    Games are updated in place. Games without a parse cache stamp are saved
+    to their SOURCE_FILE_KEY file if they have one, and are otherwise only
+    enriched in memory.
+
+    Args:
+        games: Parsed games
+        workers: Maximum concurrent lookups
+
+    Returns:
+        Counts of 'enriched', 'missing' (no PBP found) and 'skipped' games
+    """
+    from .parse_cache import get_parse_cache
+
+    pending = [game for game in games if needs_pbp_enrichment(game)]
+    counts = {'enriched': 0, 'missing': 0, 'skipped': len(games) - len(pending)}
+    if not pending:
+        return counts
+
+    info(f"Fetching play-by-play for {len(pending)} game(s)...")
+    parse_cache = get_parse_cache()
+    today = datetime.now().strftime('%Y%m%d')
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(fetch_pbp_for_game, game): game for game in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            game = futures[future]
+            try:
+                pbp_data = future.result()
+            except Exception:
+                pbp_data = None
+
+            if apply_pbp_analysis(game, pbp_data):
+                game.pop(PBP_ATTEMPT_KEY, None)
+                counts['enriched'] += 1
+            else:
+                game[PBP_ATTEMPT_KEY] = today
+                counts['missing'] += 1
+
+            # Persist each game as it finishes so an interrupted run can resume
+            if parse_cache.write_back(game) is None and game.get(SOURCE_FILE_KEY):
+                _write_back_to_source(game)
+            debug(f"  PBP {done}/{len(pending)}: {game.get('game_id', '')}")
+
+    info(f"  Play-by-play: {counts['enriched']} enriched, {counts['missing']} not found")
+    return counts
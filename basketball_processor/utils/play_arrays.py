@@ -0,0 +1,225 @@
+"""
+Columnar play-by-play data.
+
+Play lists are converted once into typed NumPy arrays (period, seconds
+remaining, away/home score, team side, points) so margin, lead change,
+comeback and scoring run analytics run as vectorized diff/sign/reduceat
+operations instead of Python loops over play dicts.
+
+Both play formats are supported: Sports Reference box score plays
+(score_away/score_home/half) and ESPN/SIDEARM plays
+(away_score/home_score/period/team_side/score_value).
+"""
+
+import re
+from functools import cached_property
+from operator import itemgetter
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+# Team side codes
+AWAY = 1
+HOME = -1
+NO_SIDE = 0
+
+# Event code for a score change that breaks a run (both teams scored)
+_RUN_BREAK = 2
+
+_SIDE_CODES = {'away': AWAY, 'home': HOME}
+
+_TIME_RE = re.compile(r'(\d+):(\d+)')
+
+
+class ScoringRun(NamedTuple):
+    """A scoring run segment; start/end are play indices."""
+    side: int
+    points: int
+    start: int
+    end: int
+
+
+def seconds_remaining(time_str: str) -> int:
+    """
+    Parse a clock string like "5:30" or "19:45.0" to seconds left in the period.
+
+    Returns:
+        Seconds remaining, or -1 if the time can't be parsed
+    """
+    match = _TIME_RE.match(time_str) if time_str else None
+    if not match:
+        return -1
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def _sr_side(play: Dict[str, Any]) -> int:
+    if play['away_action'] and not play['home_action']:
+        return AWAY
+    if play['home_action'] and not play['away_action']:
+        return HOME
+    return NO_SIDE
+
+
+class PlayArrays:
+    """
+    Typed per-play arrays for one game.
+
+    Scores are converted up front since every analysis needs them; the
+    other columns are built on first access.
+
+    Attributes:
+        away: Away score after the play, int32
+        home: Home score after the play, int32
+        margin: Away score minus home score, int32
+        period: Period (half or quarter) number, int16
+        seconds: Seconds remaining in the period (-1 if unknown), int32
+        side: Team side (AWAY, HOME or NO_SIDE), int8
+        points: Points scored on the play, int16
+    """
+
+    def __init__(self, plays: List[Dict[str, Any]], sr_format: bool = False):
+        """
+        Args:
+            plays: Play dictionaries
+            sr_format: Plays are Sports Reference plays (extract_play_by_play)
+                rather than ESPN/SIDEARM plays (parse_espn_plays)
+        """
+        self.plays = plays
+        self.sr_format = sr_format
+        away_key, home_key = ('score_away', 'score_home') if sr_format else ('away_score', 'home_score')
+        self.away = np.fromiter(map(itemgetter(away_key), plays), dtype=np.int32, count=len(plays))
+        self.home = np.fromiter(map(itemgetter(home_key), plays), dtype=np.int32, count=len(plays))
+        self.margin = self.away - self.home  # Positive = away leading
+
+    @classmethod
+    def from_sr_plays(cls, plays: List[Dict[str, Any]]) -> 'PlayArrays':
+        """Build arrays from Sports Reference plays."""
+        return cls(plays, sr_format=True)
+
+    @classmethod
+    def from_espn_plays(cls, plays: List[Dict[str, Any]]) -> 'PlayArrays':
+        """Build arrays from ESPN or SIDEARM plays."""
+        return cls(plays)
+
+    @cached_property
+    def period(self) -> np.ndarray:
+        """Period (half or quarter) of each play."""
+        key = 'half' if self.sr_format else 'period'
+        return np.fromiter(map(itemgetter(key), self.plays), dtype=np.int16, count=len(self.plays))
+
+    @cached_property
+    def seconds(self) -> np.ndarray:
+        """Seconds left in the period at each play (-1 if unknown)."""
+        return np.fromiter((seconds_remaining(p.get('time', '')) for p in self.plays),
+                           dtype=np.int32, count=len(self.plays))
+
+    @cached_property
+    def side(self) -> np.ndarray:
+        """Team side; for Sports Reference plays, the team with the only action on the row."""
+        if self.sr_format:
+            sides = (_sr_side(p) for p in self.plays)
+        else:
+            sides = (_SIDE_CODES.get(p.get('team_side', ''), NO_SIDE) for p in self.plays)
+        return np.fromiter(sides, dtype=np.int8, count=len(self.plays))
+
+    @cached_property
+    def points(self) -> np.ndarray:
+        """Points on the play; for Sports Reference plays, the change in combined score."""
+        if self.sr_format:
+            return np.diff(self.away + self.home, prepend=0).astype(np.int16)
+        return np.fromiter((p.get('score_value', 0) for p in self.plays),
+                           dtype=np.int16, count=len(self.plays))
+
+    def __len__(self) -> int:
+        return len(self.margin)
+
+    def lead_changes(self) -> int:
+        """
+        Count lead changes: plays where the leader flips from the previous play.
+
+        A lead lost to a tie and then retaken by the other team does not count,
+        matching the play-by-play parser.
+        """
+        leader = np.sign(self.margin)
+        return int(np.count_nonzero(leader[1:] * leader[:-1] < 0))
+
+    def largest_lead_index(self, side: int) -> Optional[int]:
+        """
+        Find the play where a team's lead was largest.
+
+        Args:
+            side: AWAY or HOME
+
+        Returns:
+            Index of the first play with the largest lead, or None if the
+            team never led
+        """
+        if not len(self):
+            return None
+        lead = self.margin if side == AWAY else -self.margin
+        index = int(np.argmax(lead))
+        return index if lead[index] > 0 else None
+
+    def max_deficit_index(self, side: int) -> Optional[int]:
+        """
+        Find the play where a team trailed by the most.
+
+        Args:
+            side: AWAY or HOME
+
+        Returns:
+            Index of the first play with the largest deficit, or None if the
+            team never trailed
+        """
+        return self.largest_lead_index(-side)
+
+    def scoring_runs(self, min_points: int) -> List[ScoringRun]:
+        """
+        Segment the game into unanswered scoring runs.
+
+        Each play's score change from the previous play is an event: one
+        team scoring extends (or starts) that team's run, both teams scoring
+        breaks the run, and no change is ignored. The first play is the
+        baseline.
+
+        Args:
+            min_points: Minimum points for a run to be returned
+
+        Returns:
+            Runs of at least min_points, in game order
+        """
+        if len(self) < 2:
+            return []
+
+        away_scored = np.diff(self.away)
+        home_scored = np.diff(self.home)
+        events = np.where(
+            (away_scored > 0) & (home_scored == 0), AWAY,
+            np.where(
+                (home_scored > 0) & (away_scored == 0), HOME,
+                np.where((away_scored > 0) | (home_scored > 0), _RUN_BREAK, NO_SIDE),
+            ),
+        )
+
+        event_index = np.flatnonzero(events)
+        if not len(event_index):
+            return []
+        codes = events[event_index]
+        points = np.where(codes == AWAY, away_scored[event_index], home_scored[event_index])
+
+        # A run is a stretch of consecutive events with the same code
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        ends = np.r_[starts[1:], len(codes)] - 1
+        totals = np.add.reduceat(points, starts)
+        keep = np.flatnonzero((codes[starts] != _RUN_BREAK) & (totals >= min_points))
+
+        # Event i is the change into play i + 1
+        return [
+            ScoringRun(
+                side=int(codes[starts[k]]),
+                points=int(totals[k]),
+                start=int(event_index[starts[k]]) + 1,
+                end=int(event_index[ends[k]]) + 1,
+            )
+            for k in keep
+        ]
@@ -25,13 +25,9 @@ Usage:
 
 import json
 import re
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-# Rate limiting (0 = no delay; network latency provides natural throttling)
-RATE_LIMIT_SECONDS = 0
-
 # Cache file (can be cleared)
 CACHE_DIR = Path(__file__).parent.parent.parent / 'cache'
 PROBALLERS_CACHE_FILE = CACHE_DIR / 'proballers_cache.json'
@@ -142,19 +138,12 @@ PRO_LEAGUES = {
     'brazil-nbb', 'mexico-lnbp', 'mexico-liga-sisnova-lnbp', 'canada-cebl',
 }
 
-try:
-    import cloudscraper
-    HAS_CLOUDSCRAPER = True
-except ImportError:
-    HAS_CLOUDSCRAPER = False
-    cloudscraper = None
+from .http_client import get_cloudscraper_client
 
 
 def _get_scraper():
-    """Get a cloudscraper instance."""
-    if HAS_CLOUDSCRAPER:
-        return cloudscraper.create_scraper()
-    return None
+    """Get the shared rate-limited cloudscraper client (None if not installed)."""
+    return get_cloudscraper_client()
 
 
 def _load_cache() -> Dict[str, Any]:
@@ -219,7 +208,6 @@ def fetch_ncaa_teams(scraper=None, force_refresh: bool = False) -> Dict[str, Dic
         return {}
 
     print("Fetching NCAA teams from Proballers...")
-    time.sleep(RATE_LIMIT_SECONDS)
 
     url = 'https://www.proballers.com/basketball/league/5/ncaa/teams'
     try:
@@ -350,7 +338,7 @@ def find_team_id(sr_slug: str, scraper=None) -> Optional[int]:
 
     Args:
         sr_slug: Sports Reference team slug (e.g., 'san-francisco')
-        scraper: Optional cloudscraper instance
+        scraper: Optional HTTP client (defaults to _get_scraper())
 
     Returns:
         Proballers team ID if found, None otherwise
@@ -386,7 +374,7 @@ def get_player_career(player_id: int, scraper=None, force_refresh: bool = False)
 
     Args:
         player_id: Proballers player ID
-        scraper: Optional cloudscraper instance
+        scraper: Optional HTTP client (defaults to _get_scraper())
         force_refresh: If True, ignore cache and fetch fresh data
 
     Returns:
@@ -407,8 +395,6 @@ def get_player_career(player_id: int, scraper=None, force_refresh: bool = False)
     if scraper is None:
         return None
 
-    time.sleep(RATE_LIMIT_SECONDS)
-
     url = f'https://www.proballers.com/basketball/player/{player_id}/'
     try:
         response = scraper.get(url, timeout=15)
@@ -513,7 +499,7 @@ def get_college_roster(college_slug: str, scraper=None) -> List[Dict[str, Any]]:
 
     Args:
         college_slug: Sports Reference or Proballers team slug
-        scraper: Optional cloudscraper instance
+        scraper: Optional HTTP client (defaults to _get_scraper())
 
     Returns:
         List of player dicts with 'id', 'name', 'slug'
@@ -542,8 +528,6 @@ def get_college_roster(college_slug: str, scraper=None) -> List[Dict[str, Any]]:
             pb_slug = slug
             break
 
-    time.sleep(RATE_LIMIT_SECONDS)
-
     url = f'https://www.proballers.com/basketball/team/{team_id}/{pb_slug}/all-time-roster'
     try:
         response = scraper.get(url, timeout=15)
@@ -609,7 +593,7 @@ def find_player_by_college(
         college_slug: Proballers team slug (e.g., 'virginia-cavaliers')
         player_name: Player name to search for
         year: Optional year to filter by (basketball season year, e.g., 2025 for 2024-25 season)
-        scraper: Optional cloudscraper instance
+        scraper: Optional HTTP client (defaults to _get_scraper())
 
     Returns:
         Proballers player ID if found, None otherwise
@@ -763,7 +747,7 @@ def get_player_pro_leagues(player_id: int, scraper=None, force_refresh: bool = F
 
     Args:
         player_id: Proballers player ID
-        scraper: Optional cloudscraper instance
+        scraper: Optional HTTP client (defaults to _get_scraper())
         force_refresh: If True, ignore cache and fetch fresh data
 
     Returns:
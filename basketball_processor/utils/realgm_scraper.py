@@ -3,24 +3,28 @@ RealGM scraper for player lookup and college verification.
 """
 
 import re
-import time
 from typing import Any, Dict, List, Optional
 
 try:
-    import cloudscraper
+    import cloudscraper  # noqa: F401
     from bs4 import BeautifulSoup
     HAS_DEPS = True
 except ImportError:
     HAS_DEPS = False
 
+from .http_client import TokenBucket, get_cloudscraper_client
+
 RATE_LIMIT_SECONDS = 8  # Longer delay to avoid rate limiting
 
+# Player lookups are paced on top of the realgm.com host limit
+_lookup_bucket = TokenBucket(RATE_LIMIT_SECONDS)
+
 
 def _get_scraper():
-    """Get a cloudscraper instance."""
+    """Get the shared rate-limited cloudscraper client."""
     if not HAS_DEPS:
         return None
-    return cloudscraper.create_scraper()
+    return get_cloudscraper_client()
 
 
 def search_player(name: str, scraper=None) -> List[Dict[str, Any]]:
@@ -39,7 +43,7 @@ def search_player(name: str, scraper=None) -> List[Dict[str, Any]]:
     url = f"https://basketball.realgm.com/search?q={query}"
 
     # Rate limit before request
-    time.sleep(RATE_LIMIT_SECONDS)
+    _lookup_bucket.acquire()
 
     try:
         response = scraper.get(url, timeout=15)
@@ -214,7 +218,7 @@ def find_player_by_college(name: str, college: str, scraper=None) -> Optional[in
     normalized_college = normalize_college(college)
     
     for candidate in candidates:
-        time.sleep(RATE_LIMIT_SECONDS)
+        _lookup_bucket.acquire()
         player_college = get_player_college(candidate['id'], scraper)
         
         if player_college:
@@ -5,12 +5,14 @@ Fetches upcoming games from ESPN's API to help plan trips to new venues.
 """
 
 import json
-import time
 import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
+from .helpers import atomic_write_json
+from .http_client import http_get
 from .log import info, warn, success
 
 
@@ -24,26 +26,22 @@ SCHEDULE_CACHE_FILE = DATA_DIR / "schedule_cache.json"
 SCHEDULE_CACHE_FILE_WOMENS = DATA_DIR / "schedule_cache_womens.json"
 GAME_TIMES_CACHE_FILE = DATA_DIR / "game_times_cache.json"
 
-# Rate limiting - be respectful to ESPN's servers
-REQUEST_DELAY = 0.5  # seconds between requests
+# Concurrent date fetches; the overall request rate is capped by the shared
+# ESPN scoreboard limit in http_client, however many workers run
+SCHEDULE_WORKERS = 4
 
+# Days before the last scrape re-checked by an incremental refresh (late
+# time/venue/status changes); older dates are kept from the cache
+RECENT_DAYS = 3
 
-def fetch_games_for_date(date: datetime, gender: str = 'M') -> List[Dict[str, Any]]:
-    """
-    Fetch all D1 basketball games for a specific date.
 
-    Args:
-        date: The date to fetch games for
-        gender: 'M' for men's, 'W' for women's
-
-    Returns:
-        List of game dictionaries with venue and team info
-    """
+def _fetch_date_games(date: datetime, gender: str = 'M') -> Optional[List[Dict[str, Any]]]:
+    """Fetch one date's games, returning None (not []) if the request failed."""
     date_str = date.strftime("%Y%m%d")
     api_url = ESPN_API_URL_WOMENS if gender == 'W' else ESPN_API_URL
 
     try:
-        response = requests.get(
+        response = http_get(
             api_url,
             params={
                 "dates": date_str,
@@ -65,7 +63,52 @@ def fetch_games_for_date(date: datetime, gender: str = 'M') -> List[Dict[str, An
 
     except requests.RequestException as e:
         warn(f"Failed to fetch {gender} games for {date_str}: {e}")
-        return []
+        return None
+
+
+def fetch_games_for_date(date: datetime, gender: str = 'M') -> List[Dict[str, Any]]:
+    """
+    Fetch all D1 basketball games for a specific date.
+
+    Args:
+        date: The date to fetch games for
+        gender: 'M' for men's, 'W' for women's
+
+    Returns:
+        List of game dictionaries with venue and team info
+    """
+    return _fetch_date_games(date, gender) or []
+
+
+def fetch_schedule_dates(
+    dates: List[datetime],
+    gender: str = 'M',
+    workers: int = SCHEDULE_WORKERS,
+    show_progress: bool = True
+) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+    """
+    Fetch several dates' games through a bounded worker pool.
+
+    Every request goes through the shared HTTP client, so the ESPN scoreboard
+    limit caps the overall request rate no matter how many workers run.
+
+    Args:
+        dates: Dates to fetch
+        gender: 'M' for men's, 'W' for women's
+        workers: Maximum concurrent requests
+        show_progress: Whether to show progress messages
+
+    Returns:
+        Dict mapping YYYYMMDD to that date's games, or None if the fetch failed
+    """
+    results: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(_fetch_date_games, date, gender): date for date in dates}
+        for done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future].strftime("%Y%m%d")] = future.result()
+            if show_progress and done % 10 == 0:
+                info(f"  Fetched {done}/{len(dates)} days")
+    return results
 
 
 def parse_espn_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -152,7 +195,6 @@ def _format_date(iso_date: str) -> str:
         dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
         # Convert UTC to US Eastern (UTC-5 or UTC-4 for DST)
         # For simplicity, use -5 hours (EST) since most games are in winter
-        from datetime import timezone, timedelta
         eastern = timezone(timedelta(hours=-5))
         dt_eastern = dt.astimezone(eastern)
         return dt_eastern.strftime("%a, %b %d %Y")
@@ -160,11 +202,36 @@ def _format_date(iso_date: str) -> str:
         return iso_date
 
 
+def _season_end(start_date: datetime) -> datetime:
+    """End of the season containing start_date (April 15, after the Final Four)."""
+    # Season runs Nov-April, so if we're in Nov/Dec, end is next year's April
+    year = start_date.year
+    if start_date.month >= 8:  # Aug onwards = next year's April
+        return datetime(year + 1, 4, 15)
+    return datetime(year, 4, 15)
+
+
+def _season_start(date: datetime) -> datetime:
+    """August 1 before the season containing date."""
+    year = date.year if date.month >= 8 else date.year - 1
+    return datetime(year, 8, 1)
+
+
+def _date_range(start_date: datetime, end_date: datetime) -> List[datetime]:
+    dates = []
+    current_date = start_date
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=1)
+    return dates
+
+
 def scrape_season_schedule(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     gender: str = 'M',
-    show_progress: bool = True
+    show_progress: bool = True,
+    workers: int = SCHEDULE_WORKERS
 ) -> List[Dict[str, Any]]:
     """
     Scrape the full season schedule from ESPN.
@@ -174,6 +241,7 @@ def scrape_season_schedule(
         end_date: End date (defaults to April 15 for end of season)
         gender: 'M' for men's, 'W' for women's
         show_progress: Whether to show progress messages
+        workers: Concurrent date fetches (1 = sequential)
 
     Returns:
         List of all games
@@ -183,33 +251,20 @@ def scrape_season_schedule(
 
     if end_date is None:
         # End of season is typically early April (Final Four)
-        # Season runs Nov-April, so if we're in Nov/Dec, end is next year's April
-        year = start_date.year
-        if start_date.month >= 8:  # Aug onwards = next year's April
-            end_date = datetime(year + 1, 4, 15)
-        else:
-            end_date = datetime(year, 4, 15)
+        end_date = _season_end(start_date)
 
-    all_games = []
-    current_date = start_date
+    dates = _date_range(start_date, end_date)
     total_days = (end_date - start_date).days
     gender_label = "Women's" if gender == 'W' else "Men's"
 
     if show_progress:
         info(f"Scraping {gender_label} schedule from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} ({total_days} days)")
 
-    day_count = 0
-    while current_date <= end_date:
-        day_count += 1
-
-        if show_progress and day_count % 10 == 0:
-            info(f"  Day {day_count}/{total_days}: {current_date.strftime('%Y-%m-%d')}")
+    fetched = fetch_schedule_dates(dates, gender=gender, workers=workers, show_progress=show_progress)
 
-        games = fetch_games_for_date(current_date, gender=gender)
-        all_games.extend(games)
-
-        current_date += timedelta(days=1)
-        time.sleep(REQUEST_DELAY)
+    all_games = []
+    for date in dates:
+        all_games.extend(fetched.get(date.strftime("%Y%m%d")) or [])
 
     if show_progress:
         success(f"Scraped {len(all_games)} {gender_label} games across {total_days} days")
@@ -217,6 +272,162 @@ def scrape_season_schedule(
     return all_games
 
 
+def schedule_date_key(game: Dict[str, Any]) -> str:
+    """
+    Return the scoreboard date (YYYYMMDD, US Eastern) a cached game belongs to.
+
+    ESPN scoreboards are keyed by Eastern calendar day; the same fixed -5 hour
+    offset as _format_date() is used.
+    """
+    try:
+        dt = datetime.fromisoformat(game["date"].replace("Z", "+00:00"))
+    except (KeyError, ValueError, AttributeError):
+        return ""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone(timedelta(hours=-5)))
+    return dt.strftime("%Y%m%d")
+
+
+def merge_schedule(
+    cached_games: List[Dict[str, Any]],
+    fetched: Dict[str, Optional[List[Dict[str, Any]]]],
+    keep_from: str = ""
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Merge freshly fetched dates into cached schedule games.
+
+    Fetched dates replace the cached games for that date; games that didn't
+    change keep their cached dict, so unchanged entries are written back
+    byte-for-byte. Dates that were not fetched (or whose fetch failed) keep
+    their cached games.
+
+    Args:
+        cached_games: Games from the schedule cache
+        fetched: Result of fetch_schedule_dates()
+        keep_from: Drop cached games before this YYYYMMDD (previous seasons)
+
+    Returns:
+        Tuple of (merged games in date order, counts of added/changed/removed/unchanged)
+    """
+    refreshed = {date_key: games for date_key, games in fetched.items() if games is not None}
+    refreshed_ids = {game.get("espn_id") for games in refreshed.values() for game in games}
+    cached_by_id = {game.get("espn_id"): game for game in cached_games}
+    counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+
+    merged = []
+    for game in cached_games:
+        date_key = schedule_date_key(game)
+        if date_key in refreshed or game.get("espn_id") in refreshed_ids:
+            continue
+        if keep_from and date_key < keep_from:
+            continue
+        merged.append(game)
+
+    for date_key in sorted(refreshed):
+        for game in refreshed[date_key]:
+            cached = cached_by_id.get(game.get("espn_id"))
+            if cached is None:
+                counts["added"] += 1
+                merged.append(game)
+            elif cached == game:
+                counts["unchanged"] += 1
+                merged.append(cached)
+            else:
+                counts["changed"] += 1
+                merged.append(game)
+
+    kept_ids = {game.get("espn_id") for game in merged}
+    counts["removed"] = sum(
+        1 for game in cached_games
+        if game.get("espn_id") not in kept_ids
+        and not (keep_from and schedule_date_key(game) < keep_from)
+    )
+
+    # Stable sort: unchanged dates keep their cached order
+    merged.sort(key=schedule_date_key)
+    return merged, counts
+
+
+def refresh_start(scraped_at: Optional[str], today: datetime, recent_days: int = RECENT_DAYS) -> datetime:
+    """
+    First date an incremental refresh must re-fetch.
+
+    Everything since the cache was scraped may have changed, so the window
+    starts recent_days before the scrape (or before today, if that is
+    earlier), but never before the current season.
+
+    Args:
+        scraped_at: The cache's scraped_at ISO timestamp, if known
+        today: Current date and time
+        recent_days: Extra days re-checked for late changes
+
+    Returns:
+        Start of the refresh window, at midnight
+    """
+    start = today
+    if scraped_at:
+        try:
+            start = min(start, datetime.fromisoformat(scraped_at).replace(tzinfo=None))
+        except ValueError:
+            pass
+    start = (start - timedelta(days=recent_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(start, _season_start(today))
+
+
+def refresh_schedule(
+    gender: str = 'M',
+    workers: int = SCHEDULE_WORKERS,
+    recent_days: int = RECENT_DAYS,
+    show_progress: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Incrementally refresh the schedule cache.
+
+    Re-fetches every date from recent_days before the last scrape through the
+    end of the season (see refresh_start), merges the results into the cached
+    games and saves the cache. Older dates from the current season are kept
+    as cached. Without a cache this is a full scrape.
+
+    Args:
+        gender: 'M' for men's, 'W' for women's
+        workers: Concurrent date fetches
+        recent_days: Days before the last scrape to re-check for late changes
+        show_progress: Whether to show progress messages
+
+    Returns:
+        Merged list of games
+    """
+    cache = load_schedule_cache(gender=gender)
+    if not cache or not cache.get("games"):
+        games = scrape_season_schedule(gender=gender, show_progress=show_progress, workers=workers)
+        save_schedule_cache(games, gender=gender)
+        return games
+
+    today = datetime.now()
+    start_date = refresh_start(cache.get("scraped_at"), today, recent_days)
+    dates = _date_range(start_date, _season_end(today))
+    gender_label = "Women's" if gender == 'W' else "Men's"
+
+    if show_progress:
+        info(f"Refreshing {gender_label} schedule: {len(dates)} days from {start_date.strftime('%Y-%m-%d')}")
+
+    fetched = fetch_schedule_dates(dates, gender=gender, workers=workers, show_progress=show_progress)
+    failed = sum(1 for games in fetched.values() if games is None)
+    games, counts = merge_schedule(
+        cache["games"], fetched, keep_from=_season_start(today).strftime("%Y%m%d")
+    )
+
+    if show_progress:
+        success(
+            f"{gender_label} schedule: {counts['added']} added, {counts['changed']} changed, "
+            f"{counts['removed']} removed, {counts['unchanged']} unchanged"
+            + (f" ({failed} days failed, kept cached)" if failed else "")
+        )
+
+    save_schedule_cache(games, gender=gender)
+    return games
+
+
 def save_schedule_cache(games: List[Dict[str, Any]], gender: str = 'M') -> None:
     """Save scraped schedule to cache file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -230,8 +441,7 @@ def save_schedule_cache(games: List[Dict[str, Any]], gender: str = 'M') -> None:
         "games": games
     }
 
-    with open(cache_file, 'w', encoding='utf-8') as f:
-        json.dump(cache_data, f, indent=2)
+    atomic_write_json(cache_file, cache_data, indent=2)
 
     gender_label = "Women's" if gender == 'W' else "Men's"
     info(f"Saved {len(games)} {gender_label} games to {cache_file}")
@@ -253,13 +463,20 @@ def load_schedule_cache(gender: str = 'M') -> Optional[Dict[str, Any]]:
         return None
 
 
-def get_schedule(force_refresh: bool = False, gender: str = 'M') -> List[Dict[str, Any]]:
+def get_schedule(
+    force_refresh: bool = False,
+    gender: str = 'M',
+    workers: int = SCHEDULE_WORKERS
+) -> List[Dict[str, Any]]:
     """
     Get the schedule, using cache if available and recent.
 
+    A stale cache is refreshed incrementally (see refresh_schedule).
+
     Args:
-        force_refresh: If True, always scrape fresh data
+        force_refresh: If True, always scrape the full season fresh
         gender: 'M' for men's, 'W' for women's
+        workers: Concurrent date fetches
 
     Returns:
         List of games
@@ -277,8 +494,9 @@ def get_schedule(force_refresh: bool = False, gender: str = 'M') -> List[Dict[st
                 return cache["games"]
             else:
                 info(f"{gender_label} schedule cache is {age_days} days old, refreshing daily for accurate game times...")
+                return refresh_schedule(gender=gender, workers=workers)
 
-    games = scrape_season_schedule(gender=gender)
+    games = scrape_season_schedule(gender=gender, workers=workers)
     save_schedule_cache(games, gender=gender)
     return games
 
@@ -406,41 +624,32 @@ def normalize_state(state: str) -> str:
     return state
 
 
-def venue_matches(espn_venue: Dict[str, str], user_venue: str) -> bool:
-    """
-    Check if an ESPN venue matches a user's visited venue.
+# Venue name aliases (ESPN name <-> our name)
+VENUE_ALIASES = {
+    'global credit union arena': ['gcu arena', 'grand canyon arena'],
+    'gcu arena': ['global credit union arena', 'grand canyon arena'],
+}
 
-    Args:
-        espn_venue: ESPN venue dict with name, city, state
-        user_venue: User's venue string "Name, City, State"
+# (lowercased name, normalized name, significant words) for one venue name
+VenueName = Tuple[str, str, FrozenSet[str]]
 
-    Returns:
-        True if venues match
-    """
-    # Venue name aliases (ESPN name <-> our name)
-    VENUE_ALIASES = {
-        'global credit union arena': ['gcu arena', 'grand canyon arena'],
-        'gcu arena': ['global credit union arena', 'grand canyon arena'],
-    }
 
-    # Parse user venue
-    parts = [p.strip() for p in user_venue.split(',')]
-    if len(parts) < 2:
-        return False
+def _venue_name(name: str) -> VenueName:
+    """Precompute the forms of a lowercased venue name compared by _venue_names_match."""
+    normalized = _normalize_venue_name(name)
+    # Remove very short words
+    return name, normalized, frozenset(w for w in normalized.split() if len(w) >= 3)
 
-    user_name = parts[0].lower()
-    user_city = parts[1].lower() if len(parts) > 1 else ""
-    user_state = normalize_state(parts[2]).lower() if len(parts) > 2 else ""
 
-    espn_name = espn_venue.get('name', '').lower()
-    espn_city = espn_venue.get('city', '').lower()
-    espn_state = normalize_state(espn_venue.get('state', '')).lower()
+def _venue_location(city: str, state: str) -> Tuple[str, str]:
+    return city.lower(), normalize_state(state).lower()
 
-    # Must be same city and state
-    if espn_city != user_city or espn_state != user_state:
-        return False
 
-    # Check venue name match
+def _venue_names_match(espn: VenueName, user: VenueName) -> bool:
+    """Check whether two venue names in the same city refer to the same venue."""
+    espn_name, espn_normalized, espn_words = espn
+    user_name, user_normalized, user_words = user
+
     # Exact match
     if espn_name == user_name:
         return True
@@ -454,21 +663,13 @@ def venue_matches(espn_venue: Dict[str, str], user_venue: str) -> bool:
             return True
 
     # Normalized match (removes common suffixes)
-    if _normalize_venue_name(espn_name) == _normalize_venue_name(user_name):
+    if espn_normalized == user_normalized:
         return True
 
     # Partial match - require significant word overlap
     # Must match at least one word of 5+ chars, or match 2+ words
-    espn_words = set(_normalize_venue_name(espn_name).split())
-    user_words = set(_normalize_venue_name(user_name).split())
-
-    # Remove very short words
-    espn_words = {w for w in espn_words if len(w) >= 3}
-    user_words = {w for w in user_words if len(w) >= 3}
-
     if espn_words and user_words:
         overlap = espn_words & user_words
-        # Require either: one 5+ char word match, or 2+ word matches
         long_matches = [w for w in overlap if len(w) >= 5]
         if long_matches or len(overlap) >= 2:
             return True
@@ -476,6 +677,79 @@ def venue_matches(espn_venue: Dict[str, str], user_venue: str) -> bool:
     return False
 
 
+def _parse_user_venue(user_venue: str) -> Optional[Tuple[Tuple[str, str], VenueName]]:
+    """Split "Name, City, State" into its (city, state) key and name forms."""
+    parts = [p.strip() for p in user_venue.split(',')]
+    if len(parts) < 2:
+        return None
+    user_city = parts[1].lower()
+    user_state = normalize_state(parts[2]).lower() if len(parts) > 2 else ""
+    return (user_city, user_state), _venue_name(parts[0].lower())
+
+
+def venue_matches(espn_venue: Dict[str, str], user_venue: str) -> bool:
+    """
+    Check if an ESPN venue matches a user's visited venue.
+
+    To check one ESPN venue against many visited venues, use VenueMatcher.
+
+    Args:
+        espn_venue: ESPN venue dict with name, city, state
+        user_venue: User's venue string "Name, City, State"
+
+    Returns:
+        True if venues match
+    """
+    parsed = _parse_user_venue(user_venue)
+    if parsed is None:
+        return False
+    user_location, user_name = parsed
+
+    # Must be same city and state
+    if _venue_location(espn_venue.get('city', ''), espn_venue.get('state', '')) != user_location:
+        return False
+
+    return _venue_names_match(_venue_name(espn_venue.get('name', '').lower()), user_name)
+
+
+class VenueMatcher:
+    """
+    venue_matches() against a fixed set of visited venues.
+
+    Visited venues are parsed once and bucketed by (city, state), so each ESPN
+    venue is only compared with the venues in its own city. Results are
+    memoized per ESPN venue (teams play many games in the same arena).
+    """
+
+    def __init__(self, user_venues: Iterable[str]):
+        """
+        Args:
+            user_venues: Visited venue strings "Name, City, State"
+        """
+        self._by_location: Dict[Tuple[str, str], List[VenueName]] = {}
+        for user_venue in user_venues:
+            parsed = _parse_user_venue(user_venue)
+            if parsed is not None:
+                location, name = parsed
+                self._by_location.setdefault(location, []).append(name)
+        self._results: Dict[Tuple[str, str, str], bool] = {}
+
+    def matches(self, espn_venue: Dict[str, str]) -> bool:
+        """True if any visited venue matches the ESPN venue."""
+        name = espn_venue.get('name', '')
+        city = espn_venue.get('city', '')
+        state = espn_venue.get('state', '')
+        key = (name, city, state)
+        if key not in self._results:
+            candidates = self._by_location.get(_venue_location(city, state))
+            if not candidates:
+                self._results[key] = False
+            else:
+                espn_name = _venue_name(name.lower())
+                self._results[key] = any(_venue_names_match(espn_name, user_name) for user_name in candidates)
+        return self._results[key]
+
+
 def get_visited_venues_from_games(games_data: List[Dict]) -> Set[str]:
     """Extract visited venues from game data."""
     venues = set()
@@ -673,17 +947,19 @@ def main():
     parser.add_argument("--refresh", action="store_true", help="Force refresh of schedule cache")
     parser.add_argument("--days", type=int, default=30, help="Show games within this many days")
     parser.add_argument("--state", type=str, help="Filter by state (e.g., CA, NY)")
+    parser.add_argument("--workers", type=int, default=SCHEDULE_WORKERS,
+                        help=f"Concurrent date fetches (default: {SCHEDULE_WORKERS})")
 
     args = parser.parse_args()
 
     # Get schedule
-    games = get_schedule(force_refresh=args.refresh)
+    games = get_schedule(force_refresh=args.refresh, workers=args.workers)
 
     # For now, just show stats
     info(f"\nTotal games in schedule: {len(games)}")
 
     # Count by venue
-    venues = {}
+    venues: Dict[str, int] = {}
     for game in games:
         venue = game["venue"]["name"]
         if venue:
@@ -711,7 +987,7 @@ def fetch_game_time_from_espn(date_str: str, away_team: str, home_team: str) ->
         ISO datetime string if found, None otherwise
     """
     try:
-        response = requests.get(
+        response = http_get(
             ESPN_API_URL,
             params={
                 "dates": date_str,
@@ -811,7 +1087,7 @@ def get_game_times_for_date(date_str: str, gender: str = None, verbose: bool = F
 
     for api_url in apis_to_fetch:
         try:
-            response = requests.get(
+            response = http_get(
                 api_url,
                 params={
                     "dates": date_str,
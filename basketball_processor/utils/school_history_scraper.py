@@ -9,12 +9,14 @@ import json
 import os
 import re
 import time
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple
 
-import requests
+from .http_client import HOST_RATE_LIMITS, http_get
 
-# Rate limiting: 3.1 seconds between requests (under 20/min limit)
-REQUEST_DELAY = 3.1
+# Rate limiting: 3.1 seconds between requests (under 20/min limit),
+# enforced per host by the shared HTTP client
+REQUEST_DELAY = HOST_RATE_LIMITS['sports-reference.com']
 
 # Data file paths
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
@@ -24,6 +26,11 @@ REFRESH_TIMESTAMP_FILE = os.path.join(DATA_DIR, 'conference_refresh_timestamp.tx
 # Auto-refresh settings
 REFRESH_INTERVAL_DAYS = 90  # Check for updates every 90 days
 
+# In-memory lookup index: school key -> (from years, to years, conferences, sorted)
+# Built once per process and rebuilt when the history file's mtime changes.
+_history_index: Optional[Dict[str, Tuple[List[int], List[int], List[str], bool]]] = None
+_history_index_mtime: Optional[float] = None
+
 # Headers for requests
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
@@ -40,7 +47,7 @@ def _fetch_school_list(gender: str = 'men') -> List[Tuple[str, str]]:
     url = "https://www.sports-reference.com/cbb/schools/"
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = http_get(url, headers=HEADERS, timeout=30)
         if response.status_code != 200:
             print(f"Failed to fetch schools index: HTTP {response.status_code}")
             return []
@@ -81,7 +88,7 @@ def _fetch_school_conference_history(slug: str, gender: str = 'men') -> List[Dic
     url = f"https://www.sports-reference.com/cbb/schools/{slug}/{gender}/"
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        response = http_get(url, headers=HEADERS, timeout=30)
         if response.status_code != 200:
             return []
 
@@ -197,8 +204,6 @@ def scrape_all_schools(gender: str = 'men', test_mode: bool = False) -> Dict[str
     est_minutes = len(schools) * REQUEST_DELAY / 60
     print(f"Estimated time: {est_minutes:.1f} minutes")
 
-    time.sleep(REQUEST_DELAY)  # Initial delay after fetching index
-
     all_history = {}
 
     for i, (name, slug) in enumerate(schools):
@@ -219,10 +224,6 @@ def scrape_all_schools(gender: str = 'men', test_mode: bool = False) -> Dict[str
         else:
             print("no data")
 
-        # Rate limiting (skip delay after last request)
-        if i < len(schools) - 1:
-            time.sleep(REQUEST_DELAY)
-
     return all_history
 
 
@@ -232,6 +233,7 @@ def save_school_history(history: Dict[str, List[Dict]]) -> None:
 
     with open(SCHOOL_HISTORY_FILE, 'w') as f:
         json.dump(history, f, indent=2)
+    _invalidate_history_index()
 
     print(f"\nSaved to {SCHOOL_HISTORY_FILE}")
     print(f"Total schools: {len(history)}")
@@ -352,6 +354,71 @@ def auto_refresh_if_needed(include_women: bool = True, silent: bool = False) ->
     return True
 
 
+def _invalidate_history_index() -> None:
+    """Drop the in-memory lookup index so the next lookup reloads the file."""
+    global _history_index, _history_index_mtime
+    _history_index = None
+    _history_index_mtime = None
+
+
+def _build_history_index(
+    history: Dict[str, List[Dict]]
+) -> Dict[str, Tuple[List[int], List[int], List[str], bool]]:
+    """
+    Build per-school range boundaries for bisect lookups.
+
+    Ranges are sorted by start year. Schools whose ranges overlap keep their
+    original order and are flagged unsorted, so lookups for them use a linear
+    scan and preserve first-match behavior.
+    """
+    index = {}
+    for school, memberships in history.items():
+        ranges = sorted((m['from'], m['to'], m['conference']) for m in memberships)
+        is_sorted = all(prev[1] < cur[0] for prev, cur in zip(ranges, ranges[1:]))
+        if not is_sorted:
+            ranges = [(m['from'], m['to'], m['conference']) for m in memberships]
+        index[school] = (
+            [r[0] for r in ranges],
+            [r[1] for r in ranges],
+            [r[2] for r in ranges],
+            is_sorted,
+        )
+    return index
+
+
+def _get_history_index() -> Dict[str, Tuple[List[int], List[int], List[str], bool]]:
+    """Return the lookup index, rebuilding it if the history file changed."""
+    global _history_index, _history_index_mtime
+    try:
+        mtime: Optional[float] = os.path.getmtime(SCHOOL_HISTORY_FILE)
+    except OSError:
+        mtime = None
+
+    if _history_index is None or mtime != _history_index_mtime:
+        _history_index = _build_history_index(load_school_history())
+        _history_index_mtime = mtime
+    return _history_index
+
+
+def _lookup_school_year(school: str, year: int) -> Optional[str]:
+    """Find the conference for one history key and year, or None."""
+    entry = _get_history_index().get(school)
+    if entry is None:
+        return None
+
+    froms, tos, conferences, is_sorted = entry
+    if not is_sorted:
+        for start, end, conference in zip(froms, tos, conferences):
+            if start <= year <= end:
+                return conference
+        return None
+
+    i = bisect_right(froms, year) - 1
+    if i >= 0 and year <= tos[i]:
+        return conferences[i]
+    return None
+
+
 def get_conference_for_school(school: str, year: int, gender: str = 'M') -> Optional[str]:
     """
     Get the conference a school was in for a specific year.
@@ -364,25 +431,14 @@ def get_conference_for_school(school: str, year: int, gender: str = 'M') -> Opti
     Returns:
         Conference name or None
     """
-    history = load_school_history()
-
     # For women's, try with (W) suffix first
     if gender == 'W':
-        key = f"{school} (W)"
-        if key in history:
-            for membership in history[key]:
-                if membership['from'] <= year <= membership['to']:
-                    return membership['conference']
+        conference = _lookup_school_year(f"{school} (W)", year)
+        if conference is not None:
+            return conference
 
     # Try without suffix (men's or fallback)
-    if school not in history:
-        return None
-
-    for membership in history[school]:
-        if membership['from'] <= year <= membership['to']:
-            return membership['conference']
-
-    return None
+    return _lookup_school_year(school, year)
 
 
 def _refresh_school(slug: str, gender: str, existing_history: List[Dict]) -> Optional[List[Dict]]:
@@ -465,8 +521,6 @@ def refresh_current_season(include_women: bool = True) -> None:
     print(f"Checking {len(men_schools)} men's + {len(women_schools)} women's schools")
     print()
 
-    time.sleep(REQUEST_DELAY)
-
     updated_count = 0
     skipped_count = 0
 
@@ -490,8 +544,6 @@ def refresh_current_season(include_women: bool = True) -> None:
         else:
             print("no change")
 
-        time.sleep(REQUEST_DELAY)
-
     # Process women's schools
     if include_women:
         print("\nChecking WOMEN'S schools...")
@@ -514,8 +566,6 @@ def refresh_current_season(include_women: bool = True) -> None:
             else:
                 print("no change")
 
-            time.sleep(REQUEST_DELAY)
-
     # Save updated data
     save_school_history(history)
 
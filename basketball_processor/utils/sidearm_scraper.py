@@ -12,13 +12,13 @@ as a fallback for schools that use Nuxt.js instead of SIDEARM.
 
 import json
 import re
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
-import requests
 from bs4 import BeautifulSoup
 
+from .http_client import http_get
+
 # Import WMT scraper for Nuxt.js sites
 from .wmt_scraper import (
     is_wmt_site,
@@ -29,9 +29,6 @@ from .wmt_scraper import (
 # Import ESPN scraper as fallback
 from .espn_scraper import get_espn_attendance
 
-# Rate limiting
-RATE_LIMIT_DELAY = 1.5  # seconds between requests
-
 # Cache directory
 BASE_DIR = Path(__file__).parent.parent.parent
 CACHE_DIR = BASE_DIR / 'cache'
@@ -361,7 +358,7 @@ def fetch_schedule_page(domain: str, sport: str, season: str, gender: str = 'M')
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code == 200:
             return response.text
         print(f"  Schedule page returned {response.status_code}: {url}")
@@ -494,7 +491,7 @@ def fetch_boxscore(url: str) -> Optional[Dict[str, Any]]:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code != 200:
             return None
 
@@ -615,7 +612,7 @@ def fetch_play_by_play(url: str, away_team: str = '', home_team: str = '') -> Op
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code != 200:
             return None
 
@@ -814,7 +811,6 @@ def get_sidearm_pbp_for_game(
 
         schedule_html = fetch_schedule_page(domain, 'basketball', season, gender)
         if schedule_html:
-            time.sleep(RATE_LIMIT_DELAY)
             boxscore_url = find_game_in_schedule(schedule_html, away_team, game_date, domain, sidearm_format)
             if boxscore_url:
                 if verbose:
@@ -836,7 +832,6 @@ def get_sidearm_pbp_for_game(
 
         schedule_html = fetch_schedule_page(domain, 'basketball', season, gender)
         if schedule_html:
-            time.sleep(RATE_LIMIT_DELAY)
             boxscore_url = find_game_in_schedule(schedule_html, home_team, game_date, domain, sidearm_format)
             if boxscore_url:
                 if verbose:
@@ -902,8 +897,6 @@ def _fetch_from_team_site(
     if not schedule_html:
         return None
 
-    time.sleep(RATE_LIMIT_DELAY)
-
     # Find the game
     boxscore_url = find_game_in_schedule(schedule_html, opponent, game_date, domain, sidearm_format)
     if not boxscore_url:
@@ -1067,8 +1060,6 @@ def supplement_all_games(games: List[Dict], verbose: bool = True) -> int:
             if data.get('sidearm_url'):
                 basic_info['sidearm_url'] = data['sidearm_url']
 
-        time.sleep(RATE_LIMIT_DELAY)
-
     return supplemented
 
 
@@ -6,10 +6,93 @@ and serializers.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from datetime import datetime
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, Union
 
+from . import constants
 from .constants import TEAM_ALIASES
 
+# Team nicknames stripped by normalize_team_name_for_matching(), checked in
+# order (the first suffix that matches is removed). Includes men's and
+# women's variants (cowboys/cowgirls, etc.)
+TEAM_NICKNAME_SUFFIXES = (
+    # A
+    'aces', 'aggies', 'anteaters', 'antelopes', 'aztecs',
+    # B
+    'badgers', 'banana slugs', 'battlin bears', 'beach', 'bearcats', 'bears',
+    'beavers', 'bengals', 'bighornz', 'billikens', 'bison', 'black bears',
+    'black knights', 'blazers', 'blue demons', 'blue devils', 'blue hens',
+    'blue jays', 'blue raiders', 'bluejays', 'bobcats', 'boilermakers',
+    'bonnies', 'braves', 'broncos', 'bruins', 'buckeyes', 'buffaloes',
+    'buffs', 'bulldogs', 'bulls',
+    # C
+    'camels', 'cardinals', 'catamounts', 'cavaliers', 'chanticleers',
+    'chippewas', 'citadel', 'clan', 'cobras', 'colonels', 'commodores',
+    'cornhuskers', 'cougars', 'cowboys', 'cowgirls', 'coyotes', 'crimson',
+    'crimson tide', 'crusaders', 'cyclones',
+    # D
+    'darters', 'demon deacons', 'demons', 'dolphins', 'dons', 'dragons',
+    'ducks', 'dukes', 'dustdevils',
+    # E
+    'eagles', 'engineers', 'explorers',
+    # F
+    'falcons', 'fighting camels', 'fighting hawks', 'fighting illini',
+    'fighting irish', 'flames', 'flashes', 'flyers', 'friars',
+    # G
+    'gaels', 'gators', 'golden bears', 'golden eagles', 'golden flashes',
+    'golden gophers', 'golden griffins', 'golden grizzlies', 'golden hurricane',
+    'golden knights', 'golden panthers', 'gophers', 'gorillas', 'governors',
+    'govs', 'great danes', 'green wave', 'greyhounds', 'griffins', 'grizzlies',
+    # H
+    'hatters', 'hawkeyes', 'hawks', 'highlanders', 'hilltoppers', 'hokies',
+    'hoosiers', 'hornets', 'horned frogs', 'hoyas', 'huskies', 'hurricanes',
+    # I
+    'ichabods', 'illini', 'indians',
+    # J
+    'jackrabbits', 'jacks', 'jaguars', 'jaspers', 'javelinas', 'jayhawks', 'jets',
+    # K
+    'kangaroos', 'keydets', 'kingsmen', 'knights',
+    # L
+    'lancers', 'leathernecks', 'leopards', 'lions', 'lobos', 'longhorns', 'lopes', 'lumberjacks',
+    # M
+    'mad ants', 'mavericks', 'mean green', 'midshipmen', 'miners', 'mocs',
+    'mocassins', 'monarchs', 'mountaineers', 'musketeers', 'mustangs',
+    # N
+    'nittany lions',
+    # O
+    'ospreys', 'orange', 'orangemen', 'owls',
+    # P
+    'paladins', 'panthers', 'patriots', 'peacocks', 'pelicans', 'penguins',
+    'phoenix', 'pilots', 'pioneers', 'pirates', 'privateers', 'purple aces',
+    'purple eagles',
+    # Q-R
+    'quakers', 'racers', 'ragin cajuns', 'raiders', 'rainbow wahine',
+    'rainbow warriors', 'rams', 'rattlers', 'razorbacks', 'rebels',
+    'red flash', 'red foxes', 'red hawks', 'red raiders', 'red storm',
+    'red wolves', 'redhawks', 'redbirds', 'retrievers', 'riverhawks',
+    'roadrunners', 'rockets', 'runnin bulldogs', 'running rebels',
+    # S
+    'saints', 'salukis', 'samurai', 'scarlet knights', 'scots', 'seahawks',
+    'seawolves', 'seminoles', 'shockers', 'skyhawks', 'sooners', 'spartans',
+    'spiders', 'stags', 'statesmen', 'stormy petrels', 'sun devils',
+    'sycamores',
+    # T
+    'tar heels', 'terrapins', 'terriers', 'thunderbirds', 'thundering herd',
+    'tides', 'tigers', 'titans', 'tomcats', 'toppers', 'toreadors', 'toreros',
+    'tribe', 'tritons', 'trojans', 'tritons',
+    # U-V
+    'utes', 'vandals', 'vikings', 'vixens', 'vols', 'volunteers',
+    # W
+    'wahoos', 'war hawks', 'warhawks', 'warriors', 'wasps', 'wave',
+    'westerners', 'wildcats', 'wolf pack', 'wolfpack', 'wolverines', 'wolves',
+    # Y-Z
+    'yellow jackets', 'zags', 'zips',
+)
+
+# Memoized results per resolver (team names repeat across every game)
+TEAM_RESOLVE_CACHE_SIZE = 4096
+
 
 def normalize_team_name(name: str) -> str:
     """
@@ -64,3 +147,165 @@ def get_canonical_name(name: str) -> str:
         Canonical team name
     """
     return normalize_team_name(name)
+
+
+def normalize_team_name_for_matching(name: str) -> str:
+    """
+    Normalize an ESPN-style display name (with nickname) for matching.
+
+    Lowercases, drops punctuation and strips a trailing "Lady <nickname>" or
+    team nickname, so "St. John's Red Storm" and "St. John's" compare equal.
+
+    Args:
+        name: Team name, with or without nickname
+
+    Returns:
+        Normalized name
+    """
+    n = name.lower().replace("'", "").replace(".", "").replace("-", " ").replace("(", "").replace(")", "").strip()
+    # First try to remove "Lady <nickname>" pattern
+    lady_match = re.match(r'^(.+?)\s+lady\s+\w+$', n)
+    if lady_match:
+        return lady_match.group(1).strip()
+    for suffix in TEAM_NICKNAME_SUFFIXES:
+        if n.endswith(' ' + suffix):
+            n = n[:-len(suffix)-1].strip()
+            break
+    return n
+
+
+class ResolvedTeam(NamedTuple):
+    """Result of TeamNameResolver.resolve()."""
+    canonical: str
+    code: str
+    conference: Optional[str]
+
+
+class TeamNameResolver:
+    """
+    One place to turn a team name into its canonical name, code and conference.
+
+    The lowercase code table and alias equivalence sets are built once;
+    code() and match_equivalents() are memoized with a bounded LRU. The
+    conference in resolve() is looked up uncached on every call, since the
+    school history behind it can be re-scraped during a run. Use
+    get_team_resolver() rather than constructing one, so the indexes are
+    rebuilt when the source tables are reloaded.
+    """
+
+    def __init__(self, team_codes: Dict[str, str], aliases: Dict[str, str]):
+        """
+        Args:
+            team_codes: Team name -> code (TEAM_CODES)
+            aliases: Alias -> canonical name (TEAM_ALIASES)
+        """
+        self._codes = team_codes
+        self._aliases = aliases
+
+        # Case-insensitive and partial code matches, first listing wins
+        self._codes_lower: Dict[str, str] = {}
+        self._codes_by_lower: List[Tuple[str, str]] = []
+        for name, code in team_codes.items():
+            self._codes_lower.setdefault(name.lower(), code)
+            self._codes_by_lower.append((name.lower(), code))
+
+        # Matching-normalized name -> every name it is aliased with
+        equivalents: Dict[str, Set[str]] = {}
+        for alias, target in aliases.items():
+            pair = {normalize_team_name_for_matching(alias), normalize_team_name_for_matching(target)}
+            for norm in pair:
+                equivalents.setdefault(norm, set()).update(pair)
+        self._equivalents = equivalents
+
+        self.code = lru_cache(maxsize=TEAM_RESOLVE_CACHE_SIZE)(self._code)
+        self.match_equivalents = lru_cache(maxsize=TEAM_RESOLVE_CACHE_SIZE)(self._match_equivalents)
+
+    def canonical(self, name: str) -> str:
+        """Canonical name via TEAM_ALIASES (the name itself if not aliased)."""
+        if not name:
+            return name
+        return self._aliases.get(name, name)
+
+    def resolve(
+        self,
+        name: str,
+        game_date: Optional[Union[int, str, datetime]] = None,
+        gender: str = 'M'
+    ) -> ResolvedTeam:
+        """
+        Resolve a team name.
+
+        Args:
+            name: Team name or alias
+            game_date: Date for the conference lookup (see get_conference_for_date);
+                       None for the team's current conference
+            gender: 'M' for men's, 'W' for women's
+
+        Returns:
+            ResolvedTeam(canonical, code, conference); conference is None if
+            the team has none on that date
+        """
+        if not name:
+            return ResolvedTeam(name, '', None)
+        if game_date is None:
+            conference = constants.get_conference(name)
+        else:
+            conference = constants.get_conference_for_date(name, game_date, gender)
+        return ResolvedTeam(self.canonical(name), self.code(name), conference)
+
+    def _code(self, team_name: str) -> str:
+        """Standardized team code (see helpers.get_team_code)."""
+        if not team_name:
+            return ""
+
+        # Direct lookup
+        if team_name in self._codes:
+            return self._codes[team_name]
+
+        # Try case-insensitive lookup
+        team_lower = team_name.lower()
+        if team_lower in self._codes_lower:
+            return self._codes_lower[team_lower]
+
+        # Try partial match
+        for name_lower, code in self._codes_by_lower:
+            if team_lower in name_lower or name_lower in team_lower:
+                return code
+
+        # Return original if no match
+        return team_name[:4].upper() if len(team_name) >= 4 else team_name.upper()
+
+    def _match_equivalents(self, name: str) -> FrozenSet[str]:
+        """Matching-normalized forms of a name and of every alias it belongs to."""
+        norm = normalize_team_name_for_matching(name)
+        return frozenset(self._equivalents.get(norm, ())) | {norm}
+
+    def teams_match(self, team1: str, team2: str) -> bool:
+        """Check if two team names (e.g. ours vs ESPN's) refer to the same team."""
+        return bool(self.match_equivalents(team1) & self.match_equivalents(team2))
+
+
+_resolver: Optional[TeamNameResolver] = None
+_resolver_sources: Tuple[int, ...] = ()
+
+
+def get_team_resolver() -> TeamNameResolver:
+    """Get the shared resolver, rebuilding it if the source tables were rebound."""
+    global _resolver, _resolver_sources
+    sources = (
+        id(constants.TEAM_CODES), id(constants.TEAM_ALIASES),
+        id(constants.CONFERENCES), id(constants.CONFERENCE_HISTORY),
+    )
+    if _resolver is None or sources != _resolver_sources:
+        _resolver = TeamNameResolver(constants.TEAM_CODES, constants.TEAM_ALIASES)
+        _resolver_sources = sources
+    return _resolver
+
+
+def resolve_team(
+    name: str,
+    game_date: Optional[Union[int, str, datetime]] = None,
+    gender: str = 'M'
+) -> ResolvedTeam:
+    """Resolve a team name to (canonical, code, conference) as of game_date."""
+    return get_team_resolver().resolve(name, game_date, gender)
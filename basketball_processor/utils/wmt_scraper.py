@@ -24,6 +24,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import requests
 
+from .http_client import http_get
+
 # Try to import Playwright for headless browser support
 try:
     from playwright.sync_api import sync_playwright
@@ -31,9 +33,6 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
-# Rate limiting
-RATE_LIMIT_DELAY = 1.5  # seconds between requests
-
 # WMT school slugs for wmt.games URLs
 WMT_SCHOOL_SLUGS: Dict[str, str] = {
     'Stanford': 'stanford',
@@ -253,7 +252,7 @@ def fetch_schedule_page(
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code == 200:
             return response.text
         print(f"  WMT schedule page returned {response.status_code}: {url}")
@@ -349,7 +348,7 @@ def fetch_boxscore(
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         if response.status_code != 200:
             return None
 
@@ -563,7 +562,6 @@ def supplement_game_data(
         if schedule_html:
             boxscore_url = find_game_in_schedule(schedule_html, away_team, game_date, domain)
             if boxscore_url:
-                time.sleep(RATE_LIMIT_DELAY)
                 data = fetch_boxscore(
                     boxscore_url,
                     team_name=home_team,
@@ -596,7 +594,6 @@ def supplement_game_data(
         if schedule_html:
             boxscore_url = find_game_in_schedule(schedule_html, home_team, game_date, domain)
             if boxscore_url:
-                time.sleep(RATE_LIMIT_DELAY)
                 data = fetch_boxscore(
                     boxscore_url,
                     team_name=away_team,
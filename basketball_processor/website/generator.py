@@ -14,7 +14,12 @@ from .serializers import DataSerializer
 from ..utils.log import info
 
 
-def generate_website_from_data(processed_data: Dict[str, Any], output_path: str, skip_nba: bool = False) -> None:
+def generate_website_from_data(
+    processed_data: Dict[str, Any],
+    output_path: str,
+    skip_nba: bool = False,
+    background_nba: bool = False
+) -> None:
     """
     Generate data.js from processed data.
 
@@ -25,6 +30,8 @@ def generate_website_from_data(processed_data: Dict[str, Any], output_path: str,
         processed_data: Dictionary containing processed DataFrames
         output_path: Path to the output directory (or HTML file path for backwards compat)
         skip_nba: If True, skip NBA/WNBA player lookups for faster generation
+        background_nba: If True, look up new players' pro status in the background
+            (see nba_players.wait_for_background_lookups) instead of before writing
     """
     info(f"Generating website data: {output_path}")
 
@@ -33,7 +40,7 @@ def generate_website_from_data(processed_data: Dict[str, Any], output_path: str,
 
     # Serialize data
     serializer = DataSerializer(processed_data, raw_games)
-    data = serializer.serialize_all(skip_nba=skip_nba)
+    data = serializer.serialize_all(skip_nba=skip_nba, background_nba=background_nba)
     json_data = json.dumps(data, indent=2, default=str)
 
     # Ensure output directory exists
@@ -8,14 +8,14 @@ import json
 
 from ..utils.nba_players import (
     get_nba_player_info_by_id, get_nba_status_batch, recheck_female_players_for_wnba,
-    check_proballers_for_all_players, validate_urls_on_load
+    check_proballers_for_all_players, validate_urls_on_load, background_lookups_running
 )
 from ..utils.d2d3_scraper import enrich_player_with_realgm, lookup_player_transfers
 from ..utils.schedule_scraper import (
-    get_schedule, filter_upcoming_games, venue_matches,
+    get_schedule, filter_upcoming_games, VenueMatcher,
     SCHEDULE_CACHE_FILE, SCHEDULE_CACHE_FILE_WOMENS, normalize_state, get_espn_team_id
 )
-from ..utils.team_names import normalize_team_name
+from ..utils.team_names import get_team_resolver, normalize_team_name
 from ..utils.constants import ESPN_TO_CANONICAL, NON_D1_SCHOOLS
 from ..utils.log import info, debug
 
@@ -83,18 +83,22 @@ class DataSerializer:
         self.processed_data = processed_data
         self.raw_games = raw_games or []
         self._games_cache = None  # Cache for serialized games
+        self._conference_lookups: Dict[str, str] = {}  # team name -> _lookup_conference result
 
-    def serialize_all(self, skip_nba: bool = False) -> Dict[str, Any]:
+    def serialize_all(self, skip_nba: bool = False, background_nba: bool = False) -> Dict[str, Any]:
         """
         Serialize all data for website.
 
         Args:
             skip_nba: If True, skip NBA/WNBA player lookups for faster generation
+            background_nba: If True, look up new male players in the background
+                instead of before serializing them (they appear on the next generation)
 
         Returns:
             Dictionary ready for JSON encoding
         """
         self._skip_nba = skip_nba
+        self._background_nba = background_nba
 
         # Auto-refresh conference data if needed (runs every ~90 days)
         try:
@@ -173,7 +177,8 @@ class DataSerializer:
             total_points = int(players['Total PTS'].sum())
 
         # Count unique conferences seen
-        from ..utils.constants import get_conference_for_date, DEFUNCT_TEAMS
+        from ..utils.constants import DEFUNCT_TEAMS
+        resolver = get_team_resolver()
         conferences_seen = set()
         for game in self.raw_games:
             basic_info = game.get('basic_info', {})
@@ -182,11 +187,11 @@ class DataSerializer:
             away_team = basic_info.get('away_team', '')
             home_team = basic_info.get('home_team', '')
             if away_team:
-                conf = get_conference_for_date(away_team, date_str, gender)
+                conf = resolver.resolve(away_team, date_str, gender).conference
                 if conf and conf not in ('Historical/Other', 'D3', 'D2', 'NAIA', 'Non-D1'):
                     conferences_seen.add(conf)
             if home_team:
-                conf = get_conference_for_date(home_team, date_str, gender)
+                conf = resolver.resolve(home_team, date_str, gender).conference
                 if conf and conf not in ('Historical/Other', 'D3', 'D2', 'NAIA', 'Non-D1'):
                     conferences_seen.add(conf)
 
@@ -237,7 +242,7 @@ class DataSerializer:
         if self._games_cache is not None:
             return self._games_cache
 
-        from ..utils.constants import get_conference_for_date
+        resolver = get_team_resolver()
 
         game_log = self.processed_data.get('game_log', pd.DataFrame())
         if game_log.empty:
@@ -310,12 +315,12 @@ class DataSerializer:
             home_team = game.get('Home Team', '')
 
             if date_sort and away_team:
-                away_conf = get_conference_for_date(away_team, date_sort, gender)
+                away_conf = resolver.resolve(away_team, date_sort, gender).conference
                 if away_conf:
                     game['AwayConf'] = away_conf
 
             if date_sort and home_team:
-                home_conf = get_conference_for_date(home_team, date_sort, gender)
+                home_conf = resolver.resolve(home_team, date_sort, gender).conference
                 if home_conf:
                     game['HomeConf'] = home_conf
 
@@ -376,129 +381,7 @@ class DataSerializer:
 
     def _teams_match(self, team1: str, team2: str) -> bool:
         """Check if two team names likely refer to the same team."""
-        from ..utils.constants import TEAM_ALIASES
-
-        def normalize(name: str) -> str:
-            # Remove common suffixes like Bulldogs, Bears, etc.
-            n = name.lower().replace("'", "").replace(".", "").replace("-", " ").replace("(", "").replace(")", "").strip()
-            # Remove team nickname suffixes (common ESPN format)
-            # Try to strip any "Lady X" or common nickname pattern
-            import re
-            # First try to remove "Lady <nickname>" pattern
-            lady_match = re.match(r'^(.+?)\s+lady\s+\w+$', n)
-            if lady_match:
-                return lady_match.group(1).strip()
-
-            # Comprehensive list of D1 college basketball team nicknames
-            # Includes men's and women's variants (cowboys/cowgirls, etc.)
-            suffixes = [
-                # A
-                'aces', 'aggies', 'anteaters', 'antelopes', 'aztecs',
-                # B
-                'badgers', 'banana slugs', 'battlin bears', 'beach', 'bearcats', 'bears',
-                'beavers', 'bengals', 'bighornz', 'billikens', 'bison', 'black bears',
-                'black knights', 'blazers', 'blue demons', 'blue devils', 'blue hens',
-                'blue jays', 'blue raiders', 'bluejays', 'bobcats', 'boilermakers',
-                'bonnies', 'braves', 'broncos', 'bruins', 'buckeyes', 'buffaloes',
-                'buffs', 'bulldogs', 'bulls',
-                # C
-                'camels', 'cardinals', 'catamounts', 'cavaliers', 'chanticleers',
-                'chippewas', 'citadel', 'clan', 'cobras', 'colonels', 'commodores',
-                'cornhuskers', 'cougars', 'cowboys', 'cowgirls', 'coyotes', 'crimson',
-                'crimson tide', 'crusaders', 'cyclones',
-                # D
-                'darters', 'demon deacons', 'demons', 'dolphins', 'dons', 'dragons',
-                'ducks', 'dukes', 'dustdevils',
-                # E
-                'eagles', 'engineers', 'explorers',
-                # F
-                'falcons', 'fighting camels', 'fighting hawks', 'fighting illini',
-                'fighting irish', 'flames', 'flashes', 'flyers', 'friars',
-                # G
-                'gaels', 'gators', 'golden bears', 'golden eagles', 'golden flashes',
-                'golden gophers', 'golden griffins', 'golden grizzlies', 'golden hurricane',
-                'golden knights', 'golden panthers', 'gophers', 'gorillas', 'governors',
-                'govs', 'great danes', 'green wave', 'greyhounds', 'griffins', 'grizzlies',
-                # H
-                'hatters', 'hawkeyes', 'hawks', 'highlanders', 'hilltoppers', 'hokies',
-                'hoosiers', 'hornets', 'horned frogs', 'hoyas', 'huskies', 'hurricanes',
-                # I
-                'ichabods', 'illini', 'indians',
-                # J
-                'jackrabbits', 'jacks', 'jaguars', 'jaspers', 'javelinas', 'jayhawks', 'jets',
-                # K
-                'kangaroos', 'keydets', 'kingsmen', 'knights',
-                # L
-                'lancers', 'leathernecks', 'leopards', 'lions', 'lobos', 'longhorns', 'lopes', 'lumberjacks',
-                # M
-                'mad ants', 'mavericks', 'mean green', 'midshipmen', 'miners', 'mocs',
-                'mocassins', 'monarchs', 'mountaineers', 'musketeers', 'mustangs',
-                # N
-                'nittany lions',
-                # O
-                'ospreys', 'orange', 'orangemen', 'owls',
-                # P
-                'paladins', 'panthers', 'patriots', 'peacocks', 'pelicans', 'penguins',
-                'phoenix', 'pilots', 'pioneers', 'pirates', 'privateers', 'purple aces',
-                'purple eagles',
-                # Q-R
-                'quakers', 'racers', 'ragin cajuns', 'raiders', 'rainbow wahine',
-                'rainbow warriors', 'rams', 'rattlers', 'razorbacks', 'rebels',
-                'red flash', 'red foxes', 'red hawks', 'red raiders', 'red storm',
-                'red wolves', 'redhawks', 'redbirds', 'retrievers', 'riverhawks',
-                'roadrunners', 'rockets', 'runnin bulldogs', 'running rebels',
-                # S
-                'saints', 'salukis', 'samurai', 'scarlet knights', 'scots', 'seahawks',
-                'seawolves', 'seminoles', 'shockers', 'skyhawks', 'sooners', 'spartans',
-                'spiders', 'stags', 'statesmen', 'stormy petrels', 'sun devils',
-                'sycamores',
-                # T
-                'tar heels', 'terrapins', 'terriers', 'thunderbirds', 'thundering herd',
-                'tides', 'tigers', 'titans', 'tomcats', 'toppers', 'toreadors', 'toreros',
-                'tribe', 'tritons', 'trojans', 'tritons',
-                # U-V
-                'utes', 'vandals', 'vikings', 'vixens', 'vols', 'volunteers',
-                # W
-                'wahoos', 'war hawks', 'warhawks', 'warriors', 'wasps', 'wave',
-                'westerners', 'wildcats', 'wolf pack', 'wolfpack', 'wolverines', 'wolves',
-                # Y-Z
-                'yellow jackets', 'zags', 'zips',
-            ]
-            for suffix in suffixes:
-                if n.endswith(' ' + suffix):
-                    n = n[:-len(suffix)-1].strip()
-                    break
-            return n
-
-        t1 = normalize(team1)
-        t2 = normalize(team2)
-
-        # Direct match after normalization (this handles ESPN suffix removal)
-        if t1 == t2:
-            return True
-
-        # Check exact alias matches
-        # Build equivalence sets from aliases
-        t1_equivalents = {t1}
-        t2_equivalents = {t2}
-
-        for alias, target in TEAM_ALIASES.items():
-            alias_norm = normalize(alias)
-            target_norm = normalize(target)
-            # If t1 matches alias or target exactly, add both to equivalents
-            if t1 == alias_norm or t1 == target_norm:
-                t1_equivalents.add(alias_norm)
-                t1_equivalents.add(target_norm)
-            # Same for t2
-            if t2 == alias_norm or t2 == target_norm:
-                t2_equivalents.add(alias_norm)
-                t2_equivalents.add(target_norm)
-
-        # Check if equivalence sets overlap
-        if t1_equivalents & t2_equivalents:
-            return True
-
-        return False
+        return get_team_resolver().teams_match(team1, team2)
 
     def _serialize_players(self) -> List[Dict]:
         """Serialize player statistics with NBA and international info."""
@@ -509,14 +392,15 @@ class DataSerializer:
         records = self._df_to_records(players)
 
         # Batch fetch NBA/international status
-        # - Male players: check cache + fetch new (up to 999)
+        # - Male players: check cache + fetch new (up to 999), or queue them in the background
         # - Female players: cache-only (WNBA checked separately via recheck_female_players_for_wnba)
         skip_nba = getattr(self, '_skip_nba', False)
+        background_nba = getattr(self, '_background_nba', False)
         male_player_ids = [r.get('Player ID', '') for r in records if r.get('Player ID') and r.get('Gender') == 'M']
         female_player_ids = [r.get('Player ID', '') for r in records if r.get('Player ID') and r.get('Gender') == 'W']
 
-        # Get male players (may fetch new)
-        pro_status = get_nba_status_batch(male_player_ids, max_fetch=-1 if skip_nba else 999)
+        # Get male players (may fetch new; background lookups are queued after the Proballers check)
+        pro_status = get_nba_status_batch(male_player_ids, max_fetch=-1 if skip_nba or background_nba else 999)
         # Get female players from cache only (no new fetches - handled by recheck_female_players_for_wnba)
         if female_player_ids:
             female_pro_status = get_nba_status_batch(female_player_ids, max_fetch=-1)
@@ -562,16 +446,23 @@ class DataSerializer:
                     })
             if proballers_players:
                 check_proballers_for_all_players(proballers_players)
+            if background_nba:
+                # Refresh pro_status to include Proballers data, and look up players
+                # not cached yet without holding up generation
+                pro_status = get_nba_status_batch(male_player_ids, max_fetch=999, background=True)
+            elif proballers_players:
                 # Refresh pro_status to include Proballers data
                 pro_status = get_nba_status_batch(male_player_ids, max_fetch=-1)
 
         # Add NBA and International flags to each player
+        lookups_pending = background_lookups_running()
         for record in records:
             player_id = record.get('Player ID', '')
             is_male = record.get('Gender') == 'M'
             pro_info = pro_status.get(player_id) if player_id else None
             # Only fetch NBA status for male players (females checked via recheck_female_players_for_wnba)
-            if not pro_info and not skip_nba and is_male:
+            # and not while the background lookups are still working through them
+            if not pro_info and not skip_nba and is_male and not lookups_pending:
                 pro_info = get_nba_player_info_by_id(player_id)
 
             # Check if URLs are flagged as invalid
@@ -902,6 +793,7 @@ class DataSerializer:
         # Filter to all future games (not just unvisited — website handles filtering)
         from datetime import datetime
         now = datetime.now()
+        venue_matcher = VenueMatcher(visited_venues)
         upcoming = []
         for game in schedule:
             try:
@@ -913,9 +805,7 @@ class DataSerializer:
             # Mark whether venue is visited
             espn_venue = game.get("venue", {})
             venue_key = f"{espn_venue.get('name', '')}, {espn_venue.get('city', '')}, {espn_venue.get('state', '')}"
-            game["venue_visited"] = any(
-                venue_matches(espn_venue, v) for v in visited_venues
-            ) if espn_venue.get('name') else False
+            game["venue_visited"] = venue_matcher.matches(espn_venue) if espn_venue.get('name') else False
             upcoming.append(game)
         upcoming.sort(key=lambda g: g["date"])
 
@@ -1093,9 +983,6 @@ class DataSerializer:
 
     def _lookup_conference(self, team_name: str) -> str:
         """Look up conference for a team using explicit mappings only."""
-        from ..utils.constants import get_conference_for_date
-        import datetime
-
         if not team_name:
             return ''
 
@@ -1103,18 +990,29 @@ class DataSerializer:
         if team_name in NON_D1_SCHOOLS:
             return ''
 
+        if team_name not in self._conference_lookups:
+            self._conference_lookups[team_name] = self._find_current_conference(team_name)
+        return self._conference_lookups[team_name]
+
+    def _find_current_conference(self, team_name: str) -> str:
+        """Uncached _lookup_conference."""
+        import datetime
+
+        resolver = get_team_resolver()
+        today = datetime.datetime.now().strftime('%Y%m%d')
+
         # Normalize Unicode
         normalized = team_name.replace(''', "'").replace(''', "'").replace('é', 'e').replace('ñ', 'n')
 
         # Try explicit ESPN mapping first
         if normalized in ESPN_TO_CANONICAL:
             canonical = ESPN_TO_CANONICAL[normalized]
-            conf = get_conference_for_date(canonical, datetime.datetime.now().strftime('%Y%m%d'), 'M')
+            conf = resolver.resolve(canonical, today).conference
             if conf and conf not in ('Historical/Other', 'D3', 'D2', 'NAIA', 'Non-D1'):
                 return conf
 
         # Try direct lookup with original name
-        conf = get_conference_for_date(normalized, datetime.datetime.now().strftime('%Y%m%d'), 'M')
+        conf = resolver.resolve(normalized, today).conference
         if conf and conf not in ('Historical/Other', 'D3', 'D2', 'NAIA', 'Non-D1'):
             return conf
 
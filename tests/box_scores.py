@@ -0,0 +1,66 @@
+"""Builders for minimal parsed box scores shared by the processor and engine tests."""
+
+from typing import Any, Dict, List, Optional
+
+
+def box_score_line(name: str, player_id: Optional[str] = None, mp: str = '30:00', **stats: Any) -> Dict[str, Any]:
+    """
+    Build one player's box score line.
+
+    Args:
+        name: Player name
+        player_id: Sports Reference ID (defaults to the lowercased name)
+        mp: Minutes played
+        **stats: Stat columns (pts, trb, ast, ...) and flags such as starter
+
+    Returns:
+        Player line dictionary
+    """
+    line = {'name': name, 'player_id': name.lower() if player_id is None else player_id, 'mp': mp}
+    line.update(stats)
+    return line
+
+
+def box_score_game(
+    date: str,
+    away: str,
+    home: str,
+    away_score: Any,
+    home_score: Any,
+    away_players: List[Dict[str, Any]],
+    home_players: List[Dict[str, Any]],
+    home_key: str = 'players',
+    **basic_info: Any
+) -> Dict[str, Any]:
+    """
+    Build a parsed men's D1 game.
+
+    Args:
+        date: Game date (YYYYMMDD, or any string the tests need)
+        away: Away team name
+        home: Home team name
+        away_score: Away team score
+        home_score: Home team score
+        away_players: Away box score lines (stored under 'players')
+        home_players: Home box score lines
+        home_key: Key for the home lines ('players', or 'basic' as older parses use)
+        **basic_info: Extra or overriding basic_info fields (venue, attendance, ...)
+
+    Returns:
+        Game dictionary
+    """
+    return {
+        'game_id': f"{date}-{home.lower()}",
+        'gender': 'M',
+        'basic_info': {
+            'date': date, 'date_yyyymmdd': date, 'gender': 'M', 'division': 'D1',
+            'away_team': away, 'home_team': home,
+            'away_score': away_score, 'home_score': home_score,
+            'venue': f"{home} Arena", **basic_info,
+        },
+        'box_score': {
+            'away': {'players': away_players},
+            'home': {home_key: home_players},
+        },
+        'special_events': {},
+    }
@@ -0,0 +1,176 @@
+"""Tests for basketball_processor.processors.aggregation_store module."""
+
+import copy
+import json
+
+import pytest
+
+from basketball_processor.excel.workbook_generator import process_games
+from basketball_processor.processors import aggregation_store as store_module
+from basketball_processor.processors.aggregation_store import AggregationStore, diff_processed_data, game_fingerprint
+from tests.box_scores import box_score_game, box_score_line
+
+
+def _player(name, player_id, pts, trb=4, ast=2, starter=True):
+    return box_score_line(
+        name, player_id, pts=pts, trb=trb, ast=ast, stl=1, blk=0, fg=pts // 2, fga=pts,
+        fg3=1, fg3a=3, ft=0, fta=0, orb=1, drb=trb - 1, tov=2, pf=2, starter=starter,
+    )
+
+
+def _game(date, away, home, away_score, home_score, away_players, home_players):
+    game = box_score_game(date, away, home, away_score, home_score, away_players, home_players, attendance=5000)
+    game['milestone_stats'] = {}
+    return game
+
+
+@pytest.fixture
+def games():
+    """Three games between three teams sharing some players."""
+    return [
+        _game('20250105', 'Duke', 'North Carolina', 80, 75,
+              [_player('Cooper Flagg', 'cflagg', 25), _player('Tyrese Proctor', 'tproctor', 12)],
+              [_player('RJ Davis', 'rdavis', 20), _player('Elliot Cadeau', 'ecadeau', 8, starter=False)]),
+        _game('20250112', 'North Carolina', 'Virginia', 70, 60,
+              [_player('RJ Davis', 'rdavis', 30)],
+              [_player('Isaac McKneely', 'imckneely', 18)]),
+        _game('20250119', 'Virginia', 'Duke', 55, 85,
+              [_player('Isaac McKneely', 'imckneely', 10)],
+              [_player('Cooper Flagg', 'cflagg', 31, trb=12), _player('Tyrese Proctor', 'tproctor', 9)]),
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An AggregationStore persisted in a temporary directory."""
+    return AggregationStore(path=tmp_path / "store.json")
+
+
+def _assert_matches_full(store, games):
+    assert diff_processed_data(store.build_outputs(), process_games(games)) == []
+
+
+class TestAggregationStore:
+    """Tests for incremental aggregation parity with a full rebuild."""
+
+    def test_initial_build_matches_full(self, store, games):
+        """Test that a freshly built store matches the processors."""
+        counts = store.sync(games)
+        assert counts['added'] == 3
+        _assert_matches_full(store, games)
+
+    def test_new_game_only_touches_its_keys(self, store, games):
+        """Test that adding a game leaves unrelated players' state untouched."""
+        store.sync(games[:2])
+        untouched = store.players['ecadeau']
+        counts = store.sync(games)
+        assert counts == {'added': 1, 'changed': 0, 'removed': 0, 'unchanged': 2}
+        assert store.players['ecadeau'] is untouched
+        _assert_matches_full(store, games)
+
+    def test_changed_and_removed_games(self, store, games):
+        """Test that edited and dropped games are reflected exactly."""
+        store.sync(games)
+        edited = copy.deepcopy(games)
+        edited[2]['box_score']['home']['players'][0]['pts'] = 40
+        counts = store.sync(edited)
+        assert counts['changed'] == 1
+        _assert_matches_full(store, edited)
+
+        remaining = [edited[0], edited[2]]
+        counts = store.sync(remaining)
+        assert counts['removed'] == 1
+        assert 'imckneely' in store.players
+        _assert_matches_full(store, remaining)
+
+    def test_persists_across_instances(self, store, games):
+        """Test that a saved store reloads and updates incrementally."""
+        store.sync(games[:2])
+        store.save()
+
+        reloaded = AggregationStore(path=store.path)
+        assert reloaded.load()
+        assert reloaded.sync(games)['unchanged'] == 2
+        _assert_matches_full(reloaded, games)
+
+    def test_saved_as_json(self, store, games):
+        """Test that the store is written as JSON and sets/tuples round-trip."""
+        store.sync(games)
+        store.save()
+        data = json.loads(store.path.read_text(encoding='utf-8'))
+        assert data['version'] == store_module.STORE_VERSION
+
+        reloaded = AggregationStore(path=store.path)
+        assert reloaded.load()
+        assert reloaded.players['cflagg']['teams'] == {'Duke'}
+        assert set(reloaded.head_to_head) == set(store.head_to_head)
+        assert dict(reloaded.team_index) == dict(store.team_index)
+
+    def test_conference_data_change_forces_rebuild(self, store, games, monkeypatch):
+        """Test that a store built against other conference data is not reused."""
+        store.sync(games)
+        store.save()
+
+        conferences = dict(store_module.constants.CONFERENCES)
+        conferences['Test League'] = ['Duke', 'Virginia']
+        monkeypatch.setattr(store_module.constants, 'CONFERENCES', conferences)
+        assert not AggregationStore(path=store.path).load()
+
+    def test_school_history_change_forces_rebuild(self, store, games, tmp_path, monkeypatch):
+        """Test that re-scraped school history invalidates the persisted store."""
+        history = tmp_path / "history.json"
+        history.write_text(json.dumps({'Duke': [{'conference': 'ACC', 'from': 1954, 'to': 2025}]}))
+        monkeypatch.setattr(store_module.school_history_scraper, 'SCHOOL_HISTORY_FILE', str(history))
+        store = AggregationStore(path=store.path)
+        store.sync(games)
+        store.save()
+        assert AggregationStore(path=store.path).load()
+
+        history.write_text(json.dumps({'Duke': [{'conference': 'Big East', 'from': 1954, 'to': 2025}]}))
+        assert not AggregationStore(path=store.path).load()
+
+    def test_unreadable_store_is_ignored(self, store):
+        """Test that a corrupt store file is treated as missing."""
+        store.path.write_text('{not json', encoding='utf-8')
+        assert not store.load()
+
+
+class TestGameFingerprint:
+    """Tests for the per-game fingerprint used to match games on sync."""
+
+    def _stamped(self, game):
+        game = copy.deepcopy(game)
+        game['_cache_meta'] = {'parser_version': 1, 'content_hash': 'abc123'}
+        game['_derived_fingerprint'] = 'f00d'
+        return game
+
+    def test_stamped_game_skips_box_score(self, games):
+        """Test that parse-cache games are identified by their stamps, not their box score."""
+        game = self._stamped(games[0])
+        fingerprint = game_fingerprint(game)
+        game['box_score']['away']['players'][0]['pts'] = 99
+        assert game_fingerprint(game) == fingerprint
+
+        game['_derived_fingerprint'] = 'beef'
+        assert game_fingerprint(game) != fingerprint
+
+    def test_stamped_game_tracks_post_parse_fields(self, games):
+        """Test that venue, rankings and play-by-play changes after parsing still count."""
+        game = self._stamped(games[0])
+        fingerprint = game_fingerprint(game)
+        game['basic_info']['away_rank'] = 3
+        assert game_fingerprint(game) != fingerprint
+
+        ranked = game_fingerprint(game)
+        game['espn_pbp_analysis'] = {'lead_changes': 4}
+        assert game_fingerprint(game) != ranked
+
+    def test_unstamped_game_hashes_processed_fields(self, games):
+        """Test that games without a cache stamp hash the fields the processors read."""
+        game = copy.deepcopy(games[0])
+        fingerprint = game_fingerprint(game)
+        game['espn_pbp'] = {'plays': [1, 2, 3]}
+        assert game_fingerprint(game) == fingerprint
+
+        game['box_score']['away']['players'][0]['pts'] = 99
+        assert game_fingerprint(game) != fingerprint
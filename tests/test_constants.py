@@ -33,6 +33,14 @@ class TestGetConference:
         # Mizzou should resolve to Missouri -> SEC
         assert get_conference("Mizzou") == "SEC"
 
+    def test_index_rebuilds_when_conferences_rebound(self, monkeypatch):
+        """Test that rebinding CONFERENCES is picked up by the lookup index."""
+        from basketball_processor.utils import constants
+
+        assert get_conference("Duke") == "ACC"
+        monkeypatch.setattr(constants, 'CONFERENCES', {'Test Conf': ['Duke']})
+        assert get_conference("Duke") == "Test Conf"
+
 
 class TestGetConferenceForDate:
     """Tests for historical conference lookups."""
@@ -0,0 +1,52 @@
+"""Tests for basketball_processor.utils.d2d3_scraper module."""
+
+import pytest
+
+from basketball_processor.utils import d2d3_scraper
+from basketball_processor.utils.d2d3_scraper import TransferIndex, get_player_school_history
+
+
+PLAYERS = {
+    'churchill abass': {'name': 'Churchill Abass', 'schools': [{'from': 'Wake Forest', 'to': 'New Orleans'}]},
+    'john smith': {'name': 'John Smith', 'schools': [{'from': 'Duke', 'to': 'Memphis'}]},
+    'john smithson': {'name': 'John Smithson', 'schools': [{'from': 'Iona', 'to': 'Rider'}]},
+    'al': {'name': 'Al', 'schools': []},
+}
+
+
+def _scan(players, player_name):
+    """The linear lookup the index replaces."""
+    name_key = player_name.lower().strip()
+    if name_key in players:
+        return players[name_key]
+    for key, data in players.items():
+        if name_key in key or key in name_key:
+            return data
+    return {}
+
+
+class TestTransferIndex:
+    """Tests for indexed transfer portal lookups."""
+
+    @pytest.mark.parametrize('name', [
+        'John Smith', 'john smithson', 'Smith', 'smithso', 'John Smith Jr.',
+        'Churchill Abass II', 'al', 'Alex Jones', 'xyz', 'hn s', '',
+    ])
+    def test_matches_linear_scan(self, name):
+        """Test that the index returns the same player as scanning in file order."""
+        assert TransferIndex(PLAYERS).lookup(name) == _scan(PLAYERS, name)
+
+    def test_index_built_once(self, monkeypatch):
+        """Test that the transfer file is loaded once for many lookups."""
+        loads = []
+
+        def load():
+            loads.append(1)
+            return {'players': PLAYERS}
+
+        monkeypatch.setattr(d2d3_scraper, '_load_transfer_cache', load)
+        monkeypatch.setattr(d2d3_scraper, '_transfer_index', None)
+
+        assert get_player_school_history('John Smith') == ['Duke', 'Memphis']
+        assert get_player_school_history('Churchill Abass') == ['New Orleans', 'Wake Forest']
+        assert len(loads) == 1
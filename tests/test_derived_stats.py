@@ -0,0 +1,108 @@
+"""Tests for basketball_processor.utils.derived_stats module."""
+
+import json
+
+import pytest
+
+from basketball_processor.engines import milestone_engine
+from basketball_processor.utils import derived_stats
+from basketball_processor.utils import parse_cache as parse_cache_module
+from basketball_processor.utils.derived_stats import (
+    DERIVED_STATS_KEY,
+    derived_stats_fingerprint,
+    needs_derived_refresh,
+    refresh_derived_stats,
+    stamp_derived_stats,
+)
+from basketball_processor.utils.parse_cache import ParseCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A temporary parse cache used as the process-wide cache."""
+    cache = ParseCache(cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(parse_cache_module, '_parse_cache', cache)
+    return cache
+
+
+def _game(game_id, pts):
+    return {
+        'game_id': game_id,
+        'gender': 'M',
+        'basic_info': {'away_team': 'Away', 'home_team': 'Home', 'away_score': 80, 'home_score': 55},
+        'box_score': {
+            'away': {'players': [{'name': 'Scorer', 'player_id': 'scorer', 'pts': pts, 'mp': '30:00'}]},
+            'home': {'players': []},
+        },
+        'linescore': {},
+    }
+
+
+class TestFingerprint:
+    """Tests for the engine/threshold fingerprint."""
+
+    def test_changes_with_thresholds(self, monkeypatch):
+        """Test that editing a threshold or engine version changes the fingerprint."""
+        original = derived_stats_fingerprint()
+        assert derived_stats_fingerprint() == original
+
+        monkeypatch.setitem(derived_stats.MILESTONE_THRESHOLDS, 'hot_shooting_pct', 0.55)
+        changed = derived_stats_fingerprint()
+        assert changed != original
+
+        monkeypatch.setattr(milestone_engine, 'ENGINE_VERSION', milestone_engine.ENGINE_VERSION + 1)
+        assert derived_stats_fingerprint() not in (original, changed)
+
+    def test_unstamped_games_are_stale(self):
+        """Test that games cached before fingerprinting are refreshed."""
+        game = _game('g1', 25)
+        assert needs_derived_refresh(game)
+        stamp_derived_stats(game)
+        assert not needs_derived_refresh(game)
+
+
+class TestRefreshDerivedStats:
+    """Tests for re-running the engines on cached box scores."""
+
+    def test_only_stale_games_rerun(self, cache):
+        """Test that current games are left alone and stale ones get new results."""
+        current = _game('current', 25)
+        current['milestone_stats'] = {'sentinel': []}
+        stamp_derived_stats(current)
+        stale = _game('stale', 25)
+
+        counts = refresh_derived_stats([current, stale])
+
+        assert counts == {'refreshed': 1, 'failed': 0, 'current': 1}
+        assert current['milestone_stats'] == {'sentinel': []}
+        assert [m['player'] for m in stale['milestone_stats']['twenty_point_games']] == ['Scorer']
+        assert stale['special_events']['blowout_margin'] == 25
+        assert stale[DERIVED_STATS_KEY] == derived_stats_fingerprint()
+
+    def test_threshold_change_rewrites_cache_entry(self, cache, monkeypatch):
+        """Test that a config change re-detects milestones and persists them."""
+        game = _game('g1', 25)
+        cache.store('a' * 64, 'M', game)
+        refresh_derived_stats([game])
+
+        configs = dict(derived_stats.MILESTONE_STAT_CONFIGS)
+        configs['scoring'] = [('twenty_five_point_games', 'pts', 25, None, '{value} points')]
+        monkeypatch.setattr(derived_stats, 'MILESTONE_STAT_CONFIGS', configs)
+        monkeypatch.setattr(milestone_engine, 'MILESTONE_STAT_CONFIGS', configs)
+
+        assert refresh_derived_stats([game])['refreshed'] == 1
+        stored = json.loads(cache.entry_path('a' * 64, 'M').read_text())
+        assert stored['milestone_stats']['twenty_point_games'] == []
+        assert stored['milestone_stats']['twenty_five_point_games'][0]['detail'] == '25 points'
+        assert stored[DERIVED_STATS_KEY] == derived_stats_fingerprint()
+
+    def test_womens_sidearm_game_rewrites_its_own_entry(self, cache):
+        """Test that a game with gender only in basic_info keeps its -W entry."""
+        game = _game('g1', 25)
+        del game['gender']
+        game['basic_info']['gender'] = 'W'
+        cache.store('b' * 64, 'W', game)
+
+        assert refresh_derived_stats([game])['refreshed'] == 1
+        assert cache.load('b' * 64, 'W')[DERIVED_STATS_KEY] == derived_stats_fingerprint()
+        assert not cache.entry_path('b' * 64, 'M').exists()
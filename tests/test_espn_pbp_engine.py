@@ -0,0 +1,87 @@
+"""Tests for basketball_processor.engines.espn_pbp_engine module."""
+
+import json
+
+import pytest
+
+from basketball_processor.engines.espn_pbp_engine import ESPNPlayByPlayEngine
+from basketball_processor.utils.espn_pbp_scraper import CACHE_DIR
+
+PBP_FILES = sorted(CACHE_DIR.glob("*.json")) if CACHE_DIR.exists() else []
+
+
+def _play(period, time, away, home, side='', player='', value=0, play_type='', scoring=True):
+    return {
+        'period': period, 'time': time, 'away_score': away, 'home_score': home,
+        'team_side': side, 'team': {'away': 'Away', 'home': 'Home'}.get(side, ''),
+        'player': player, 'scoring_play': scoring, 'score_value': value,
+        'play_type': play_type, 'text': f'{player} {play_type}',
+    }
+
+
+# Home builds a 15-0 run, away comes back from 13 down and takes the lead late
+PLAYS = [
+    _play(1, '19:30', 2, 0, 'away', 'A1', 2, 'jumper_made'),
+    _play(1, '18:00', 2, 3, 'home', 'H1', 3, 'three_made'),
+    _play(1, '17:00', 2, 5, 'home', 'H1', 2, 'layup_made'),
+    _play(1, '16:00', 2, 8, 'home', 'H1', 3, 'three_made'),
+    _play(1, '15:00', 2, 8, 'away', 'A2', 0, 'jumper_missed', scoring=False),
+    _play(1, '14:00', 2, 10, 'home', 'H2', 2, 'dunk_made'),
+    _play(1, '13:00', 2, 12, 'home', 'H2', 2, 'layup_made'),
+    _play(1, '12:00', 2, 15, 'home', 'H1', 3, 'three_made'),
+    _play(2, '10:00', 12, 15, 'away', 'A1', 10, 'jumper_made'),
+    _play(2, '4:30', 14, 15, 'away', 'A2', 2, 'layup_made'),
+    _play(2, '3:00', 14, 16, 'home', 'H2', 1, 'ft_made'),
+    _play(2, '1:10', 17, 16, 'away', 'A1', 3, 'three_made'),
+    _play(2, '0:40', 17, 16, '', '', 0, 'timeout', scoring=False),
+    _play(2, '0:20', 18, 16, 'away', 'A2', 1, 'free_throw'),
+]
+
+
+def _engine(plays, gender='M'):
+    last = plays[-1]
+    espn_pbp = {
+        'plays': plays, 'gender': gender, 'away_team': 'Away', 'home_team': 'Home',
+        'away_score': last['away_score'], 'home_score': last['home_score'],
+    }
+    return ESPNPlayByPlayEngine(espn_pbp, {'basic_info': {}})
+
+
+class TestFusedAnalysis:
+    """Tests that the single-pass analysis matches the individual analyses."""
+
+    def test_matches_separate_passes(self):
+        """Test that analyze() gives the same results fused and unfused."""
+        engine = _engine(PLAYS)
+        fused = engine.analyze(fused=True)
+
+        assert fused == engine.analyze(fused=False)
+        assert fused['team_scoring_runs'][0]['points'] == 15
+        assert fused['biggest_comeback']['deficit'] == 13
+        assert fused['game_winning_shots']['decisive_shot']['player'] == 'A1'
+
+    def test_womens_final_period(self):
+        """Test that clutch windows use the fourth quarter for women's games."""
+        plays = [dict(p, period=p['period'] + 2) for p in PLAYS]
+        engine = _engine(plays, gender='W')
+        fused = engine.analyze(fused=True)
+
+        assert fused == engine.analyze(fused=False)
+        assert fused['clutch_scoring']['away'][0]['points'] == 3
+
+    def test_no_plays(self):
+        """Test that an empty play list gives an empty result."""
+        engine = ESPNPlayByPlayEngine({'plays': []}, {})
+        assert engine.analyze(fused=True) == {}
+
+
+@pytest.mark.skipif(not PBP_FILES, reason="No cached ESPN play-by-play files available")
+class TestFusedAnalysisCachedGames:
+    """Parity of the fused analysis over every cached ESPN play-by-play file."""
+
+    @pytest.mark.parametrize('path', PBP_FILES, ids=lambda p: p.stem)
+    def test_fused_matches_separate_passes(self, path):
+        """Test that one cached game analyzes identically both ways."""
+        espn_pbp = json.loads(path.read_text())
+        engine = ESPNPlayByPlayEngine(espn_pbp, {})
+        assert engine.analyze(fused=True) == engine.analyze(fused=False)
@@ -0,0 +1,122 @@
+"""Tests for basketball_processor.utils.espn_pbp_scraper module."""
+
+import json
+import random
+from datetime import date, datetime
+
+import pytest
+
+from basketball_processor.utils import espn_pbp_scraper
+from basketball_processor.utils.espn_pbp_scraper import ScheduleIndex, get_espn_id_from_cache
+from basketball_processor.utils.team_names import normalize_team_name_for_comparison
+
+
+TEAMS = [
+    {'name': 'Duke Blue Devils', 'short_name': 'Duke', 'abbreviation': 'DUKE'},
+    {'name': 'North Carolina Tar Heels', 'short_name': 'North Carolina', 'abbreviation': 'UNC'},
+    {'name': 'NC State Wolfpack', 'short_name': 'NC State', 'abbreviation': 'NCST'},
+    {'name': 'Virginia Cavaliers', 'short_name': 'Virginia', 'abbreviation': 'UVA'},
+    {'name': 'Virginia Tech Hokies', 'short_name': 'Virginia Tech', 'abbreviation': 'VT'},
+    {'name': '', 'short_name': '', 'abbreviation': ''},
+]
+
+
+def _linear_find(games, away_team, home_team, target_date):
+    """Reference lookup: first game in file order within a day whose teams match."""
+    away_norm = normalize_team_name_for_comparison(away_team)
+    home_norm = normalize_team_name_for_comparison(home_team)
+    for game in games:
+        game_date_str = game.get('date', '')
+        try:
+            if 'T' in game_date_str:
+                game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00')).date()
+            else:
+                game_date = datetime.fromisoformat(game_date_str).date()
+        except (ValueError, AttributeError):
+            continue
+        if abs((game_date - target_date).days) > 1:
+            continue
+        home_names = [normalize_team_name_for_comparison(game['home_team'].get(k, ''))
+                      for k in ('name', 'short_name', 'abbreviation')]
+        away_names = [normalize_team_name_for_comparison(game['away_team'].get(k, ''))
+                      for k in ('name', 'short_name', 'abbreviation')]
+        if (any(home_norm in n or n in home_norm for n in home_names if n)
+                and any(away_norm in n or n in away_norm for n in away_names if n)):
+            return game.get('espn_id')
+    return None
+
+
+def _random_schedule(rng):
+    games = []
+    for n in range(300):
+        day = rng.randint(10, 20)
+        hour = rng.randint(0, 23)
+        date_str = rng.choice([
+            f"2026-01-{day:02d}T{hour:02d}:00Z",
+            f"2026-01-{day:02d}T{hour:02d}:30-05:00",
+            f"2026-01-{day:02d}",
+            "",
+            "not a date",
+        ])
+        home, away = rng.sample(TEAMS, 2)
+        games.append({'espn_id': str(401000000 + n), 'date': date_str, 'home_team': home, 'away_team': away})
+    return games
+
+
+class TestScheduleIndex:
+    """Tests for date-bucketed ESPN ID lookups."""
+
+    def test_matches_linear_scan(self):
+        """Test that bucketed lookups return the same game as a full scan."""
+        rng = random.Random(11)
+        games = _random_schedule(rng)
+        index = ScheduleIndex(games)
+        names = ['Duke', 'North Carolina', 'NC State', 'Virginia', 'Virginia Tech', 'Gonzaga']
+        for day in range(8, 23):
+            target = date(2026, 1, day)
+            for away in names:
+                for home in names:
+                    match = index.find(normalize_team_name_for_comparison(away),
+                                       normalize_team_name_for_comparison(home), target)
+                    expected = _linear_find(games, away, home, target)
+                    assert (match[1] if match else None) == expected, (away, home, target)
+
+    def test_buckets_by_date_in_timestamp(self):
+        """Test that games bucket by the date of their timestamp (UTC for 'Z'), not local time."""
+        index = ScheduleIndex([
+            {'espn_id': 'late', 'date': '2026-01-16T01:00Z', 'home_team': TEAMS[0], 'away_team': TEAMS[1]},
+            {'espn_id': 'offset', 'date': '2026-01-15T21:00-05:00', 'home_team': TEAMS[2], 'away_team': TEAMS[3]},
+        ])
+        assert set(index.buckets) == {date(2026, 1, 16), date(2026, 1, 15)}
+        # An 8pm Eastern tip on the 15th is stored on the 16th, and found by the +/-1 day window
+        assert index.find('north carolina', 'duke', date(2026, 1, 15))[1] == 'late'
+        assert index.find('north carolina', 'duke', date(2026, 1, 17))[1] == 'late'
+        assert index.find('north carolina', 'duke', date(2026, 1, 18)) is None
+
+
+class TestGetEspnIdFromCache:
+    """Tests for schedule cache lookups through the cached index."""
+
+    @pytest.fixture
+    def schedule_file(self, tmp_path, monkeypatch):
+        """A temporary men's schedule cache with scoreboard fallbacks recorded."""
+        path = tmp_path / "schedule_cache.json"
+        monkeypatch.setattr(espn_pbp_scraper, 'SCHEDULE_CACHE_FILE', path)
+        monkeypatch.setattr(espn_pbp_scraper, '_schedule_indexes', {})
+        fallbacks = []
+        monkeypatch.setattr(espn_pbp_scraper, '_lookup_espn_id_from_scoreboard',
+                            lambda *args: fallbacks.append(args))
+        return path, fallbacks
+
+    def test_lookup_and_fallback(self, schedule_file):
+        """Test cache hits, scoreboard fallback on a miss, and a missing file."""
+        path, fallbacks = schedule_file
+        assert get_espn_id_from_cache('North Carolina', 'Duke', '20260115') is None
+        assert len(fallbacks) == 1
+
+        path.write_text(json.dumps({'games': [
+            {'espn_id': '401', 'date': '2026-01-16T01:00Z', 'home_team': TEAMS[0], 'away_team': TEAMS[1]},
+        ]}))
+        assert get_espn_id_from_cache('North Carolina', 'Duke', '20260115') == '401'
+        assert get_espn_id_from_cache('Virginia', 'Duke', '20260115') is None
+        assert len(fallbacks) == 2
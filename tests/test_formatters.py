@@ -0,0 +1,125 @@
+"""Tests for basketball_processor.excel.formatters module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xlsxwriter
+
+from basketball_processor.excel.formatters import (
+    get_default_format,
+    get_header_format,
+    iter_dataframe_rows,
+    write_dataframe_to_sheet,
+)
+from basketball_processor.utils.constants import EXCEL_COLORS
+
+
+def _sample_frame(rows=7):
+    df = pd.DataFrame({
+        'Player': [f"Player {i}" for i in range(rows)],
+        'PTS': np.arange(rows, dtype=np.int64) * 3,
+        'FG%': [0.5, np.nan, 0.25, 1.0, np.nan, 0.333, 0.0][:rows],
+        'Notes': ['', None, '2OT', 'x', None, 'y', 'z'][:rows],
+        'Starter': [True, False, True, True, False, False, True][:rows],
+        'Attendance': pd.array([21750, None, 9000, 0, None, 1, 2][:rows], dtype='Int64'),
+        'Team': pd.Categorical(['Duke', 'UNC', 'Duke', 'UVA', 'UNC', 'Duke', 'UVA'][:rows]),
+    })
+    # Duplicate column names must be written independently
+    df.insert(2, 'PTS ', df['PTS'] * 2)
+    return df.rename(columns={'PTS ': 'PTS'})
+
+
+def _alt_row_format(workbook):
+    """The per-cell writer's alternating row format (border and fill on every cell)."""
+    return workbook.add_format({
+        'bg_color': EXCEL_COLORS['alt_row'],
+        'border': 1,
+        'align': 'center',
+        'valign': 'vcenter',
+    })
+
+
+def _write_cell_by_cell(workbook, sheet_name, df):
+    """Reference writer: the per-cell loop with alternating row formats."""
+    worksheet = workbook.add_worksheet(sheet_name)
+    header_format = get_header_format(workbook)
+    for col_idx, col_name in enumerate(df.columns):
+        worksheet.write(0, col_idx, col_name, header_format)
+    default_format = get_default_format(workbook)
+    alt_format = _alt_row_format(workbook)
+    for row_idx, (_, row) in enumerate(df.iterrows(), start=1):
+        row_format = alt_format if row_idx % 2 == 0 else default_format
+        for col_idx, value in enumerate(row):
+            worksheet.write(row_idx, col_idx, '' if pd.isna(value) else value, row_format)
+
+
+def _read_values(path, sheet_name):
+    openpyxl = pytest.importorskip('openpyxl')
+    worksheet = openpyxl.load_workbook(path)[sheet_name]
+    return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+
+class TestIterDataframeRows:
+    """Tests for streaming DataFrame rows to the writer."""
+
+    def test_missing_values_blank(self):
+        """Test that NaN, None and NA become '' and other values are kept."""
+        rows = list(iter_dataframe_rows(_sample_frame()))
+        assert len(rows) == 7
+        assert rows[1][3] == '' and rows[1][4] == '' and rows[1][6] == ''
+        assert rows[0][:4] == ('Player 0', 0, 0, 0.5)
+        assert rows[2][7] == 'Duke'
+
+    def test_does_not_modify_frame(self):
+        """Test that the caller's DataFrame keeps its missing values and dtypes."""
+        df = _sample_frame()
+        dtypes = df.dtypes.tolist()
+        list(iter_dataframe_rows(df))
+        assert df['FG%'].isna().sum() == 2
+        assert df.dtypes.tolist() == dtypes
+
+
+class TestWriteDataframeToSheet:
+    """Tests for sheet writing parity with the per-cell writer."""
+
+    @pytest.mark.parametrize('constant_memory', [False, True])
+    def test_values_match_cell_by_cell(self, tmp_path, constant_memory):
+        """Test that cell values read back the same as the per-cell writer's."""
+        df = _sample_frame()
+        expected_path = tmp_path / "expected.xlsx"
+        workbook = xlsxwriter.Workbook(str(expected_path))
+        _write_cell_by_cell(workbook, 'Sheet', df)
+        workbook.close()
+
+        path = tmp_path / "actual.xlsx"
+        workbook = xlsxwriter.Workbook(str(path), {'constant_memory': constant_memory})
+        write_dataframe_to_sheet(workbook, 'Sheet', df)
+        workbook.close()
+
+        assert _read_values(path, 'Sheet') == _read_values(expected_path, 'Sheet')
+
+    def test_banding_matches_alternating_rows(self, tmp_path):
+        """Test that the conditional format shades the rows the per-row formats did."""
+        openpyxl = pytest.importorskip('openpyxl')
+        df = _sample_frame()
+        path = tmp_path / "banded.xlsx"
+        workbook = xlsxwriter.Workbook(str(path))
+        write_dataframe_to_sheet(workbook, 'Sheet', df)
+        workbook.close()
+
+        formats = openpyxl.load_workbook(path)['Sheet'].conditional_formatting
+        (cell_range, rules), = [(str(cf.sqref), cf.rules) for cf in formats]
+        assert cell_range == f"A2:{chr(ord('A') + len(df.columns) - 1)}{len(df) + 1}"
+        assert rules[0].formula == ['MOD(ROW(),2)=1']
+
+        # Per-row writer: alt format on even 0-based rows; Excel ROW() is 1-based
+        shaded = [excel_row for excel_row in range(2, len(df) + 2) if excel_row % 2 == 1]
+        assert shaded == [row_idx + 1 for row_idx in range(1, len(df) + 1) if row_idx % 2 == 0]
+
+    def test_empty_frame(self, tmp_path):
+        """Test that an empty DataFrame writes the placeholder."""
+        path = tmp_path / "empty.xlsx"
+        workbook = xlsxwriter.Workbook(str(path))
+        write_dataframe_to_sheet(workbook, 'Sheet', pd.DataFrame())
+        workbook.close()
+        assert _read_values(path, 'Sheet') == [['No data available']]
@@ -0,0 +1,92 @@
+"""Tests for basketball_processor.utils.game_archive module."""
+
+import json
+
+import pytest
+
+from basketball_processor.utils.game_archive import (
+    GameArchive,
+    load_archived_games,
+    list_cache_sources,
+    source_signature,
+)
+
+
+@pytest.fixture
+def games():
+    """A few minimal parsed games."""
+    return [
+        {'game_id': f'2025010{i}-duke', 'basic_info': {'home_team': 'Duke', 'away_team': f'Team {i}'}}
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, games):
+    """A cache directory holding one JSON file per game plus a non-game cache."""
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    for game in games:
+        (cache / f"{game['game_id']}.json").write_text(json.dumps(game, indent=2))
+    (cache / "poll_cache.json").write_text("{}")
+    return cache
+
+
+class TestGameArchive:
+    """Tests for the packed game archive."""
+
+    def test_roundtrip_preserves_order(self, tmp_path, games):
+        """Test that all games load back in the order they were written."""
+        archive = GameArchive(tmp_path / "games_archive.bin")
+        archive.write(games, {})
+        assert archive.load_all() == games
+
+    def test_load_single_game(self, tmp_path, games):
+        """Test that one game can be loaded by ID."""
+        archive = GameArchive(tmp_path / "games_archive.bin")
+        archive.write(games, {})
+        assert archive.load_game(games[1]['game_id']) == games[1]
+        assert archive.load_game('missing') is None
+
+    def test_stale_when_cache_changes(self, cache_dir, games):
+        """Test that adding a cache file makes the archive stale."""
+        loaded, sources, rejected = load_archived_games(cache_dir)
+        assert loaded is None
+        assert rejected == []
+
+        game_sources = {name: sig for name, sig in sources.items() if name != 'poll_cache.json'}
+        GameArchive(cache_dir / "games_archive.bin").write(games, game_sources, ['poll_cache.json'])
+        loaded, _, rejected = load_archived_games(cache_dir)
+        assert loaded == games
+        assert rejected == ['poll_cache.json']
+
+        (cache_dir / "20250110-duke.json").write_text(json.dumps(games[0]))
+        loaded, _, _ = load_archived_games(cache_dir)
+        assert loaded is None
+
+    def test_rejected_files_may_change(self, cache_dir, games):
+        """Test that rewriting a recorded non-game cache keeps the archive fresh."""
+        sources = source_signature(list_cache_sources(cache_dir, ['poll_cache.json']))
+        GameArchive(cache_dir / "games_archive.bin").write(games, sources, ['poll_cache.json'])
+
+        (cache_dir / "poll_cache.json").write_text('{"rankings": []}')
+        loaded, _, _ = load_archived_games(cache_dir)
+        assert loaded == games
+
+        (cache_dir / f"{games[0]['game_id']}.json").unlink()
+        loaded, _, _ = load_archived_games(cache_dir)
+        assert loaded is None
+
+    def test_corrupt_archive_is_ignored(self, tmp_path):
+        """Test that a truncated or foreign file is treated as missing."""
+        path = tmp_path / "games_archive.bin"
+        path.write_bytes(b"not an archive")
+        archive = GameArchive(path)
+        assert archive.load_all() is None
+        assert archive.load_game('x') is None
+
+    def test_signature_lists_sources(self, cache_dir):
+        """Test that the source signature leaves out files known to hold no game."""
+        assert len(source_signature(list_cache_sources(cache_dir))) == 4
+        sources = source_signature(list_cache_sources(cache_dir, ['poll_cache.json']))
+        assert len(sources) == 3
@@ -0,0 +1,158 @@
+"""Tests for basketball_processor.processors.game_frame module."""
+
+import pandas as pd
+
+from basketball_processor.processors.game_frame import GameFrame
+from basketball_processor.processors.milestones_processor import (
+    BlowoutGamesProcessor, MilestonesProcessor, OvertimeGamesProcessor,
+)
+from basketball_processor.processors.player_stats_processor import PlayerStatsProcessor
+from basketball_processor.processors.team_records_processor import GameLogProcessor, TeamRecordsProcessor
+from tests.box_scores import box_score_game, box_score_line
+
+
+def _player(name, player_id, pts, mp='30:00', starter=True):
+    return box_score_line(name, player_id, mp, pts=pts, trb=5, ast=3, fg=4, fga=9, ft=2, fta=2, starter=starter)
+
+
+def _game(date, away, home, away_score, home_score, away_players, home_players, **basic_info):
+    basic_info.setdefault('venue', f"{home} Arena, Durham, NC")
+    return box_score_game(
+        date, away, home, away_score, home_score, away_players, home_players, home_key='basic', **basic_info
+    )
+
+
+GAMES = [
+    _game('20250105', 'Duke', 'North Carolina', '80', 75,
+          [_player('Cooper Flagg', 'cflagg', 25), _player('No Name', '', 0, mp=''), {'name': ''}],
+          [_player('RJ Davis', 'rdavis', '20'), _player('Elliot Cadeau', '', 8, starter=False)],
+          attendance=21750),
+    _game('', 'North Carolina', 'Duke', 70, 91,
+          [_player('RJ Davis', 'rdavis', 30, mp='35:30')], [], neutral_site=True),
+]
+GAMES[1]['special_events'] = {
+    'overtime_game': True, 'overtime_periods': 2,
+    'blowout': True, 'blowout_margin': 21, 'blowout_winner': 'home',
+}
+
+
+class TestGameFrame:
+    """Tests for the flattened game and player line columns."""
+
+    def test_game_columns(self):
+        """Test that game fields are typed once: int scores, stored date strings."""
+        frame = GameFrame(GAMES)
+        dates, away_scores, away_teams, neutral, overtime_periods = frame.game_values(
+            'date_yyyymmdd', 'away_score', 'away_team', 'neutral_site', 'overtime_periods')
+        assert dates == ['20250105', '']
+        assert away_scores == [80, 70]
+        assert away_teams == ['Duke', 'North Carolina']
+        assert neutral == [False, True]
+        assert overtime_periods == [1, 2]
+
+    def test_player_line_columns(self):
+        """Test that named lines follow game order, away first, with typed stats."""
+        players, games, keys, pts, minutes, team_scores, opp_scores = GameFrame(GAMES).line_values(
+            'player', 'game', 'key', 'pts', 'minutes', 'team_score', 'opp_score')
+        assert players == ['Cooper Flagg', 'No Name', 'RJ Davis', 'Elliot Cadeau', 'RJ Davis']
+        assert games == [0, 0, 0, 0, 1]
+        assert keys == ['cflagg', 'No Name', 'rdavis', 'Elliot Cadeau', 'rdavis']
+        assert pts == [25, 0, 20, 8, 30]
+        assert minutes == [30.0, 0.0, 30.0, 30.0, 35.5]
+        assert team_scores == [80, 80, 75, 75, 70]
+        assert opp_scores == [75, 75, 80, 80, 91]
+
+    def test_nullable_attendance(self):
+        """Test that missing or unparseable attendance comes back as None."""
+        frame = GameFrame(GAMES)
+        assert frame.game_values('attendance') == [[21750, None]]
+        assert frame.game_values('attendance')[0] is frame.game_values('attendance')[0]
+
+        game = _game('20250105', 'Duke', 'Virginia', 80, 70, [], [], attendance='N/A')
+        assert GameFrame([game]).game_values('attendance') == [[None]]
+
+    def test_empty(self):
+        """Test that no games gives empty columns."""
+        frame = GameFrame([])
+        assert len(frame) == 0
+        assert frame.line_values('player') == [[]]
+
+
+class TestSharedFrame:
+    """Tests that processors give the same output from a shared frame."""
+
+    def test_processors_match_own_frame(self):
+        """Test that passing one frame to every processor matches building one each."""
+        frame = GameFrame(GAMES)
+
+        pd.testing.assert_frame_equal(
+            GameLogProcessor(GAMES, frame).create_game_log(), GameLogProcessor(GAMES).create_game_log())
+        pd.testing.assert_frame_equal(
+            OvertimeGamesProcessor(GAMES, frame).process_overtime_games(),
+            OvertimeGamesProcessor(GAMES).process_overtime_games())
+
+        shared = PlayerStatsProcessor(GAMES, frame).process_all_player_stats()
+        own = PlayerStatsProcessor(GAMES).process_all_player_stats()
+        for name in shared:
+            pd.testing.assert_frame_equal(shared[name], own[name])
+
+    def test_player_lines_flattened_on_demand(self):
+        """Test that game-level processors do not flatten the player lines."""
+        frame = GameFrame(GAMES)
+        TeamRecordsProcessor(GAMES, frame).process_team_records()
+        GameLogProcessor(GAMES, frame).create_game_log()
+        assert '_lines' not in vars(frame)
+        PlayerStatsProcessor(GAMES, frame).process_all_player_stats()
+        assert '_lines' in vars(frame)
+
+    def test_player_totals(self):
+        """Test player aggregation from the player line columns."""
+        players = PlayerStatsProcessor(GAMES).process_all_player_stats()['players'].set_index('Player')
+        assert players.loc['RJ Davis', 'Games'] == 2
+        assert players.loc['RJ Davis', 'Total PTS'] == 50
+        assert players.loc['RJ Davis', 'Wins'] == 0
+        # No minutes and no points: not counted as a game played
+        assert 'No Name' not in players.index
+
+    def test_game_tables(self):
+        """Test game-level processors read scores, dates and events from the game columns."""
+        game_log = GameLogProcessor(GAMES).create_game_log()
+        assert game_log['DateSort'].tolist() == ['20250105', '']
+        assert game_log['Notes'].tolist() == ['', '2OT, +21']
+        assert game_log['City'].tolist() == ['Durham', 'Durham']
+
+        blowouts = BlowoutGamesProcessor(GAMES).process_blowout_games()
+        assert blowouts[['Winner', 'Loser', 'Score']].values.tolist() == [['Duke', 'North Carolina', '70-91']]
+
+        records = TeamRecordsProcessor(GAMES).process_team_records()['team_records'].set_index('Team')
+        assert records.loc['Duke', 'Wins'] == 2
+        assert records.loc['North Carolina', 'PF'] == 145
+
+    def test_malformed_date_kept_verbatim(self):
+        """Test that processors sort and show the stored date string."""
+        games = [
+            _game('Jan 5 2025', 'Duke', 'Virginia', 60, 70, [_player('A', 'a', 10)], []),
+            _game('20250110', 'Duke', 'Clemson', 80, 70, [_player('A', 'a', 12)], []),
+        ]
+        game_log = GameLogProcessor(games).create_game_log()
+        assert sorted(game_log['DateSort']) == ['20250110', 'Jan 5 2025']
+
+        # 'Jan 5 2025' sorts after '20250110' as a string, so the streak ends on the loss
+        streaks = TeamRecordsProcessor(games).process_team_records()['team_streaks'].set_index('Team')
+        assert streaks.loc['Duke', 'Current Streak'] == 'L1'
+
+        game_rows = PlayerStatsProcessor(games).process_all_player_stats()['player_games']
+        assert sorted(game_rows['date_yyyymmdd']) == ['20250110', 'Jan 5 2025']
+
+    def test_gender_sources(self):
+        """Test that stats follow basic_info gender and milestones the top-level gender."""
+        game = _game('20250105', 'Duke', 'Virginia', 80, 70, [_player('A', 'a', 30)], [])
+        game['gender'] = 'W'
+        game['milestone_stats'] = {'thirty_point_games': [{'player': 'A', 'side': 'away'}]}
+
+        players = PlayerStatsProcessor([game]).process_all_player_stats()['players']
+        assert players['Gender'].tolist() == ['M']
+        records = TeamRecordsProcessor([game]).process_team_records()['team_records']
+        assert set(records['Gender']) == {'M'}
+        milestones = MilestonesProcessor([game]).process_all_milestones()
+        assert milestones['thirty_point_games']['Gender'].tolist() == ['W']
@@ -0,0 +1,122 @@
+"""Tests for basketball_processor.utils.http_client module."""
+
+import asyncio
+
+import pytest
+import requests
+
+from basketball_processor.utils import http_client
+from basketball_processor.utils.http_client import HttpClient, TokenBucket, get_host_bucket
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, headers=None, url=''):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = url
+
+
+class FakeSession:
+    """Session returning scripted responses (or raising scripted exceptions)."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.headers = {}
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome, url=url)
+
+
+@pytest.fixture(autouse=True)
+def unlimited_hosts(monkeypatch):
+    """Run without rate-limit or backoff waits."""
+    monkeypatch.setattr(http_client, 'DEFAULT_HOST_INTERVAL', 0.0)
+    monkeypatch.setattr(http_client, 'HOST_RATE_LIMITS', {'example.com': 0.0})
+    http_client.reset_host_buckets()
+    yield
+    http_client.reset_host_buckets()
+
+
+class TestTokenBucket:
+    """Tests for the per-host token bucket."""
+
+    def test_back_to_back_reservations_queue(self):
+        """Test that each reservation waits one interval longer than the last."""
+        bucket = TokenBucket(10.0)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(10.0, abs=0.1)
+        assert bucket.reserve() == pytest.approx(20.0, abs=0.1)
+
+    def test_zero_interval_never_waits(self):
+        """Test that an interval of 0 disables limiting."""
+        bucket = TokenBucket(0.0)
+        assert all(bucket.reserve() == 0.0 for _ in range(5))
+
+
+class TestHostBuckets:
+    """Tests for mapping URLs to shared buckets."""
+
+    def test_subdomains_share_bucket(self):
+        """Test that subdomains of a listed site share one bucket."""
+        assert get_host_bucket('https://a.example.com/x') is get_host_bucket('https://b.example.com/y')
+
+    def test_unlisted_hosts_get_own_bucket(self):
+        """Test that each unlisted host is limited independently."""
+        assert get_host_bucket('https://one.edu/') is not get_host_bucket('https://two.edu/')
+
+    def test_endpoint_bucket(self, monkeypatch):
+        """Test that a listed endpoint is paced apart from the rest of its site."""
+        monkeypatch.setattr(http_client, 'HOST_RATE_LIMITS', {'example.com': 1.0})
+        monkeypatch.setattr(http_client, 'ENDPOINT_RATE_LIMITS', {('example.com', '/scoreboard'): 0.5})
+
+        scoreboard = get_host_bucket('https://api.example.com/v2/scoreboard?dates=20250105')
+        summary = get_host_bucket('https://api.example.com/v2/summary?event=1')
+        assert scoreboard is not summary
+        assert scoreboard is get_host_bucket('https://www.example.com/scoreboard')
+        assert (scoreboard.interval, summary.interval) == (0.5, 1.0)
+
+
+class TestHttpClient:
+    """Tests for retries and the async API."""
+
+    def test_retries_server_errors(self):
+        """Test that 5xx responses are retried until one succeeds."""
+        session = FakeSession([503, 502, 200])
+        client = HttpClient(session=session, retries=2, backoff=0)
+        assert client.get('https://example.com/').status_code == 200
+        assert len(session.calls) == 3
+
+    def test_returns_last_response_when_retries_exhausted(self):
+        """Test that the final failing response is returned, not raised."""
+        session = FakeSession([429, 429])
+        client = HttpClient(session=session, retries=1, backoff=0)
+        assert client.get('https://example.com/').status_code == 429
+
+    def test_connection_error_raised_after_retries(self):
+        """Test that connection errors propagate once retries run out."""
+        session = FakeSession([requests.ConnectionError(), requests.ConnectionError()])
+        client = HttpClient(session=session, retries=1, backoff=0)
+        with pytest.raises(requests.ConnectionError):
+            client.get('https://example.com/')
+
+    def test_client_errors_not_retried(self):
+        """Test that a 404 is returned immediately."""
+        session = FakeSession([404])
+        client = HttpClient(session=session, retries=3, backoff=0)
+        assert client.get('https://example.com/').status_code == 404
+        assert len(session.calls) == 1
+
+    def test_aget_many_keeps_input_order(self):
+        """Test that concurrent fetches return results in input order."""
+        session = FakeSession([200, 200, 200])
+        client = HttpClient(session=session, backoff=0)
+        urls = [f'https://example.com/{i}' for i in range(3)]
+        responses = asyncio.run(client.aget_many(urls, concurrency=2))
+        assert [r.url for r in responses] == urls
@@ -0,0 +1,141 @@
+"""Tests for basketball_processor.main module."""
+
+import argparse
+
+import pytest
+
+from basketball_processor import main as main_module
+from basketball_processor.main import _iter_parallel_results, _non_negative_int, _positive_int
+from basketball_processor.utils import parse_cache as parse_cache_module
+from basketball_processor.utils.parse_cache import ParseCache
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Point the shared parse cache at a temporary directory."""
+    cache = ParseCache(cache_dir=tmp_path / "cache", manifest_path=tmp_path / "manifest.json")
+    monkeypatch.setattr(parse_cache_module, '_parse_cache', cache)
+    monkeypatch.setattr(main_module, 'BASE_DIR', tmp_path)
+    return cache
+
+
+def _write_html(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def _cached_file(cache, path, game_id):
+    """Write an HTML file and store a parsed game for it so it is a cache hit."""
+    file_path = _write_html(path, f"<html>{game_id}</html>")
+    content_hash = cache.get_content_hash(file_path)
+    cache.store(content_hash, 'M', {'game_id': game_id, 'basic_info': {}})
+    return file_path
+
+
+class TestNonNegativeInt:
+    """Tests for the --jobs argument type."""
+
+    def test_accepts_zero_and_positive(self):
+        """Test that 0 (all cores) and positive counts pass through."""
+        assert _non_negative_int('0') == 0
+        assert _non_negative_int('4') == 4
+
+    @pytest.mark.parametrize('value', ['-1', 'two', '1.5'])
+    def test_rejects_negative_and_non_integer(self, value):
+        """Test that negative or non-integer values are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            _non_negative_int(value)
+
+
+class TestPositiveInt:
+    """Tests for the --pbp-workers argument type."""
+
+    def test_accepts_positive(self):
+        """Test that counts of 1 or more pass through."""
+        assert _positive_int('1') == 1
+        assert _positive_int('8') == 8
+
+    @pytest.mark.parametrize('value', ['0', '-2', 'four'])
+    def test_rejects_zero_negative_and_non_integer(self, value):
+        """Test that zero, negative or non-integer values are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            _positive_int(value)
+
+
+class TestIterParallelResults:
+    """Tests for the process-pool parse path."""
+
+    def test_results_follow_input_order(self, cache, tmp_path):
+        """Test that cache hits and worker results are yielded in input order."""
+        file_paths = [
+            _cached_file(cache, tmp_path / "a.html", '20250101-a'),
+            _write_html(tmp_path / "b.html", "<html><body>not a box score</body></html>"),
+            _cached_file(cache, tmp_path / "c.html", '20250102-c'),
+            _write_html(tmp_path / "d.html", "<html><body>also not a box score</body></html>"),
+        ]
+
+        results = list(_iter_parallel_results(file_paths, 'M', jobs=2))
+
+        assert len(results) == 4
+        assert results[0]['game_id'] == '20250101-a'
+        assert results[0]['_from_cache'] is True
+        assert results[2]['game_id'] == '20250102-c'
+        assert [r.get('file') for r in (results[1], results[3])] == [file_paths[1], file_paths[3]]
+
+    def test_worker_errors_become_error_dicts(self, cache, tmp_path):
+        """Test that files failing in a worker yield error dicts instead of raising."""
+        file_paths = [
+            _write_html(tmp_path / "bad1.html", "<html></html>"),
+            _write_html(tmp_path / "bad2.html", "garbage"),
+        ]
+
+        results = list(_iter_parallel_results(file_paths, 'M', jobs=2))
+
+        assert [r['file'] for r in results] == file_paths
+        assert all(r['_error'] is True and r['error'] for r in results)
+
+    def test_worker_crash_is_reported_per_file(self, cache, tmp_path, monkeypatch):
+        """Test that an exception raised out of a worker future is caught for that file only."""
+        good = _cached_file(cache, tmp_path / "good.html", '20250103-good')
+        bad = _write_html(tmp_path / "bad.html", "<html></html>")
+
+        class CrashingFuture:
+            def result(self):
+                raise RuntimeError("worker died")
+
+        class CrashingExecutor:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, *args):
+                return CrashingFuture()
+
+        monkeypatch.setattr(main_module, 'ProcessPoolExecutor', CrashingExecutor)
+
+        results = list(_iter_parallel_results([bad, good], 'M', jobs=2))
+
+        assert results[0] == {'_error': True, 'file': bad, 'error': 'worker died'}
+        assert results[1]['game_id'] == '20250103-good'
+
+
+class TestLegacyCacheCleanup:
+    """Tests for filename-keyed cache entries left from before content hashing."""
+
+    def test_stale_legacy_entry_removed_on_hash_hit(self, cache, tmp_path, monkeypatch):
+        """Test that a legacy entry older than its HTML is dropped, not loaded twice."""
+        monkeypatch.setattr(main_module, 'CACHE_DIR', tmp_path / "cache")
+        file_path = _cached_file(cache, tmp_path / "game.html", '20250101-a')
+        legacy_path = tmp_path / "cache" / "game.json"
+        legacy_path.write_text('{"game_id": "20250101-a", "basic_info": {}}', encoding='utf-8')
+        main_module.os.utime(legacy_path, (0, 0))
+
+        result = main_module.process_html_file(file_path)
+
+        assert result['game_id'] == '20250101-a'
+        assert not legacy_path.exists()
@@ -0,0 +1,75 @@
+"""Tests for basketball_processor.engines.milestone_engine module."""
+
+import copy
+
+from basketball_processor.engines.milestone_engine import MilestoneEngine, PlayerLines
+from tests.box_scores import box_score_game, box_score_line
+
+
+_player = box_score_line
+
+
+def _game(away_players, home_players):
+    game = box_score_game('20250105', 'Away', 'Home', 70, 65, away_players, home_players, home_key='basic')
+    game['box_score']['away']['totals'] = {'pts': 70, 'fga': 60, 'fta': 20, 'orb': 10, 'tov': 12}
+    return game
+
+
+GAMES = [
+    _game(
+        [
+            _player('Triple', pts=22, trb=11, ast=10, stl=2, blk=1, fg=9, fga=15, ft=4, fta=4, tov=0),
+            _player('Shooter', pts=31, trb=3, ast=2, fg3=7, fg3a=7, fg=11, fga=17, ft=2, fta=3, tov=2),
+            _player('Bench', pts='', trb=None, mp='4:00'),
+        ],
+        [
+            _player('Near', pts=18, trb=9, ast=3, blk=5, stl=3, fg=8, fga=12, fg_pct='.667', ft=2, fta=2, tov=1),
+            _player('Perfect', pts=16, trb=2, fg=6, fga=6, ft=4, fta=4, tov=0, mp=25),
+        ],
+    ),
+    _game([], [_player('Big', pts=20, trb=20, ast=5, blk=10, stl=8, fg=8, fga=10, ft=4, fta=6, tov=3)]),
+    _game([], []),
+]
+
+
+class TestBatchMilestones:
+    """Tests for batch milestone detection over a stats matrix."""
+
+    def test_matches_per_game_engine(self):
+        """Test that batch mode gives the same game data as process() per game."""
+        expected = [MilestoneEngine(copy.deepcopy(g)).process() for g in GAMES]
+        assert MilestoneEngine.process_batch(copy.deepcopy(GAMES)) == expected
+
+    def test_milestone_details(self):
+        """Test the entries and detail strings produced by the rule table."""
+        milestones = MilestoneEngine(copy.deepcopy(GAMES[0])).process()['milestone_stats']
+
+        def details(key):
+            return [(m['player'], m['detail']) for m in milestones[key]]
+
+        assert details('triple_doubles') == [('Triple', 'PTS:22 / REB:11 / AST:10')]
+        assert details('near_double_doubles') == [('Near', '18 pts, 9 reb (needed 1 more reb)')]
+        assert details('twenty_point_games') == [('Triple', '22 points'), ('Shooter', '31 points')]
+        assert details('perfect_from_three') == [('Shooter', '7/7 3PT (100%)')]
+        assert details('defensive_monster') == [('Near', '5 blocks, 3 steals (8 combined)')]
+        assert details('hot_shooting_games')[-1] == ('Near', '8/12 FG (66.7%)')
+        assert details('efficient_scoring')[0] == ('Triple', '22 pts on 65.6% TS')
+        assert details('zero_turnover_games') == [('Triple', '30 min, 0 turnovers'), ('Perfect', '25 min, 0 turnovers')]
+        # 4/4 free throws is below the perfect-FT minimum
+        assert milestones['perfect_ft_games'] == []
+
+    def test_entries_per_game(self):
+        """Test that entries land on the game the player line came from."""
+        games = MilestoneEngine.process_batch(copy.deepcopy(GAMES))
+        assert [m['player'] for m in games[0]['milestone_stats']['triple_doubles']] == ['Triple']
+        assert [m['player'] for m in games[1]['milestone_stats']['ten_block_games']] == ['Big']
+        assert games[1]['milestone_stats']['quadruple_double'] == []
+        assert not any(games[2]['milestone_stats'].values())
+
+    def test_player_lines_matrix(self):
+        """Test that lines follow game order with away players first and typed stats."""
+        lines = PlayerLines(GAMES)
+        assert len(lines) == 6
+        assert lines.game_index == [0, 0, 0, 0, 0, 1]
+        assert lines.stats['pts'].tolist() == [22, 31, 0, 18, 16, 20]
+        assert lines.minutes.tolist() == [30.0, 30.0, 4.0, 30.0, 25.0, 30.0]
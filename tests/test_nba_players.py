@@ -0,0 +1,160 @@
+"""Tests for basketball_processor.utils.nba_players module."""
+
+import json
+
+import pytest
+
+from basketball_processor.utils import nba_players
+from basketball_processor.utils.nba_players import (
+    ProStatusStore,
+    get_nba_status_batch,
+    resolve_nba_status_concurrent,
+)
+
+
+@pytest.fixture
+def cache_files(tmp_path, monkeypatch):
+    """Point the lookup cache and confirmed file at a temp directory."""
+    monkeypatch.setattr(nba_players, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(nba_players, 'DATA_DIR', tmp_path)
+    monkeypatch.setattr(nba_players, 'NBA_LOOKUP_CACHE_FILE', tmp_path / 'nba_lookup_cache.json')
+    monkeypatch.setattr(nba_players, 'NBA_CONFIRMED_FILE', tmp_path / 'nba_confirmed.json')
+    monkeypatch.setattr(nba_players, '_new_lookup_scraper', lambda: None)
+    return tmp_path
+
+
+def _fake_lookups(monkeypatch, pros=(), failures=(), calls=None):
+    """Replace both host stages with offline fakes."""
+    def scan(player_id, scraper, notes):
+        if calls is not None:
+            calls.append(player_id)
+        if player_id in failures:
+            raise ConnectionError("offline")
+        scan = {'result': {'sr_page_exists': True}}
+        if player_id in pros:
+            scan['intl_url'] = f'https://www.basketball-reference.com/international/players/{player_id}.html'
+        return scan
+
+    def resolve(player_id, scan, scraper, notes):
+        result = scan['result']
+        if 'intl_url' in scan:
+            result['intl_url'] = scan['intl_url']
+        return result
+
+    monkeypatch.setattr(nba_players, '_scan_sr_page', scan)
+    monkeypatch.setattr(nba_players, '_resolve_pro_links', resolve)
+
+
+class TestProStatusStore:
+    """Tests for the shared, write-behind status file store."""
+
+    def test_loaded_once_and_shared(self, tmp_path):
+        """Test that the file is parsed once and every caller gets the same dict."""
+        path = tmp_path / 'status.json'
+        path.write_text(json.dumps({'a': None}))
+        store = ProStatusStore(path, 'test cache')
+
+        data = store.data()
+        path.write_text(json.dumps({'changed': True}))
+
+        assert store.data() is data
+        assert data == {'a': None}
+
+    def test_flush_writes_only_when_dirty(self, tmp_path):
+        """Test that updates are written once, on flush."""
+        path = tmp_path / 'status.json'
+        store = ProStatusStore(path, 'test cache')
+
+        store.data()['a'] = {'nba_url': 'x'}
+        assert not store.flush()
+        assert not path.exists()
+
+        store.mark_dirty()
+        assert store.flush()
+        assert json.loads(path.read_text()) == {'a': {'nba_url': 'x'}}
+        assert not store.dirty and not store.flush()
+
+
+class TestResolveNbaStatusConcurrent:
+    """Tests for the two-lane lookup runner."""
+
+    def test_results_cached_and_confirmed(self, cache_files, monkeypatch):
+        """Test that every lookup is cached and pros are added to the confirmed file."""
+        _fake_lookups(monkeypatch, pros={'pro-1'})
+        ids = [f'player-{i}' for i in range(5)] + ['pro-1']
+
+        results = resolve_nba_status_concurrent(ids, checkpoint_every=2, show_progress=False)
+
+        assert set(results) == set(ids)
+        assert results['pro-1']['intl_url'].endswith('pro-1.html')
+        cache = json.loads((cache_files / 'nba_lookup_cache.json').read_text())
+        assert set(cache) == set(ids)
+        confirmed = json.loads((cache_files / 'nba_confirmed.json').read_text())
+        assert confirmed['pro-1']['first_detected_as'] == 'international'
+
+    def test_failed_lookups_retried_next_run(self, cache_files, monkeypatch):
+        """Test that players whose lookup failed are not cached, so a rerun resumes with them."""
+        _fake_lookups(monkeypatch, failures={'player-1'})
+        resolve_nba_status_concurrent(['player-0', 'player-1'], show_progress=False)
+
+        calls = []
+        _fake_lookups(monkeypatch, calls=calls)
+        get_nba_status_batch(['player-0', 'player-1'])
+
+        assert calls == ['player-1']
+
+    def test_stops_quietly_when_executors_shut_down(self, cache_files, monkeypatch):
+        """Test that a refused submit at interpreter exit keeps finished lookups."""
+        _fake_lookups(monkeypatch)
+
+        class ExitingExecutor(nba_players.ThreadPoolExecutor):
+            """Refuses Basketball Reference work after the first player, like at exit."""
+            def submit(self, fn, *args, **kwargs):
+                if self._thread_name_prefix == 'br-lookup' and args[0] != 'player-0':
+                    raise RuntimeError('cannot schedule new futures after interpreter shutdown')
+                return super().submit(fn, *args, **kwargs)
+
+        monkeypatch.setattr(nba_players, 'ThreadPoolExecutor', ExitingExecutor)
+        ids = [f'player-{i}' for i in range(4)]
+
+        results = resolve_nba_status_concurrent(ids, show_progress=False)
+
+        assert 'player-0' in results
+        assert len(results) < len(ids)
+        cache = json.loads((cache_files / 'nba_lookup_cache.json').read_text())
+        assert set(cache) == set(results)
+
+
+class TestGetNbaStatusBatch:
+    """Tests for batch lookups through the concurrent runner."""
+
+    def test_new_players_resolved_before_returning(self, cache_files, monkeypatch):
+        """Test that uncached players are looked up and returned in the same call."""
+        _fake_lookups(monkeypatch, pros={'pro-1'})
+
+        results = get_nba_status_batch(['pro-1', 'player-0'], max_fetch=999)
+
+        assert results['pro-1']['intl_url'].endswith('pro-1.html')
+        assert 'player-0' in results
+
+    def test_cache_only_and_max_fetch(self, cache_files, monkeypatch):
+        """Test that max_fetch=-1 never fetches and a positive max_fetch caps the lookups."""
+        calls = []
+        _fake_lookups(monkeypatch, calls=calls)
+
+        assert get_nba_status_batch(['player-0', 'player-1'], max_fetch=-1) == {}
+        assert calls == []
+
+        get_nba_status_batch(['player-0', 'player-1'], max_fetch=1)
+        assert calls == ['player-0']
+
+    def test_background_returns_cached_only(self, cache_files, monkeypatch):
+        """Test that background mode returns immediately and fills the cache afterwards."""
+        _fake_lookups(monkeypatch, pros={'pro-1'})
+
+        results = get_nba_status_batch(['pro-1'], max_fetch=999, background=True)
+
+        assert results == {}
+        assert nba_players.background_lookups_started()
+        assert nba_players.wait_for_background_lookups(timeout=10)
+        assert get_nba_status_batch(['pro-1'], max_fetch=-1)['pro-1']['intl_url']
@@ -0,0 +1,102 @@
+"""Tests for basketball_processor.utils.parse_cache module."""
+
+import json
+
+import pytest
+
+from basketball_processor.utils import parse_cache as parse_cache_module
+from basketball_processor.utils.parse_cache import ParseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A ParseCache rooted in a temporary directory."""
+    return ParseCache(cache_dir=tmp_path / "cache")
+
+
+def _write_html(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+class TestParseCache:
+    """Tests for the content-hash parse cache."""
+
+    def test_copies_share_hash(self, cache, tmp_path):
+        """Test that two files with identical bytes map to the same entry."""
+        a = _write_html(tmp_path / "a.html", "<html>box score</html>")
+        b = _write_html(tmp_path / "b.html", "<html>box score</html>")
+        assert cache.get_content_hash(a) == cache.get_content_hash(b)
+
+    def test_store_and_load_roundtrip(self, cache, tmp_path):
+        """Test that a stored game loads back with its parser stamp."""
+        path = _write_html(tmp_path / "a.html", "<html>box score</html>")
+        content_hash = cache.get_content_hash(path)
+        cache.store(content_hash, 'M', {'game_id': '20250101-duke', '_from_cache': True})
+
+        assert cache.has_entry(content_hash, 'M')
+        assert not cache.has_entry(content_hash, 'W')
+        loaded = cache.load(content_hash, 'M')
+        assert loaded['game_id'] == '20250101-duke'
+        assert '_from_cache' not in loaded
+
+    def test_parser_version_bump_invalidates(self, cache, tmp_path, monkeypatch):
+        """Test that entries from an older parser version are treated as misses."""
+        path = _write_html(tmp_path / "a.html", "<html>box score</html>")
+        content_hash = cache.get_content_hash(path)
+        cache.store(content_hash, 'M', {'game_id': 'x'})
+
+        monkeypatch.setattr(parse_cache_module, 'PARSER_VERSION', parse_cache_module.PARSER_VERSION + 1)
+        assert not cache.has_entry(content_hash, 'M')
+        assert cache.load(content_hash, 'M') is None
+
+    def test_manifest_skips_rehash(self, cache, tmp_path, monkeypatch):
+        """Test that unchanged files are not re-hashed once in the manifest."""
+        path = _write_html(tmp_path / "a.html", "<html>box score</html>")
+        content_hash = cache.get_content_hash(path)
+        cache.save_manifest()
+
+        def fail_hash(content):
+            raise AssertionError("file was re-hashed")
+
+        monkeypatch.setattr(parse_cache_module, 'hash_html_bytes', fail_hash)
+        reloaded = ParseCache(cache_dir=cache.cache_dir)
+        assert reloaded.get_content_hash(path) == content_hash
+
+    def test_edited_file_drops_old_entry(self, cache, tmp_path):
+        """Test that editing a file removes its now-orphaned cache entry."""
+        html = tmp_path / "a.html"
+        path = _write_html(html, "<html>old</html>")
+        old_hash = cache.get_content_hash(path)
+        cache.store(old_hash, 'M', {'game_id': 'x'})
+
+        _write_html(html, "<html>new content</html>")
+        new_hash = cache.get_content_hash(path)
+        assert new_hash != old_hash
+        assert not cache.entry_path(old_hash, 'M').exists()
+
+    @pytest.mark.parametrize('indent', [None, 2, 4])
+    def test_has_entry_reads_stamp_in_any_layout(self, cache, indent):
+        """Test that has_entry decodes the leading stamp however the JSON is spaced."""
+        content_hash = 'd' * 64
+        meta = {'parser_version': parse_cache_module.PARSER_VERSION, 'content_hash': content_hash}
+        path = cache.entry_path(content_hash, 'M')
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({'_cache_meta': meta, 'game_id': 'x'}, indent=indent))
+        assert cache.has_entry(content_hash, 'M')
+
+        meta['parser_version'] += 10
+        path.write_text(json.dumps({'_cache_meta': meta, 'game_id': 'x'}, indent=indent))
+        assert not cache.has_entry(content_hash, 'M')
+
+    def test_has_entry_without_leading_stamp(self, cache):
+        """Test that entries whose stamp is not first fall back to a full load."""
+        content_hash = 'e' * 64
+        path = cache.entry_path(content_hash, 'M')
+        path.parent.mkdir(parents=True)
+        meta = {'parser_version': parse_cache_module.PARSER_VERSION, 'content_hash': content_hash}
+        path.write_text(json.dumps({'game_id': 'x', 'box_score': {}, '_cache_meta': meta}))
+        assert cache.has_entry(content_hash, 'M')
+
+        path.write_text('{"_cache_meta": {"parser_version": ')
+        assert not cache.has_entry(content_hash, 'M')
@@ -0,0 +1,81 @@
+"""
+Parity tests for the parser fast paths.
+
+Every box score in html_games/ must parse to identical game_data with the
+lxml tree builder and with html.parser, and with and without the region
+slicing pre-pass.
+"""
+
+import json
+
+import pytest
+
+from basketball_processor.main import _detect_gender
+from basketball_processor.parsers import backend
+from basketball_processor.parsers.html_parser import parse_sports_reference_boxscore
+from basketball_processor.parsers.sidearm_parser import parse_sidearm_boxscore, is_sidearm_format
+from basketball_processor.utils.constants import DEFAULT_INPUT_DIR
+
+HTML_FILES = sorted(DEFAULT_INPUT_DIR.glob("*.html")) if DEFAULT_INPUT_DIR.exists() else []
+
+
+@pytest.fixture(autouse=True)
+def offline_pbp(monkeypatch):
+    """Keep parsing off the network: no ESPN/SIDEARM play-by-play fetches."""
+    from basketball_processor.utils import espn_pbp_scraper, sidearm_scraper
+    monkeypatch.setattr(espn_pbp_scraper, 'get_espn_pbp_for_game', lambda *a, **k: None)
+    monkeypatch.setattr(sidearm_scraper, 'get_sidearm_pbp_for_game', lambda *a, **k: None)
+    yield
+    backend.set_parser_backend('auto')
+
+
+def _parse(path, backend_name, slice_regions=True):
+    backend.set_parser_backend(backend_name)
+    html = path.read_text(encoding='utf-8', errors='replace')
+    gender = _detect_gender(str(path), 'M')
+    if is_sidearm_format(html):
+        game_data = parse_sidearm_boxscore(html, gender)
+    else:
+        game_data = parse_sports_reference_boxscore(html, gender, slice_regions=slice_regions)
+    return json.dumps(game_data, sort_keys=True, default=str)
+
+
+class TestParserBackendSelection:
+    """Tests for backend selection and fallback."""
+
+    def test_unknown_backend_rejected(self):
+        """Test that an unknown backend name raises ValueError."""
+        with pytest.raises(ValueError):
+            backend.set_parser_backend('html5lib')
+
+    def test_html_parser_forced(self):
+        """Test that html.parser can always be selected explicitly."""
+        backend.set_parser_backend('html.parser')
+        assert backend.resolve_parser_backend() == 'html.parser'
+
+    def test_lxml_falls_back_when_missing(self, monkeypatch):
+        """Test that requesting lxml without it installed uses html.parser."""
+        monkeypatch.setattr(backend, '_lxml_available', lambda: False)
+        backend.set_parser_backend('lxml')
+        assert backend.resolve_parser_backend() == 'html.parser'
+
+
+@pytest.mark.skipif(not HTML_FILES, reason="No box score HTML files available")
+class TestParserBackendParity:
+    """Tests that lxml and html.parser produce identical game data."""
+
+    @pytest.mark.parametrize('path', HTML_FILES, ids=lambda p: p.name[:60])
+    def test_lxml_matches_html_parser(self, path):
+        """Test that one box score parses identically under both backends."""
+        pytest.importorskip('lxml')
+        assert _parse(path, 'lxml') == _parse(path, 'html.parser')
+
+
+@pytest.mark.skipif(not HTML_FILES, reason="No box score HTML files available")
+class TestRegionSlicingParity:
+    """Tests that the region slicing pre-pass does not change game data."""
+
+    @pytest.mark.parametrize('path', HTML_FILES, ids=lambda p: p.name[:60])
+    def test_sliced_matches_full_page(self, path):
+        """Test that one box score parses identically from sliced regions."""
+        assert _parse(path, 'html.parser') == _parse(path, 'html.parser', slice_regions=False)
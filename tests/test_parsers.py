@@ -1,12 +1,17 @@
 """Tests for basketball_processor.parsers module."""
 
 import pytest
+from bs4 import BeautifulSoup
 
 from basketball_processor.parsers import (
     HTMLParsingError,
     validate_html_content,
     validate_game_data,
 )
+from basketball_processor.parsers import html_parser
+from basketball_processor.parsers.html_parser import extract_four_factors
+from basketball_processor.parsers.table_locator import TableLocator
+from basketball_processor.parsers.region_slicer import slice_boxscore_regions
 
 
 class TestValidateHtmlContent:
@@ -160,3 +165,104 @@ class TestHTMLParsingError:
     def test_exception_inheritance(self):
         """Test that HTMLParsingError is a proper Exception."""
         assert issubclass(HTMLParsingError, Exception)
+
+
+class TestTableLocator:
+    """Tests for the shared table[id] locator."""
+
+    HTML = (
+        '<html><body>'
+        '<table id="box-score-basic-duke"><tr><td>1</td></tr></table>'
+        '<table id="box-score-basic-unc"><tr><td>2</td></tr></table>'
+        '<!-- <table id="line-score"><tr><td>Duke</td></tr></table> -->'
+        '<!-- <div id="pbp-note">no table here</div> -->'
+        '</body></html>'
+    )
+
+    def test_document_tables_in_order(self):
+        """Test that uncommented tables are indexed in document order."""
+        locator = TableLocator(BeautifulSoup(self.HTML, 'html.parser'))
+        assert locator.table_ids == ['box-score-basic-duke', 'box-score-basic-unc']
+        assert locator.table('box-score-basic-unc').get_text() == '2'
+
+    def test_commented_table_found_once(self):
+        """Test that commented-out tables are found and each comment is parsed once."""
+        locator = TableLocator(BeautifulSoup(self.HTML, 'html.parser'))
+        assert locator.table('line-score') is None
+        first = locator.find('line-score')
+        assert first is not None and first.get_text() == 'Duke'
+        assert locator.find('line-score') is first
+
+    def test_comment_marker_must_match(self):
+        """Test that comments without the marker are not searched."""
+        locator = TableLocator(BeautifulSoup(self.HTML, 'html.parser'))
+        assert locator.find('line-score', comment_marker='id="pbp"') is None
+        assert locator.find('missing') is None
+
+
+class TestExtractFourFactors:
+    """Tests for four factors extraction through the shared locator."""
+
+    HTML = (
+        '<html><body><!-- <table id="four-factors">'
+        '<tr><th>Team</th><th data-stat="pace">Pace</th></tr>'
+        '<tr><th><a href="/duke">Duke</a></th><td data-stat="pace">68.2</td><td data-stat="efg_pct">.541</td></tr>'
+        '<tr><th><a href="/unc">UNC</a></th><td data-stat="pace">68.2</td><td data-stat="efg_pct"></td></tr>'
+        '</table> --></body></html>'
+    )
+
+    def test_reads_commented_table_with_locator(self, monkeypatch):
+        """Test that a passed locator is used and the commented table is read."""
+        locator = TableLocator(BeautifulSoup(self.HTML, 'html.parser'))
+
+        def fail(soup):
+            raise AssertionError("locator was rebuilt")
+
+        monkeypatch.setattr(html_parser, 'TableLocator', fail)
+        assert extract_four_factors(None, locator=locator) == {
+            'away': {'pace': 68.2, 'efg_pct': 0.541},
+            'home': {'pace': 68.2, 'efg_pct': None},
+        }
+
+    def test_missing_table(self):
+        """Test that pages without the table give empty factors."""
+        soup = BeautifulSoup('<html></html>', 'html.parser')
+        assert extract_four_factors(soup) == {'away': {}, 'home': {}}
+
+
+class TestSliceBoxscoreRegions:
+    """Tests for the box score region slicing pre-pass."""
+
+    PAGE = (
+        '<html><head><title>Duke vs. UNC Box Score</title>'
+        '<link rel="canonical" href="https://example.com/box.html">'
+        '<script>var s = "<table id=\'line-score\'>";</script></head><body>'
+        '<div class="nav"><div>menu</div></div>'
+        '<div class="scorebox"><div><a href="/cbb/schools/duke/">Duke</a></div></div>'
+        '<table id="box-score-basic-duke"><tbody><tr><td>1</td></tr></tbody></table>'
+        '<table id="box-score-basic-unc"><tbody><tr><td>2</td></tr></tbody></table>'
+        '<table id="ads"><tr><td>ad</td></tr></table>'
+        '<!-- <div><table id="line-score"><tr><td>Duke</td></tr></table></div> -->'
+        '</body></html>'
+    )
+
+    def test_keeps_only_needed_regions(self):
+        """Test that wanted regions survive and page chrome is dropped."""
+        sliced = slice_boxscore_regions(self.PAGE)
+        assert '<title>Duke vs. UNC Box Score</title>' in sliced
+        assert 'rel="canonical"' in sliced
+        assert 'class="scorebox"' in sliced
+        assert 'box-score-basic-unc' in sliced
+        assert 'id="ads"' not in sliced
+        assert 'menu' not in sliced
+        assert '<script' not in sliced
+
+    def test_commented_tables_stay_commented(self):
+        """Test that tables found in comments are kept inside comments."""
+        sliced = slice_boxscore_regions(self.PAGE)
+        assert '<!--<table id="line-score"><tr><td>Duke</td></tr></table>-->' in sliced
+
+    def test_falls_back_without_box_scores(self):
+        """Test that pages missing box score tables return None."""
+        page = self.PAGE.replace('box-score-basic-unc', 'other')
+        assert slice_boxscore_regions(page) is None
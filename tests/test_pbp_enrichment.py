@@ -0,0 +1,111 @@
+"""Tests for basketball_processor.utils.pbp_enrichment module."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from basketball_processor.utils import parse_cache as parse_cache_module
+from basketball_processor.utils import pbp_enrichment
+from basketball_processor.utils.parse_cache import ParseCache
+from basketball_processor.utils.pbp_enrichment import (
+    PBP_ATTEMPT_KEY,
+    SOURCE_FILE_KEY,
+    enrich_games_with_pbp,
+    needs_pbp_enrichment,
+)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A temporary parse cache used as the process-wide cache."""
+    cache = ParseCache(cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(parse_cache_module, '_parse_cache', cache)
+    return cache
+
+
+def _stored_game(cache, content_hash, game_id):
+    game = {'game_id': game_id, 'gender': 'M', 'basic_info': {}}
+    cache.store(content_hash, 'M', game)
+    return game
+
+
+class TestNeedsPbpEnrichment:
+    """Tests for deciding which games need a lookup."""
+
+    def test_analyzed_game_skipped(self):
+        """Test that games with analysis are not fetched again."""
+        assert not needs_pbp_enrichment({'espn_pbp_analysis': {}})
+
+    def test_recent_attempt_skipped_until_retry(self):
+        """Test that failed lookups are retried only after PBP_RETRY_DAYS."""
+        game = {PBP_ATTEMPT_KEY: '20250110'}
+        assert not needs_pbp_enrichment(game, today=datetime(2025, 1, 12))
+        assert needs_pbp_enrichment(game, today=datetime(2025, 2, 1))
+
+
+class TestEnrichGamesWithPbp:
+    """Tests for the enrichment stage."""
+
+    @staticmethod
+    def _fail(game):
+        raise AssertionError("game was fetched again")
+
+    def test_results_written_back_to_cache(self, cache, monkeypatch):
+        """Test that enriched and missing games are persisted to their entries."""
+        found = _stored_game(cache, 'a' * 64, 'found')
+        missing = _stored_game(cache, 'b' * 64, 'missing')
+        monkeypatch.setattr(
+            pbp_enrichment, 'fetch_pbp_for_game',
+            lambda game: {'plays': [1]} if game['game_id'] == 'found' else None
+        )
+        monkeypatch.setattr(
+            pbp_enrichment, 'apply_pbp_analysis',
+            lambda game, pbp: bool(pbp) and game.update(espn_pbp_analysis={'ok': True}) is None
+        )
+
+        counts = enrich_games_with_pbp([found, missing], workers=2)
+
+        assert counts == {'enriched': 1, 'missing': 1, 'skipped': 0}
+        assert cache.load('a' * 64, 'M')['espn_pbp_analysis'] == {'ok': True}
+        assert PBP_ATTEMPT_KEY in cache.load('b' * 64, 'M')
+
+    def test_sidearm_womens_game_written_to_its_own_entry(self, cache, monkeypatch):
+        """Test that a game without a top-level gender keeps its parsed gender."""
+        # SIDEARM games only carry gender in basic_info
+        game = {'game_id': 'sidearm', 'basic_info': {'gender': 'W'}}
+        cache.store('d' * 64, 'W', game)
+        monkeypatch.setattr(pbp_enrichment, 'fetch_pbp_for_game', lambda game: None)
+
+        assert enrich_games_with_pbp([game])['missing'] == 1
+        assert PBP_ATTEMPT_KEY in cache.load('d' * 64, 'W')
+        assert not cache.entry_path('d' * 64, 'M').exists()
+
+        # The next run loads the stamped entry and does not look it up again
+        monkeypatch.setattr(pbp_enrichment, 'fetch_pbp_for_game', self._fail)
+        assert enrich_games_with_pbp([cache.load('d' * 64, 'W')])['skipped'] == 1
+
+    def test_resumes_without_refetching(self, cache, monkeypatch):
+        """Test that a second run skips games already handled."""
+        game = _stored_game(cache, 'c' * 64, 'done')
+        game['espn_pbp_analysis'] = {}
+
+        monkeypatch.setattr(pbp_enrichment, 'fetch_pbp_for_game', self._fail)
+        assert enrich_games_with_pbp([game])['skipped'] == 1
+
+    def test_source_file_games_written_back(self, cache, tmp_path, monkeypatch):
+        """Test that games from the ESPN cache save their result to their own file."""
+        source = tmp_path / "401700000.json"
+        source.write_text(json.dumps({'game_id': 'espn', 'basic_info': {}}))
+        game = {'game_id': 'espn', 'gender': 'M', 'basic_info': {}, SOURCE_FILE_KEY: str(source)}
+        monkeypatch.setattr(pbp_enrichment, 'fetch_pbp_for_game', lambda game: None)
+
+        assert enrich_games_with_pbp([game])['missing'] == 1
+        stored = json.loads(source.read_text())
+        assert stored[PBP_ATTEMPT_KEY] == game[PBP_ATTEMPT_KEY]
+        assert SOURCE_FILE_KEY not in stored
+
+        # The next run loads the stamp from the file and does not look it up again
+        monkeypatch.setattr(pbp_enrichment, 'fetch_pbp_for_game', self._fail)
+        stored[SOURCE_FILE_KEY] = str(source)
+        assert enrich_games_with_pbp([stored])['skipped'] == 1
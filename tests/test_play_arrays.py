@@ -0,0 +1,93 @@
+"""Tests for basketball_processor.utils.play_arrays module."""
+
+from basketball_processor.parsers.play_by_play_parser import (
+    count_lead_changes,
+    extract_scoring_runs,
+    get_largest_lead,
+)
+from basketball_processor.utils.play_arrays import AWAY, HOME, PlayArrays, seconds_remaining
+
+
+def _sr_plays(scores):
+    return [
+        {'half': 1, 'time': f'{19 - i}:00.0', 'away_action': 'x', 'home_action': '',
+         'score_away': away, 'score_home': home}
+        for i, (away, home) in enumerate(scores)
+    ]
+
+
+# Away 7-0 run, home 10-0 run, both score on one row, then trade leads
+SCORES = [(0, 0), (2, 0), (5, 0), (7, 0), (7, 3), (7, 5), (7, 7), (7, 10),
+          (9, 11), (11, 11), (13, 11), (13, 13), (13, 15), (16, 15)]
+
+
+class TestPlayArrays:
+    """Tests for vectorized margin and run analytics."""
+
+    def test_columns(self):
+        """Test that scores, margin, side and points are typed per play."""
+        arrays = PlayArrays.from_sr_plays(_sr_plays(SCORES[:3]))
+        assert arrays.margin.tolist() == [0, 2, 5]
+        assert arrays.side.tolist() == [AWAY, AWAY, AWAY]
+        assert arrays.points.tolist() == [0, 2, 3]
+        assert arrays.seconds.tolist() == [1140, 1080, 1020]
+
+        espn = PlayArrays.from_espn_plays([
+            {'away_score': 0, 'home_score': 2, 'period': 1, 'team_side': 'home', 'score_value': 2},
+            {'away_score': 3, 'home_score': 2, 'period': 2, 'team_side': 'away', 'score_value': 3},
+        ])
+        assert espn.margin.tolist() == [-2, 1]
+        assert espn.period.tolist() == [1, 2]
+        assert espn.side.tolist() == [HOME, AWAY]
+        assert espn.points.tolist() == [2, 3]
+
+    def test_lead_changes_skip_ties(self):
+        """Test that only direct flips between consecutive plays count."""
+        arrays = PlayArrays.from_sr_plays(_sr_plays(SCORES))
+        # 7-7 tie breaks the first flip, 11-11 and 13-13 the others; 13-15 -> 16-15 flips
+        assert arrays.lead_changes() == 1
+
+    def test_largest_lead_and_deficit(self):
+        """Test that the first play with the largest margin is found."""
+        arrays = PlayArrays.from_sr_plays(_sr_plays(SCORES))
+        assert arrays.largest_lead_index(AWAY) == 3
+        assert arrays.max_deficit_index(AWAY) == 7
+        assert PlayArrays.from_sr_plays(_sr_plays([(0, 0), (2, 0)])).largest_lead_index(HOME) is None
+
+    def test_scoring_runs(self):
+        """Test that run segments break when both teams score."""
+        runs = PlayArrays.from_sr_plays(_sr_plays(SCORES)).scoring_runs(min_points=5)
+        assert [(r.side, r.points, r.start, r.end) for r in runs] == [(AWAY, 7, 1, 3), (HOME, 10, 4, 7)]
+
+    def test_seconds_remaining(self):
+        """Test clock parsing."""
+        assert seconds_remaining('5:30') == 330
+        assert seconds_remaining('') == -1
+
+
+class TestPlayByPlayAnalytics:
+    """Tests for the play-by-play parser analytics built on PlayArrays."""
+
+    def test_scoring_runs(self):
+        """Test that runs are reported with times and starting score."""
+        plays = _sr_plays(SCORES)
+        assert extract_scoring_runs(plays, min_run=8) == [{
+            'team': 'home', 'points': 10, 'start_time': '15:00.0',
+            'end_time': '12:00.0', 'start_score': '7-0',
+        }]
+
+    def test_lead_summary(self):
+        """Test lead changes and largest leads with shared arrays."""
+        plays = _sr_plays(SCORES)
+        arrays = PlayArrays.from_sr_plays(plays)
+        assert count_lead_changes(plays, arrays=arrays) == 1
+        assert get_largest_lead(plays, arrays=arrays) == {
+            'away': {'lead': 7, 'score': '7-0', 'time': '16:00.0', 'half': 1},
+            'home': {'lead': 3, 'score': '7-10', 'time': '12:00.0', 'half': 1},
+        }
+
+    def test_empty(self):
+        """Test that no plays gives empty results."""
+        assert extract_scoring_runs([]) == []
+        assert count_lead_changes([]) == 0
+        assert get_largest_lead([])['away']['lead'] == 0
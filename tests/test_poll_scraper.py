@@ -0,0 +1,98 @@
+"""Tests for basketball_processor.scrapers.poll_scraper module."""
+
+import json
+import random
+
+import pytest
+
+from basketball_processor.scrapers import poll_scraper
+from basketball_processor.scrapers.poll_scraper import PollIndex, get_poll_index
+from basketball_processor.utils import constants
+
+
+ALIASES = {'UConn': 'Connecticut', 'Ole Miss': 'Mississippi', 'Miami (FL)': 'Miami', 'Miami FL': 'Miami'}
+
+
+def _linear_rank(all_polls, aliases, team_name, game_date, season):
+    """Reference lookup: latest poll on or before the date, then exact, alias and reverse-alias scans."""
+    season_polls = all_polls.get(season)
+    if not season_polls:
+        return None
+    applicable = None
+    for poll_date in sorted(season_polls):
+        if poll_date <= game_date:
+            applicable = poll_date
+        else:
+            break
+    if not applicable:
+        return None
+    rankings = season_polls[applicable]
+    if team_name in rankings:
+        return rankings[team_name]
+    canonical = aliases.get(team_name, team_name)
+    if canonical in rankings:
+        return rankings[canonical]
+    for poll_team, rank in rankings.items():
+        poll_canonical = aliases.get(poll_team, poll_team)
+        if poll_canonical == team_name or poll_canonical == canonical:
+            return rank
+    return None
+
+
+@pytest.fixture
+def aliases(monkeypatch):
+    """A small TEAM_ALIASES table with several aliases per canonical name."""
+    monkeypatch.setattr(constants, 'TEAM_ALIASES', ALIASES)
+    return ALIASES
+
+
+class TestPollIndex:
+    """Tests for indexed AP rank lookups."""
+
+    def test_matches_linear_scan(self, aliases):
+        """Test that index lookups agree with the per-call poll scan."""
+        rng = random.Random(7)
+        teams = ['Duke', 'Kansas', 'Connecticut', 'UConn', 'Ole Miss', 'Mississippi',
+                 'Miami (FL)', 'Miami FL', 'Miami', 'Houston']
+        all_polls = {}
+        for season in ('2023-24', '2024-25'):
+            year = int(season[:4])
+            dates = sorted({f"{year}-{rng.choice([11, 12])}-{rng.randint(10, 28)}" for _ in range(6)})
+            all_polls[season] = {
+                poll_date: {team: rank for rank, team in enumerate(rng.sample(teams, 6), start=1)}
+                for poll_date in dates
+            }
+        index = PollIndex(all_polls)
+
+        for season in ('2023-24', '2024-25', '2022-23'):
+            year = int(season[:4])
+            for day in range(1, 31):
+                game_date = f"{year}-12-{day:02d}"
+                for team in teams + ['Unranked State']:
+                    assert index.get_rank(team, game_date, season) == \
+                        _linear_rank(all_polls, aliases, team, game_date, season), (team, game_date)
+
+    def test_reverse_alias_takes_earliest_listed(self, aliases):
+        """Test that when several poll entries share a canonical name, the first listed wins."""
+        index = PollIndex({'2024-25': {'2024-11-04': {'Miami FL': 9, 'Duke': 1, 'Miami (FL)': 4}}})
+        assert index.get_rank('Miami', '2024-11-10', '2024-25') == 9
+
+    def test_poll_before_first_date(self, aliases):
+        """Test that games before a season's first poll are unranked."""
+        index = PollIndex({'2024-25': {'2024-11-04': {'Duke': 1}, '2024-11-11': {'Duke': 3}}})
+        assert index.get_rank('Duke', '2024-11-03', '2024-25') is None
+        assert index.get_rank('Duke', '2024-11-04', '2024-25') == 1
+        assert index.get_rank('Duke', '2024-11-20', '2024-25') == 3
+        assert index.latest_poll_date('2024-25') == '2024-11-11'
+
+    def test_index_rebuilt_when_file_changes(self, tmp_path, monkeypatch, aliases):
+        """Test that the cached index follows the polls file."""
+        polls_file = tmp_path / "ap_polls.json"
+        monkeypatch.setattr(poll_scraper, 'POLLS_FILE_MEN', polls_file)
+        monkeypatch.setattr(poll_scraper, '_poll_indexes', {})
+
+        assert not get_poll_index('M')
+        poll_scraper.save_polls({'2024-25': {'2024-11-04': {'Duke': 2}}}, gender='M')
+        assert get_poll_index('M').get_rank('Duke', '2024-11-05', '2024-25') == 2
+        assert get_poll_index('M') is get_poll_index('M')
+        assert json.loads(polls_file.read_text())['2024-25']['2024-11-04'] == {'Duke': 2}
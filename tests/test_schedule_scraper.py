@@ -0,0 +1,142 @@
+"""Tests for basketball_processor.utils.schedule_scraper module."""
+
+from datetime import datetime
+
+from basketball_processor.utils import schedule_scraper
+from basketball_processor.utils.schedule_scraper import (
+    VenueMatcher,
+    fetch_schedule_dates,
+    merge_schedule,
+    refresh_start,
+    schedule_date_key,
+    venue_matches,
+)
+
+
+def _game(espn_id, date, venue='Arena'):
+    return {'espn_id': espn_id, 'date': date, 'venue': {'name': venue}}
+
+
+class TestScheduleDateKey:
+    """Tests for mapping games to ESPN scoreboard dates."""
+
+    def test_late_game_stays_on_eastern_day(self):
+        """Test that a 9pm Eastern tip (next day in UTC) keys to the Eastern date."""
+        assert schedule_date_key(_game('1', '2025-01-12T02:00Z')) == '20250111'
+
+
+class TestMergeSchedule:
+    """Tests for incremental schedule merges."""
+
+    def test_unchanged_entries_reused(self):
+        """Test that unchanged games keep their cached dict and order."""
+        cached = [_game('1', '2025-01-11T17:00Z'), _game('2', '2025-01-11T19:00Z')]
+        fetched = {'20250111': [_game('1', '2025-01-11T17:00Z'), _game('2', '2025-01-11T19:00Z')]}
+
+        merged, counts = merge_schedule(cached, fetched)
+
+        assert merged[0] is cached[0] and merged[1] is cached[1]
+        assert counts == {'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 2}
+
+    def test_changes_additions_and_removals(self):
+        """Test that a refreshed date replaces its cached games."""
+        cached = [_game('1', '2025-01-11T17:00Z'), _game('2', '2025-01-11T19:00Z')]
+        fetched = {'20250111': [_game('1', '2025-01-11T17:00Z', venue='New Arena'),
+                                _game('3', '2025-01-11T21:00Z')]}
+
+        merged, counts = merge_schedule(cached, fetched)
+
+        assert [g['espn_id'] for g in merged] == ['1', '3']
+        assert merged[0]['venue']['name'] == 'New Arena'
+        assert counts == {'added': 1, 'changed': 1, 'removed': 1, 'unchanged': 0}
+
+    def test_unfetched_and_failed_dates_kept(self):
+        """Test that dates not refreshed, or whose fetch failed, keep cached games."""
+        cached = [_game('1', '2025-01-05T17:00Z'), _game('2', '2025-01-11T17:00Z')]
+        fetched = {'20250111': None, '20250112': [_game('3', '2025-01-12T17:00Z')]}
+
+        merged, _ = merge_schedule(cached, fetched)
+
+        assert [g['espn_id'] for g in merged] == ['1', '2', '3']
+
+    def test_previous_seasons_pruned(self):
+        """Test that cached games before keep_from are dropped."""
+        cached = [_game('old', '2024-03-01T17:00Z'), _game('new', '2024-11-10T17:00Z')]
+
+        merged, counts = merge_schedule(cached, {}, keep_from='20240801')
+
+        assert [g['espn_id'] for g in merged] == ['new']
+        assert counts['removed'] == 0
+
+
+class TestRefreshStart:
+    """Tests for the incremental refresh window."""
+
+    def test_starts_before_last_scrape(self):
+        """Test that a week-old cache re-fetches every day since it was scraped."""
+        today = datetime(2025, 1, 20, 9, 30)
+        assert refresh_start('2025-01-13T22:15:00', today, recent_days=3) == datetime(2025, 1, 10)
+
+    def test_fresh_cache_rechecks_recent_days(self):
+        """Test that a cache scraped today still re-checks the last few days."""
+        today = datetime(2025, 1, 20, 9, 30)
+        assert refresh_start('2025-01-20T08:00:00', today, recent_days=3) == datetime(2025, 1, 17)
+        assert refresh_start(None, today, recent_days=3) == datetime(2025, 1, 17)
+
+    def test_capped_at_season_start(self):
+        """Test that a cache from last season refreshes from this season's start."""
+        today = datetime(2025, 11, 20)
+        assert refresh_start('2025-03-01T12:00:00', today) == datetime(2025, 8, 1)
+
+
+class TestFetchScheduleDates:
+    """Tests for the concurrent date fetcher."""
+
+    def test_results_keyed_by_date(self, monkeypatch):
+        """Test that every requested date is returned, including failures."""
+        def fake_fetch(date, gender):
+            return None if date.day == 2 else [_game(str(date.day), date.isoformat())]
+
+        monkeypatch.setattr(schedule_scraper, '_fetch_date_games', fake_fetch)
+        dates = [datetime(2025, 1, day) for day in range(1, 6)]
+
+        results = fetch_schedule_dates(dates, workers=3, show_progress=False)
+
+        assert sorted(results) == [d.strftime('%Y%m%d') for d in dates]
+        assert results['20250102'] is None
+        assert results['20250104'][0]['espn_id'] == '4'
+
+
+VISITED = [
+    'Cameron Indoor Stadium, Durham, NC',
+    'GCU Arena, Phoenix, Arizona',
+    'Madison Square Garden, New York, NY',
+    'The Pavilion, Villanova, PA',
+    'Allen Fieldhouse, Lawrence',
+    'Unknown Venue',
+]
+
+
+class TestVenueMatcher:
+    """Tests for matching ESPN venues against visited venues."""
+
+    def test_same_results_as_venue_matches(self):
+        """Test that the matcher agrees with checking every venue pair."""
+        espn_venues = [
+            {'name': 'Cameron Indoor Stadium', 'city': 'Durham', 'state': 'North Carolina'},
+            {'name': 'Global Credit Union Arena', 'city': 'Phoenix', 'state': 'AZ'},
+            {'name': 'Madison Square Garden', 'city': 'Brooklyn', 'state': 'NY'},
+            {'name': 'Finneran Pavilion', 'city': 'Villanova', 'state': 'PA'},
+            {'name': 'Allen Fieldhouse', 'city': 'Lawrence', 'state': ''},
+            {'name': 'Cameron Indoor', 'city': 'durham', 'state': 'nc'},
+            {'name': 'Smith Center', 'city': 'Chapel Hill', 'state': 'NC'},
+        ]
+        matcher = VenueMatcher(VISITED)
+        for espn_venue in espn_venues:
+            expected = any(venue_matches(espn_venue, v) for v in VISITED)
+            assert matcher.matches(espn_venue) == expected, espn_venue
+
+    def test_other_cities_not_compared(self):
+        """Test that a venue name match in another city is not a match."""
+        matcher = VenueMatcher(VISITED)
+        assert not matcher.matches({'name': 'Madison Square Garden', 'city': 'Boston', 'state': 'MA'})
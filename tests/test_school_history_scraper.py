@@ -0,0 +1,92 @@
+"""Tests for basketball_processor.utils.school_history_scraper module."""
+
+import json
+import random
+
+import pytest
+
+from basketball_processor.utils import school_history_scraper
+from basketball_processor.utils.school_history_scraper import get_conference_for_school
+
+
+def _linear_lookup(history, school, year, gender='M'):
+    """Reference lookup: first membership whose range covers the year."""
+    keys = [f"{school} (W)", school] if gender == 'W' else [school]
+    for key in keys:
+        for membership in history.get(key, []):
+            if membership['from'] <= year <= membership['to']:
+                return membership['conference']
+    return None
+
+
+def _random_history(rng):
+    history = {}
+    for n in range(40):
+        memberships = []
+        year = rng.randint(1930, 1960)
+        for _ in range(rng.randint(1, 6)):
+            start = year + rng.randint(-3, 4)  # negative steps give overlapping ranges
+            end = start + rng.randint(0, 15)
+            memberships.append({'conference': rng.choice(['ACC', 'SEC', 'Big East', 'A-10', '']),
+                                'from': start, 'to': end})
+            year = end + 1
+        rng.shuffle(memberships)
+        history[f"School {n}" + (" (W)" if n % 5 == 0 else "")] = memberships
+    return history
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """Point the scraper at a temporary history file and return a writer."""
+    path = tmp_path / "school_conference_history.json"
+    monkeypatch.setattr(school_history_scraper, 'SCHOOL_HISTORY_FILE', str(path))
+    school_history_scraper._invalidate_history_index()
+
+    def write(history):
+        path.write_text(json.dumps(history))
+        school_history_scraper._invalidate_history_index()
+        return history
+
+    yield write
+    school_history_scraper._invalidate_history_index()
+
+
+class TestConferenceForSchool:
+    """Tests for indexed conference lookups."""
+
+    def test_matches_linear_scan(self, history_file):
+        """Test that bisect lookups agree with a first-match linear scan."""
+        rng = random.Random(3)
+        history = history_file(_random_history(rng))
+        for school in [f"School {n}" for n in range(40)] + ['Unknown']:
+            for year in range(1925, 2010, 2):
+                for gender in ('M', 'W'):
+                    assert get_conference_for_school(school, year, gender) == \
+                        _linear_lookup(history, school, year, gender), (school, year, gender)
+
+    def test_overlapping_ranges_keep_first_match(self, history_file):
+        """Test that overlapping memberships resolve to the first listed one."""
+        history_file({'Duke': [
+            {'conference': 'ACC', 'from': 1954, 'to': 2025},
+            {'conference': 'Southern', 'from': 1929, 'to': 1960},
+        ]})
+        assert get_conference_for_school('Duke', 1958) == 'ACC'
+        assert get_conference_for_school('Duke', 1950) == 'Southern'
+        assert get_conference_for_school('Duke', 1920) is None
+
+    def test_women_fall_back_to_shared_history(self, history_file):
+        """Test that women's lookups try the (W) key before the shared one."""
+        history_file({
+            'Utah': [{'conference': 'Pac-12', 'from': 2012, 'to': 2024}],
+            'Utah (W)': [{'conference': 'Big 12', 'from': 2024, 'to': 2025}],
+        })
+        assert get_conference_for_school('Utah', 2024, 'W') == 'Big 12'
+        assert get_conference_for_school('Utah', 2015, 'W') == 'Pac-12'
+        assert get_conference_for_school('Utah', 2024, 'M') == 'Pac-12'
+
+    def test_index_reloads_when_file_changes(self, history_file):
+        """Test that a rewritten history file is picked up."""
+        history_file({'Duke': [{'conference': 'ACC', 'from': 1954, 'to': 2025}]})
+        assert get_conference_for_school('Duke', 2000) == 'ACC'
+        history_file({'Duke': [{'conference': 'Big East', 'from': 1954, 'to': 2025}]})
+        assert get_conference_for_school('Duke', 2000) == 'Big East'
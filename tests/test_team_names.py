@@ -0,0 +1,81 @@
+"""Tests for basketball_processor.utils.team_names module."""
+
+from basketball_processor.utils import school_history_scraper
+from basketball_processor.utils.team_names import (
+    TeamNameResolver,
+    get_team_resolver,
+    normalize_team_name_for_matching,
+    resolve_team,
+)
+
+
+CODES = {'Duke': 'DUKE', 'North Carolina': 'UNC', 'NC State': 'NCST'}
+ALIASES = {'UNC': 'North Carolina', "St. John's (NY)": "St. John's"}
+
+
+class TestTeamNameResolver:
+    """Tests for the shared team name resolver."""
+
+    def test_code_lookup_order(self):
+        """Test exact, case-insensitive, partial and fallback code lookups."""
+        resolver = TeamNameResolver(CODES, ALIASES)
+        assert resolver.code('Duke') == 'DUKE'
+        assert resolver.code('north carolina') == 'UNC'
+        assert resolver.code('NC State Wolfpack') == 'NCST'
+        assert resolver.code('Unknown University') == 'UNKN'
+
+    def test_teams_match_through_aliases(self):
+        """Test that nicknames are stripped and aliases are equivalent."""
+        resolver = TeamNameResolver(CODES, ALIASES)
+        assert resolver.teams_match('UNC', 'North Carolina Tar Heels')
+        assert resolver.teams_match("St. John's (NY)", "St. John's Red Storm")
+        assert not resolver.teams_match('Duke', 'North Carolina')
+
+    def test_shared_resolver_uses_team_codes(self):
+        """Test that the shared resolver reads the TEAM_CODES table."""
+        assert get_team_resolver().code('Duke') == 'DUKE'
+
+    def test_resolve_returns_canonical_code_conference(self):
+        """Test that resolve() combines alias, code and conference lookups."""
+        team = resolve_team('Duke')
+        assert team.canonical == 'Duke'
+        assert team.code == 'DUKE'
+        assert team.conference == 'ACC'
+
+    def test_resolve_conference_is_date_aware(self):
+        """Test that a game date resolves the conference the team was in then."""
+        assert resolve_team('UCLA', 20240315).conference == 'Pac-12'
+        assert resolve_team('UCLA', '20241201').conference == 'Big Ten'
+        assert resolve_team('UCLA').conference == 'Big Ten'
+
+    def test_resolve_sees_resaved_school_history(self, tmp_path, monkeypatch):
+        """Test that re-saving the school history changes the resolved conference."""
+        monkeypatch.setattr(school_history_scraper, 'DATA_DIR', str(tmp_path))
+        monkeypatch.setattr(school_history_scraper, 'SCHOOL_HISTORY_FILE', str(tmp_path / "history.json"))
+        school_history_scraper._invalidate_history_index()
+        try:
+            school_history_scraper.save_school_history(
+                {'Gamma Tech': [{'conference': 'Old League', 'from': 1950, 'to': 1960}]})
+            assert resolve_team('Gamma Tech', 19550101).conference == 'Old League'
+
+            school_history_scraper.save_school_history(
+                {'Gamma Tech': [{'conference': 'New League', 'from': 1950, 'to': 1960}]})
+            assert resolve_team('Gamma Tech', 19550101).conference == 'New League'
+        finally:
+            school_history_scraper._invalidate_history_index()
+
+    def test_resolver_shared(self):
+        """Test that the indexes are built once per process."""
+        assert get_team_resolver() is get_team_resolver()
+
+
+class TestNormalizeTeamNameForMatching:
+    """Tests for ESPN display name normalization."""
+
+    def test_lady_nickname_removed(self):
+        """Test that 'Lady <nickname>' is stripped."""
+        assert normalize_team_name_for_matching('Tennessee Lady Volunteers') == 'tennessee'
+
+    def test_first_matching_suffix_only(self):
+        """Test that only one nickname is removed."""
+        assert normalize_team_name_for_matching('Duke Blue Devils') == 'duke'